@@ -0,0 +1,71 @@
+"""
+TORQ Console Code Scanner Benchmarks.
+
+Measures Python parsing throughput (files/sec) of indexer.CodeScanner
+against the number of parser processes.
+
+Example:
+    python benchmark_code_scanner.py --path /path/to/repo --workers 1 2 4 8
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Any, Dict, List
+
+from torq_console.indexer.code_scanner import CodeScanner
+
+
+def benchmark_workers(path: str, workers: int, repeat: int) -> Dict[str, Any]:
+    """Time a full structure scan with the given number of workers."""
+    timings = []
+    structures = 0
+    for _ in range(repeat):
+        scanner = CodeScanner(path)
+        start = time.perf_counter()
+        structures = sum(len(batch) for batch in scanner.iter_structures(workers=workers))
+        timings.append(time.perf_counter() - start)
+
+    python_files = sum(1 for f in CodeScanner(path).scan_files() if f['extension'] == '.py')
+
+    best = min(timings)
+    return {
+        'workers': workers,
+        'python_files': python_files,
+        'structures': structures,
+        'best_seconds': round(best, 3),
+        'files_per_sec': round(python_files / best, 1) if best else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TORQ Console Code Scanner Benchmarks")
+    parser.add_argument("--path", default=os.path.join(os.path.dirname(__file__), "torq_console"),
+                        help="Codebase to scan (default: the torq_console package)")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+                        help="Worker counts to compare")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per worker count")
+    parser.add_argument("--output", "-o", default="code_scanner_benchmark_results.json",
+                        help="Output file for results")
+    args = parser.parse_args()
+
+    print(f"📊 Scanning {args.path} on {os.cpu_count()} cores...")
+    results: List[Dict[str, Any]] = []
+    for workers in args.workers:
+        result = benchmark_workers(args.path, workers, args.repeat)
+        results.append(result)
+        speedup = results[0]['best_seconds'] / result['best_seconds'] if result['best_seconds'] else 0
+        print(
+            f"   workers={workers:<3d} {result['files_per_sec']:>9.1f} files/sec "
+            f"({result['best_seconds']:.2f}s, {speedup:.2f}x)"
+        )
+
+    with open(args.output, 'w') as f:
+        json.dump({'path': args.path, 'cpu_count': os.cpu_count(), 'results': results}, f, indent=2)
+    print(f"\n💾 Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
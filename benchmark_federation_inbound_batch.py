@@ -0,0 +1,108 @@
+"""
+TORQ Console Federation Inbound Batch Benchmarks.
+
+Times InboundFederatedClaimProcessor on the same stream of simulated
+claims (plus replayed envelopes), per claim via process_claim versus in
+batches via process_claims, and checks both give the same outcomes.
+
+Example:
+    python benchmark_federation_inbound_batch.py --claims 5000 --batch-size 500
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import time
+
+from torq_console.layer12.federation.simulator.executor_async import AsyncFederationSimulationExecutor
+from torq_console.layer12.federation.simulator.models import (
+    Domain,
+    NodeBehaviorProfile,
+    NodeType,
+    SimulatedNode,
+)
+
+
+def make_stream(safeguards: str, num_nodes: int, num_claims: int, seed: int):
+    """Fresh executor and envelopes; every 7th envelope is replayed at the end."""
+    random.seed(seed)
+    executor = AsyncFederationSimulationExecutor(simulation_mode=(safeguards == "simulation"))
+    nodes = [
+        SimulatedNode(f"node_{i}", NodeBehaviorProfile(node_type=NodeType.NORMAL, baseline_trust=random.random()))
+        for i in range(num_nodes)
+    ]
+    for node in nodes:
+        executor.adapter.register_node(node)
+    envelopes = []
+    for i in range(num_claims):
+        node = random.choice(nodes)
+        claim = node.generate_claim(round_num=1, available_domains=list(Domain))
+        envelopes.append(executor.adapter._build_processor_request(claim, node, 1, "benchmark"))
+    return executor.processor, envelopes + envelopes[::7]
+
+
+async def per_claim(processor, envelopes):
+    return [await processor.process_claim(envelope) for envelope in envelopes]
+
+
+async def batched(processor, envelopes, batch_size: int):
+    results = []
+    for start in range(0, len(envelopes), batch_size):
+        results += await processor.process_claims(envelopes[start:start + batch_size])
+    return results
+
+
+def time_mode(safeguards: str, args, seed: int):
+    processor, envelopes = make_stream(safeguards, args.nodes, args.claims, seed)
+    start = time.perf_counter()
+    serial = asyncio.run(per_claim(processor, envelopes))
+    serial_ms = (time.perf_counter() - start) * 1000
+
+    processor, envelopes = make_stream(safeguards, args.nodes, args.claims, seed)
+    start = time.perf_counter()
+    batch = asyncio.run(batched(processor, envelopes, args.batch_size))
+    batch_ms = (time.perf_counter() - start) * 1000
+
+    match = [(r.status, r.error_code) for r in serial] == [(r.status, r.error_code) for r in batch]
+    return {"per_claim_ms": serial_ms, "batch_ms": batch_ms, "match": match}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TORQ Console Federation Inbound Batch Benchmarks")
+    parser.add_argument("--nodes", type=int, default=50, help="Source nodes")
+    parser.add_argument("--claims", type=int, default=3000, help="Claims in the stream")
+    parser.add_argument("--batch-size", type=int, default=500, help="Envelopes per process_claims call")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions (median reported)")
+    parser.add_argument("--output", "-o", default="federation_inbound_batch_benchmark_results.json",
+                        help="Output file for results")
+    args = parser.parse_args()
+
+    # Rejected claims are logged per claim; keep the timing output readable
+    logging.getLogger("torq_console").setLevel(logging.CRITICAL)
+
+    print(f"📊 {args.claims} claims from {args.nodes} nodes, batches of {args.batch_size}...")
+    results = {}
+    for safeguards in ("simulation", "production"):
+        runs = [time_mode(safeguards, args, seed) for seed in range(args.repeat)]
+        per_claim_ms = statistics.median(run["per_claim_ms"] for run in runs)
+        batch_ms = statistics.median(run["batch_ms"] for run in runs)
+        results[safeguards] = {
+            "per_claim_ms": round(per_claim_ms, 1),
+            "batch_ms": round(batch_ms, 1),
+            "speedup": round(per_claim_ms / batch_ms, 2),
+            "outcomes_match": all(run["match"] for run in runs),
+        }
+        entry = results[safeguards]
+        print(f"   {safeguards:<11} per-claim={entry['per_claim_ms']:>9.1f}ms  batch={entry['batch_ms']:>9.1f}ms  "
+              f"speedup={entry['speedup']:>5.2f}x  match={entry['outcomes_match']}")
+
+    with open(args.output, 'w') as f:
+        json.dump({'args': vars(args), 'results': results}, f, indent=2)
+    print(f"\n💾 Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+TORQ Console Federation Simulator Metrics Benchmarks.
+
+Times the per-round bookkeeping of the async federation simulator (node
+trust update, round metrics and round summary) on one synthetic round,
+list-based (Counters over SimulatedClaim objects, as before ClaimBatch)
+versus columnar (one ClaimBatch per round).
+
+The list-based trust update scans every result for every node, so at
+full scale it is timed on --trust-sample nodes and scaled to all nodes.
+
+Example:
+    python benchmark_federation_metrics.py --nodes 10000 --claims 100000 --repeat 3
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+import statistics
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List
+
+from torq_console.layer12.federation.simulator.claim_batch import ClaimBatch, NodeIndex
+from torq_console.layer12.federation.simulator.executor_async import AsyncFederationSimulationExecutor
+from torq_console.layer12.federation.simulator.models import (
+    Domain,
+    NodeBehaviorProfile,
+    NodeType,
+    SimulatedClaim,
+    SimulatedNode,
+    SimulationRound,
+    Stance,
+)
+from torq_console.layer12.federation.simulator.processor_adapter import ProcessedSimulationClaimResult
+
+
+# ============================================================================
+# List-based reference implementation
+# ============================================================================
+
+def legacy_entropy(values: List[Any]) -> float:
+    if not values:
+        return 0.0
+    counts = Counter(values)
+    total = len(values)
+    entropy = -sum((count / total) * math.log2(count / total) for count in counts.values())
+    return min(1.0, entropy / math.log2(len(counts))) if len(counts) > 1 else 0.0
+
+
+def legacy_gini(claims: List[SimulatedClaim]) -> float:
+    if not claims:
+        return 0.0
+    values = sorted(Counter(c.source_node_id for c in claims).values())
+    if len(values) == 1:
+        return 0.0
+    n, total = len(values), sum(values)
+    cumulative = sum((n - i + 1) * val for i, val in enumerate(values))
+    return max(0.0, min(1.0, (2 * cumulative) / (n * total) - (n + 1) / n))
+
+
+def legacy_hhi(claims: List[SimulatedClaim]) -> float:
+    if not claims:
+        return 0.0
+    total = len(claims)
+    return sum((count / total) ** 2 for count in Counter(c.source_node_id for c in claims).values())
+
+
+def legacy_top_shares(claims: List[SimulatedClaim]):
+    if not claims:
+        return 0.0, 0.0
+    counts = sorted(Counter(c.source_node_id for c in claims).values(), reverse=True)
+    top_1 = counts[0] / len(claims)
+    return top_1, (sum(counts[:2]) / len(claims) if len(counts) >= 2 else top_1)
+
+
+def legacy_trust_update(nodes: List[SimulatedNode], results: List[Any]) -> None:
+    for node in nodes:
+        node_results = [r for r in results if r.claim.source_node_id == node.node_id]
+        if not node_results:
+            continue
+        accepted = sum(1 for r in node_results if r.accepted)
+        trust_delta = (accepted / len(node_results) - 0.5) * 0.05
+        trust_delta += (random.random() - 0.5) * node.profile.trust_volatility
+        node.state.current_trust = max(0.0, min(1.0, node.state.current_trust + trust_delta))
+
+
+def legacy_round_metrics(claims: List[SimulatedClaim], nodes: List[SimulatedNode], results: List[Any]) -> None:
+    # _calculate_round_metrics
+    legacy_entropy([c.domain for c in claims])
+    legacy_entropy([c.stance for c in claims])
+    legacy_gini(claims)
+    legacy_hhi(claims)
+    legacy_top_shares(claims)
+    trusts = [n.state.current_trust for n in nodes]
+    mean = sum(trusts) / len(trusts)
+    (sum((t - mean) ** 2 for t in trusts) / len(trusts)) ** 0.5
+    sum(1 for r in results if r.accepted)
+    # _create_round_summary
+    legacy_entropy([c.domain for c in claims])
+    legacy_entropy([c.stance for c in claims])
+    legacy_gini(claims)
+    legacy_hhi(claims)
+    legacy_top_shares(claims)
+    legacy_top_shares(claims)  # minority ratio
+    sum(1 for r in results if r.accepted)
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+def make_round(num_nodes: int, num_claims: int, seed: int):
+    """One round: nodes, and claims from a skewed (Pareto) set of sources with random acceptance."""
+    rng = random.Random(seed)
+    nodes = [
+        SimulatedNode(f"node_{i}", NodeBehaviorProfile(node_type=NodeType.NORMAL, baseline_trust=rng.random()))
+        for i in range(num_nodes)
+    ]
+    domains, stances = list(Domain), list(Stance)
+    now = datetime.utcnow()
+    results = []
+    for i in range(num_claims):
+        source = nodes[int(rng.paretovariate(1.2)) % num_nodes]
+        claim = SimulatedClaim(
+            claim_id=f"claim_{i}",
+            source_node_id=source.node_id,
+            domain=rng.choice(domains),
+            stance=rng.choice(stances),
+            confidence=rng.random(),
+            provenance_quality=rng.random(),
+            content="",
+            timestamp=now,
+        )
+        results.append(ProcessedSimulationClaimResult(claim=claim, accepted=rng.random() < 0.6, status="accepted"))
+    return nodes, results
+
+
+def time_legacy(nodes, results, trust_sample: int) -> Dict[str, float]:
+    claims = [r.claim for r in results]
+    sample = nodes[:trust_sample]
+    start = time.perf_counter()
+    legacy_trust_update(sample, results)
+    trust_ms = (time.perf_counter() - start) * 1000 * len(nodes) / len(sample)
+
+    start = time.perf_counter()
+    legacy_round_metrics(claims, nodes, results)
+    metrics_ms = (time.perf_counter() - start) * 1000
+    return {"trust_ms": trust_ms, "metrics_ms": metrics_ms}
+
+
+def time_batch(executor: AsyncFederationSimulationExecutor, nodes, results) -> Dict[str, float]:
+    start = time.perf_counter()
+    batch = ClaimBatch.from_results(results, NodeIndex.from_nodes(nodes))
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    asyncio.run(executor._update_node_trust(nodes, batch))
+    trust_ms = (time.perf_counter() - start) * 1000
+
+    round_data = SimulationRound(round_number=1, nodes=nodes, claims=[r.claim for r in results])
+    start = time.perf_counter()
+    executor._calculate_round_metrics(round_data, nodes, batch)
+    executor._create_round_summary(round_num=1, round_start=datetime.utcnow(), batch=batch)
+    metrics_ms = (time.perf_counter() - start) * 1000
+    return {"build_ms": build_ms, "trust_ms": trust_ms, "metrics_ms": metrics_ms}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TORQ Console Federation Simulator Metrics Benchmarks")
+    parser.add_argument("--nodes", type=int, default=10000, help="Nodes in the round")
+    parser.add_argument("--claims", type=int, default=100000, help="Claims in the round")
+    parser.add_argument("--trust-sample", type=int, default=100,
+                        help="Nodes to time the list-based trust update on (scaled to --nodes)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions (median reported)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", "-o", default="federation_metrics_benchmark_results.json",
+                        help="Output file for results")
+    args = parser.parse_args()
+
+    logging.getLogger("torq_console.layer12").setLevel(logging.WARNING)
+
+    print(f"📊 Round bookkeeping at {args.nodes} nodes x {args.claims} claims...")
+    nodes, results = make_round(args.nodes, args.claims, args.seed)
+    executor = AsyncFederationSimulationExecutor()
+
+    legacy_runs = [time_legacy(nodes, results, min(args.trust_sample, args.nodes)) for _ in range(args.repeat)]
+    batch_runs = [time_batch(executor, nodes, results) for _ in range(args.repeat)]
+
+    def median(runs, key):
+        return round(statistics.median(run[key] for run in runs), 2)
+
+    legacy = {key: median(legacy_runs, key) for key in ("trust_ms", "metrics_ms")}
+    batch = {key: median(batch_runs, key) for key in ("build_ms", "trust_ms", "metrics_ms")}
+    legacy_total = legacy["trust_ms"] + legacy["metrics_ms"]
+    batch_total = batch["build_ms"] + batch["trust_ms"] + batch["metrics_ms"]
+    result = {
+        "nodes": args.nodes,
+        "claims": args.claims,
+        "list_based": {**legacy, "total_ms": round(legacy_total, 2)},
+        "columnar": {**batch, "total_ms": round(batch_total, 2)},
+        "metrics_speedup": round(legacy["metrics_ms"] / batch["metrics_ms"], 1),
+        "metrics_speedup_with_build": round(legacy["metrics_ms"] / (batch["build_ms"] + batch["metrics_ms"]), 1),
+        "total_speedup": round(legacy_total / batch_total, 1),
+    }
+
+    print(f"   list-based  trust={legacy['trust_ms']:>10.1f}ms (scaled)  metrics={legacy['metrics_ms']:>8.1f}ms  "
+          f"total={legacy_total:>10.1f}ms")
+    print(f"   columnar    build={batch['build_ms']:>8.1f}ms  trust={batch['trust_ms']:>8.1f}ms  "
+          f"metrics={batch['metrics_ms']:>8.1f}ms  total={batch_total:>8.1f}ms")
+    print(f"   speedup: metrics {result['metrics_speedup']}x ({result['metrics_speedup_with_build']}x incl. batch build), "
+          f"per round {result['total_speedup']}x")
+
+    with open(args.output, 'w') as f:
+        json.dump({'args': vars(args), 'results': result}, f, indent=2)
+    print(f"\n💾 Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+TORQ Console Federation Simulation Sweep Benchmarks.
+
+Runs the same scenario x seed sweep with 1, 2, 4, ... worker processes
+(up to --max-workers) and reports throughput and scaling efficiency
+(speedup / workers) relative to the single-process sweep.
+
+Example:
+    python benchmark_federation_sweep.py --seeds 40 --max-workers 8
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from torq_console.layer12.federation.simulator.scenarios import SCENARIO_REGISTRY
+from torq_console.layer12.federation.simulator.sweep import build_sweep, run_sweep
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TORQ Console Federation Simulation Sweep Benchmarks")
+    parser.add_argument("--seeds", type=int, default=20, help="Seeds per scenario")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1,
+                        help="Largest worker count to time (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=1, help="Runs per pool task")
+    parser.add_argument("--output", "-o", default="federation_sweep_benchmark_results.json",
+                        help="Output file for results")
+    args = parser.parse_args()
+
+    # The processor adapter logs per-claim errors; keep the timing output readable
+    logging.getLogger("torq_console").setLevel(logging.CRITICAL)
+
+    runs = build_sweep(SCENARIO_REGISTRY.keys(), range(args.seeds))
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= args.max_workers:
+        worker_counts.append(worker_counts[-1] * 2)
+    if worker_counts[-1] != args.max_workers:
+        worker_counts.append(args.max_workers)
+
+    print(f"📊 Sweep of {len(runs)} runs at {worker_counts} workers...")
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in worker_counts:
+            result = run_sweep(runs, Path(tmp) / f"sweep_{workers}.jsonl",
+                               max_workers=workers, chunksize=args.chunksize, resume=False,
+                               worker_log_level=logging.CRITICAL)
+            results.append({
+                "workers": workers,
+                "elapsed_s": round(result.elapsed_seconds, 3),
+                "runs_per_s": round(result.runs_per_second, 1),
+                "failed": result.failed,
+            })
+
+    base = results[0]["elapsed_s"]
+    for entry in results:
+        entry["speedup"] = round(base / entry["elapsed_s"], 2)
+        entry["efficiency"] = round(entry["speedup"] / entry["workers"], 2)
+        print(f"   workers={entry['workers']:>3}  {entry['elapsed_s']:>8.2f}s  {entry['runs_per_s']:>8.1f} runs/s  "
+              f"speedup={entry['speedup']:>5.2f}x  efficiency={entry['efficiency']:.0%}")
+
+    with open(args.output, 'w') as f:
+        json.dump({'args': vars(args), 'cpu_count': os.cpu_count(), 'results': results}, f, indent=2)
+    print(f"\n💾 Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
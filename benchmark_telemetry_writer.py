@@ -0,0 +1,156 @@
+"""
+TORQ Console Telemetry Writer Benchmarks.
+
+Drives TelemetryCollector with a producer offering --rate events/sec and
+measures sustained throughput (events stored per second, end to end) and
+event loop lag (how late a 1ms timer fires while telemetry is flowing),
+with the SQLite storage as it was before the writer thread (a connection
+per flush, one INSERT per event on the event loop) versus the writer
+thread (persistent WAL connection, executemany per batch).
+
+Example:
+    python benchmark_telemetry_writer.py --events 200000 --rate 50000
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from torq_console.core.telemetry.collector import (
+    SQLiteTelemetryStorage,
+    TelemetryCollector,
+    TelemetryConfig,
+)
+from torq_console.core.telemetry.event import TorqEvent, TorqEventType
+
+
+# ============================================================================
+# Reference implementation (before the writer thread)
+# ============================================================================
+
+class LegacySQLiteTelemetryStorage(SQLiteTelemetryStorage):
+    """store_events as it was: new connection, per-event INSERT, on the loop."""
+
+    async def store_events(self, events: List[TorqEvent]) -> bool:
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            for event in events:
+                event_dict = event.to_dict()
+                cursor.execute(self._INSERT_EVENT, (
+                    event_dict['event_id'], event_dict['event_type'], event_dict['timestamp'],
+                    event_dict['session_id'], event_dict['run_id'], event_dict['severity'],
+                    event_dict['source'], event_dict['version'], event_dict['trace_id'],
+                    event_dict['span_id'], event_dict['parent_span_id'],
+                    json.dumps(event_dict['data']), json.dumps(event_dict['tags']),
+                    json.dumps(event_dict['context']), event_dict['duration_ms'],
+                    event_dict['cpu_usage_percent'], event_dict['memory_usage_mb'],
+                ))
+            conn.commit()
+            conn.close()
+            return True
+        except Exception as e:
+            logging.error(f"Failed to store events: {e}")
+            return False
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+def make_events(count: int) -> List[TorqEvent]:
+    return [
+        TorqEvent(
+            event_type=TorqEventType.TOOL_EXECUTION,
+            session_id=f"session_{i % 50}",
+            run_id=f"run_{i % 500}",
+            data={'tool_name': 'search', 'query': f"query {i}", 'tokens': i % 1000},
+            tags={'env': 'bench'},
+            duration_ms=i % 250,
+        )
+        for i in range(count)
+    ]
+
+
+async def lag_probe(stop: asyncio.Event, lags: List[float]):
+    """Record how late a 1ms sleep wakes up."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append((time.perf_counter() - start - 0.001) * 1000)
+
+
+async def run_once(storage_cls, events: List[TorqEvent], rate: int, batch_size: int, db_path: Path):
+    config = TelemetryConfig(storage_type="sqlite", storage_path=db_path, batch_size=batch_size,
+                             flush_interval_seconds=0.5)
+    collector = TelemetryCollector(config)
+    collector.storage = storage_cls(db_path)
+    await collector.start()
+
+    stop, lags = asyncio.Event(), []
+    probe = asyncio.create_task(lag_probe(stop, lags))
+
+    # Offer events in 1ms ticks at the target rate
+    per_tick = max(1, rate // 1000)
+    start = time.perf_counter()
+    for i in range(0, len(events), per_tick):
+        for event in events[i:i + per_tick]:
+            await collector.collect_event(event)
+        target = start + (i + per_tick) / rate
+        await asyncio.sleep(max(0.0, target - time.perf_counter()))
+    await collector.stop()
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe
+    stored = collector._stats['events_stored']
+    lags.sort()
+    return {
+        "stored": stored,
+        "elapsed_s": round(elapsed, 3),
+        "events_per_s": round(stored / elapsed),
+        "lag_p50_ms": round(statistics.median(lags), 2),
+        "lag_p99_ms": round(lags[int(len(lags) * 0.99)], 2),
+        "lag_max_ms": round(lags[-1], 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TORQ Console Telemetry Writer Benchmarks")
+    parser.add_argument("--events", type=int, default=200000, help="Events to collect")
+    parser.add_argument("--rate", type=int, default=50000, help="Offered load in events/sec")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Collector batch_size")
+    parser.add_argument("--output", "-o", default="telemetry_writer_benchmark_results.json",
+                        help="Output file for results")
+    args = parser.parse_args()
+
+    events = make_events(args.events)
+    # Keep full collections from rescanning the pre-built events (they would show up as loop lag)
+    gc.freeze()
+    results = {}
+    print(f"📊 {args.events} events offered at {args.rate}/s, batch_size={args.batch_size}...")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, storage_cls in (("per_event_on_loop", LegacySQLiteTelemetryStorage),
+                                  ("writer_thread", SQLiteTelemetryStorage)):
+            result = asyncio.run(run_once(storage_cls, events, args.rate, args.batch_size,
+                                          Path(tmp) / f"{name}.db"))
+            results[name] = result
+            print(f"   {name:<18} {result['events_per_s']:>8} events/s  stored={result['stored']}  "
+                  f"loop lag p50={result['lag_p50_ms']}ms p99={result['lag_p99_ms']}ms "
+                  f"max={result['lag_max_ms']}ms")
+
+    with open(args.output, 'w') as f:
+        json.dump({'args': vars(args), 'results': results}, f, indent=2)
+    print(f"\n💾 Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+TORQ Console Vector Index Benchmarks.
+
+Compares the approximate nearest-neighbour backends of the codebase indexer
+(IVF-Flat, HNSW, IVF-PQ) against the exact flat baseline: build time,
+single-query latency (p50/p95, as issued by SemanticSearch.search) and
+recall@k for a sweep of nprobe / efSearch settings.
+
+Every index type is measured twice: in memory, and the way SemanticSearch
+serves it after a restart - saved, appended to with ``--tail`` of the
+vectors (which the ANN structure does not cover and which are scanned
+exactly) and loaded back as a memory-mapped segment.
+
+Example:
+    python benchmark_vector_index.py --vectors 1000000 --queries 500
+"""
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from torq_console.indexer.vector_store import VectorStore
+
+
+def make_dataset(n: int, dim: int, seed: int = 0) -> np.ndarray:
+    """Clustered Gaussian vectors, closer to real embeddings than uniform noise."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(1, n // 1000), dim)).astype('float32')
+    assignments = rng.integers(0, len(centers), size=n)
+    vectors = centers[assignments] + 0.3 * rng.standard_normal((n, dim)).astype('float32')
+    return vectors.astype('float32')
+
+
+class VectorIndexBenchmark:
+    """Recall-vs-latency benchmarking for VectorStore index types."""
+
+    def __init__(self, vectors: np.ndarray, queries: np.ndarray, k: int = 10,
+                 tail: float = 0.2, workdir: str = None):
+        self.vectors = vectors
+        self.queries = queries
+        self.k = k
+        self.tail = tail
+        self.workdir = workdir
+        self.ground_truth: List[set] = []
+        self.results: List[Dict[str, Any]] = []
+
+    def _build(self, index_type: str, index_params: Dict = None) -> Tuple[VectorStore, float]:
+        store = VectorStore(
+            dimension=self.vectors.shape[1],
+            index_type=index_type,
+            index_params=index_params
+        )
+        metadata = [{'id': i} for i in range(len(self.vectors))]
+        start = time.perf_counter()
+        store.add_vectors(self.vectors, metadata)
+        return store, time.perf_counter() - start
+
+    def _build_mapped(self, index_type: str) -> Tuple[VectorStore, float]:
+        """Save the head, append the tail, and reload the segment from disk."""
+        head = len(self.vectors) - int(len(self.vectors) * self.tail)
+        path = tempfile.mkdtemp(prefix=f"{index_type}-", dir=self.workdir)
+        store = VectorStore(dimension=self.vectors.shape[1], index_type=index_type)
+        start = time.perf_counter()
+        store.add_vectors(self.vectors[:head], [{'id': i} for i in range(head)])
+        store.save(path)
+        if head < len(self.vectors):
+            store.add_vectors(
+                self.vectors[head:],
+                [{'id': i} for i in range(head, len(self.vectors))],
+                ids=list(range(head, len(self.vectors)))
+            )
+            store.save(path)
+        build_s = time.perf_counter() - start
+
+        mapped = VectorStore(dimension=self.vectors.shape[1])
+        mapped.load(path)
+        return mapped, build_s
+
+    def _stores(self, index_type: str):
+        """(storage, store, build seconds) for the in-memory and mapped variants."""
+        print(f"📊 Building {index_type}...")
+        yield ('memory', *self._build(index_type))
+        print(f"📊 Saving {index_type} with a {self.tail:.0%} unindexed tail and mapping it...")
+        yield ('mapped', *self._build_mapped(index_type))
+
+    def _measure(self, store: VectorStore) -> Dict[str, float]:
+        latencies = []
+        hits = 0
+        for query, truth in zip(self.queries, self.ground_truth):
+            start = time.perf_counter()
+            found = store.search_ids(query, k=self.k)
+            latencies.append((time.perf_counter() - start) * 1000)
+            hits += len(truth & {doc_id for doc_id, _ in found})
+
+        latencies.sort()
+        return {
+            'recall_at_k': round(hits / (len(self.queries) * self.k), 4),
+            'p50_ms': round(statistics.median(latencies), 3),
+            'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1], 3),
+            'mean_ms': round(statistics.fmean(latencies), 3)
+        }
+
+    def run_baseline(self):
+        print(f"📊 Building flat baseline over {len(self.vectors)} vectors...")
+        store, build_s = self._build('flat')
+        self.ground_truth = [
+            {doc_id for doc_id, _ in store.search_ids(q, k=self.k)}
+            for q in self.queries
+        ]
+        self._record('flat', 'memory', {}, build_s, self._measure(store))
+
+        print(f"📊 Saving flat with a {self.tail:.0%} appended tail and mapping it...")
+        store, build_s = self._build_mapped('flat')
+        self._record('flat', 'mapped', {}, build_s, self._measure(store))
+
+    def run_ivf(self, index_type: str, nprobes: List[int]):
+        for storage, store, build_s in self._stores(index_type):
+            for nprobe in nprobes:
+                store.set_search_params(nprobe=nprobe)
+                self._record(index_type, storage, {'nprobe': nprobe}, build_s, self._measure(store))
+
+    def run_hnsw(self, ef_searches: List[int]):
+        for storage, store, build_s in self._stores('hnsw'):
+            for ef in ef_searches:
+                store.set_search_params(ef_search=ef)
+                self._record('hnsw', storage, {'ef_search': ef}, build_s, self._measure(store))
+
+    def _record(self, index_type: str, storage: str, params: Dict, build_s: float, stats: Dict):
+        row = {'index_type': index_type, 'storage': storage, **params,
+               'build_s': round(build_s, 2), **stats}
+        self.results.append(row)
+        label = ", ".join(f"{k}={v}" for k, v in params.items()) or "exact"
+        print(
+            f"   {index_type:9s} {storage:6s} {label:14s} recall@{self.k}={stats['recall_at_k']:.3f} "
+            f"p50={stats['p50_ms']:.2f}ms p95={stats['p95_ms']:.2f}ms"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TORQ Console Vector Index Benchmarks")
+    parser.add_argument("--vectors", type=int, default=100000,
+                        help="Number of indexed vectors (default: 100000)")
+    parser.add_argument("--dim", type=int, default=384,
+                        help="Embedding dimension (default: 384)")
+    parser.add_argument("--queries", type=int, default=200,
+                        help="Number of timed queries (default: 200)")
+    parser.add_argument("--k", type=int, default=10, help="Results per query")
+    parser.add_argument("--types", nargs="+", default=["ivf_flat", "hnsw", "ivf_pq"],
+                        choices=["ivf_flat", "hnsw", "ivf_pq"],
+                        help="ANN index types to compare against flat")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[16, 32, 64, 128])
+    parser.add_argument("--tail", type=float, default=0.2,
+                        help="Fraction of vectors appended after the first save, "
+                             "left outside the ANN structure (default: 0.2)")
+    parser.add_argument("--workdir", default=None,
+                        help="Parent directory for the saved segments (default: system temp)")
+    parser.add_argument("--output", "-o", default="vector_index_benchmark_results.json",
+                        help="Output file for results")
+    args = parser.parse_args()
+
+    vectors = make_dataset(args.vectors, args.dim)
+    queries = make_dataset(args.queries, args.dim, seed=1)
+
+    with tempfile.TemporaryDirectory(prefix="torq-vector-bench-", dir=args.workdir) as workdir:
+        benchmark = VectorIndexBenchmark(vectors, queries, k=args.k, tail=args.tail, workdir=workdir)
+        benchmark.run_baseline()
+        for index_type in args.types:
+            if index_type == 'hnsw':
+                benchmark.run_hnsw(args.ef_search)
+            else:
+                benchmark.run_ivf(index_type, args.nprobe)
+
+    with open(args.output, 'w') as f:
+        json.dump({
+            'vectors': args.vectors,
+            'dimension': args.dim,
+            'queries': args.queries,
+            'k': args.k,
+            'tail': args.tail,
+            'results': benchmark.results
+        }, f, indent=2)
+    print(f"\n💾 Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
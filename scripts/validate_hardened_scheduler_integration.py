@@ -86,10 +86,11 @@ def validate_scheduler_integration():
     print(f"  hardened_executor in __init__: {'[PASS]' if has_hardened_init else '[FAIL]'} {has_hardened_init}")
     print(f"  mission_completer in __init__: {'[PASS]' if has_completer_init else '[FAIL]'} {has_completer_init}")
 
-    print("\n[CHECK 7] _dispatch_nodes uses hardened executor")
-    dispatch_source = inspect.getsource(scheduler._dispatch_nodes)
+    print("\n[CHECK 7] _run_node uses hardened executor")
+    dispatch_source = inspect.getsource(scheduler._run_node)
     uses_hardened = '_execute_node_hardened' in dispatch_source
-    skips_completed = 'already' in dispatch_source and ('COMPLETED' in dispatch_source or 'completed' in dispatch_source)
+    hardened_source = inspect.getsource(scheduler._execute_node_hardened)
+    skips_completed = 'skipped' in hardened_source and 'already' in hardened_source
     print(f"  Calls _execute_node_hardened: {'[PASS]' if uses_hardened else '[FAIL]'} {uses_hardened}")
     print(f"  Skips already-executed nodes: {'[PASS]' if skips_completed else '[FAIL]'} {skips_completed}")
 
@@ -0,0 +1,264 @@
+"""
+TORQ Console Tier Router Simulation.
+
+Replays recorded chat traffic through the latency-aware TierRouter and the
+previous static routing (token-count tiers, fixed DeepSeek -> Ollama ->
+Claude order) against simulated providers, and reports end-to-end latency
+(mean/p50/p95/p99), tier mix, hedges and failures for each.
+
+Traffic is JSONL, one request per line, using the first of these fields
+present: ``messages`` (chat messages), ``prompt``, or ``title``/``body``
+(so backlog files such as requests.jsonl replay as-is). Optional fields:
+``timestamp`` (ISO 8601 or epoch seconds; otherwise Poisson arrivals at
+--rate) and ``min_quality``.
+
+Providers are simulated with log-normal latency, a failure probability and
+a fixed number of slots per backend (both llama.cpp tiers share one model);
+requests queue FIFO for a free slot. Override with --profiles (JSON mapping
+provider name to any of median_ms, sigma, error_rate, capacity).
+
+Example:
+    python simulate_tier_router.py --traffic requests.jsonl --repeat 40 --rate 2
+"""
+
+import argparse
+import heapq
+import itertools
+import json
+import math
+import random
+import statistics
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from torq_console.llm.tier_router import DEFAULT_RESOURCES, RouteDecision, TierRouter
+
+DEFAULT_PROFILES = {
+    "llama_cpp_fast": {"median_ms": 1500, "sigma": 0.3, "error_rate": 0.01, "capacity": 1},
+    "llama_cpp_quality": {"median_ms": 8000, "sigma": 0.3, "error_rate": 0.01, "capacity": 1},
+    "deepseek": {"median_ms": 22000, "sigma": 0.5, "error_rate": 0.03, "capacity": 32},
+    "ollama": {"median_ms": 30000, "sigma": 0.4, "error_rate": 0.02, "capacity": 2},
+    "claude": {"median_ms": 15000, "sigma": 0.7, "error_rate": 0.02, "capacity": 32},
+    "glm": {"median_ms": 18000, "sigma": 0.6, "error_rate": 0.04, "capacity": 32},
+}
+
+STATIC_ORDER = ["deepseek", "ollama", "claude"]
+
+
+class StaticRouter(TierRouter):
+    """The routing chat_with_routing used before TierRouter, for comparison."""
+
+    def route(self, messages, available, min_quality=None) -> Optional[RouteDecision]:
+        available = set(available)
+        quality = min_quality if min_quality is not None else self.required_quality(messages)
+        order = STATIC_ORDER
+        if quality == 1:
+            order = ["llama_cpp_fast"] + STATIC_ORDER
+        elif quality == 2:
+            order = ["llama_cpp_quality"] + STATIC_ORDER
+        elif quality >= 4:
+            order = ["claude"]
+        chain = [name for name in order if name in available]
+        if not chain:
+            return None
+        return RouteDecision(
+            tier=self._tier_of[chain[0]].name, provider=chain[0], quality=quality,
+            expected_ms=0.0, fallbacks=chain[1:]
+        )
+
+
+def load_traffic(path: str, repeat: int, rate: float, seed: int) -> List[Dict[str, Any]]:
+    """Read traffic records and give each an arrival time in seconds."""
+    records = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "messages" in record:
+                messages = record["messages"]
+            elif "prompt" in record:
+                messages = [{"role": "user", "content": record["prompt"]}]
+            else:
+                text = f"{record.get('title', '')}\n\n{record.get('body', '')}".strip()
+                messages = [{"role": "user", "content": text}]
+            records.append({
+                "messages": messages,
+                "min_quality": record.get("min_quality"),
+                "timestamp": record.get("timestamp")
+            })
+
+    rng = random.Random(seed)
+    stamped = all(r["timestamp"] is not None for r in records)
+    traffic = []
+    clock = 0.0
+    for cycle in range(repeat):
+        if stamped:
+            times = [_epoch(r["timestamp"]) for r in records]
+            base, span = min(times), max(times) - min(times) + 1.0
+            for record, t in zip(records, times):
+                traffic.append({**record, "arrival": t - base + cycle * span})
+        else:
+            for record in records:
+                clock += rng.expovariate(rate)
+                traffic.append({**record, "arrival": clock})
+    traffic.sort(key=lambda r: r["arrival"])
+    return traffic
+
+
+def _epoch(value: Any) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    return datetime.fromisoformat(str(value)).timestamp()
+
+
+class Simulation:
+    """Discrete-event replay of traffic through one router."""
+
+    def __init__(self, router: TierRouter, profiles: Dict[str, Dict[str, float]], seed: int):
+        self.router = router
+        self.profiles = profiles
+        self.rng = random.Random(seed)
+        self.now = 0.0
+        router.clock = lambda: self.now
+        self.events: List = []
+        self.sequence = itertools.count()
+        self.slots: Dict[str, List[float]] = {}
+        for name, profile in profiles.items():
+            resource = DEFAULT_RESOURCES.get(name, name)
+            self.slots.setdefault(resource, [0.0] * int(profile.get("capacity", 1)))
+        self.requests: List[Dict[str, Any]] = []
+
+    def _push(self, t: float, kind: str, *payload):
+        heapq.heappush(self.events, (t, next(self.sequence), kind, payload))
+
+    def _start(self, request: Dict[str, Any], provider: str):
+        """Send a request to a provider: queue for a slot, sample outcome."""
+        profile = self.profiles[provider]
+        started = self.router.begin(provider)
+        slots = self.slots[DEFAULT_RESOURCES.get(provider, provider)]
+        free_at = heapq.heappop(slots)
+        service = profile["median_ms"] / 1000 * math.exp(self.rng.gauss(0, profile.get("sigma", 0.5)))
+        success = self.rng.random() >= profile.get("error_rate", 0.0)
+        if not success:
+            service *= 0.3  # errors tend to come back early
+        finish = max(self.now, free_at) + service
+        heapq.heappush(slots, finish)
+        request["running"][provider] = started
+        request["tried"].add(provider)
+        self._push(finish, "finish", request, provider, success)
+
+    def _next_candidate(self, request: Dict[str, Any]) -> Optional[str]:
+        decision = request["decision"]
+        for provider in [decision.hedge_provider] + decision.fallbacks:
+            if provider and provider not in request["tried"]:
+                return provider
+        return None
+
+    def run(self, traffic: List[Dict[str, Any]]) -> Dict[str, Any]:
+        for record in traffic:
+            self._push(record["arrival"], "arrive", record)
+
+        while self.events:
+            self.now, _, kind, payload = heapq.heappop(self.events)
+            if kind == "arrive":
+                record, = payload
+                decision = self.router.route(record["messages"], self.profiles, record["min_quality"])
+                request = {"arrival": self.now, "decision": decision, "running": {},
+                           "tried": set(), "done": False, "latency": None, "winner": None}
+                self.requests.append(request)
+                self._start(request, decision.provider)
+                if decision.hedge_provider:
+                    self._push(self.now + decision.hedge_delay_ms / 1000, "hedge", request)
+
+            elif kind == "hedge":
+                request, = payload
+                hedge = request["decision"].hedge_provider
+                if not request["done"] and hedge not in request["tried"]:
+                    self.router.hedges += 1
+                    self._start(request, hedge)
+
+            elif kind == "finish":
+                request, provider, success = payload
+                if provider not in request["running"]:
+                    continue  # cancelled hedge loser
+                started = request["running"].pop(provider)
+                self.router.end(provider, started, success=success)
+                if success:
+                    request["done"] = True
+                    request["latency"] = self.now - request["arrival"]
+                    request["winner"] = provider
+                    if provider == request["decision"].hedge_provider:
+                        self.router.hedge_wins += 1
+                    for loser, loser_started in list(request["running"].items()):
+                        self.router.end(loser, loser_started, cancelled=True)
+                    request["running"].clear()
+                elif not request["running"]:
+                    retry = self._next_candidate(request)
+                    if retry:
+                        self._start(request, retry)
+                    else:
+                        request["done"] = True
+
+        return self.report()
+
+    def report(self) -> Dict[str, Any]:
+        latencies = sorted(r["latency"] for r in self.requests if r["latency"] is not None)
+
+        def pct(p):
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 2)
+
+        return {
+            "requests": len(self.requests),
+            "failed": sum(1 for r in self.requests if r["latency"] is None),
+            "mean_s": round(statistics.mean(latencies), 2) if latencies else None,
+            "p50_s": pct(0.50) if latencies else None,
+            "p95_s": pct(0.95) if latencies else None,
+            "p99_s": pct(0.99) if latencies else None,
+            "served_by": dict(Counter(r["winner"] for r in self.requests if r["winner"])),
+            "hedges": self.router.hedges,
+            "hedge_wins": self.router.hedge_wins,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay traffic through the LLM tier router")
+    parser.add_argument("--traffic", default="requests.jsonl", help="JSONL traffic file")
+    parser.add_argument("--repeat", type=int, default=20, help="Replay the traffic this many times")
+    parser.add_argument("--rate", type=float, default=1.0, help="Requests/s when records lack timestamps")
+    parser.add_argument("--premium-share", type=float, default=0.1,
+                        help="Fraction of requests that ask for the premium tier")
+    parser.add_argument("--profiles", help="JSON file overriding provider profiles")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON")
+    args = parser.parse_args()
+
+    profiles = {name: dict(profile) for name, profile in DEFAULT_PROFILES.items()}
+    if args.profiles:
+        with open(args.profiles) as f:
+            for name, overrides in json.load(f).items():
+                profiles.setdefault(name, {}).update(overrides)
+
+    traffic = load_traffic(args.traffic, args.repeat, args.rate, args.seed)
+    rng = random.Random(args.seed)
+    for record in traffic:
+        if record["min_quality"] is None and rng.random() < args.premium_share:
+            record["min_quality"] = 4
+
+    results = {}
+    for name, router in (("static", StaticRouter()), ("tier_router", TierRouter())):
+        results[name] = Simulation(router, profiles, args.seed).run(traffic)
+        r = results[name]
+        print(f"{name:12s} n={r['requests']} failed={r['failed']} mean={r['mean_s']}s "
+              f"p50={r['p50_s']}s p95={r['p95_s']}s p99={r['p99_s']}s "
+              f"hedges={r['hedges']} (won {r['hedge_wins']})")
+        print(f"{'':12s} served_by={r['served_by']}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+"""
+Chat Persistence Tests
+
+Tests for the snapshot + append-only log storage behind
+core.chat_manager.ChatPersistence, the SQLite backend
+(SQLiteChatPersistence) and offset-based checkpoints.
+"""
+
+import asyncio
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+
+from torq_console.core.chat_log import ChatLog
+from torq_console.core.chat_manager import (
+    BatchedChatPersistence, ChatCheckpoint, ChatManager, ChatMessage, ChatPersistence, ChatTab,
+    ChatTabStatus, CheckpointType, MessageType, SQLiteChatPersistence
+)
+
+
+def _tab(title: str = "Chat") -> ChatTab:
+    now = datetime.now()
+    return ChatTab(
+        id=str(uuid.uuid4()), title=title, created_at=now,
+        last_accessed=now, status=ChatTabStatus.ACTIVE
+    )
+
+
+def _message(content: str) -> ChatMessage:
+    return ChatMessage(
+        id=str(uuid.uuid4()), type=MessageType.USER,
+        content=content, timestamp=datetime.now()
+    )
+
+
+@pytest.fixture
+def persistence(tmp_path):
+    return ChatPersistence(tmp_path / "chat")
+
+
+class TestChatPersistenceLog:
+    """Delta saves, replay and compaction."""
+
+    async def test_round_trip(self, persistence):
+        tab = _tab()
+        await persistence.save_tab(tab)
+        for i in range(5):
+            tab.add_message(_message(f"message {i}"))
+            tab.title = f"Chat {i}"
+            assert await persistence.save_tab(tab)
+
+        loaded = await ChatPersistence(persistence.storage_path).load_tab(tab.id)
+        assert [m.content for m in loaded.messages] == [f"message {i}" for i in range(5)]
+        assert loaded.title == "Chat 4"
+
+    async def test_save_appends_only_new_messages(self, persistence):
+        tab = _tab()
+        await persistence.save_tab(tab)
+        snapshot = persistence.storage_path / "tabs" / f"{tab.id}.json"
+        snapshot_before = snapshot.read_text()
+
+        tab.add_message(_message("first"))
+        await persistence.save_tab(tab)
+        tab.add_message(_message("second"))
+        await persistence.save_tab(tab)
+
+        assert snapshot.read_text() == snapshot_before
+        records = [json.loads(line) for line in persistence.log.path(tab.id).read_text().splitlines()]
+        contents = [r["message"]["content"] for r in records if r["op"] == "message"]
+        assert contents == ["first", "second"]
+
+    async def test_unchanged_tab_writes_nothing(self, persistence):
+        tab = _tab()
+        tab.add_message(_message("hello"))
+        await persistence.save_tab(tab)
+        size = persistence.log.size(tab.id)
+
+        await persistence.save_tab(tab)
+        assert persistence.log.size(tab.id) == size
+
+    async def test_compaction_folds_log_into_snapshot(self, persistence):
+        persistence.COMPACT_MIN_BYTES = 2048
+        tab = _tab()
+        await persistence.save_tab(tab)
+        for i in range(50):
+            tab.add_message(_message("x" * 100))
+            await persistence.save_tab(tab)
+
+        assert persistence.log.size(tab.id) <= 2048 + 1024
+        snapshot = json.loads((persistence.storage_path / "tabs" / f"{tab.id}.json").read_text())
+        assert snapshot["log_seq"] > 0
+
+        loaded = await ChatPersistence(persistence.storage_path).load_tab(tab.id)
+        assert len(loaded.messages) == 50
+
+    async def test_replay_skips_records_already_in_snapshot(self, persistence):
+        tab = _tab()
+        await persistence.save_tab(tab)
+        tab.add_message(_message("one"))
+        await persistence.save_tab(tab)
+        log_bytes = persistence.log.path(tab.id).read_bytes()
+
+        # Crash after the snapshot was written but before the log was emptied
+        await persistence._write_snapshot(tab)
+        persistence.log.path(tab.id).write_bytes(log_bytes)
+
+        loaded = await ChatPersistence(persistence.storage_path).load_tab(tab.id)
+        assert [m.content for m in loaded.messages] == ["one"]
+
+    async def test_torn_tail_is_ignored(self, persistence):
+        tab = _tab()
+        await persistence.save_tab(tab)
+        tab.add_message(_message("kept"))
+        await persistence.save_tab(tab)
+        with open(persistence.log.path(tab.id), 'a') as f:
+            f.write('{"seq": 99, "op": "mess')
+
+        loaded = await ChatPersistence(persistence.storage_path).load_tab(tab.id)
+        assert [m.content for m in loaded.messages] == ["kept"]
+
+    async def test_append_after_torn_tail_survives_reload(self, persistence):
+        tab = _tab()
+        await persistence.save_tab(tab)
+        tab.add_message(_message("kept"))
+        await persistence.save_tab(tab)
+        with open(persistence.log.path(tab.id), 'a') as f:
+            f.write('{"seq": 99, "op": "mess')
+
+        # Restart after the crash, keep chatting, restart again
+        restarted = ChatPersistence(persistence.storage_path)
+        loaded = await restarted.load_tab(tab.id)
+        loaded.add_message(_message("after crash"))
+        assert await restarted.save_tab(loaded)
+
+        reloaded = await ChatPersistence(persistence.storage_path).load_tab(tab.id)
+        assert [m.content for m in reloaded.messages] == ["kept", "after crash"]
+
+    async def test_rewritten_history_falls_back_to_snapshot(self, persistence):
+        tab = _tab()
+        for i in range(3):
+            tab.add_message(_message(f"m{i}"))
+        await persistence.save_tab(tab)
+
+        tab.messages = tab.messages[:1]
+        await persistence.save_tab(tab)
+
+        loaded = await ChatPersistence(persistence.storage_path).load_tab(tab.id)
+        assert [m.content for m in loaded.messages] == ["m0"]
+
+    async def test_legacy_snapshot_without_log(self, persistence):
+        tab = _tab()
+        tab.add_message(_message("legacy"))
+        path = persistence.storage_path / "tabs" / f"{tab.id}.json"
+        path.write_text(json.dumps(tab.to_dict(), indent=2))
+
+        loaded = await persistence.load_tab(tab.id)
+        assert loaded.messages[0].content == "legacy"
+
+        loaded.add_message(_message("new"))
+        await persistence.save_tab(loaded)
+        reloaded = await ChatPersistence(persistence.storage_path).load_tab(tab.id)
+        assert [m.content for m in reloaded.messages] == ["legacy", "new"]
+
+    async def test_delete_removes_log(self, persistence):
+        tab = _tab()
+        await persistence.save_tab(tab)
+        tab.add_message(_message("bye"))
+        await persistence.save_tab(tab)
+
+        assert await persistence.delete_tab(tab.id)
+        assert not persistence.log.path(tab.id).exists()
+        assert await persistence.load_tab(tab.id) is None
+
+    async def test_index_entries_carry_tab_id(self, persistence):
+        tab = _tab()
+        await persistence.save_tab(tab)
+        assert [t["id"] for t in await persistence.list_tabs()] == [tab.id]
+
+
+class TestGroupCommit:
+    """Concurrent appends share writes."""
+
+    async def test_concurrent_appends_are_grouped(self, tmp_path):
+        log = ChatLog(tmp_path, fsync=False)
+        await asyncio.gather(*(
+            log.append(f"tab{i % 4}", [{"op": "message", "n": i}]) for i in range(40)
+        ))
+
+        assert log.records_written == 40
+        assert log.group_writes < 40
+        records, last_seq = log.read("tab0")
+        assert [r["n"] for r in records] == list(range(0, 40, 4))
+        assert last_seq == 10
+
+    async def test_batched_flush_writes_deltas(self, persistence):
+        batched = BatchedChatPersistence(persistence)
+        tabs = [_tab(f"Chat {i}") for i in range(3)]
+        for tab in tabs:
+            await batched.save_tab(tab)
+        await batched.flush()
+
+        for tab in tabs:
+            tab.add_message(_message(f"hello from {tab.title}"))
+            await batched.save_tab(tab)
+        await batched.shutdown()
+
+        fresh = ChatPersistence(persistence.storage_path)
+        for tab in tabs:
+            loaded = await fresh.load_tab(tab.id)
+            assert loaded.messages[0].content == f"hello from {tab.title}"
+
+
+@pytest.fixture
+def sqlite_persistence(tmp_path):
+    persistence = SQLiteChatPersistence(tmp_path / "chat")
+    yield persistence
+    persistence.close()
+
+
+class TestSQLiteChatPersistence:
+    """SQLite backend: deltas, keyset paging and retention."""
+
+    async def test_round_trip(self, sqlite_persistence):
+        tab = _tab()
+        for i in range(3):
+            tab.add_message(_message(f"m{i}"))
+            await sqlite_persistence.save_tab(tab)
+        tab.title = "Renamed"
+        await sqlite_persistence.save_tab(tab)
+
+        loaded = await sqlite_persistence.load_tab(tab.id)
+        assert loaded.title == "Renamed"
+        assert [m.content for m in loaded.messages] == ["m0", "m1", "m2"]
+
+    async def test_truncated_history_is_rewritten(self, sqlite_persistence):
+        tab = _tab()
+        for i in range(4):
+            tab.add_message(_message(f"m{i}"))
+        await sqlite_persistence.save_tab(tab)
+
+        tab.messages = tab.messages[:2]
+        tab.add_message(_message("replacement"))
+        await sqlite_persistence.save_tab(tab)
+
+        loaded = await sqlite_persistence.load_tab(tab.id)
+        assert [m.content for m in loaded.messages] == ["m0", "m1", "replacement"]
+
+    async def test_message_pages(self, sqlite_persistence):
+        tab = _tab()
+        for i in range(10):
+            tab.add_message(_message(f"m{i}"))
+        await sqlite_persistence.save_tab(tab)
+
+        page = await sqlite_persistence.load_messages(tab.id, limit=3, offset=4)
+        assert [m.content for m in page] == ["m4", "m5", "m6"]
+
+    async def test_list_tabs_keyset_pages(self, sqlite_persistence):
+        tabs = [_tab(f"Chat {i}") for i in range(5)]
+        for i, tab in enumerate(tabs):
+            tab.last_accessed = datetime(2026, 1, 1 + i)
+            await sqlite_persistence.save_tab(tab)
+
+        first = await sqlite_persistence.list_tabs(limit=2)
+        second = await sqlite_persistence.list_tabs(limit=2, before=first[-1])
+        rest = await sqlite_persistence.list_tabs(before=second[-1])
+        titles = [t["title"] for t in first + second + rest]
+        assert titles == ["Chat 4", "Chat 3", "Chat 2", "Chat 1", "Chat 0"]
+        assert first[0]["message_count"] == 0
+
+    async def test_cleanup_archives_old_tabs(self, sqlite_persistence):
+        old, new = _tab("old"), _tab("new")
+        old.last_accessed = datetime(2000, 1, 1)
+        await sqlite_persistence.save_tabs([old, new])
+
+        stats = await sqlite_persistence.cleanup_old_data()
+        assert stats["tabs_archived"] == 1
+        assert [t["title"] for t in await sqlite_persistence.list_tabs()] == ["new"]
+        assert await sqlite_persistence.load_tab(old.id) is None
+
+    async def test_checkpoints_and_delete(self, sqlite_persistence):
+        tab = _tab()
+        await sqlite_persistence.save_tab(tab)
+        checkpoint = ChatCheckpoint(
+            id=str(uuid.uuid4()), tab_id=tab.id, type=CheckpointType.MANUAL,
+            timestamp=datetime.now(), state_snapshot={"model": tab.model}
+        )
+        assert await sqlite_persistence.save_checkpoint(checkpoint)
+        assert [c.id for c in await sqlite_persistence.load_checkpoints(tab.id)] == [checkpoint.id]
+
+        assert await sqlite_persistence.delete_tab(tab.id)
+        assert await sqlite_persistence.load_checkpoints(tab.id) == []
+        assert await sqlite_persistence.list_tabs() == []
+
+
+@pytest.fixture(params=["files", "sqlite"])
+async def manager(request, tmp_path):
+    chat_manager = ChatManager(None, None, storage_path=tmp_path / "chat", backend=request.param)
+    yield chat_manager
+    await chat_manager.shutdown()
+
+
+class TestOffsetCheckpoints:
+    """Checkpoints store a message offset; restore truncates or replays."""
+
+    async def _conversation(self, manager, count):
+        tab = await manager.create_new_tab("Checkpoints")
+        for i in range(count):
+            await manager.add_message(f"m{i}")
+        return tab
+
+    async def test_checkpoint_size_is_constant(self, manager):
+        tab = await self._conversation(manager, 5)
+        small = await manager.create_checkpoint(tab.id, description="small")
+        for i in range(200):
+            await manager.add_message("y" * 200)
+        large = await manager.create_checkpoint(tab.id, description="large")
+
+        assert "messages" not in large.state_snapshot
+        assert len(json.dumps(large.to_dict())) - len(json.dumps(small.to_dict())) < 16
+
+    async def test_restore_truncates_and_persists(self, manager):
+        tab = await self._conversation(manager, 3)
+        checkpoint = await manager.create_checkpoint(tab.id, description="three")
+        await manager.add_message("m3")
+        await manager.add_message("m4")
+
+        assert await manager.restore_checkpoint(checkpoint.id)
+        assert [m.content for m in tab.messages] == ["m0", "m1", "m2"]
+
+        await manager.persistence.flush()
+        fresh = type(manager.persistence.persistence)(manager.storage_path)
+        loaded = await fresh.load_tab(tab.id)
+        assert [m.content for m in loaded.messages] == ["m0", "m1", "m2"]
+        fresh.close()
+
+    async def test_restore_forward_replays_discarded_messages(self, manager):
+        tab = await self._conversation(manager, 2)
+        early = await manager.create_checkpoint(tab.id, description="early")
+        await manager.add_message("m2")
+        late = await manager.create_checkpoint(tab.id, description="late")
+
+        assert await manager.restore_checkpoint(early.id)
+        assert [m.content for m in tab.messages] == ["m0", "m1"]
+        assert await manager.restore_checkpoint(late.id)
+        assert [m.content for m in tab.messages] == ["m0", "m1", "m2"]
+
+    async def test_legacy_full_snapshot_checkpoint(self, manager):
+        tab = await self._conversation(manager, 2)
+        legacy = ChatCheckpoint(
+            id=str(uuid.uuid4()), tab_id=tab.id, type=CheckpointType.MANUAL,
+            timestamp=datetime.now(),
+            state_snapshot={"messages": [tab.messages[0].to_dict()]}
+        )
+        manager.checkpoints[tab.id].append(legacy)
+
+        assert await manager.restore_checkpoint(legacy.id)
+        assert [m.content for m in tab.messages] == ["m0"]
@@ -0,0 +1,151 @@
+"""
+Code Graph Tests
+
+Tests for the persistent symbol/import graph behind
+core.context_manager.GraphTraversalRetriever.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from torq_console.core.code_graph import CodeGraph, module_name, parse_python_graph
+from torq_console.core.context_manager import GraphTraversalRetriever, LRUCache, TreeSitterParser
+
+
+def _write(path: Path, text: str, mtime_offset: int = 0):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+    if mtime_offset:
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + mtime_offset))
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    _write(root / "app" / "__init__.py", "")
+    _write(root / "app" / "models.py", "class User:\n    def save(self):\n        pass\n")
+    _write(root / "app" / "auth.py", "from .models import User\n\ndef login(name):\n    return User()\n")
+    _write(root / "app" / "views.py", "from app.auth import login\n\ndef index():\n    return login('x')\n")
+    _write(root / "cli.py", "import app.views\n\ndef main():\n    app.views.index()\n")
+    return root
+
+
+def _files(root):
+    return sorted(root.rglob("*.py"))
+
+
+@pytest.fixture
+def graph(repo, tmp_path):
+    g = CodeGraph(str(tmp_path / "graph.sqlite"), repo)
+    yield g
+    g.close()
+
+
+class TestPythonExtraction:
+    """Test ast-based symbol and import extraction."""
+
+    def test_module_name(self):
+        assert module_name("app/auth.py") == "app.auth"
+        assert module_name("app/__init__.py") == "app"
+        assert module_name("src/pkg/util.py") == "pkg.util"
+
+    def test_relative_imports_are_resolved(self):
+        parsed = parse_python_graph("from .models import User\nfrom ..core import db\n", "app.sub.auth")
+
+        targets = [target for target, _ in parsed['imports']]
+        assert "app.sub.models" in targets
+        assert "app.sub.models.User" in targets
+        assert "app.core.db" in targets
+
+    def test_symbols_include_methods(self):
+        parsed = parse_python_graph("class A:\n    async def run(self):\n        pass\n", "m")
+
+        assert [(n, k, l) for n, k, l, _ in parsed['symbols']] == [("A", "class", 1), ("A.run", "method", 2)]
+
+
+class TestCodeGraph:
+    """Test adjacency, k-hop queries and incremental updates."""
+
+    def test_k_hop_neighbors(self, repo, graph):
+        graph.sync(_files(repo))
+
+        assert graph.neighbors(repo / "app" / "auth.py", k=1) == {
+            repo / "app" / "models.py": 1,
+            repo / "app" / "views.py": 1,
+        }
+        two_hops = graph.neighbors(repo / "app" / "models.py", k=2, direction='imported_by')
+        assert two_hops == {repo / "app" / "auth.py": 1, repo / "app" / "views.py": 2}
+        assert graph.neighbors(repo / "cli.py", k=1, direction='imports') == {repo / "app" / "views.py": 1}
+
+    def test_find_symbols(self, repo, graph):
+        graph.sync(_files(repo))
+
+        found = graph.find_symbols(["LOGIN", "save"])
+
+        assert [(s['name'], s['kind'], s['file_path']) for s in found] == [
+            ("login", "function", repo / "app" / "auth.py"),
+            ("User.save", "method", repo / "app" / "models.py"),
+        ]
+
+    def test_incremental_update_rewires_edges(self, repo, graph):
+        graph.sync(_files(repo))
+
+        _write(repo / "app" / "views.py", "def index():\n    return 'static'\n", mtime_offset=5)
+        assert graph.sync(_files(repo))['indexed'] == 1
+        assert repo / "app" / "views.py" not in graph.neighbors(repo / "app" / "auth.py", k=1)
+
+        _write(repo / "app" / "session.py", "from app import models\n")
+        assert graph.update_file(repo / "app" / "session.py")
+        assert repo / "app" / "session.py" in graph.neighbors(repo / "app" / "models.py", k=1)
+
+        # Imports of a removed module fall back to its package
+        assert graph.remove_file(repo / "app" / "models.py")
+        assert graph.neighbors(repo / "app" / "auth.py", k=1) == {repo / "app" / "__init__.py": 1}
+
+    def test_new_module_resolves_existing_imports(self, repo, graph):
+        _write(repo / "late.py", "import app.utils\n")
+        graph.sync(_files(repo))
+        assert graph.neighbors(repo / "late.py", k=1, direction='imports') == {repo / "app" / "__init__.py": 1}
+
+        _write(repo / "app" / "utils.py", "def helper():\n    pass\n")
+        graph.update_file(repo / "app" / "utils.py")
+
+        assert graph.neighbors(repo / "late.py", k=1, direction='imports') == {repo / "app" / "utils.py": 1}
+
+    def test_persists_across_instances(self, repo, graph, tmp_path):
+        graph.sync(_files(repo))
+        graph.close()
+
+        reopened = CodeGraph(str(tmp_path / "graph.sqlite"), repo)
+        try:
+            assert reopened.sync(_files(repo))['indexed'] == 0
+            assert repo / "app" / "views.py" in reopened.neighbors(repo / "app" / "auth.py", k=1)
+        finally:
+            reopened.close()
+
+
+class TestGraphTraversalRetriever:
+    """Test related-code lookups through the retriever."""
+
+    async def test_search_returns_symbol_and_related_files(self, repo, tmp_path):
+        retriever = GraphTraversalRetriever(
+            LRUCache(), TreeSitterParser(), graph_path=tmp_path / "graph.sqlite"
+        )
+
+        matches = await retriever.search("where is login defined", repo)
+
+        assert matches[0].file_path == repo / "app" / "auth.py"
+        assert matches[0].content == "def login(name):"
+        related = {m.file_path: m.metadata['hops'] for m in matches[1:]}
+        assert related[repo / "app" / "models.py"] == 1
+        assert related[repo / "app" / "views.py"] == 1
+        assert related[repo / "cli.py"] == 2
+
+        retriever.on_file_event(repo / "cli.py", "deleted")
+        (repo / "cli.py").unlink()
+        matches = await retriever.search("where is login defined", repo)
+        assert repo / "cli.py" not in {m.file_path for m in matches}
+        retriever.graph.close()
@@ -0,0 +1,71 @@
+"""
+Code Scanner Tests
+
+Tests for serial and process-pool scanning in indexer.CodeScanner.
+"""
+
+from concurrent.futures import Future
+
+import pytest
+
+from torq_console.indexer import code_scanner
+from torq_console.indexer.code_scanner import CodeScanner
+
+
+@pytest.fixture
+def codebase(tmp_path):
+    for i in range(6):
+        (tmp_path / f"mod_{i}.py").write_text(
+            f"def func_{i}():\n    '''Doc {i}.'''\n    return {i}\n\n\nclass Cls{i}:\n    pass\n"
+        )
+    (tmp_path / "broken.py").write_text("def broken(:\n")
+    (tmp_path / "app.js").write_text("function x() {}\n")
+    return tmp_path
+
+
+def _key(structure):
+    return (structure.get('type', 'file'), structure.get('name'), structure.get('relative_path'))
+
+
+class TestParallelScanning:
+    """Test that the process pool produces the same structures as a serial scan."""
+
+    def test_parallel_matches_serial(self, codebase):
+        serial = CodeScanner(str(codebase)).scan_codebase(workers=1)
+
+        scanner = CodeScanner(str(codebase))
+        batches = list(scanner.iter_structures(workers=2, files_per_task=2))
+
+        parallel = [s for batch in batches for s in batch]
+        assert sorted(map(_key, parallel)) == sorted(map(_key, serial))
+        assert len(batches) > 2  # streamed in several batches
+        assert scanner.get_stats()['functions_found'] == 6
+        assert scanner.get_stats()['classes_found'] == 6
+
+    def test_file_structures_stream_first(self, codebase):
+        first = next(CodeScanner(str(codebase)).iter_structures(workers=2))
+        assert {s['relative_path'] for s in first} >= {"app.js", "mod_0.py"}
+
+    def test_parses_submitted_before_first_batch(self, codebase, monkeypatch):
+        submitted = []
+
+        class RecordingExecutor:
+            def __init__(self, max_workers):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def submit(self, fn, chunk):
+                submitted.append(chunk)
+                future = Future()
+                future.set_result(fn(chunk))
+                return future
+
+        monkeypatch.setattr(code_scanner, 'ProcessPoolExecutor', RecordingExecutor)
+        batches = CodeScanner(str(codebase)).iter_structures(workers=2, files_per_task=2)
+        next(batches)
+        assert sum(len(chunk) for chunk in submitted) == 7
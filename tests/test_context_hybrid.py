@@ -0,0 +1,148 @@
+"""
+Hybrid Context Retrieval Tests
+
+Tests for reciprocal-rank fusion of keyword, semantic and graph retrievers
+in core.context_manager.ContextManager.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from torq_console.core.context_manager import ContextManager, ContextMatch, SemanticRetriever, LRUCache
+
+
+class FakeRetriever:
+    """Retriever returning fixed matches after an optional delay."""
+
+    def __init__(self, matches, delay=0.0, error=None):
+        self.matches = matches
+        self.delay = delay
+        self.error = error
+
+    async def search(self, query, root_path, file_patterns=None):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return list(self.matches)
+
+
+def _match(name, line, kind='keyword', content=None, score=1.0):
+    return ContextMatch(
+        pattern='q', match_type=kind, content=content or f"{name}:{line}",
+        file_path=Path(name), line_number=line, score=score
+    )
+
+
+@pytest.fixture
+def manager(tmp_path):
+    cm = ContextManager(None, tmp_path)
+    cm.graph_retriever = FakeRetriever([])
+    return cm
+
+
+class TestHybridSearch:
+    """Test fusion, budgeting and concurrency."""
+
+    async def test_rrf_prefers_matches_found_by_several_retrievers(self, manager):
+        manager.keyword_retriever = FakeRetriever([_match('a.py', 1), _match('b.py', 5)])
+        manager.semantic_retriever = FakeRetriever([
+            _match('c.py', 2, 'semantic'), _match('b.py', 5, 'semantic', content='def b(): ...')
+        ])
+
+        results = await manager.hybrid_search("query")
+
+        assert [(str(m.file_path), m.line_number) for m in results][0] == ('b.py', 5)
+        assert results[0].content == 'def b(): ...'
+        assert results[0].metadata['rrf_ranks'] == {'keyword': 2, 'semantic': 2}
+        assert results[0].score == pytest.approx(2 / 62)
+
+    async def test_token_budget_limits_context(self, manager):
+        manager.keyword_retriever = FakeRetriever(
+            [_match(f'f{i}.py', 1, content='x' * 400) for i in range(10)]
+        )
+        manager.semantic_retriever = FakeRetriever([])
+
+        results = await manager.hybrid_search("query", token_budget=250)
+
+        assert len(results) == 2
+
+    async def test_retrievers_run_concurrently(self, manager):
+        manager.keyword_retriever = FakeRetriever([_match('a.py', 1)], delay=0.2)
+        manager.semantic_retriever = FakeRetriever([_match('b.py', 1, 'semantic')], delay=0.2)
+        manager.graph_retriever = FakeRetriever([], delay=0.2)
+
+        start = time.perf_counter()
+        results = await manager.hybrid_search("query")
+
+        assert time.perf_counter() - start < 0.5
+        assert len(results) == 2
+
+    async def test_slow_retriever_is_left_out(self, manager):
+        manager.retriever_timeout = 0.1
+        manager.keyword_retriever = FakeRetriever([_match('a.py', 1)])
+        manager.semantic_retriever = FakeRetriever([_match('b.py', 1, 'semantic')], delay=5.0)
+
+        start = time.perf_counter()
+        results = await manager.hybrid_search("query")
+
+        assert time.perf_counter() - start < 1.0
+        assert [str(m.file_path) for m in results] == ['a.py']
+
+    async def test_failing_retriever_is_skipped(self, manager):
+        manager.keyword_retriever = FakeRetriever([_match('a.py', 1)])
+        manager.semantic_retriever = FakeRetriever([], error=RuntimeError("model missing"))
+
+        results = await manager.hybrid_search("query")
+
+        assert [str(m.file_path) for m in results] == ['a.py']
+
+    async def test_mixed_context_uses_hybrid_path(self, manager):
+        manager.keyword_retriever = FakeRetriever([_match('a.py', 1)])
+        manager.semantic_retriever = FakeRetriever([_match('b.py', 3, 'semantic')])
+
+        results = await manager.parse_and_retrieve("how does login work", "mixed")
+
+        assert {str(m.file_path) for m in results['general']} == {'a.py', 'b.py'}
+
+
+class FakeSemanticSearch:
+    """Stand-in for indexer.SemanticSearch."""
+
+    def __init__(self):
+        self.indexed = False
+
+    def index_codebase(self):
+        self.indexed = True
+
+    def search(self, query, k=10):
+        return [{
+            'type': 'function', 'name': 'login', 'file': '/repo/auth.py', 'line': 3,
+            'code': 'def login(): ...', 'relevance_score': 0.8, 'distance': 0.25
+        }]
+
+
+class TestSemanticRetriever:
+    """Test the adapter over indexer.SemanticSearch."""
+
+    async def test_disabled_without_backend(self, tmp_path):
+        assert await SemanticRetriever(LRUCache()).search("login", tmp_path) == []
+
+    async def test_converts_results_and_indexes_in_background(self, tmp_path):
+        backend = FakeSemanticSearch()
+        retriever = SemanticRetriever(LRUCache(), backend)
+
+        # The first search starts indexing instead of waiting for it
+        assert await retriever.search("login", tmp_path) == []
+        await retriever._index_task
+        assert backend.indexed
+
+        matches = await retriever.search("login", tmp_path)
+
+        assert matches[0].match_type == 'semantic'
+        assert matches[0].file_path == Path('/repo/auth.py')
+        assert matches[0].line_number == 3
+        assert matches[0].content == 'def login(): ...'
+        assert matches[0].score == 0.8
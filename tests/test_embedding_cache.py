@@ -0,0 +1,100 @@
+"""
+Embedding Cache Tests
+
+Tests for the persistent (model_name, sha256(text)) embedding cache used by
+indexer.EmbeddingGenerator.
+"""
+
+import numpy as np
+import pytest
+
+from torq_console.indexer.embedding_cache import EmbeddingCache
+from torq_console.indexer.embeddings import EmbeddingGenerator
+
+
+class FakeModel:
+    """Stand-in for SentenceTransformer that records every encoded text."""
+
+    max_seq_length = 256
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, batch_size=100, show_progress_bar=False, convert_to_numpy=True):
+        self.encoded.extend(texts)
+        return np.array([[len(t), sum(map(ord, t)) % 97, 1.0] for t in texts], dtype='float32')
+
+
+@pytest.fixture
+def generator(tmp_path):
+    gen = EmbeddingGenerator(cache=EmbeddingCache(str(tmp_path / "cache.sqlite")))
+    gen.model = FakeModel()
+    return gen
+
+
+class TestEmbeddingCache:
+    """Test cache hits, misses and eviction."""
+
+    def test_cached_texts_skip_model(self, generator):
+        first = generator.generate_embeddings(["alpha", "beta"])
+        generator.model.encoded.clear()
+
+        second = generator.generate_embeddings(["beta", "gamma", "alpha"])
+
+        assert generator.model.encoded == ["gamma"]
+        np.testing.assert_array_equal(second[0], first[1])
+        np.testing.assert_array_equal(second[2], first[0])
+
+    def test_fully_cached_batch_never_loads_model(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path / "cache.sqlite"))
+        warm = EmbeddingGenerator(cache=cache)
+        warm.model = FakeModel()
+        expected = warm.generate_embeddings(["x", "y"])
+        cache.close()
+
+        cold = EmbeddingGenerator(cache=EmbeddingCache(str(tmp_path / "cache.sqlite")))
+        # model stays None: _load_model() would try to import sentence-transformers
+        np.testing.assert_array_equal(cold.generate_embeddings(["y", "x"]), expected[::-1])
+        assert cold.model is None
+
+    def test_keys_include_model_name(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path / "cache.sqlite"))
+        cache.put_many("model-a", ["text"], np.ones((1, 3), dtype='float32'))
+        assert cache.get_many("model-b", ["text"]) == {}
+        assert 0 in cache.get_many("model-a", ["text"])
+
+    def test_eviction_bounds_size(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path / "cache.sqlite"), max_entries=10)
+        texts = [f"t{i}" for i in range(25)]
+        for text in texts:
+            cache.put_many("m", [text], np.zeros((1, 3), dtype='float32'))
+
+        stats = cache.get_stats()
+        assert stats['entries'] <= 10
+        assert stats['evictions'] >= 15
+        # Most recent entries survive
+        assert 0 in cache.get_many("m", ["t24"])
+        assert cache.get_many("m", ["t0"]) == {}
+
+    def test_hits_do_not_write(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path / "cache.sqlite"))
+        cache.put_many("m", ["a", "b"], np.zeros((2, 3), dtype='float32'))
+        changes = cache._conn.total_changes
+
+        assert len(cache.get_many("m", ["a", "b"])) == 2
+        assert cache._conn.total_changes == changes
+
+    def test_buffered_hits_protect_from_eviction(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path / "cache.sqlite"), max_entries=10)
+        for i in range(10):
+            cache.put_many("m", [f"t{i}"], np.zeros((1, 3), dtype='float32'))
+        assert 0 in cache.get_many("m", ["t0"])
+
+        cache.put_many("m", ["t10"], np.zeros((1, 3), dtype='float32'))
+        assert 0 in cache.get_many("m", ["t0"])
+        assert cache.get_many("m", ["t1"]) == {}
+
+    def test_uncached_generation_skips_cache(self, generator):
+        generator.generate_single_embedding("query", use_cache=False)
+        assert generator.cache.get_stats()['entries'] == 0
+        assert generator.cache.get_stats()['misses'] == 0
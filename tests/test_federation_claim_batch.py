@@ -0,0 +1,118 @@
+"""
+Federation Claim Batch Tests
+
+Tests for simulator.claim_batch.ClaimBatch and the vectorised round and
+simulation metrics built on it.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from torq_console.layer12.federation.simulator.claim_batch import (
+    ClaimBatch,
+    NodeIndex,
+    herfindahl_index,
+    normalized_entropy,
+    top_shares,
+)
+from torq_console.layer12.federation.simulator.executor_async import AsyncFederationSimulationExecutor
+from torq_console.layer12.federation.simulator.metrics import (
+    ContradictionRetentionCalculator,
+    DomainLeadershipBalanceCalculator,
+    MinorityViewpointSurvivalCalculator,
+    TrustDriftCalculator,
+)
+from torq_console.layer12.federation.simulator.models import (
+    Domain,
+    NodeBehaviorProfile,
+    SimulatedClaim,
+    SimulatedNode,
+    Stance,
+)
+
+
+def claim(i, source, domain=Domain.TECHNICAL, stance=Stance.SUPPORT):
+    return SimulatedClaim(f"c{i}", source, domain, stance, 0.5, 0.5, "", datetime.utcnow())
+
+
+def executor():
+    # Metric helpers only; skip processor and safeguard setup
+    return AsyncFederationSimulationExecutor.__new__(AsyncFederationSimulationExecutor)
+
+
+class TestClaimBatch:
+    """Columns and counts."""
+
+    def test_columns_follow_shared_node_index(self):
+        nodes = NodeIndex(["a", "b"])
+        first = ClaimBatch.from_claims([claim(0, "b"), claim(1, "c")], accepted=[True, False], nodes=nodes)
+        second = ClaimBatch.from_claims([claim(2, "a")], nodes=nodes)
+
+        assert nodes.ids == ["a", "b", "c"]
+        assert first.node_index.tolist() == [1, 2]
+        combined = ClaimBatch.concat([first, second])
+        assert combined.node_counts.tolist() == [1, 1, 1]
+        assert combined.node_accepted_counts.tolist() == [1, 1, 0]
+
+    def test_metric_helpers(self):
+        counts = np.array([3, 1, 0])
+        assert herfindahl_index(counts) == pytest.approx(0.625)
+        assert top_shares(counts) == pytest.approx((0.75, 1.0))
+        assert top_shares(np.array([0, 4])) == (1.0, 1.0)
+        assert normalized_entropy(np.array([2, 2, 0])) == 1.0
+        assert normalized_entropy(np.array([5, 0])) == 0.0
+
+
+class TestRoundMetrics:
+    """AsyncFederationSimulationExecutor per-round metrics."""
+
+    def test_concentration_metrics(self):
+        claims = [claim(0, "a"), claim(1, "a"), claim(2, "b")]
+        batch = ClaimBatch.from_claims(claims)
+        sim = executor()
+
+        assert sim._calculate_hhi(batch) == pytest.approx(5 / 9)
+        assert sim._calculate_top_node_shares(batch) == pytest.approx((2 / 3, 1.0))
+        assert sim._calculate_gini_coefficient(batch) == pytest.approx(5 / 6)
+        assert sim._calculate_gini_coefficient(ClaimBatch.from_claims([])) == 0.0
+
+    async def test_trust_update_uses_per_node_acceptance(self):
+        nodes = [SimulatedNode(node_id, NodeBehaviorProfile(baseline_trust=0.5, trust_volatility=0.0))
+                 for node_id in ("a", "b", "idle")]
+        batch = ClaimBatch.from_claims([claim(0, "a"), claim(1, "b")], accepted=[True, False],
+                                       nodes=NodeIndex.from_nodes(nodes))
+        await executor()._update_node_trust(nodes, batch)
+
+        assert nodes[0].state.current_trust == pytest.approx(0.525)
+        assert nodes[1].state.current_trust == pytest.approx(0.475)
+        assert nodes[2].state.trust_observations == []
+
+
+class TestSimulationMetrics:
+    """metrics.py calculators over cached batches."""
+
+    def test_contradictions_are_counted_within_round_and_domain(self):
+        rounds = [
+            {"accepted_claims": [claim(0, "a", stance=Stance.SUPPORT),
+                                 claim(1, "b", stance=Stance.OPPOSE),
+                                 claim(2, "c", stance=Stance.NEUTRAL),
+                                 claim(3, "d", Domain.FINANCIAL, Stance.CONDITIONAL)]},
+            {"accepted_claims": [claim(4, "a", Domain.FINANCIAL, Stance.SUPPORT)]},
+        ]
+        score = ContradictionRetentionCalculator("c").calculate({"rounds": rounds})
+        assert score == pytest.approx(2 / 5)
+
+    def test_minority_and_domain_balance(self):
+        accepted = [claim(i, "a") for i in range(9)] + [claim(9, "b", stance=Stance.OPPOSE)]
+        data = {"rounds": [{"accepted_claims": accepted}]}
+
+        assert MinorityViewpointSurvivalCalculator("m").calculate(data) == 1.0
+        assert DomainLeadershipBalanceCalculator("d").calculate(data) == pytest.approx(1 - 0.82)
+
+    def test_trust_drift_uses_first_and_last_observation(self):
+        rounds = [{"node_trust_scores": {"a": 0.5}},
+                  {"node_trust_scores": {"b": 0.9}},
+                  {"node_trust_scores": {"a": 0.7, "b": 0.8}}]
+        assert TrustDriftCalculator("t").calculate({"rounds": rounds}) == pytest.approx(1 - 0.15)
@@ -0,0 +1,100 @@
+"""
+Federation Sweep Tests
+
+Tests for simulator.sweep: sweep construction, deterministic seeding
+across worker processes, streamed results with resume, and aggregation.
+"""
+
+import json
+
+import pytest
+
+from torq_console.layer12.federation.simulator.sweep import (
+    SweepRun,
+    aggregate_records,
+    build_sweep,
+    execute_run,
+    load_records,
+    parse_seeds,
+    run_sweep,
+)
+
+
+def ok_record(scenario, seed, health, safeguards="simulation"):
+    run = SweepRun(scenario, seed, safeguards)
+    return {"run_id": run.run_id, "scenario": scenario, "seed": seed, "safeguards": safeguards,
+            "status": "ok", "success_rate": 0.5, "metrics": {"overall_health_index": health},
+            "predictive_metrics": {"fcri": health / 10, "fcri_status": "healthy"}}
+
+
+class TestSweepRuns:
+    """Run construction and seeding."""
+
+    def test_build_sweep_is_cross_product(self):
+        runs = build_sweep(["baseline_healthy_exchange", "semantic_monoculture"], [0, 1],
+                           ["simulation", "none"])
+        assert len(runs) == 8
+        assert len({run.run_id for run in runs}) == 8
+
+    def test_unknown_names_are_rejected(self):
+        with pytest.raises(ValueError, match="Unknown scenario"):
+            build_sweep(["nope"], [0])
+        with pytest.raises(ValueError, match="Unknown safeguard config"):
+            build_sweep(["baseline_healthy_exchange"], [0], ["strict"])
+
+    def test_rng_seed_is_shared_across_safeguard_configs(self):
+        assert SweepRun("a", 1, "none").rng_seed == SweepRun("a", 1, "production").rng_seed
+        assert SweepRun("a", 1).rng_seed != SweepRun("a", 2).rng_seed
+
+    def test_parse_seeds(self):
+        assert parse_seeds(["0-2", "7"]) == [0, 1, 2, 7]
+
+    def test_failed_run_becomes_error_record(self):
+        record = execute_run(SweepRun("nope", 0))
+        assert record["status"] == "error"
+        assert "Unknown scenario" in record["error"]
+
+
+class TestRunSweep:
+    """Process pool execution, streaming and resume."""
+
+    def test_pool_results_match_in_process_results(self, tmp_path):
+        runs = build_sweep(["insight_flooding_attack"], [0, 1, 2])
+        serial = run_sweep(runs, tmp_path / "serial.jsonl", max_workers=1)
+        pooled = run_sweep(runs, tmp_path / "pooled.jsonl", max_workers=2)
+
+        assert serial.completed == pooled.completed == 3
+        metrics = [{r: rec["metrics"] for r, rec in load_records(tmp_path / name).items()}
+                   for name in ("serial.jsonl", "pooled.jsonl")]
+        assert metrics[0] == metrics[1]
+
+    def test_resume_skips_finished_runs_and_drops_partial_line(self, tmp_path):
+        path = tmp_path / "sweep.jsonl"
+        runs = build_sweep(["baseline_healthy_exchange"], [0, 1, 2])
+        done = execute_run(runs[0])
+        path.write_text(json.dumps(done) + "\n" + '{"run_id": "baseline')
+
+        result = run_sweep(runs, path, max_workers=1)
+
+        assert (result.skipped, result.completed) == (1, 2)
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["run_id"] for line in lines] == [run.run_id for run in runs]
+        assert result.aggregates["baseline_healthy_exchange/simulation"]["runs"] == 3
+
+
+class TestAggregation:
+    """Metric distributions per scenario and safeguard config."""
+
+    def test_distributions_and_error_counts(self):
+        records = [ok_record("s", seed, health) for seed, health in enumerate([0.2, 0.4, 0.6])]
+        records.append({"run_id": "s/simulation/seed=9", "scenario": "s", "safeguards": "simulation",
+                        "status": "error", "error": "boom"})
+        group = aggregate_records(records)["s/simulation"]
+
+        health = group["metrics"]["overall_health_index"]
+        assert (group["runs"], group["errors"]) == (3, 1)
+        assert health["mean"] == pytest.approx(0.4)
+        assert health["median"] == pytest.approx(0.4)
+        assert (health["min"], health["max"]) == (0.2, 0.6)
+        assert group["metrics"]["fcri"]["n"] == 3
+        assert group["fcri_status"] == {"healthy": 3}
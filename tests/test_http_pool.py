@@ -0,0 +1,207 @@
+"""
+HTTP Pool Tests
+
+Tests for core.http_pool.HTTPPool against a local stub server: keep-alive
+reuse, per-host connection limits, budgeted retries, metrics, and providers
+sending their requests through the shared pool.
+"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from torq_console.core import http_pool
+from torq_console.core.http_pool import HTTPPool, RetryBudget
+
+
+@pytest.fixture
+async def stub_server():
+    """Local HTTP server; ``state`` lets tests script its behaviour."""
+    state = {"requests": 0, "active": 0, "max_active": 0, "fail_first": 0, "delay": 0.0}
+
+    async def handle(request):
+        state["requests"] += 1
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+        try:
+            if state["delay"]:
+                await asyncio.sleep(state["delay"])
+            if state["requests"] <= state["fail_first"]:
+                return web.Response(status=503, text="overloaded")
+            if request.path == "/v1/chat/completions":
+                return web.json_response({
+                    "choices": [{"message": {"content": "pooled"}}],
+                    "model": "deepseek-chat"
+                })
+            return web.json_response({"ok": True, "path": request.path})
+        finally:
+            state["active"] -= 1
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    state["url"] = f"http://127.0.0.1:{port}"
+    yield state
+    await runner.cleanup()
+
+
+@pytest.fixture
+async def pool():
+    pool = HTTPPool(limit_per_host=2)
+    yield pool
+    await pool.close()
+
+
+class TestPooling:
+    """Connection reuse and limits."""
+
+    async def test_sequential_requests_reuse_one_connection(self, stub_server, pool):
+        for _ in range(5):
+            async with pool.request("GET", stub_server["url"] + "/ping") as response:
+                assert (await response.json())["ok"] is True
+
+        assert pool.connections_created == 1
+        assert pool.connections_reused == 4
+        assert pool.get_stats()["reuse_rate"] == 0.8
+
+    async def test_per_host_limit_caps_concurrent_connections(self, stub_server, pool):
+        stub_server["delay"] = 0.05
+
+        async def fetch():
+            async with pool.request("GET", stub_server["url"] + "/slow") as response:
+                return response.status
+
+        statuses = await asyncio.gather(*(fetch() for _ in range(8)))
+        assert statuses == [200] * 8
+        assert stub_server["max_active"] <= 2
+        assert pool.connections_created <= 2
+
+    async def test_metrics_are_tracked_per_host(self, stub_server, pool):
+        async with pool.request("GET", stub_server["url"] + "/a") as response:
+            await response.read()
+
+        host = stub_server["url"].split("//")[1]
+        stats = pool.get_stats()["hosts"][host]
+        assert stats["requests"] == 1
+        assert stats["in_flight"] == 0
+        assert stats["errors"] == 0
+
+
+class TestRetries:
+    """Retries on overload, limited by method and budget."""
+
+    async def test_get_is_retried_on_503(self, stub_server, pool):
+        stub_server["fail_first"] = 2
+        async with pool.request("GET", stub_server["url"] + "/flaky") as response:
+            assert response.status == 200
+
+        assert stub_server["requests"] == 3
+        assert pool.retries == 2
+
+    async def test_post_is_not_retried_by_default(self, stub_server, pool):
+        stub_server["fail_first"] = 1
+        async with pool.request("POST", stub_server["url"] + "/flaky", json={}) as response:
+            assert response.status == 503
+        assert stub_server["requests"] == 1
+
+    async def test_exhausted_budget_denies_retries(self, stub_server):
+        pool = HTTPPool(retry_budget=RetryBudget(ratio=0.0, min_per_second=0.0))
+        stub_server["fail_first"] = 1
+        try:
+            async with pool.request("GET", stub_server["url"] + "/flaky") as response:
+                assert response.status == 503
+            assert pool.retries == 0
+            assert pool.retries_denied == 1
+        finally:
+            await pool.close()
+
+    async def test_connection_errors_surface_after_retries(self, pool):
+        with pytest.raises(Exception):
+            async with pool.request("GET", "http://127.0.0.1:9/", retries=1):
+                pass
+        assert pool.get_stats()["hosts"]["127.0.0.1:9"]["errors"] == 2
+
+    async def test_invalid_url_releases_in_flight_slot(self, pool):
+        with pytest.raises(Exception):
+            async with pool.request("GET", "ftp://example.invalid/"):
+                pass
+        host = pool.get_stats()["hosts"]["example.invalid"]
+        assert host["in_flight"] == 0
+        assert host["errors"] == 1
+
+
+class TestProvidersUseSharedPool:
+    """Providers send their requests over the shared pool."""
+
+    async def test_deepseek_requests_go_through_pool(self, stub_server, monkeypatch):
+        from torq_console.llm.providers.deepseek import DeepSeekProvider
+
+        monkeypatch.setattr(http_pool, "_shared_pool", None)
+        provider = DeepSeekProvider(api_key="test", base_url=stub_server["url"])
+        try:
+            for _ in range(3):
+                response = await provider._make_request("/v1/chat/completions", {"messages": []})
+                assert response["choices"][0]["message"]["content"] == "pooled"
+
+            stats = http_pool.get_http_pool_stats()
+            assert stats["connections_created"] == 1
+            assert stats["connections_reused"] == 2
+        finally:
+            await http_pool.close_http_pool()
+
+    async def test_research_providers_go_through_pool(self, stub_server, monkeypatch):
+        from torq_console.research.providers import BraveProvider, DuckDuckGoProvider, TavilyProvider
+        from torq_console.research.schema import ResearchQuery
+
+        monkeypatch.setattr(http_pool, "_shared_pool", None)
+        providers = [TavilyProvider(api_key="test"), BraveProvider(api_key="test"), DuckDuckGoProvider()]
+        for provider in providers:
+            provider.base_url = stub_server["url"] + "/search"
+        try:
+            for provider in providers:
+                response = await provider.search(ResearchQuery(query="pooling"))
+                assert "error" not in response.meta
+
+            stats = http_pool.get_http_pool_stats()
+            assert stats["connections_created"] == 1
+            assert stats["connections_reused"] == 2
+        finally:
+            await http_pool.close_http_pool()
+
+    async def test_content_extractor_fetches_through_pool(self, stub_server, monkeypatch):
+        from torq_console.llm.providers.content_synthesis.extractor import ContentExtractor
+
+        monkeypatch.setattr(http_pool, "_shared_pool", None)
+        try:
+            content = await ContentExtractor().extract_from_url(stub_server["url"] + "/page")
+            assert content.extraction_method not in ("failed", "error")
+
+            stats = http_pool.get_http_pool_stats()
+            assert stats["connections_created"] == 1
+            assert stats["hosts"][stub_server["url"].split("//")[1]]["requests"] == 1
+        finally:
+            await http_pool.close_http_pool()
+
+
+class TestHttpxClients:
+    """Shared httpx clients for SDKs."""
+
+    def test_async_client_is_per_event_loop(self):
+        pytest.importorskip("httpx")
+        pool = HTTPPool()
+
+        async def get_clients():
+            return pool.httpx_client(), pool.httpx_client()
+
+        first, again = asyncio.run(get_clients())
+        second, _ = asyncio.run(get_clients())
+
+        assert first is again
+        assert second is not first
+        # Loops that have finished do not keep their clients
+        assert list(pool._httpx_async.values()) == [second]
@@ -0,0 +1,138 @@
+"""
+Incremental Indexing Tests
+
+Tests for file-hash-aware re-indexing in indexer.SemanticSearch.
+"""
+
+import hashlib
+
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from torq_console.indexer.semantic_search import SemanticSearch
+from torq_console.indexer.embeddings import EmbeddingGenerator
+
+
+class CountingEmbedder:
+    """Deterministic hash-based embedder that records how many texts it embeds."""
+
+    embedding_dim = 384
+
+    def __init__(self):
+        self.embedded = 0
+        self._formatter = EmbeddingGenerator()
+
+    def format_code_for_embedding(self, structure):
+        return self._formatter.format_code_for_embedding(structure)
+
+    def generate_embeddings(self, texts, batch_size=100, show_progress=False):
+        self.embedded += len(texts)
+        rows = []
+        for text in texts:
+            seed = int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
+            rows.append(np.random.default_rng(seed).standard_normal(self.embedding_dim))
+        return np.array(rows, dtype='float32')
+
+    def generate_single_embedding(self, text):
+        return self.generate_embeddings([text])[0]
+
+
+@pytest.fixture
+def codebase(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.py").write_text("def alpha():\n    return 1\n")
+    (src / "b.py").write_text("class Beta:\n    pass\n")
+    return src
+
+
+@pytest.fixture
+def search(codebase, tmp_path):
+    s = SemanticSearch(str(codebase), index_path=str(tmp_path / "index"), auto_index=False)
+    s.embedder = CountingEmbedder()
+    s.index_codebase()
+    return s
+
+
+def _names(search):
+    return sorted(d.get('name', d.get('relative_path')) for d in search.vector_store.get_all_documents())
+
+
+class TestIncrementalIndexing:
+    """Test incremental re-indexing."""
+
+    def test_full_index_records_manifest(self, search):
+        assert set(search.file_manifest) == {"a.py", "b.py"}
+        assert all(e['sha256'] for e in search.file_manifest.values())
+
+    def test_unchanged_tree_embeds_nothing(self, search):
+        before = search.embedder.embedded
+        result = search.update_index()
+        assert result == {'added': 0, 'modified': 0, 'deleted': 0, 'unchanged': 2}
+        assert search.embedder.embedded == before
+
+    def test_modified_file_replaces_only_its_vectors(self, search, codebase):
+        before = search.embedder.embedded
+        (codebase / "a.py").write_text("def gamma():\n    return 2\n\n\ndef delta():\n    pass\n")
+
+        result = search.update_index()
+
+        assert result['modified'] == 1
+        # One file-level structure plus two functions
+        assert search.embedder.embedded - before == 3
+        assert _names(search) == ["Beta", "a.py", "b.py", "delta", "gamma"]
+
+    def test_deleted_and_added_files(self, search, codebase):
+        (codebase / "b.py").unlink()
+        (codebase / "c.py").write_text("def charlie():\n    pass\n")
+
+        result = search.update_index()
+
+        assert result['added'] == 1 and result['deleted'] == 1
+        assert "b.py" not in search.file_manifest
+        assert _names(search) == ["a.py", "alpha", "c.py", "charlie"]
+
+    def test_force_reindex_does_not_duplicate(self, search):
+        total = search.vector_store.get_stats()['total_vectors']
+        search.index_codebase(force=True)
+        assert search.vector_store.get_stats()['total_vectors'] == total
+
+    def test_manifest_survives_reload(self, search, codebase, tmp_path):
+        reloaded = SemanticSearch(str(codebase), index_path=str(tmp_path / "index"), auto_index=False)
+        reloaded.embedder = CountingEmbedder()
+        assert reloaded.file_manifest == search.file_manifest
+        assert reloaded.update_index()['unchanged'] == 2
+        assert reloaded.embedder.embedded == 0
+
+    def test_file_monitor_events(self, search, codebase):
+        from torq_console.utils.file_monitor import FileMonitor
+
+        monitor = FileMonitor(codebase)
+        search.watch(monitor)
+
+        (codebase / "a.py").write_text("def omega():\n    pass\n")
+        monitor.notify(codebase / "a.py", "modified")
+        assert "omega" in _names(search)
+
+        (codebase / "a.py").unlink()
+        monitor.notify(codebase / "a.py", "deleted")
+        assert _names(search) == ["Beta", "b.py"]
+
+    def test_absolute_events_with_relative_root(self, codebase, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        search = SemanticSearch("src", index_path=str(tmp_path / "index"), auto_index=False)
+        search.embedder = CountingEmbedder()
+        search.index_codebase()
+
+        # Watchdog reports absolute paths
+        (codebase / "a.py").write_text("def omega():\n    pass\n")
+        assert search.update_files([codebase / "a.py"]) == {'updated': 1, 'deleted': 0}
+        assert "omega" in _names(search)
+        assert search.file_manifest["a.py"]['sha256'] == hashlib.sha256(
+            (codebase / "a.py").read_bytes()).hexdigest()
+
+        (codebase / "b.py").unlink()
+        assert search.update_files([str(codebase / "b.py")]) == {'updated': 0, 'deleted': 1}
+        assert set(search.file_manifest) == {"a.py"}
@@ -0,0 +1,218 @@
+"""
+Keyword Index Tests
+
+Tests for the persistent inverted index behind
+core.context_manager.KeywordRetriever.
+"""
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+from torq_console.core.context_manager import KeywordRetriever, LRUCache
+from torq_console.core.keyword_index import KeywordIndex, tokenize
+from torq_console.utils.file_monitor import FileMonitor
+
+
+def _write(path: Path, text: str, mtime_offset: int = 0):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+    if mtime_offset:
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + mtime_offset))
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    _write(root / "auth.py", "def login(user):\n    return check_password(user)\n")
+    _write(root / "db.py", "def connect():\n    return open_database()\n")
+    return root
+
+
+@pytest.fixture
+def index(repo, tmp_path):
+    idx = KeywordIndex(str(tmp_path / "keywords.sqlite"), repo)
+    yield idx
+    idx.close()
+
+
+class TestKeywordIndex:
+    """Test postings, incremental sync and persistence."""
+
+    def test_tokenize_skips_short_words(self):
+        assert tokenize("def fn(a, bb): return Foo_Bar") == ["def", "return", "foo_bar"]
+
+    def test_lookup_returns_line_and_token_positions(self, repo, index):
+        index.sync([repo / "auth.py", repo / "db.py"])
+
+        postings = index.lookup(["check_password", "connect"])
+
+        assert postings[repo / "auth.py"] == {"check_password": [(2, 1)]}
+        assert postings[repo / "db.py"] == {"connect": [(1, 1)]}
+
+    def test_sync_only_reads_changed_files(self, repo, index):
+        files = [repo / "auth.py", repo / "db.py"]
+        assert index.sync(files)["indexed"] == 2
+
+        _write(repo / "db.py", "def connect():\n    return open_pool()\n", mtime_offset=5)
+        stats = index.sync(files)
+
+        assert stats == {"indexed": 1, "removed": 0, "unchanged": 1}
+        assert index.lookup(["open_database"]) == {}
+        assert repo / "db.py" in index.lookup(["open_pool"])
+
+    def test_sync_prunes_missing_files(self, repo, index):
+        index.sync([repo / "auth.py", repo / "db.py"])
+
+        stats = index.sync([repo / "auth.py"])
+
+        assert stats["removed"] == 1
+        assert index.lookup(["connect"]) == {}
+
+    def test_no_file_cap(self, repo, index):
+        files = [repo / f"mod_{i}.py" for i in range(600)]
+        for i, path in enumerate(files):
+            _write(path, f"value_{i} = shared_symbol\n")
+
+        index.sync(files)
+
+        assert len(index.lookup(["shared_symbol"])) == 600
+        assert repo / "mod_599.py" in index.lookup(["value_599"])
+
+    def test_update_and_remove_file(self, repo, index):
+        index.sync([repo / "auth.py"])
+
+        _write(repo / "new.py", "token_refresh = True\n")
+        assert index.update_file(repo / "new.py")
+        assert not index.update_file(repo / "new.py")
+        assert repo / "new.py" in index.lookup(["token_refresh"])
+
+        assert index.remove_file(repo / "new.py")
+        assert index.lookup(["token_refresh"]) == {}
+
+    def test_persists_across_instances(self, repo, index, tmp_path):
+        index.sync([repo / "auth.py", repo / "db.py"])
+        index.close()
+
+        reopened = KeywordIndex(str(tmp_path / "keywords.sqlite"), repo)
+        try:
+            assert not reopened.is_empty()
+            assert repo / "auth.py" in reopened.lookup(["login"])
+            assert reopened.sync([repo / "auth.py", repo / "db.py"])["indexed"] == 0
+        finally:
+            reopened.close()
+
+
+class TestKeywordRanking:
+    """Test BM25F scoring with phrase and proximity boosts."""
+
+    def test_rare_terms_outrank_common_terms(self, repo, index):
+        _write(repo / "common.py", "\n".join(f"value = config_{i}" for i in range(20)) + "\n")
+        _write(repo / "rare.py", "value = rate_limiter\n")
+        index.sync([repo / "common.py", repo / "rare.py"])
+
+        results = index.search(["value", "rate_limiter"])
+
+        assert results[0]['file_path'] == repo / "rare.py"
+        assert results[0]['matched_terms'] == ["value", "rate_limiter"]
+
+    def test_phrase_and_proximity_boost(self, repo, index):
+        _write(repo / "a.py", "retry connection pool = 1\n")
+        _write(repo / "b.py", "connection = other_thing_here_and_more retry pool\n")
+        index.sync([repo / "a.py", repo / "b.py"])
+
+        results = index.search(["retry", "connection", "pool"])
+
+        assert [r['file_path'] for r in results] == [repo / "a.py", repo / "b.py"]
+        assert results[0]['phrase'] == 1.0
+        assert results[0]['proximity'] == 1.0
+        assert results[1]['phrase'] == 0.0
+        assert results[1]['proximity'] < 1.0
+
+    def test_path_field_boosts_matching_files(self, repo, index):
+        _write(repo / "billing" / "invoice.py", "total = compute()\n")
+        _write(repo / "report.py", "total = compute()\n")
+        index.sync([repo / "billing" / "invoice.py", repo / "report.py"])
+
+        results = index.search(["invoice", "total"])
+
+        assert results[0]['file_path'] == repo / "billing" / "invoice.py"
+
+    def test_snippets_come_from_index(self, repo, index):
+        index.sync([repo / "auth.py"])
+        (repo / "auth.py").unlink()
+
+        results = index.search(["check_password"])
+
+        assert results[0]['content'] == "return check_password(user)"
+        assert results[0]['line_number'] == 2
+
+    def test_max_per_file_and_filter(self, repo, index):
+        _write(repo / "many.py", "shared_name\n" * 15)
+        index.sync([repo / "auth.py", repo / "many.py"])
+
+        assert len(index.search(["shared_name"], max_per_file=10)) == 10
+        assert index.search(["shared_name"], file_filter=lambda p: p.name != "many.py") == []
+
+
+class TestKeywordRetrieverIndex:
+    """Test KeywordRetriever on top of the persistent index."""
+
+    async def test_search_uses_persisted_index(self, repo, tmp_path):
+        index_path = tmp_path / "keywords.sqlite"
+        retriever = KeywordRetriever(LRUCache(), index_path=index_path)
+        matches = await retriever.search("check_password", repo)
+        assert [(m.file_path, m.line_number) for m in matches] == [(repo / "auth.py", 2)]
+        retriever.index.close()
+
+        # A fresh retriever answers from disk and refreshes in the background
+        restarted = KeywordRetriever(LRUCache(), index_path=index_path)
+        matches = await restarted.search("open_database", repo)
+        assert [m.file_path for m in matches] == [repo / "db.py"]
+        await restarted._refresh_task
+        restarted.index.close()
+
+    async def test_file_event_updates_results(self, repo, tmp_path):
+        retriever = KeywordRetriever(LRUCache(), index_path=tmp_path / "keywords.sqlite")
+        assert await retriever.search("session_token", repo) == []
+
+        _write(repo / "session.py", "session_token = issue()\n")
+        retriever.on_file_event(repo / "session.py", "created")
+        matches = await retriever.search("session_token", repo)
+        assert [m.file_path for m in matches] == [repo / "session.py"]
+
+        (repo / "session.py").unlink()
+        retriever.on_file_event(repo / "session.py", "deleted")
+        assert await retriever.search("session_token", repo) == []
+        retriever.index.close()
+
+    async def test_file_monitor_edits_reach_index(self, repo, tmp_path):
+        pytest.importorskip("watchdog")
+        retriever = KeywordRetriever(LRUCache(), index_path=tmp_path / "keywords.sqlite")
+        assert await retriever.search("monitored_symbol", repo) == []
+
+        monitor = FileMonitor(repo)
+        monitor.add_callback(retriever.on_file_event)
+        await monitor.start()
+        try:
+            _write(repo / "db.py", "def connect():\n    return monitored_symbol()\n")
+            matches = []
+            for _ in range(50):
+                await asyncio.sleep(0.1)
+                matches = await retriever.search("monitored_symbol", repo)
+                if matches:
+                    break
+            assert [m.file_path for m in matches] == [repo / "db.py"]
+        finally:
+            await monitor.stop()
+            retriever.index.close()
+
+    async def test_ignored_directories_are_skipped(self, repo, tmp_path):
+        _write(repo / "node_modules" / "lib.js", "const vendored_symbol = 1;\n")
+        retriever = KeywordRetriever(LRUCache(), index_path=tmp_path / "keywords.sqlite")
+
+        assert await retriever.search("vendored_symbol", repo) == []
+        retriever.index.close()
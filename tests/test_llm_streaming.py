@@ -0,0 +1,162 @@
+"""
+LLM Streaming Tests
+
+Tests for LLMManager.stream_chat(): chunk delivery, fallback before the
+first chunk, no splicing after it, backpressure and cancellation.
+"""
+
+import asyncio
+
+import pytest
+
+from torq_console.generation_meta import GenerationMeta
+from torq_console.llm.manager import LLMManager
+from torq_console.llm.providers.base import MockLLMProvider, iterate_in_thread
+from torq_console.ui.web_ai_fix import AIResponseError, ProviderError
+
+
+class StreamingProvider:
+    """Yields the given chunks, optionally failing after ``fail_after`` of them."""
+
+    def __init__(self, chunks, fail_after=None, error=None, delay=0.0):
+        self.chunks = chunks
+        self.fail_after = fail_after
+        self.error = error or ProviderError("stream broke")
+        self.delay = delay
+        self.produced = 0
+        self.closed = False
+        self.model = "fake"
+
+    async def stream_chat(self, messages, system_message=None, **kwargs):
+        try:
+            for i, chunk in enumerate(self.chunks):
+                if i == self.fail_after:
+                    raise self.error
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                self.produced += 1
+                yield chunk
+            if self.fail_after is not None and self.fail_after >= len(self.chunks):
+                raise self.error
+        finally:
+            self.closed = True
+
+
+@pytest.fixture
+def manager():
+    llm = LLMManager()
+    llm.providers = {}
+    return llm
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestStreamChat:
+    """Chunk delivery and provider fallback."""
+
+    async def test_chunks_arrive_in_order(self, manager):
+        manager.providers = {"deepseek": StreamingProvider(["Hel", "lo", "!"])}
+        meta = GenerationMeta()
+        chunks = await _collect(manager.stream_chat("deepseek", [], meta=meta))
+
+        assert chunks == ["Hel", "lo", "!"]
+        assert meta.provider == "deepseek"
+        assert meta.fallback_used is False
+
+    async def test_failure_before_first_chunk_falls_back(self, manager):
+        manager.providers = {
+            "claude": StreamingProvider(["never"], fail_after=0),
+            "deepseek": StreamingProvider(["from ", "deepseek"]),
+        }
+        meta = GenerationMeta()
+        chunks = await _collect(manager.stream_chat("claude", [], meta=meta))
+
+        assert chunks == ["from ", "deepseek"]
+        assert meta.provider == "deepseek"
+        assert meta.fallback_used is True
+        assert meta.fallback_reason.startswith("provider_error")
+
+    async def test_slow_first_chunk_falls_back(self, manager):
+        manager.providers = {
+            "claude": StreamingProvider(["late"], delay=1.0),
+            "ollama": StreamingProvider(["local"]),
+        }
+        chunks = await _collect(manager.stream_chat("claude", [], first_chunk_timeout=0.05))
+        assert chunks == ["local"]
+        assert manager.providers["claude"].closed
+
+    async def test_failure_after_first_chunk_is_raised(self, manager):
+        backup = StreamingProvider(["backup"])
+        manager.providers = {
+            "claude": StreamingProvider(["partial", "more"], fail_after=1),
+            "deepseek": backup,
+        }
+        received = []
+        with pytest.raises(ProviderError):
+            async for chunk in manager.stream_chat("claude", []):
+                received.append(chunk)
+
+        assert received == ["partial"]
+        assert backup.produced == 0
+
+    async def test_policy_errors_do_not_fall_back(self, manager):
+        backup = StreamingProvider(["backup"])
+        manager.providers = {
+            "claude": StreamingProvider(["x"], fail_after=0, error=AIResponseError("policy")),
+            "deepseek": backup,
+        }
+        with pytest.raises(AIResponseError):
+            await _collect(manager.stream_chat("claude", []))
+        assert backup.produced == 0
+
+    async def test_all_providers_failing_raises_provider_error(self, manager):
+        manager.providers = {"claude": StreamingProvider(["x"], fail_after=0)}
+        with pytest.raises(ProviderError, match="All providers failed"):
+            await _collect(manager.stream_chat("claude", []))
+
+    async def test_non_streaming_provider_yields_whole_response(self, manager):
+        manager.providers = {"mock": MockLLMProvider()}
+        chunks = await _collect(manager.stream_chat("mock", [{"role": "user", "content": "hi"}]))
+        assert chunks == ["Mock chat response to: hi..."]
+
+
+class TestBackpressureAndCancellation:
+    """The provider never runs far ahead of the caller and stops when it leaves."""
+
+    async def test_provider_read_ahead_is_bounded(self, manager):
+        provider = StreamingProvider([str(i) for i in range(100)])
+        manager.providers = {"deepseek": provider}
+
+        stream = manager.stream_chat("deepseek", [], max_buffer=4)
+        assert await stream.__anext__() == "0"
+        await asyncio.sleep(0.05)
+        # One chunk consumed, four queued, one waiting on the full queue
+        assert provider.produced <= 6
+        await stream.aclose()
+
+    async def test_closing_the_stream_cancels_the_provider(self, manager):
+        provider = StreamingProvider([str(i) for i in range(100)], delay=0.01)
+        manager.providers = {"deepseek": provider}
+
+        async for chunk in manager.stream_chat("deepseek", []):
+            if chunk == "2":
+                break
+        await asyncio.sleep(0.05)
+        assert provider.closed
+        assert provider.produced < 10
+
+    async def test_thread_backed_stream_stops_when_closed(self):
+        pulled = []
+
+        def blocking():
+            for i in range(1000):
+                pulled.append(i)
+                yield i
+
+        stream = iterate_in_thread(blocking, max_buffer=2)
+        assert await stream.__anext__() == 0
+        await stream.aclose()
+        await asyncio.sleep(0.05)
+        assert len(pulled) < 10
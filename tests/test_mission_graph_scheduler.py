@@ -0,0 +1,184 @@
+"""
+Mission Graph Scheduler Tests
+
+Tests for MissionGraphScheduler's ready-queue dispatch: concurrent
+independent nodes, the parallelism cap, per-agent-type pools, dependency
+counters and failure handling, against an in-memory Supabase stand-in.
+"""
+
+import asyncio
+import time
+
+from torq_console.mission_graph.models import (
+    AgentType,
+    Mission,
+    MissionGraph,
+    MissionNode,
+    NodeStatus,
+    NodeType,
+)
+from torq_console.mission_graph.scheduler import MissionGraphScheduler, SchedulerState
+
+
+class FakeQuery:
+    """Chainable subset of the supabase-py query builder."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.filters = []
+        self.action = ("select", None)
+        self.max_rows = None
+
+    def select(self, *_):
+        return self
+
+    def update(self, values):
+        self.action = ("update", values)
+        return self
+
+    def insert(self, row):
+        self.action = ("insert", row)
+        return self
+
+    def eq(self, key, value):
+        self.filters.append(lambda row: row.get(key) == value)
+        return self
+
+    def in_(self, key, values):
+        self.filters.append(lambda row: row.get(key) in values)
+        return self
+
+    def limit(self, n):
+        self.max_rows = n
+        return self
+
+    def execute(self):
+        kind, payload = self.action
+        if kind == "insert":
+            self.rows.append(dict(payload))
+            return type("Result", (), {"data": [payload]})
+        matched = [row for row in self.rows if all(f(row) for f in self.filters)]
+        if kind == "update":
+            for row in matched:
+                row.update(payload)
+        return type("Result", (), {"data": matched[:self.max_rows]})
+
+
+class FakeSupabase:
+    def __init__(self):
+        self.tables = {}
+
+    def table(self, name):
+        return FakeQuery(self.tables.setdefault(name, []))
+
+
+class SleepingExecutor:
+    """Agent executor that sleeps per node and tracks concurrency."""
+
+    def __init__(self, delays=None, default_delay=0.02):
+        self.delays = delays or {}
+        self.default_delay = default_delay
+        self.events = []
+        self.running = 0
+        self.max_running = 0
+
+    async def execute(self, node_id, **kwargs):
+        self.events.append(("start", node_id))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(node_id, self.default_delay))
+        finally:
+            self.running -= 1
+        self.events.append(("end", node_id))
+        return {"output": {"done": node_id}, "confidence": 0.9}
+
+
+def node(node_id, *deps, agent_type=AgentType.SPECIALIST):
+    return MissionNode(id=node_id, graph_id="g", node_type=NodeType.TASK, title=node_id,
+                       agent_type=agent_type, depends_on=list(deps))
+
+
+def setup(nodes, **scheduler_kwargs):
+    supabase = FakeSupabase()
+    supabase.tables["missions"] = [{"id": "m", "status": "planned"}]
+    supabase.tables["mission_nodes"] = [{"id": n.id, "status": "pending"} for n in nodes]
+    executor = SleepingExecutor(scheduler_kwargs.pop("delays", None))
+    scheduler = MissionGraphScheduler(supabase, executor=executor, **scheduler_kwargs)
+    mission = Mission(id="m", title="Mission", mission_type="analysis", objective="test")
+    graph = MissionGraph(id="g", mission_id="m", nodes=nodes, edges=[])
+    return scheduler, executor, mission, graph, supabase
+
+
+class TestReadyQueueDispatch:
+    """Concurrency, ordering and limits."""
+
+    async def test_independent_nodes_run_concurrently(self):
+        nodes = [node(f"n{i}") for i in range(50)]
+        scheduler, executor, mission, graph, _ = setup(nodes, max_parallel=10)
+        start = time.perf_counter()
+        result = await scheduler.execute_graph(mission, graph)
+        elapsed = time.perf_counter() - start
+
+        assert result.completed_nodes == 50
+        assert executor.max_running == 10
+        assert elapsed < 50 * 0.02 / 2
+
+    async def test_dependent_starts_before_slow_sibling_finishes(self):
+        nodes = [node("slow"), node("fast"), node("after_fast", "fast")]
+        scheduler, executor, mission, graph, _ = setup(nodes, delays={"slow": 0.2})
+        await scheduler.execute_graph(mission, graph)
+
+        assert executor.events.index(("start", "after_fast")) < executor.events.index(("end", "slow"))
+
+    async def test_saturated_agent_pool_does_not_block_other_types(self):
+        nodes = [node(f"s{i}") for i in range(3)] + [node("qa", agent_type=AgentType.RISK_QA)]
+        scheduler, executor, mission, graph, _ = setup(
+            nodes, agent_pool_limits={AgentType.SPECIALIST: 1})
+        result = await scheduler.execute_graph(mission, graph)
+
+        assert result.completed_nodes == 4
+        assert executor.max_running == 2
+        assert set([n for kind, n in executor.events if kind == "start"][:2]) == {"s0", "qa"}
+        assert scheduler.pool_waits > 0
+
+    async def test_work_output_reaches_database_and_dependents(self):
+        nodes = [node("a"), node("b", "a")]
+        scheduler, _, mission, graph, supabase = setup(nodes)
+        await scheduler.execute_graph(mission, graph)
+
+        rows = {row["id"]: row for row in supabase.tables["mission_nodes"]}
+        assert rows["a"]["output_data"] == {"done": "a"}
+        assert supabase.tables["missions"][0]["status"] == "completed"
+
+    async def test_failed_node_does_not_release_dependents(self):
+        nodes = [node("bad"), node("child", "bad"), node("other")]
+        scheduler, _, mission, graph, supabase = setup(nodes)
+        original = scheduler._execute_task_node_work
+
+        async def work(mission, node, *args):
+            if node.id == "bad":
+                raise RuntimeError("boom")
+            return await original(mission, node, *args)
+
+        scheduler._execute_task_node_work = work
+        result = await scheduler.execute_graph(mission, graph)
+
+        assert result.failed_nodes == 1
+        assert result.completed_nodes == 1
+        assert result.pending_nodes == 1
+        assert supabase.tables["missions"][0]["status"] == "failed"
+
+
+class TestSchedulerState:
+    """Dependency counters."""
+
+    def test_dependents_released_when_last_dependency_completes(self):
+        nodes = [node("a"), node("b"), node("c", "a", "b")]
+        state = SchedulerState(MissionGraph(id="g", mission_id="m", nodes=nodes, edges=[]))
+
+        state.update_node_status("a", NodeStatus.COMPLETED)
+        assert state.mark_dependencies_ready("a") == []
+        state.update_node_status("b", NodeStatus.COMPLETED)
+        assert state.mark_dependencies_ready("b") == ["c"]
+        assert state.is_ready(state.get_node("c"))
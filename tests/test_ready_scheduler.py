@@ -0,0 +1,173 @@
+"""
+Ready-Queue Scheduler Tests
+
+Tests for tasks.ready_scheduler.ReadyQueueScheduler and its use by
+ExecutionEngine: no layer barrier, concurrency limits, critical-path
+priority, and failure handling.
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from torq_console.tasks.dependency_resolver import DependencyResolver
+from torq_console.tasks.executor import ExecutionEngine
+from torq_console.tasks.graph_engine import TaskGraph
+from torq_console.tasks.models import (
+    ExecutionCreate,
+    ExecutionStatus,
+    NodeDefinition,
+    NodeType,
+    TaskGraphNode,
+)
+from torq_console.tasks.node_runner import NodeRunner
+from torq_console.tasks.ready_scheduler import ReadyQueueScheduler
+
+
+def node(name, *deps, node_type=NodeType.ANALYSIS, agent_id=None):
+    return TaskGraphNode(name=name, node_type=node_type, agent_id=agent_id,
+                         depends_on=[d.node_id for d in deps])
+
+
+class Recorder:
+    """run_node/on_result pair that logs start and finish order."""
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.events = []
+        self.running = 0
+        self.max_running = 0
+
+    async def run_node(self, graph_node):
+        self.events.append(("start", graph_node.name))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(graph_node.name, 0.01))
+        finally:
+            self.running -= 1
+        self.events.append(("end", graph_node.name))
+        return {"status": "completed", "output": {graph_node.name: True}}
+
+    def on_result(self, node_id, result):
+        return False
+
+    def started(self):
+        return [name for kind, name in self.events if kind == "start"]
+
+
+class TestReadyQueueScheduler:
+    """Scheduling order and limits."""
+
+    async def test_dependent_starts_before_slow_sibling_finishes(self):
+        slow, fast = node("slow"), node("fast")
+        after_fast = node("after_fast", fast)
+        recorder = Recorder({"slow": 0.2})
+        scheduler = ReadyQueueScheduler(DependencyResolver([slow, fast, after_fast]))
+        await scheduler.run(recorder.run_node, recorder.on_result)
+
+        assert recorder.events.index(("start", "after_fast")) < recorder.events.index(("end", "slow"))
+
+    async def test_global_concurrency_limit(self):
+        nodes = [node(f"n{i}") for i in range(10)]
+        recorder = Recorder()
+        await ReadyQueueScheduler(DependencyResolver(nodes), max_concurrency=3).run(
+            recorder.run_node, recorder.on_result)
+
+        assert recorder.max_running == 3
+        assert len(recorder.started()) == 10
+
+    async def test_saturated_agent_does_not_block_other_nodes(self):
+        agents = [node(f"a{i}", node_type=NodeType.AGENT, agent_id="researcher") for i in range(3)]
+        other = node("other")
+        recorder = Recorder({"a0": 0.1, "a1": 0.1, "a2": 0.1})
+        scheduler = ReadyQueueScheduler(
+            DependencyResolver(agents + [other]),
+            max_concurrency=4,
+            resource_limits={"agent:researcher": 1},
+        )
+        await scheduler.run(recorder.run_node, recorder.on_result)
+
+        assert recorder.max_running == 2
+        assert recorder.started()[:2] == ["a0", "other"]
+        assert scheduler.resource_waits > 0
+
+    async def test_critical_path_runs_first(self):
+        short = node("short")
+        head = node("head")
+        chain1 = node("chain1", head)
+        chain2 = node("chain2", chain1)
+        resolver = DependencyResolver([short, head, chain1, chain2])
+        recorder = Recorder()
+        await ReadyQueueScheduler(resolver, max_concurrency=1).run(recorder.run_node, recorder.on_result)
+
+        assert recorder.started()[0] == "head"
+
+    async def test_abort_cancels_running_nodes(self):
+        slow, failing = node("slow"), node("failing")
+        recorder = Recorder({"slow": 1.0, "failing": 0.0})
+        cancelled = []
+
+        async def run_node(graph_node):
+            try:
+                return await recorder.run_node(graph_node)
+            except asyncio.CancelledError:
+                cancelled.append(graph_node.name)
+                raise
+
+        await ReadyQueueScheduler(DependencyResolver([slow, failing])).run(
+            run_node, lambda node_id, result: True)
+        assert cancelled == ["slow"]
+
+    def test_cycle_is_rejected(self):
+        a = node("a")
+        b = node("b", a)
+        a.depends_on = [b.node_id]
+        with pytest.raises(ValueError, match="Cycle"):
+            ReadyQueueScheduler(DependencyResolver([a, b]))
+
+
+class OutputRunner(NodeRunner):
+    """Completes each node with ``{name: input keys}`` after a short sleep."""
+
+    async def execute_node(self, node, input_data, trace_id=None):
+        await asyncio.sleep(node.parameters.get("delay", 0.01))
+        return {"status": "completed", "output": {node.name: sorted(input_data)},
+                "error": None, "duration_ms": 10, "retry_count": 0}
+
+
+def make_graph():
+    first = NodeDefinition(node_id=uuid4(), name="first", node_type=NodeType.ANALYSIS)
+    second = NodeDefinition(node_id=uuid4(), name="second", node_type=NodeType.ANALYSIS,
+                            depends_on=[first.node_id])
+    side = NodeDefinition(node_id=uuid4(), name="side", node_type=NodeType.ANALYSIS,
+                          parameters={"delay": 0.05})
+    return TaskGraph(graph_id=uuid4(), name="test", nodes=[first, second, side], edges=[])
+
+
+class TestExecutionEngineScheduling:
+    """execute_graph in both scheduling modes."""
+
+    @pytest.mark.parametrize("scheduling", ["ready_queue", "layered"])
+    async def test_graph_completes_and_merges_outputs(self, scheduling):
+        engine = ExecutionEngine(scheduling=scheduling)
+        engine.node_runner = OutputRunner()
+        response = await engine.execute_graph(make_graph(), ExecutionCreate(input_data={"seed": 1}))
+
+        assert response.status == ExecutionStatus.COMPLETED
+        assert response.nodes_completed == 3
+        assert {"first", "seed"} <= set(response.output["second"])
+        if scheduling == "ready_queue":
+            # "second" ran without waiting for its slow layer-mate
+            assert "side" not in response.output["second"]
+
+    async def test_durations_feed_critical_path_estimates(self):
+        engine = ExecutionEngine()
+        engine.node_runner = OutputRunner()
+        await engine.execute_graph(make_graph(), ExecutionCreate())
+        assert engine.duration_estimates["first"] == 10
+
+    def test_unknown_scheduling_mode_is_rejected(self):
+        with pytest.raises(ValueError):
+            ExecutionEngine(scheduling="greedy")
@@ -0,0 +1,221 @@
+"""
+Research Query Cache Tests
+
+Tests for research.cache.QueryCache: LRU eviction, the shared SQLite
+store, stale-while-revalidate, single-flight fetches and the semantic tier.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from torq_console.research.cache import QueryCache, SemanticCacheTier
+
+PARAMS = {"top_k": 5, "search_depth": "basic", "recency_days": None}
+
+
+def _age(cached, seconds):
+    """Pretend an entry was cached ``seconds`` ago."""
+    cached.created_at = (datetime.now(timezone.utc) - timedelta(seconds=seconds)).isoformat()
+
+
+class Fetcher:
+    """Counts calls; optionally blocks until released."""
+
+    def __init__(self, gate=None):
+        self.calls = 0
+        self.gate = gate
+
+    async def __call__(self):
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        return {"items": [self.calls]}
+
+
+class TestQueryCache:
+    """Memory tier behaviour."""
+
+    async def test_lru_evicts_least_recently_used(self):
+        cache = QueryCache(max_size=2)
+        await cache.set("a", PARAMS, {"v": 1})
+        await cache.set("b", PARAMS, {"v": 2})
+        assert await cache.get("a", PARAMS)
+        await cache.set("c", PARAMS, {"v": 3})
+
+        assert await cache.get("b", PARAMS) is None
+        assert await cache.get("a", PARAMS)
+        assert cache.get_stats()["evictions"] == 1
+
+    async def test_ttl_follows_recency_window(self):
+        cache = QueryCache()
+        cached = await cache.set("rust release notes", {**PARAMS, "recency_days": 1}, {})
+        assert cached.ttl_seconds == 900
+
+    async def test_stale_entry_served_while_one_refresh_runs(self):
+        cache = QueryCache(stale_ttl_factor=1.0)
+        cached = await cache.set("topic", PARAMS, {"items": [0]}, ttl_seconds=60)
+        _age(cached, 90)
+
+        gate = asyncio.Event()
+        refresh = Fetcher(gate)
+        results = await asyncio.gather(*(
+            cache.get_or_refresh("topic", PARAMS, refresh) for _ in range(5)
+        ))
+        assert all(r.response == {"items": [0]} for r in results)
+
+        gate.set()
+        await asyncio.sleep(0.05)
+        assert refresh.calls == 1
+        fresh = await cache.get("topic", PARAMS)
+        assert fresh.response == {"items": [1]}
+
+        stats = cache.get_stats()
+        assert stats["stale_hits"] == 5
+        assert stats["refreshes"] == 1
+        assert stats["coalesced"] == 4
+
+    async def test_entries_past_stale_window_miss(self):
+        cache = QueryCache(stale_ttl_factor=1.0)
+        cached = await cache.set("topic", PARAMS, {}, ttl_seconds=60)
+        _age(cached, 121)
+
+        assert await cache.get_or_refresh("topic", PARAMS, Fetcher()) is None
+        assert cache.get_stats()["misses"] == 1
+
+    async def test_concurrent_misses_share_one_fetch(self):
+        cache = QueryCache()
+        fetch = Fetcher()
+        results = await asyncio.gather(*(
+            cache.get_or_fetch("topic", PARAMS, fetch) for _ in range(10)
+        ))
+
+        assert fetch.calls == 1
+        assert {id(r) for r in results} == {id(results[0])}
+
+    async def test_failed_refresh_keeps_stale_entry(self):
+        cache = QueryCache()
+        cached = await cache.set("topic", PARAMS, {"items": [0]}, ttl_seconds=60)
+        _age(cached, 90)
+
+        async def failing():
+            raise RuntimeError("provider down")
+
+        assert await cache.get_or_refresh("topic", PARAMS, failing)
+        await asyncio.sleep(0.01)
+        assert cache.get_stats()["refresh_failures"] == 1
+        assert (await cache.get("topic", PARAMS, allow_stale=True)).response == {"items": [0]}
+
+
+class TestPersistentQueryCache:
+    """Entries shared through the SQLite store."""
+
+    async def test_entries_survive_restart(self, tmp_path):
+        path = str(tmp_path / "research.sqlite")
+        first = QueryCache(path=path)
+        await first.set("topic", PARAMS, {"items": [1]})
+        first.close()
+
+        second = QueryCache(path=path)
+        cached = await second.get("topic", PARAMS)
+        assert cached.response == {"items": [1]}
+        assert second.get_stats()["disk_hits"] == 1
+        second.close()
+
+    async def test_worker_sees_fresher_copy_from_another(self, tmp_path):
+        path = str(tmp_path / "research.sqlite")
+        worker_a, worker_b = QueryCache(path=path), QueryCache(path=path)
+        stale = await worker_a.set("topic", PARAMS, {"items": ["old"]}, ttl_seconds=60)
+        _age(stale, 90)
+        await worker_b.set("topic", PARAMS, {"items": ["new"]}, ttl_seconds=60)
+
+        fetch = Fetcher()
+        cached = await worker_a.get_or_refresh("topic", PARAMS, fetch)
+        assert cached.response == {"items": ["new"]}
+        assert fetch.calls == 0
+        worker_a.close()
+        worker_b.close()
+
+    async def test_invalidate_clears_store(self, tmp_path):
+        cache = QueryCache(path=str(tmp_path / "research.sqlite"))
+        await cache.set("bitcoin price", PARAMS, {})
+        await cache.set("python release", PARAMS, {})
+
+        await cache.invalidate("bitcoin")
+        assert cache._store.count() == 1
+        await cache.invalidate()
+        assert cache._store.count() == 0
+        cache.close()
+
+
+class SynonymEmbedder:
+    """Bag-of-words embedding that treats a few synonyms as the same word."""
+
+    SYNONYMS = {"btc": "bitcoin", "latest": "current", "cost": "price"}
+    VOCAB = ["bitcoin", "current", "price", "ethereum", "python", "release"]
+
+    def generate_single_embedding(self, text):
+        words = [self.SYNONYMS.get(w, w) for w in text.split()]
+        return np.array([words.count(v) for v in self.VOCAB] + [0.01], dtype='float32')
+
+
+class FailingEmbedder:
+    """Embedder whose model is broken."""
+
+    def generate_single_embedding(self, text):
+        raise RuntimeError("model crashed")
+
+
+def _response(*urls):
+    return {"items": [{"url": url} for url in urls]}
+
+
+class TestSemanticTier:
+    """Near-duplicate queries answered from cache."""
+
+    async def test_near_duplicate_query_hits(self):
+        cache = QueryCache(semantic=SemanticCacheTier(SynonymEmbedder(), threshold=0.95, verify_rate=0))
+        await cache.set("latest BTC price", PARAMS, _response("https://a"))
+
+        cached = await cache.get("current bitcoin price", PARAMS)
+        assert cached.query == "latest BTC price"
+        assert cache.get_stats()["semantic_hits"] == 1
+        assert await cache.get("latest ethereum price", PARAMS) is None
+
+    async def test_embedder_failure_falls_back_to_exact_match(self):
+        cache = QueryCache(semantic=SemanticCacheTier(FailingEmbedder(), verify_rate=0))
+        await cache.set("latest BTC price", PARAMS, _response("https://a"))
+
+        assert (await cache.get("latest BTC price", PARAMS)).response == _response("https://a")
+        assert await cache.get("current bitcoin price", PARAMS) is None
+
+    async def test_ttl_class_and_params_must_match(self):
+        cache = QueryCache(semantic=SemanticCacheTier(SynonymEmbedder(), threshold=0.8, verify_rate=0))
+        await cache.set("python release", PARAMS, _response("https://a"))
+
+        # "latest" makes the query time-sensitive: different TTL class
+        assert await cache.get("latest python release", PARAMS) is None
+        assert await cache.get("python release", {**PARAMS, "top_k": 10}) is None
+
+    async def test_verification_tracks_precision(self):
+        tier = SemanticCacheTier(SynonymEmbedder(), threshold=0.95, verify_rate=1.0)
+        cache = QueryCache(semantic=tier)
+        await cache.set("latest BTC price", PARAMS, _response("https://a", "https://b"))
+
+        async def same():
+            return _response("https://a", "https://b")
+
+        async def different():
+            return _response("https://x")
+
+        assert await cache.get_or_refresh("current bitcoin price", PARAMS, same)
+        await asyncio.sleep(0.01)
+        assert await cache.get_or_refresh("bitcoin current cost", PARAMS, different)
+        await asyncio.sleep(0.01)
+
+        stats = tier.get_stats()
+        assert stats["verified"] == 2
+        assert stats["precision"] == 0.5
+        # The verified result is cached under its own key
+        assert (await cache.get("bitcoin current cost", PARAMS)).response == _response("https://x")
@@ -0,0 +1,110 @@
+"""
+Telemetry Writer Tests
+
+Tests for SQLiteTelemetryStorage's writer thread (WAL connection, batched
+inserts, backpressure) and the TelemetryCollector flush path.
+"""
+
+import asyncio
+import sqlite3
+from datetime import datetime, timedelta
+
+from torq_console.core.telemetry.collector import (
+    SQLiteTelemetryStorage,
+    TelemetryCollector,
+    TelemetryConfig,
+)
+from torq_console.core.telemetry.event import (
+    AgentStatus,
+    TorqEvent,
+    TorqEventType,
+    create_agent_run_event,
+)
+
+
+def event(i, **kwargs):
+    return TorqEvent(event_type=TorqEventType.SYSTEM_EVENT, session_id="s", run_id=f"run_{i % 3}",
+                     data={"n": i}, **kwargs)
+
+
+async def wait_for(condition, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+class TestSQLiteWriter:
+    """Writes through the writer thread."""
+
+    async def test_store_and_read_back(self, tmp_path):
+        storage = SQLiteTelemetryStorage(tmp_path / "telemetry.db")
+        run = create_agent_run_event(session_id="s", agent_name="a", agent_type="t",
+                                     status=AgentStatus.COMPLETED, run_id="run_x",
+                                     data={"agent_name": "a", "status": "completed"})
+        assert await storage.store_events([event(i) for i in range(10)] + [run])
+
+        rows = await storage.get_events(limit=100)
+        assert len(rows) == 11
+        assert {row["event_type"] for row in rows} == {"system_event", "agent_run"}
+        assert sorted(row["data"]["n"] for row in rows if row["event_type"] == "system_event") == list(range(10))
+        stats = await storage.get_statistics()
+        assert stats["total_agent_runs"] == 1
+        await storage.close()
+
+    async def test_database_is_in_wal_mode(self, tmp_path):
+        storage = SQLiteTelemetryStorage(tmp_path / "telemetry.db")
+        await storage.store_events([event(0)])
+        conn = sqlite3.connect(tmp_path / "telemetry.db")
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+        await storage.close()
+
+    async def test_backpressure_with_full_queue(self, tmp_path):
+        storage = SQLiteTelemetryStorage(tmp_path / "telemetry.db", max_pending_batches=1)
+        batches = [[event(b * 10 + i) for i in range(10)] for b in range(20)]
+
+        results = await asyncio.gather(*(storage.store_events(batch) for batch in batches))
+
+        assert all(results)
+        assert (await storage.get_statistics())["total_events"] == 200
+        await storage.close()
+
+    async def test_cleanup_and_restart_after_close(self, tmp_path):
+        storage = SQLiteTelemetryStorage(tmp_path / "telemetry.db")
+        old = event(0, timestamp=datetime.utcnow() - timedelta(days=40))
+        await storage.store_events([old, event(1)])
+        await storage.close()
+
+        assert await storage.cleanup_old_events(datetime.utcnow() - timedelta(days=30)) == 1
+        assert (await storage.get_statistics())["total_events"] == 1
+        await storage.close()
+
+
+class TestCollectorFlush:
+    """TelemetryCollector batching into storage."""
+
+    async def test_full_batches_flush_before_interval(self, tmp_path):
+        config = TelemetryConfig(storage_path=tmp_path / "telemetry.db", batch_size=10,
+                                 flush_interval_seconds=60)
+        collector = TelemetryCollector(config)
+        await collector.start()
+
+        await collector.collect_events([event(i) for i in range(25)])
+        await wait_for(lambda: collector._stats["events_stored"] >= 20)
+
+        await collector.stop()
+        assert collector._stats["events_stored"] == 25
+        assert collector._stats["storage_errors"] == 0
+
+    async def test_pii_is_redacted_without_touching_the_original(self, tmp_path):
+        collector = TelemetryCollector(TelemetryConfig(storage_path=tmp_path / "telemetry.db"))
+        run = create_agent_run_event(session_id="s", agent_name="a", agent_type="t",
+                                     status=AgentStatus.STARTED, data={"query": "mail bob@example.com"})
+        await collector.start()
+        await collector.collect_event(run)
+        await collector.stop()
+
+        stored = await collector.storage.get_events()
+        assert stored[0]["data"]["query"] == "mail [REDACTED]"
+        assert run.data["query"] == "mail bob@example.com"
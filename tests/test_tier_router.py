@@ -0,0 +1,213 @@
+"""
+Tier Router Tests
+
+Tests for llm.tier_router.TierRouter: quality constraints, EWMA latency and
+load-aware provider choice, hedged premium requests and fallback.
+"""
+
+import asyncio
+
+import pytest
+
+from torq_console.llm.manager import LLMManager
+from torq_console.llm.tier_router import TierRouter, TierSpec
+
+ALL = ["llama_cpp_fast", "llama_cpp_quality", "deepseek", "ollama", "claude", "glm"]
+SHORT = [{"role": "user", "content": "what is a monad?"}]
+LONG = [{"role": "user", "content": "x" * 6000}]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def observe(router, clock, provider, latency_s, success=True):
+    started = router.begin(provider)
+    clock.now += latency_s
+    router.end(provider, started, success=success)
+
+
+class TestRouting:
+    """Provider choice under the quality constraint."""
+
+    def test_quality_constraint_excludes_lower_tiers(self):
+        router = TierRouter()
+        assert router.route(SHORT, ALL).tier == "fast"
+        decision = router.route(LONG, ALL)
+        assert decision.quality == 3
+        assert decision.tier in ("standard", "premium")
+        assert router.route(SHORT, ["llama_cpp_fast"], min_quality=3) is None
+
+    def test_cold_start_keeps_premium_opt_in(self):
+        router = TierRouter()
+        for messages in (SHORT, LONG):
+            decision = router.route(messages, ALL)
+            assert decision.tier != "premium"
+            assert decision.hedge_provider is None
+            # Premium stays available, behind every cheaper fallback
+            assert set(decision.fallbacks[-2:]) == {"claude", "glm"}
+        assert router.route(LONG, ALL).tier == "standard"
+
+        decision = router.route(LONG, ALL, min_quality=4)
+        assert decision.tier == "premium"
+        assert decision.hedge_provider in ("claude", "glm")
+        # Premium is the first choice when nothing cheaper is configured
+        assert router.route(SHORT, ["claude"]).provider == "claude"
+
+    def test_latency_ranks_providers_across_tiers(self):
+        clock = FakeClock()
+        router = TierRouter(clock=clock)
+        for _ in range(5):
+            observe(router, clock, "llama_cpp_quality", 8.0)
+            observe(router, clock, "deepseek", 3.0)
+        decision = router.route(SHORT, ALL, min_quality=2)
+        assert decision.provider == "deepseek"
+        assert decision.fallbacks[0] == "llama_cpp_quality"
+
+    def test_tier_past_its_deadline_is_hedged_to_premium(self):
+        clock = FakeClock()
+        router = TierRouter(clock=clock)
+        for _ in range(5):
+            observe(router, clock, "deepseek", 70.0)
+            observe(router, clock, "ollama", 90.0)
+        decision = router.route(LONG, ALL)
+        assert decision.provider == "deepseek"
+        assert decision.hedge_provider in ("claude", "glm")
+        assert decision.hedge_delay_ms == 60000
+
+    def test_observed_latency_beats_prior(self):
+        clock = FakeClock()
+        router = TierRouter(clock=clock)
+        for _ in range(5):
+            observe(router, clock, "deepseek", 3.0)
+        decision = router.route(LONG, ALL)
+        assert decision.provider == "deepseek"
+        assert 2500 < decision.expected_ms < 3500
+
+    def test_in_flight_load_moves_traffic_off_local_model(self):
+        router = TierRouter()
+        assert router.route(SHORT, ALL).provider == "llama_cpp_fast"
+        # Both llama.cpp tiers share one single-slot model
+        for _ in range(20):
+            router.begin("llama_cpp_quality")
+        assert router.route(SHORT, ALL).tier not in ("fast", "balanced")
+
+    def test_error_rate_penalises_provider(self):
+        clock = FakeClock()
+        router = TierRouter(clock=clock)
+        for _ in range(5):
+            observe(router, clock, "deepseek", 5.0)
+            observe(router, clock, "ollama", 6.0)
+        assert router.route(LONG, ["deepseek", "ollama"]).provider == "deepseek"
+        for _ in range(5):
+            observe(router, clock, "deepseek", 0.1, success=False)
+        assert router.route(LONG, ["deepseek", "ollama"]).provider == "ollama"
+
+
+class TestExecution:
+    """Hedging and fallback in run()."""
+
+    async def test_slow_premium_primary_is_hedged(self):
+        router = TierRouter()
+        router.stats["claude"].latency_ms = 10.0
+        router.stats["glm"].latency_ms = 20.0
+        decision = router.route(SHORT, ["claude", "glm"], min_quality=4)
+        assert decision.provider == "claude"
+        assert decision.hedge_provider == "glm"
+
+        cancelled = []
+
+        async def call(provider):
+            try:
+                await asyncio.sleep(1.0 if provider == "claude" else 0.01)
+            except asyncio.CancelledError:
+                cancelled.append(provider)
+                raise
+            return provider
+
+        assert await router.run(decision, call) == "glm"
+        await asyncio.sleep(0)
+        assert cancelled == ["claude"]
+        assert router.hedge_wins == 1
+        # The cancelled loser released its slot without skewing its EWMA
+        assert router.in_flight["claude"] == 0
+        assert router.stats["claude"].requests == 0
+
+    async def test_fast_primary_is_not_hedged(self):
+        router = TierRouter()
+        decision = router.route(SHORT, ["claude", "glm"], min_quality=4)
+        calls = []
+
+        async def call(provider):
+            calls.append(provider)
+            return "ok"
+
+        assert await router.run(decision, call) == "ok"
+        assert calls == [decision.provider]
+        assert router.hedges == 0
+
+    async def test_failure_falls_back_to_next_candidate(self):
+        router = TierRouter()
+        decision = router.route(LONG, ["deepseek", "ollama"])
+
+        async def call(provider):
+            if provider == decision.provider:
+                raise RuntimeError("down")
+            return provider
+
+        assert await router.run(decision, call) == decision.fallbacks[0]
+        assert router.stats[decision.provider].failures == 1
+
+    async def test_all_failures_raise_last_error(self):
+        router = TierRouter()
+        decision = router.route(LONG, ["deepseek"])
+
+        async def call(provider):
+            raise RuntimeError(provider)
+
+        with pytest.raises(RuntimeError, match="deepseek"):
+            await router.run(decision, call)
+
+
+class FakeChatProvider:
+    def __init__(self, name, delay=0.0):
+        self.name = name
+        self.delay = delay
+        self.calls = 0
+
+    async def chat(self, messages, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return f"answer from {self.name}"
+
+
+class TestChatWithRouting:
+    """LLMManager.chat_with_routing end to end."""
+
+    @pytest.fixture
+    def manager(self):
+        llm = LLMManager()
+        llm.tier_router = TierRouter(tiers=[
+            TierSpec("standard", 3, ["deepseek"], prior_latency_ms=30, deadline_ms=50),
+            TierSpec("premium", 4, ["claude"], prior_latency_ms=20, hedge=True, opt_in=True),
+        ])
+        llm.providers = {
+            "deepseek": FakeChatProvider("deepseek", delay=1.0),
+            "claude": FakeChatProvider("claude"),
+        }
+        return llm
+
+    async def test_standard_request_stays_off_premium(self, manager):
+        manager.providers["deepseek"].delay = 0.0
+        assert await manager.chat_with_routing(LONG) == "answer from deepseek"
+        assert manager.providers["claude"].calls == 0
+
+    async def test_slow_standard_tier_is_hedged_to_premium(self, manager):
+        manager.tier_router.stats["deepseek"].latency_ms = 1000.0
+        assert await manager.chat_with_routing(LONG) == "answer from claude"
+        assert manager.tier_router.hedges == 1
+        assert manager.tier_router.hedge_wins == 1
@@ -0,0 +1,248 @@
+"""
+Vector Store Tests
+
+Tests for ID-addressable storage, upserts and deletes in indexer.VectorStore.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from torq_console.indexer.vector_store import VectorStore
+
+
+DIM = 8
+
+
+def _vectors(n, seed=0):
+    return np.random.default_rng(seed).standard_normal((n, DIM)).astype('float32')
+
+
+@pytest.fixture
+def store():
+    s = VectorStore(dimension=DIM)
+    s.add_vectors(_vectors(10), [{'name': f'doc_{i}'} for i in range(10)])
+    return s
+
+
+class TestVectorStoreIds:
+    """Test ID-addressed operations."""
+
+    def test_add_returns_stable_ids(self, store):
+        ids = store.add_vectors(_vectors(2, seed=1), [{'name': 'x'}, {'name': 'y'}])
+        assert ids == [10, 11]
+        assert store.get_document(11) == {'name': 'y'}
+
+    def test_duplicate_ids_rejected(self, store):
+        with pytest.raises(ValueError):
+            store.add_vectors(_vectors(1), [{'name': 'dup'}], ids=[3])
+
+    def test_remove_ids_hides_documents_from_search(self, store):
+        vectors = _vectors(10)
+        assert store.remove_ids([3, 4]) == 2
+        hits = [doc_id for doc_id, _ in store.search_ids(vectors[3], k=10)]
+        assert 3 not in hits and 4 not in hits
+        assert len(hits) == 8
+        assert store.get_stats()['total_vectors'] == 8
+
+    def test_upsert_replaces_vector_and_metadata(self, store):
+        target = _vectors(1, seed=42)
+        store.upsert_vectors([5], target, [{'name': 'replaced'}])
+        doc, dist = store.search(target[0], k=1)[0]
+        assert doc == {'name': 'replaced'}
+        assert dist == pytest.approx(0.0, abs=1e-5)
+        assert store.get_stats()['total_vectors'] == 10
+
+    def test_compaction_drops_tombstones(self, store):
+        store.remove_ids(list(range(5)))
+        stats = store.get_stats()
+        assert stats['tombstones'] == 0
+        assert stats['index_rows'] == 5
+
+    def test_positional_remove_still_supported(self, store):
+        store.remove_vectors([0, 1, 2])
+        assert [d['name'] for d in store.get_all_documents()][:2] == ['doc_3', 'doc_4']
+
+    def test_save_load_round_trip(self, store, tmp_path):
+        store.remove_ids([0])
+        store.save(str(tmp_path))
+
+        loaded = VectorStore(dimension=DIM)
+        loaded.load(str(tmp_path))
+        assert loaded.get_all_ids() == store.get_all_ids()
+        query = _vectors(10)[7]
+        expected = store.search_ids(query, k=3)
+        actual = loaded.search_ids(query, k=3)
+        assert [i for i, _ in actual] == [i for i, _ in expected]
+        assert [d for _, d in actual] == pytest.approx([d for _, d in expected], abs=1e-4)
+        assert loaded.add_vectors(_vectors(1), [{'name': 'new'}]) == [10]
+
+
+class TestAnnIndexTypes:
+    """Test IVF / HNSW / PQ backends behind the same ID-addressed API."""
+
+    @pytest.fixture(params=['ivf_flat', 'hnsw', 'ivf_pq'])
+    def ann_store(self, request):
+        s = VectorStore(dimension=DIM, index_type=request.param, index_params={'nprobe': 64})
+        s.add_vectors(_vectors(2000), [{'name': f'doc_{i}'} for i in range(2000)])
+        return s
+
+    def test_unknown_index_type_rejected(self):
+        with pytest.raises(ValueError):
+            VectorStore(dimension=DIM, index_type='annoy')
+
+    def test_self_query_finds_document(self, ann_store):
+        vectors = _vectors(2000)
+        hits = [doc_id for doc_id, _ in ann_store.search_ids(vectors[123], k=5)]
+        assert 123 in hits
+
+    def test_remove_and_upsert(self, ann_store):
+        vectors = _vectors(2000)
+        ann_store.remove_ids(list(range(600)))
+        ann_store.compact()
+        hits = [doc_id for doc_id, _ in ann_store.search_ids(vectors[10], k=10)]
+        assert all(doc_id >= 600 for doc_id in hits)
+
+        ann_store.upsert_vectors([700], vectors[10:11], [{'name': 'moved'}])
+        assert ann_store.search(vectors[10], k=1)[0][0] == {'name': 'moved'}
+
+    def test_tombstones_filtered_inside_index(self, ann_store):
+        vectors = _vectors(2000)
+        nearest = np.argsort(((vectors - vectors[10]) ** 2).sum(axis=1))[:50]
+        ann_store.remove_ids(nearest.tolist())
+        assert ann_store.get_stats()['tombstones'] == 50
+
+        hits = [doc_id for doc_id, _ in ann_store.search_ids(vectors[10], k=10)]
+        assert len(hits) == 10
+        assert not set(hits) & set(nearest.tolist())
+
+    def test_save_load_keeps_index_type(self, ann_store, tmp_path):
+        ann_store.save(str(tmp_path))
+        loaded = VectorStore(dimension=DIM)
+        loaded.load(str(tmp_path))
+        assert loaded.index_type == ann_store.index_type
+        query = _vectors(2000)[55]
+        assert loaded.search_ids(query, k=3) == ann_store.search_ids(query, k=3)
+
+
+class TestMappedStorage:
+    """Test the memory-mapped, pickle-free on-disk format."""
+
+    def test_load_is_memory_mapped(self, store, tmp_path):
+        store.save(str(tmp_path))
+        assert not list(tmp_path.rglob('*.pkl'))
+
+        loaded = VectorStore(dimension=DIM)
+        loaded.load(str(tmp_path))
+        stats = loaded.get_stats()
+        assert stats['memory_mapped'] is True
+        assert stats['total_vectors'] == 10
+
+        query = _vectors(10)[4]
+        doc, dist = loaded.search(query, k=1)[0]
+        assert doc == {'name': 'doc_4'}
+        assert dist == pytest.approx(0.0, abs=1e-4)
+        assert loaded.get_document(7) == {'name': 'doc_7'}
+
+    def test_mapped_results_match_in_memory(self, store, tmp_path):
+        store.save(str(tmp_path))
+        loaded = VectorStore(dimension=DIM)
+        loaded.load(str(tmp_path))
+
+        queries = _vectors(5, seed=9)
+        for expected, actual in zip(store.batch_search(queries, k=4), loaded.batch_search(queries, k=4)):
+            assert [d for d, _ in expected] == [d for d, _ in actual]
+            assert [x for _, x in expected] == pytest.approx([x for _, x in actual], rel=1e-4, abs=1e-4)
+
+    def test_mutations_keep_reading_segment(self, store, tmp_path):
+        store.save(str(tmp_path))
+        loaded = VectorStore(dimension=DIM)
+        loaded.load(str(tmp_path))
+
+        target = _vectors(1, seed=42)
+        loaded.remove_ids([0])
+        loaded.upsert_vectors([5], target, [{'name': 'replaced'}])
+        assert loaded.get_stats()['memory_mapped'] is True
+        assert loaded.get_stats()['total_vectors'] == 9
+        assert loaded.get_document(0) is None
+        assert loaded.search(target[0], k=1)[0][0] == {'name': 'replaced'}
+        hits = [doc_id for doc_id, _ in loaded.search_ids(_vectors(10)[0], k=10)]
+        assert 0 not in hits and len(hits) == 9
+
+    def test_incremental_save_appends_to_segment(self, store, tmp_path):
+        store.save(str(tmp_path))
+        segment = next(tmp_path.glob('segment-*'))
+
+        store.remove_ids([0])
+        store.add_vectors(_vectors(1, seed=7), [{'name': 'new'}])
+        store.save(str(tmp_path))
+        assert list(tmp_path.glob('segment-*')) == [segment]
+        assert (segment / 'tombstones.i64').stat().st_size == 8
+        assert store.get_stats()['index_rows'] == 11
+
+        reloaded = VectorStore(dimension=DIM)
+        reloaded.load(str(tmp_path))
+        assert reloaded.get_all_ids() == list(range(1, 11))
+        assert reloaded.search(_vectors(1, seed=7)[0], k=1)[0][0] == {'name': 'new'}
+        assert reloaded.get_document(0) is None
+
+    def test_compaction_rewrites_segment_past_threshold(self, store, tmp_path):
+        store.save(str(tmp_path))
+        segment = next(tmp_path.glob('segment-*'))
+
+        store.remove_ids([0, 1, 2])
+        store.save(str(tmp_path))
+        segments = list(tmp_path.glob('segment-*'))
+        assert segments != [segment] and len(segments) == 1
+        stats = store.get_stats()
+        assert stats['tombstones'] == 0
+        assert stats['index_rows'] == 7
+
+    def test_torn_append_is_ignored(self, store, tmp_path):
+        store.save(str(tmp_path))
+        segment = next(tmp_path.glob('segment-*'))
+        with open(segment / 'vectors.f32', 'ab') as f:
+            f.write(b'\x00' * 10)
+
+        loaded = VectorStore(dimension=DIM)
+        loaded.load(str(tmp_path))
+        loaded.add_vectors(_vectors(1, seed=7), [{'name': 'new'}])
+        loaded.save(str(tmp_path))
+
+        reloaded = VectorStore(dimension=DIM)
+        reloaded.load(str(tmp_path))
+        doc, dist = reloaded.search(_vectors(1, seed=7)[0], k=1)[0]
+        assert doc == {'name': 'new'}
+        assert dist == pytest.approx(0.0, abs=1e-4)
+
+    def test_ann_segment_searches_appended_tail(self, tmp_path):
+        vectors = _vectors(2000)
+        store = VectorStore(dimension=DIM, index_type='hnsw')
+        store.add_vectors(vectors, [{'name': f'doc_{i}'} for i in range(2000)])
+        store.save(str(tmp_path))
+
+        store.add_vectors(_vectors(1, seed=7), [{'name': 'tail'}])
+        store.remove_ids([123])
+        store.save(str(tmp_path))
+
+        reloaded = VectorStore(dimension=DIM)
+        reloaded.load(str(tmp_path))
+        assert reloaded.search(_vectors(1, seed=7)[0], k=1)[0][0] == {'name': 'tail'}
+        hits = [doc_id for doc_id, _ in reloaded.search_ids(vectors[123], k=5)]
+        assert 123 not in hits and len(hits) == 5
+
+    def test_legacy_pickle_index_migrates(self, tmp_path):
+        import pickle
+        import faiss
+
+        vectors = _vectors(3)
+        index = faiss.IndexFlatL2(DIM)
+        index.add(vectors)
+        faiss.write_index(index, str(tmp_path / 'index.faiss'))
+        with open(tmp_path / 'documents.pkl', 'wb') as f:
+            pickle.dump([{'name': 'a'}, {'name': 'b'}, {'name': 'c'}], f)
+
+        loaded = VectorStore(dimension=DIM)
+        loaded.load(str(tmp_path))
+        assert loaded.search(vectors[1], k=1)[0][0] == {'name': 'b'}
@@ -0,0 +1,113 @@
+"""
+WebSearch Fan-out Tests
+
+Tests for WebSearchProvider's concurrent fan-out mode: staggered starts,
+early cut-off with cancellation, URL deduplication and per-method stats.
+"""
+
+import asyncio
+
+import pytest
+
+from torq_console.llm.providers.websearch import WebSearchProvider
+
+
+def _results(*urls):
+    return {'results': [{'title': url, 'snippet': '', 'url': url} for url in urls]}
+
+
+@pytest.fixture
+def provider():
+    """Provider whose search methods are scripted: name -> (delay, result or exception)."""
+    provider = WebSearchProvider({'fanout': True, 'fanout_stagger': 0.05, 'fanout_min_results': 3})
+    provider.script = {}
+    provider.started = []
+    provider.cancelled = []
+
+    async def scripted(method, query, max_results, search_type):
+        provider.started.append(method)
+        delay, outcome = provider.script[method]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            provider.cancelled.append(method)
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    provider._search_with_method = scripted
+    return provider
+
+
+def _use(provider, script):
+    provider.script = script
+    provider.search_methods = list(script) + ['web_scraping', 'fallback_response']
+
+
+class TestFanout:
+    """Racing, merging and cancelling search methods."""
+
+    async def test_fast_first_method_cuts_off_the_race(self, provider):
+        _use(provider, {
+            'google_custom_search': (0.0, _results('https://a.com', 'https://b.com', 'https://c.com')),
+            'brave_search': (1.0, _results('https://d.com')),
+        })
+        result = await provider.search("q")
+
+        assert result['success'] is True
+        assert result['method_used'] == 'google_custom_search'
+        assert provider.started == ['google_custom_search']
+
+    async def test_slow_method_is_hedged_and_cancelled(self, provider):
+        _use(provider, {
+            'perplexity_search': (1.0, _results('https://slow.com')),
+            'brave_search': (0.01, _results('https://a.com', 'https://b.com', 'https://c.com')),
+        })
+        result = await provider.search("q")
+
+        assert result['methods_used'] == ['brave_search']
+        await asyncio.sleep(0)
+        assert provider.cancelled == ['perplexity_search']
+        assert provider.get_method_stats()['perplexity_search']['cancelled'] == 1
+
+    async def test_results_are_merged_and_deduplicated(self, provider):
+        _use(provider, {
+            'google_custom_search': (0.0, _results('https://a.com/x', 'https://b.com')),
+            'brave_search': (0.0, _results('https://A.com/x/?utm_source=brave', 'https://c.com')),
+        })
+        result = await provider.search("q")
+
+        urls = [r['url'] for r in result['results']]
+        assert urls == ['https://a.com/x', 'https://b.com', 'https://c.com']
+        assert result['methods_used'] == ['google_custom_search', 'brave_search']
+
+    async def test_failure_starts_next_method_immediately(self, provider):
+        provider.fanout_stagger = 5.0
+        _use(provider, {
+            'google_custom_search': (0.0, RuntimeError("quota")),
+            'brave_search': (0.0, _results('https://a.com', 'https://b.com', 'https://c.com')),
+        })
+        result = await asyncio.wait_for(provider.search("q"), timeout=1.0)
+
+        assert result['method_used'] == 'brave_search'
+        assert provider.get_method_stats()['google_custom_search']['empty'] == 1
+
+    async def test_no_real_results_falls_back_to_guidance(self, provider):
+        _use(provider, {'brave_search': (0.0, None)})
+        provider.script['web_scraping'] = (0.0, _results('https://guide.example'))
+        result = await provider.search("q")
+
+        assert result['method_used'] == 'web_scraping'
+        assert provider.started == ['brave_search', 'web_scraping']
+
+    async def test_win_rates_are_recorded(self, provider):
+        _use(provider, {
+            'google_custom_search': (0.0, _results('https://a.com', 'https://b.com', 'https://c.com')),
+        })
+        await provider.search("q")
+        await provider.search("q")
+
+        stats = provider.get_method_stats()['google_custom_search']
+        assert stats['launched'] == 2
+        assert stats['win_rate'] == 1.0
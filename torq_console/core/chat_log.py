@@ -0,0 +1,219 @@
+"""
+Chat Log - Append-only per-tab record log with group commit.
+
+Each tab gets a JSONL file of sequenced records (``{"seq": n, "op": ...}``)
+next to its snapshot. Appends from concurrent coroutines are queued and
+written by a single writer: every record queued while a write is in flight
+goes out in the next write with one fsync (group commit), so the cost per
+message is one short line instead of a rewrite of the whole conversation.
+
+Snapshots record the last sequence number they contain; replay skips
+records at or below it, so a crash between writing a snapshot and
+truncating its log never duplicates messages. A torn final line from a
+crash mid-append is cut off when the log is next read, so later appends
+start on a clean line.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .executor_pool import get_executor
+
+logger = logging.getLogger(__name__)
+
+
+class ChatLog:
+    """Per-tab append-only JSONL logs sharing one group-commit writer."""
+
+    SUFFIX = ".log"
+
+    def __init__(self, directory: Path, fsync: bool = True):
+        """
+        Initialize chat log.
+
+        Args:
+            directory: Directory holding ``<tab_id>.log`` files
+            fsync: fsync after every group write (durable on power loss)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        self.executor = get_executor()
+
+        self._seq: Dict[str, int] = {}
+        self._sizes: Dict[str, int] = {}
+        self._pending: Dict[str, List[str]] = defaultdict(list)
+        self._waiters: List[asyncio.Future] = []
+        self._writer_task: Optional[asyncio.Task] = None
+
+        self.group_writes = 0
+        self.records_written = 0
+
+    def path(self, tab_id: str) -> Path:
+        """Log file of a tab."""
+        return self.directory / f"{tab_id}{self.SUFFIX}"
+
+    def last_seq(self, tab_id: str) -> Optional[int]:
+        """Last sequence number assigned for a tab (None if unknown)."""
+        return self._seq.get(tab_id)
+
+    def size(self, tab_id: str) -> int:
+        """Bytes currently in a tab's log."""
+        return self._sizes.get(tab_id, 0)
+
+    async def append(self, tab_id: str, records: List[Dict[str, Any]]) -> int:
+        """
+        Append records to a tab's log and wait until they are durable.
+
+        Args:
+            tab_id: Tab the records belong to
+            records: Records (an ``op`` key plus payload)
+
+        Returns:
+            Sequence number of the last appended record
+        """
+        seq = self._seq.get(tab_id, 0)
+        if not records:
+            return seq
+
+        lines = self._pending[tab_id]
+        for record in records:
+            seq += 1
+            lines.append(json.dumps({"seq": seq, **record}, separators=(',', ':'), default=str) + "\n")
+        self._seq[tab_id] = seq
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._write_loop())
+        await waiter
+        return seq
+
+    async def _write_loop(self) -> None:
+        """Write queued records in groups until the queue is empty."""
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            batch, waiters = dict(self._pending), self._waiters
+            self._pending.clear()
+            self._waiters = []
+            try:
+                written = await loop.run_in_executor(self.executor, self._write_batch, batch)
+            except Exception as e:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(e)
+                continue
+
+            for tab_id, size in written.items():
+                self._sizes[tab_id] = self._sizes.get(tab_id, 0) + size
+            self.group_writes += 1
+            self.records_written += sum(len(lines) for lines in batch.values())
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    def _write_batch(self, batch: Dict[str, List[str]]) -> Dict[str, int]:
+        """Append one group of records per tab (runs in the thread pool)."""
+        written = {}
+        for tab_id, lines in batch.items():
+            data = "".join(lines).encode('utf-8')
+            with open(self.path(tab_id), 'ab') as f:
+                f.write(data)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            written[tab_id] = len(data)
+        return written
+
+    def read(self, tab_id: str, after_seq: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Read a tab's records newer than a snapshot.
+
+        A torn record at the tail is truncated away. Callers must not
+        append to the tab while reading it.
+
+        Args:
+            tab_id: Tab to read
+            after_seq: Sequence number already covered by the snapshot
+
+        Returns:
+            (records with seq > after_seq, last sequence number seen)
+        """
+        path = self.path(tab_id)
+        records = []
+        last_seq = after_seq
+        size = 0
+        torn = False
+        try:
+            with open(path, 'rb') as f:
+                for raw in f:
+                    try:
+                        # Records are only complete once their newline is on disk
+                        record = json.loads(raw) if raw.endswith(b"\n") else None
+                    except ValueError:
+                        record = None
+                    if record is None:
+                        # Torn write at the tail: everything before it is intact
+                        torn = True
+                        break
+                    size += len(raw)
+                    seq = record.get("seq", 0)
+                    last_seq = max(last_seq, seq)
+                    if seq > after_seq:
+                        records.append(record)
+            if torn:
+                # Otherwise the next append would merge into the fragment
+                logger.warning(f"Truncating incomplete record at byte {size} of {path}")
+                os.truncate(path, size)
+        except FileNotFoundError:
+            pass
+
+        self._seq[tab_id] = max(self._seq.get(tab_id, 0), last_seq)
+        self._sizes[tab_id] = size
+        return records, last_seq
+
+    def reset(self, tab_id: str, seq: int) -> None:
+        """
+        Empty a tab's log after its records were folded into a snapshot.
+
+        Args:
+            tab_id: Tab whose log to truncate
+            seq: Sequence number covered by the snapshot (numbering continues after it)
+        """
+        path = self.path(tab_id)
+        if path.exists():
+            with open(path, 'wb'):
+                pass
+        self._seq[tab_id] = seq
+        self._sizes[tab_id] = 0
+
+    def delete(self, tab_id: str) -> None:
+        """Remove a tab's log."""
+        self._pending.pop(tab_id, None)
+        self._seq.pop(tab_id, None)
+        self._sizes.pop(tab_id, None)
+        try:
+            self.path(tab_id).unlink()
+        except FileNotFoundError:
+            pass
+
+    async def flush(self) -> None:
+        """Wait for every queued record to be written."""
+        while self._writer_task is not None and not self._writer_task.done():
+            await self._writer_task
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get log statistics."""
+        return {
+            "tabs": len(self._seq),
+            "group_writes": self.group_writes,
+            "records_written": self.records_written,
+            "records_per_write": round(self.records_written / self.group_writes, 2)
+            if self.group_writes else 0.0,
+            "log_bytes": sum(self._sizes.values())
+        }
@@ -38,6 +38,8 @@ from .config import TorqConfig
 from .context_manager import ContextManager, ContextMatch
 from .logger import setup_logger
 from .executor_pool import get_executor, shutdown_executor
+from .chat_log import ChatLog
+from .chat_store import ChatStore
 
 
 class ChatTabStatus(Enum):
@@ -224,12 +226,13 @@ class BatchedChatPersistence:
     - Accumulates save requests in a queue
     - Flushes every FLUSH_INTERVAL seconds or FLUSH_THRESHOLD items
     - Reduces I/O operations by 10-100x for active chat sessions
+    - A flush appends only each tab's new messages (see ChatPersistence)
     """
 
     FLUSH_INTERVAL = 5.0  # Flush every 5 seconds
     FLUSH_THRESHOLD = 10  # Or after 10 pending changes
 
-    def __init__(self, persistence: 'ChatPersistence'):
+    def __init__(self, persistence: Union['ChatPersistence', 'SQLiteChatPersistence']):
         self.persistence = persistence
         self.logger = logging.getLogger(__name__)
         self._pending_tabs: Dict[str, ChatTab] = {}  # tab_id -> latest tab state
@@ -270,11 +273,30 @@ class BatchedChatPersistence:
             self._start_background_flush()
 
             # Flush if threshold reached
-            if len(self._pending_tabs) >= self.FLUSH_THRESHOLD:
-                await self.flush()
+            should_flush = len(self._pending_tabs) >= self.FLUSH_THRESHOLD
+
+        # flush() takes the lock itself
+        if should_flush:
+            await self.flush()
 
         return True
 
+    async def load_tab(self, tab_id: str) -> Optional[ChatTab]:
+        """Load a tab, preferring a queued state that has not been flushed yet."""
+        pending = self._pending_tabs.get(tab_id)
+        if pending is not None:
+            return pending
+        return await self.persistence.load_tab(tab_id)
+
+    async def load_messages(self, tab_id: str, limit: Optional[int] = None,
+                            offset: int = 0) -> List[ChatMessage]:
+        """Load a page of a tab's messages, including unflushed ones."""
+        pending = self._pending_tabs.get(tab_id)
+        if pending is not None:
+            end = None if limit is None else offset + limit
+            return pending.messages[offset:end]
+        return await self.persistence.load_messages(tab_id, limit, offset)
+
     async def save_checkpoint(self, checkpoint: ChatCheckpoint) -> bool:
         """Queue checkpoint for batched save."""
         async with self._lock:
@@ -284,8 +306,10 @@ class BatchedChatPersistence:
             self._start_background_flush()
 
             # Checkpoints are important, flush immediately if many pending
-            if len(self._pending_checkpoints) >= 5:
-                await self.flush()
+            should_flush = len(self._pending_checkpoints) >= 5
+
+        if should_flush:
+            await self.flush()
 
         return True
 
@@ -310,12 +334,12 @@ class BatchedChatPersistence:
         saved_tabs = 0
         saved_checkpoints = 0
 
-        for tab in tabs_to_save.values():
+        # Each tab contributes only the messages added since its last flush
+        if tabs_to_save:
             try:
-                await self.persistence.save_tab(tab)
-                saved_tabs += 1
+                saved_tabs = await self.persistence.save_tabs(list(tabs_to_save.values()))
             except Exception as e:
-                self.logger.error(f"Error flushing tab {tab.id}: {e}")
+                self.logger.error(f"Error flushing tabs: {e}")
 
         for checkpoint in checkpoints_to_save.values():
             try:
@@ -336,6 +360,7 @@ class BatchedChatPersistence:
             except asyncio.CancelledError:
                 pass
         await self.flush()
+        self.persistence.close()
 
     # Delegate all other methods to underlying persistence
     def __getattr__(self, name):
@@ -343,7 +368,18 @@ class BatchedChatPersistence:
 
 
 class ChatPersistence:
-    """Handles chat history persistence with rotation."""
+    """
+    Handles chat history persistence with rotation.
+
+    Each tab is stored as a snapshot (``tabs/<id>.json``) plus an append-only
+    log of the changes made since (``tabs/<id>.log``, see ChatLog). Saving a
+    tab appends only the messages added since the last save (preceded by a
+    truncate record if the tab was rolled back) and a header record; the log is folded back into the snapshot once it outgrows it, so
+    bytes written stay linear in the conversation length.
+    """
+
+    # Compact once the log exceeds both this and the snapshot size
+    COMPACT_MIN_BYTES = 64 * 1024
 
     def __init__(self, storage_path: Path, retention_days: int = 30):
         self.storage_path = storage_path
@@ -354,6 +390,12 @@ class ChatPersistence:
         # Initialize storage structure
         self._init_storage_structure()
 
+        self.log = ChatLog(self.storage_path / "tabs")
+        self.executor = get_executor()
+        # tab_id -> what is on disk: message_ids, header, snapshot_bytes
+        self._log_state: Dict[str, Dict[str, Any]] = {}
+        self._tab_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
     def _init_storage_structure(self) -> None:
         """Initialize storage directory structure."""
         try:
@@ -377,50 +419,159 @@ class ChatPersistence:
             self.logger.error(f"Error initializing storage structure: {e}")
 
     async def save_tab(self, tab: ChatTab) -> bool:
-        """Save a chat tab to persistent storage using async I/O."""
-        try:
-            tab_file = self.storage_path / "tabs" / f"{tab.id}.json"
-            tab_data = tab.to_dict()
-            json_content = json.dumps(tab_data, indent=2)
-
-            # Write to temporary file first for atomic operation (async)
-            temp_file = tab_file.with_suffix('.tmp')
-            async with aiofiles.open(temp_file, 'w', encoding='utf-8') as f:
-                await f.write(json_content)
-
-            # Atomic move (still need os.rename for atomicity)
-            if os.name == 'nt':  # Windows
-                if await aiofiles.os.path.exists(str(tab_file)):
-                    await aiofiles.os.remove(str(tab_file))
-                await aiofiles.os.rename(str(temp_file), str(tab_file))
-            else:
-                await aiofiles.os.rename(str(temp_file), str(tab_file))
+        """Save a chat tab, appending only what changed since the last save."""
+        return await self.save_tabs([tab]) == 1
 
-            # Update index
-            await self._update_index(tab.id, {
-                "title": tab.title,
-                "last_accessed": tab.last_accessed.isoformat(),
-                "status": tab.status.value,
-                "message_count": len(tab.messages)
-            })
+    async def save_tabs(self, tabs: List[ChatTab]) -> int:
+        """
+        Save several tabs at once.
 
-            return True
+        Deltas are appended concurrently so they share group-commit writes,
+        and the index is rewritten once for the whole batch.
 
-        except Exception as e:
-            self.logger.error(f"Error saving tab {tab.id}: {e}")
-            return False
+        Returns:
+            Number of tabs saved
+        """
+        results = await asyncio.gather(
+            *(self._save_tab_delta(tab) for tab in tabs), return_exceptions=True
+        )
+
+        entries = {}
+        for tab, result in zip(tabs, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error saving tab {tab.id}: {result}")
+            else:
+                entries[tab.id] = result
+
+        if entries:
+            await self._update_index_entries(entries)
+        return len(entries)
+
+    async def _save_tab_delta(self, tab: ChatTab) -> Dict[str, Any]:
+        """Append a tab's new messages and header to its log; returns its index entry."""
+        async with self._tab_locks[tab.id]:
+            state = self._log_state.get(tab.id)
+            header = self._tab_header(tab)
+            header_key = json.dumps(header, sort_keys=True, default=str)
+
+            if state is None:
+                # Not written (or loaded) by this process yet
+                await self._write_snapshot(tab)
+            else:
+                message_ids = state["message_ids"]
+                keep = self._common_prefix(message_ids, tab.messages)
+                records = []
+                if keep < len(message_ids):
+                    # History rolled back (checkpoint restore)
+                    records.append({"op": "truncate", "count": keep})
+                records.extend(
+                    {"op": "message", "message": msg.to_dict()} for msg in tab.messages[keep:]
+                )
+                if header_key != state["header"]:
+                    records.append({"op": "header", "tab": header})
+
+                if records:
+                    await self.log.append(tab.id, records)
+                    del message_ids[keep:]
+                    message_ids.extend(msg.id for msg in tab.messages[keep:])
+                    state["header"] = header_key
+
+                    if self.log.size(tab.id) > max(self.COMPACT_MIN_BYTES, state["snapshot_bytes"]):
+                        await self._write_snapshot(tab)
+
+        return self._index_entry(tab)
+
+    @staticmethod
+    def _common_prefix(message_ids: List[str], messages: List[ChatMessage]) -> int:
+        """Length of the persisted history that the tab still starts with."""
+        keep = min(len(message_ids), len(messages))
+        # Histories only grow or get cut back, so this matches at once
+        # unless the tab was rolled back
+        while keep and message_ids[keep - 1] != messages[keep - 1].id:
+            keep -= 1
+        return keep
+
+    @staticmethod
+    def _tab_header(tab: ChatTab) -> Dict[str, Any]:
+        """Everything about a tab except its messages."""
+        header = tab.to_dict()
+        del header["messages"]
+        return header
+
+    @staticmethod
+    def _index_entry(tab: ChatTab) -> Dict[str, Any]:
+        """Summary of a tab kept in index.json."""
+        return {
+            "id": tab.id,
+            "title": tab.title,
+            "last_accessed": tab.last_accessed.isoformat(),
+            "status": tab.status.value,
+            "message_count": len(tab.messages)
+        }
+
+    async def _write_snapshot(self, tab: ChatTab) -> None:
+        """Write a full snapshot of a tab and truncate its log (compaction)."""
+        tab_file = self.storage_path / "tabs" / f"{tab.id}.json"
+        seq = self.log.last_seq(tab.id) or 0
+        tab_data = tab.to_dict()
+        tab_data["log_seq"] = seq
+        json_content = json.dumps(tab_data, default=str)
+
+        # Write to temporary file first for atomic operation (async)
+        temp_file = tab_file.with_suffix('.tmp')
+        async with aiofiles.open(temp_file, 'w', encoding='utf-8') as f:
+            await f.write(json_content)
+
+        # Atomic move (still need os.rename for atomicity)
+        if os.name == 'nt':  # Windows
+            if await aiofiles.os.path.exists(str(tab_file)):
+                await aiofiles.os.remove(str(tab_file))
+            await aiofiles.os.rename(str(temp_file), str(tab_file))
+        else:
+            await aiofiles.os.rename(str(temp_file), str(tab_file))
+
+        # Records up to seq are now in the snapshot; replay skips them even
+        # if we crash before the log is emptied
+        self.log.reset(tab.id, seq)
+        self._remember_persisted(tab, len(json_content))
+
+    def _remember_persisted(self, tab: ChatTab, snapshot_bytes: int) -> None:
+        """Record what is on disk for a tab so the next save can append a delta."""
+        self._log_state[tab.id] = {
+            "message_ids": [msg.id for msg in tab.messages],
+            "header": json.dumps(self._tab_header(tab), sort_keys=True, default=str),
+            "snapshot_bytes": snapshot_bytes
+        }
 
     async def load_tab(self, tab_id: str) -> Optional[ChatTab]:
-        """Load a chat tab from persistent storage using async I/O."""
+        """Load a chat tab: read its snapshot and replay the log tail."""
         try:
-            tab_file = self.storage_path / "tabs" / f"{tab_id}.json"
-            if not await aiofiles.os.path.exists(str(tab_file)):
-                return None
+            async with self._tab_locks[tab_id]:
+                tab_file = self.storage_path / "tabs" / f"{tab_id}.json"
+                if not await aiofiles.os.path.exists(str(tab_file)):
+                    return None
 
-            async with aiofiles.open(tab_file, 'r', encoding='utf-8') as f:
-                content = await f.read()
+                async with aiofiles.open(tab_file, 'r', encoding='utf-8') as f:
+                    content = await f.read()
                 tab_data = json.loads(content)
-                return ChatTab.from_dict(tab_data)
+
+                loop = asyncio.get_running_loop()
+                records, _ = await loop.run_in_executor(
+                    self.executor, self.log.read, tab_id, tab_data.get("log_seq", 0)
+                )
+                messages = tab_data.setdefault("messages", [])
+                for record in records:
+                    op = record.get("op")
+                    if op == "message":
+                        messages.append(record["message"])
+                    elif op == "truncate":
+                        del messages[record["count"]:]
+                    elif op == "header":
+                        tab_data.update(record["tab"])
+
+                tab = ChatTab.from_dict(tab_data)
+                self._remember_persisted(tab, len(content))
+                return tab
 
         except Exception as e:
             self.logger.error(f"Error loading tab {tab_id}: {e}")
@@ -461,15 +612,36 @@ class ChatPersistence:
             self.logger.error(f"Error loading checkpoints for tab {tab_id}: {e}")
             return []
 
-    async def list_tabs(self) -> List[Dict[str, Any]]:
-        """List all available tabs."""
+    async def load_messages(self, tab_id: str, limit: Optional[int] = None,
+                            offset: int = 0) -> List[ChatMessage]:
+        """Load a page of a tab's messages."""
+        tab = await self.load_tab(tab_id)
+        if not tab:
+            return []
+        end = None if limit is None else offset + limit
+        return tab.messages[offset:end]
+
+    async def list_tabs(self, limit: Optional[int] = None,
+                        before: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        List available tabs, most recently accessed first.
+
+        Args:
+            limit: Maximum tabs to return
+            before: Last tab of the previous page (keyset cursor)
+        """
         try:
             index_file = self.storage_path / "index.json"
             if not index_file.exists():
                 return []
 
             index_data = json.loads(index_file.read_text(encoding='utf-8'))
-            return list(index_data.get("tabs", {}).values())
+            tabs = [{**info, "id": tab_id} for tab_id, info in index_data.get("tabs", {}).items()]
+            tabs.sort(key=lambda t: (t.get("last_accessed", ""), t["id"]), reverse=True)
+            if before is not None:
+                cursor = (before.get("last_accessed", ""), before["id"])
+                tabs = [t for t in tabs if (t.get("last_accessed", ""), t["id"]) < cursor]
+            return tabs[:limit] if limit is not None else tabs
 
         except Exception as e:
             self.logger.error(f"Error listing tabs: {e}")
@@ -482,6 +654,8 @@ class ChatPersistence:
             tab_file = self.storage_path / "tabs" / f"{tab_id}.json"
             if tab_file.exists():
                 tab_file.unlink()
+            self.log.delete(tab_id)
+            self._log_state.pop(tab_id, None)
 
             # Delete associated checkpoints
             checkpoint_dir = self.storage_path / "checkpoints"
@@ -510,20 +684,31 @@ class ChatPersistence:
             # Archive old tabs
             tabs_dir = self.storage_path / "tabs"
             archive_dir = self.storage_path / "archive"
+            index_tabs = json.loads(
+                (self.storage_path / "index.json").read_text(encoding='utf-8')
+            ).get("tabs", {})
 
             for tab_file in tabs_dir.glob("*.json"):
                 try:
-                    tab_data = json.loads(tab_file.read_text(encoding='utf-8'))
-                    last_accessed = datetime.fromisoformat(tab_data["last_accessed"])
-
-                    if last_accessed < cutoff_date:
-                        # Move to archive
-                        archive_file = archive_dir / tab_file.name
-                        shutil.move(str(tab_file), str(archive_file))
+                    tab_id = tab_file.stem
+                    # The index tracks header updates still sitting in the log
+                    last_accessed = index_tabs.get(tab_id, {}).get("last_accessed")
+                    if last_accessed is None:
+                        tab_data = json.loads(tab_file.read_text(encoding='utf-8'))
+                        last_accessed = tab_data["last_accessed"]
+
+                    if datetime.fromisoformat(last_accessed) < cutoff_date:
+                        async with self._tab_locks[tab_id]:
+                            # Move snapshot and log to archive
+                            shutil.move(str(tab_file), str(archive_dir / tab_file.name))
+                            log_file = self.log.path(tab_id)
+                            if log_file.exists():
+                                shutil.move(str(log_file), str(archive_dir / log_file.name))
+                            self.log.delete(tab_id)
+                            self._log_state.pop(tab_id, None)
                         stats["tabs_archived"] += 1
 
                         # Remove from index
-                        tab_id = tab_file.stem
                         await self._remove_from_index(tab_id)
 
                 except Exception as e:
@@ -555,11 +740,15 @@ class ChatPersistence:
 
     async def _update_index(self, tab_id: str, tab_info: Dict[str, Any]) -> None:
         """Update the index file."""
+        await self._update_index_entries({tab_id: tab_info})
+
+    async def _update_index_entries(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Update several index entries with a single index rewrite."""
         try:
             index_file = self.storage_path / "index.json"
             index_data = json.loads(index_file.read_text(encoding='utf-8'))
 
-            index_data["tabs"][tab_id] = tab_info
+            index_data["tabs"].update(entries)
             index_file.write_text(json.dumps(index_data, indent=2), encoding='utf-8')
 
         except Exception as e:
@@ -592,6 +781,147 @@ class ChatPersistence:
         except Exception as e:
             self.logger.error(f"Error updating cleanup timestamp: {e}")
 
+    def close(self) -> None:
+        """Nothing to release; log appends are awaited by their callers."""
+
+
+class SQLiteChatPersistence:
+    """
+    Chat persistence in a single SQLite database (see ChatStore).
+
+    Drop-in alternative to ChatPersistence for large histories: saves write
+    only the messages that changed, and listing, paging and retention run
+    as index-backed queries instead of reading tab files.
+    """
+
+    def __init__(self, storage_path: Path, retention_days: int = 30):
+        self.storage_path = storage_path
+        self.retention_days = retention_days
+        self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+
+        self.store = ChatStore(str(self.storage_path / "chats.sqlite"))
+        self.executor = get_executor()
+        self._tab_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def _run(self, func: Callable, *args) -> Any:
+        """Run a blocking store call in the shared thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def save_tab(self, tab: ChatTab) -> bool:
+        """Save a chat tab, writing only the messages that changed."""
+        return await self.save_tabs([tab]) == 1
+
+    async def save_tabs(self, tabs: List[ChatTab]) -> int:
+        """Save several tabs; returns the number saved."""
+        results = await asyncio.gather(
+            *(self._save_tab(tab) for tab in tabs), return_exceptions=True
+        )
+        saved = 0
+        for tab, result in zip(tabs, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error saving tab {tab.id}: {result}")
+            else:
+                saved += 1
+        return saved
+
+    async def _save_tab(self, tab: ChatTab) -> None:
+        """Write one tab's header and message delta."""
+        async with self._tab_locks[tab.id]:
+            # Copy on the event loop; the tab may change while the write runs
+            header = ChatPersistence._tab_header(tab)
+            messages = list(tab.messages)
+            await self._run(self._save_tab_sync, header, messages)
+
+    def _save_tab_sync(self, header: Dict[str, Any], messages: List[ChatMessage]) -> None:
+        """Keep the stored prefix that still matches and write the rest."""
+        tab_id = header["id"]
+        keep = min(self.store.message_count(tab_id) or 0, len(messages))
+        if keep and self.store.message_id(tab_id, keep - 1) != messages[keep - 1].id:
+            # Rolled back: find where the histories diverge and truncate there
+            keep = ChatPersistence._common_prefix(self.store.message_ids(tab_id), messages)
+        self.store.save_tab(header, keep, [
+            (msg.id, json.dumps(msg.to_dict(), default=str)) for msg in messages[keep:]
+        ])
+
+    async def load_tab(self, tab_id: str) -> Optional[ChatTab]:
+        """Load a chat tab with all its messages."""
+        try:
+            tab_data = await self._run(self.store.load_tab, tab_id)
+            return ChatTab.from_dict(tab_data) if tab_data else None
+        except Exception as e:
+            self.logger.error(f"Error loading tab {tab_id}: {e}")
+            return None
+
+    async def load_messages(self, tab_id: str, limit: Optional[int] = None,
+                            offset: int = 0) -> List[ChatMessage]:
+        """Load a page of a tab's messages without loading the rest."""
+        try:
+            rows = await self._run(self.store.get_messages, tab_id, offset, limit)
+            return [ChatMessage.from_dict(row) for row in rows]
+        except Exception as e:
+            self.logger.error(f"Error loading messages for tab {tab_id}: {e}")
+            return []
+
+    async def save_checkpoint(self, checkpoint: ChatCheckpoint) -> bool:
+        """Save a checkpoint."""
+        try:
+            await self._run(self.store.save_checkpoint, checkpoint.to_dict())
+            return True
+        except Exception as e:
+            self.logger.error(f"Error saving checkpoint {checkpoint.id}: {e}")
+            return False
+
+    async def load_checkpoints(self, tab_id: str) -> List[ChatCheckpoint]:
+        """Load all checkpoints for a tab, newest first."""
+        try:
+            rows = await self._run(self.store.load_checkpoints, tab_id)
+            return [ChatCheckpoint.from_dict(row) for row in rows]
+        except Exception as e:
+            self.logger.error(f"Error loading checkpoints for tab {tab_id}: {e}")
+            return []
+
+    async def list_tabs(self, limit: Optional[int] = None,
+                        before: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        List available tabs, most recently accessed first.
+
+        Args:
+            limit: Maximum tabs to return
+            before: Last tab of the previous page (keyset cursor)
+        """
+        try:
+            return await self._run(self.store.list_tabs, limit, before)
+        except Exception as e:
+            self.logger.error(f"Error listing tabs: {e}")
+            return []
+
+    async def delete_tab(self, tab_id: str) -> bool:
+        """Delete a tab and its associated data."""
+        try:
+            async with self._tab_locks[tab_id]:
+                await self._run(self.store.delete_tab, tab_id)
+            return True
+        except Exception as e:
+            self.logger.error(f"Error deleting tab {tab_id}: {e}")
+            return False
+
+    async def cleanup_old_data(self) -> Dict[str, int]:
+        """Archive old tabs and delete old checkpoints based on retention policy."""
+        try:
+            cutoff = (datetime.now() - timedelta(days=self.retention_days)).timestamp()
+            stats = await self._run(self.store.cleanup, cutoff)
+            self.logger.info(f"Cleanup completed: {stats}")
+            return stats
+        except Exception as e:
+            self.logger.error(f"Error during cleanup: {e}")
+            return {"tabs_archived": 0, "checkpoints_deleted": 0}
+
+    def close(self) -> None:
+        """Close the database."""
+        self.store.close()
+
 
 class MarkdownExporter:
     """Handles markdown export of chat conversations."""
@@ -706,7 +1036,7 @@ class ChatManager:
     """
 
     def __init__(self, config: TorqConfig, context_manager: ContextManager,
-                 storage_path: Optional[Path] = None):
+                 storage_path: Optional[Path] = None, backend: Optional[str] = None):
         self.config = config
         self.context_manager = context_manager
         self.logger = setup_logger("chat_manager")
@@ -716,8 +1046,14 @@ class ChatManager:
             storage_path = Path.home() / ".torq_console" / "chat_history"
         self.storage_path = storage_path
 
+        # Storage backend: "files" (JSON snapshots + logs) or "sqlite"
+        self.backend = backend or os.environ.get("TORQ_CHAT_BACKEND", "files")
+
         # Initialize components with batched persistence for performance
-        base_persistence = ChatPersistence(self.storage_path)
+        if self.backend == "sqlite":
+            base_persistence = SQLiteChatPersistence(self.storage_path)
+        else:
+            base_persistence = ChatPersistence(self.storage_path)
         self.persistence = BatchedChatPersistence(base_persistence)
         self.exporter = MarkdownExporter(self.storage_path)
 
@@ -958,11 +1294,8 @@ class ChatManager:
         """Get messages from a chat tab."""
         try:
             if tab_id not in self.active_tabs:
-                # Try to load from persistence
-                tab = await self.persistence.load_tab(tab_id)
-                if not tab:
-                    return []
-                self.active_tabs[tab_id] = tab
+                # Page straight from storage without loading the whole tab
+                return await self.persistence.load_messages(tab_id, limit or None, offset)
 
             tab = self.active_tabs[tab_id]
             messages = tab.messages[offset:]
@@ -1016,8 +1349,26 @@ class ChatManager:
 
             # Restore state from checkpoint
             state = checkpoint.state_snapshot
+            branch = None
             if "messages" in state:
+                # Full copy written before checkpoints stored offsets
                 tab.messages = [ChatMessage.from_dict(msg) for msg in state["messages"]]
+            elif "message_count" in state:
+                messages = self._messages_at_checkpoint(tab, state)
+                if messages is None:
+                    self.logger.warning(
+                        f"Checkpoint {checkpoint_id} is not on the current history of tab {tab_id}"
+                    )
+                    return False
+                count = state["message_count"]
+                if count < len(tab.messages):
+                    # Keep the discarded tail so restoring forward again can replay it
+                    branch = {
+                        "base": count,
+                        "base_message_id": tab.messages[count - 1].id if count else None,
+                        "messages": [msg.to_dict() for msg in tab.messages[count:]]
+                    }
+                tab.messages = messages
             if "context_state" in state:
                 tab.context_state = state["context_state"]
             if "model" in state:
@@ -1030,7 +1381,8 @@ class ChatManager:
 
             # Create checkpoint for this restoration
             await self._create_checkpoint(
-                tab_id, CheckpointType.AUTO, f"Restored to: {checkpoint.description}"
+                tab_id, CheckpointType.AUTO, f"Restored to: {checkpoint.description}",
+                branch=branch
             )
 
             # Notify WebSocket clients
@@ -1096,9 +1448,10 @@ class ChatManager:
                     })
 
             # Add available tabs from persistence
+            listed = {t["id"] for t in tab_list}
             persisted_tabs = await self.persistence.list_tabs()
             for tab_info in persisted_tabs:
-                if not any(t["id"] == tab_info.get("id") for t in tab_list):
+                if tab_info.get("id") not in listed:
                     tab_list.append({
                         **tab_info,
                         "is_active": False,
@@ -1175,7 +1528,9 @@ class ChatManager:
             # Get storage statistics
             storage_size = 0
             if self.storage_path.exists():
-                for file_path in self.storage_path.rglob("*.json"):
+                for file_path in self.storage_path.rglob("*"):
+                    if file_path.suffix not in (".json", ".log"):
+                        continue
                     try:
                         storage_size += file_path.stat().st_size
                     except Exception:
@@ -1196,8 +1551,16 @@ class ChatManager:
             return {}
 
     async def _create_checkpoint(self, tab_id: str, checkpoint_type: CheckpointType,
-                               description: str, auto_created: bool = True) -> Optional[ChatCheckpoint]:
-        """Create a checkpoint for a chat tab."""
+                               description: str, auto_created: bool = True,
+                               branch: Optional[Dict[str, Any]] = None) -> Optional[ChatCheckpoint]:
+        """
+        Create a checkpoint for a chat tab.
+
+        Messages are append-only, so a checkpoint records the message offset
+        (count plus id of the last message) instead of copying the history;
+        only the context is stored by value. ``branch`` carries messages a
+        restore cut off, so later checkpoints can still reach them.
+        """
         try:
             if tab_id not in self.active_tabs:
                 return None
@@ -1206,12 +1569,15 @@ class ChatManager:
 
             # Create state snapshot
             state_snapshot = {
-                "messages": [msg.to_dict() for msg in tab.messages],
+                "message_count": len(tab.messages),
+                "last_message_id": tab.messages[-1].id if tab.messages else None,
                 "context_state": tab.context_state.copy(),
                 "model": tab.model,
                 "system_prompt": tab.system_prompt,
                 "metadata": tab.metadata.copy()
             }
+            if branch:
+                state_snapshot["branch"] = branch
 
             # Create checkpoint
             checkpoint = ChatCheckpoint(
@@ -1245,17 +1611,45 @@ class ChatManager:
             self.logger.error(f"Error creating checkpoint: {e}")
             return None
 
+    def _messages_at_checkpoint(self, tab: ChatTab,
+                                state: Dict[str, Any]) -> Optional[List[ChatMessage]]:
+        """
+        Rebuild a tab's messages at a checkpoint offset.
+
+        Usually a truncation of the current history. If the checkpoint lies
+        on messages an earlier restore cut off, they are replayed from the
+        branch saved with that restore. Returns None if neither applies.
+        """
+        count = state["message_count"]
+        last_id = state.get("last_message_id")
+
+        if count == 0:
+            return []
+        if count <= len(tab.messages) and tab.messages[count - 1].id == last_id:
+            return tab.messages[:count]
+
+        for checkpoint in reversed(self.checkpoints.get(tab.id, [])):
+            branch = checkpoint.state_snapshot.get("branch")
+            if not branch:
+                continue
+            base = branch["base"]
+            offset = count - base
+            if base > len(tab.messages) or not 0 < offset <= len(branch["messages"]):
+                continue
+            if base and tab.messages[base - 1].id != branch["base_message_id"]:
+                continue
+            if branch["messages"][offset - 1]["id"] == last_id:
+                return tab.messages[:base] + [
+                    ChatMessage.from_dict(msg) for msg in branch["messages"][:offset]
+                ]
+
+        return None
+
     async def _load_existing_tabs(self) -> None:
         """Load existing tabs from persistence."""
         try:
-            tab_list = await self.persistence.list_tabs()
-
-            # Load recently accessed tabs
-            recent_tabs = sorted(
-                tab_list,
-                key=lambda t: t.get("last_accessed", ""),
-                reverse=True
-            )[:5]  # Load top 5 recent tabs
+            # Load top 5 recently accessed tabs (list_tabs is newest first)
+            recent_tabs = await self.persistence.list_tabs(limit=5)
 
             for tab_info in recent_tabs:
                 tab_id = tab_info.get("id")
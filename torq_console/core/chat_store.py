@@ -0,0 +1,305 @@
+"""
+Chat Store - SQLite (WAL) storage for chat tabs, messages and checkpoints.
+
+Optional backend for ChatPersistence when there are too many tabs or too
+much history to keep re-reading JSON files:
+
+    tabs(id, title, status, created_at, last_accessed, message_count, archived, header)
+    messages(tab_id, seq, id, data)       one row per message, seq = position
+    checkpoints(id, tab_id, timestamp, data)
+
+Listing, paging and retention are index-backed queries. Tab summaries never
+touch the messages table, and message pages are read with keyset
+pagination on (tab_id, seq), so the cost of a page does not depend on how
+far into the history it is. All methods are blocking and thread-safe; call
+them from an executor.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ChatStore:
+    """SQLite database of chat tabs, messages and checkpoints."""
+
+    SCHEMA_VERSION = 1
+
+    _SUMMARY_COLUMNS = "id, title, status, created_at, last_accessed, message_count"
+
+    def __init__(self, path: str):
+        """
+        Initialize chat store.
+
+        Args:
+            path: SQLite file to store chats in (created on first use)
+        """
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Connection
+    # ------------------------------------------------------------------
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the connection lazily. Caller holds the lock."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_schema(conn)
+            self._conn = conn
+        return self._conn
+
+    def _create_schema(self, conn: sqlite3.Connection):
+        """Create tables and indexes."""
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS tabs ("
+            " id TEXT PRIMARY KEY,"
+            " title TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_accessed REAL NOT NULL,"
+            " message_count INTEGER NOT NULL DEFAULT 0,"
+            " archived INTEGER NOT NULL DEFAULT 0,"
+            " header TEXT NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tabs_recent ON tabs (archived, last_accessed, id)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS messages ("
+            " tab_id TEXT NOT NULL,"
+            " seq INTEGER NOT NULL,"
+            " id TEXT NOT NULL,"
+            " data TEXT NOT NULL,"
+            " PRIMARY KEY (tab_id, seq)) WITHOUT ROWID"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            " id TEXT PRIMARY KEY,"
+            " tab_id TEXT NOT NULL,"
+            " timestamp REAL NOT NULL,"
+            " data TEXT NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_checkpoints_tab ON checkpoints (tab_id, timestamp)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_checkpoints_time ON checkpoints (timestamp)")
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+            (str(self.SCHEMA_VERSION),)
+        )
+        conn.commit()
+
+    @staticmethod
+    def _summary(row: Sequence[Any]) -> Dict[str, Any]:
+        """Tab summary dict from a _SUMMARY_COLUMNS row."""
+        return {
+            "id": row[0],
+            "title": row[1],
+            "status": row[2],
+            "created_at": datetime.fromtimestamp(row[3]).isoformat(),
+            "last_accessed": datetime.fromtimestamp(row[4]).isoformat(),
+            "message_count": row[5]
+        }
+
+    # ------------------------------------------------------------------
+    # Tabs and messages
+    # ------------------------------------------------------------------
+
+    def message_id(self, tab_id: str, seq: int) -> Optional[str]:
+        """Id of the message at a position (None if there is none)."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT id FROM messages WHERE tab_id = ? AND seq = ?", (tab_id, seq)
+            ).fetchone()
+        return row[0] if row else None
+
+    def message_ids(self, tab_id: str) -> List[str]:
+        """Ids of a tab's stored messages in order (no message bodies)."""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT id FROM messages WHERE tab_id = ? ORDER BY seq", (tab_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def message_count(self, tab_id: str) -> Optional[int]:
+        """Number of stored messages of a tab (None if the tab is unknown)."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT message_count FROM tabs WHERE id = ?", (tab_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def save_tab(self, tab: Dict[str, Any], keep: int,
+                 new_messages: List[Tuple[str, str]]) -> None:
+        """
+        Write a tab's header and the messages that changed.
+
+        Args:
+            tab: Tab dict without messages (ChatTab.to_dict() minus "messages")
+            keep: Stored messages to keep; later positions are deleted
+            new_messages: (id, JSON) of messages to store from position ``keep``
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM messages WHERE tab_id = ? AND seq >= ?", (tab["id"], keep))
+                conn.executemany(
+                    "INSERT INTO messages (tab_id, seq, id, data) VALUES (?, ?, ?, ?)",
+                    [(tab["id"], keep + i, msg_id, data) for i, (msg_id, data) in enumerate(new_messages)]
+                )
+                conn.execute(
+                    "INSERT INTO tabs (id, title, status, created_at, last_accessed,"
+                    " message_count, archived, header) VALUES (?, ?, ?, ?, ?, ?, 0, ?)"
+                    " ON CONFLICT(id) DO UPDATE SET title = excluded.title,"
+                    " status = excluded.status, last_accessed = excluded.last_accessed,"
+                    " message_count = excluded.message_count, archived = 0,"
+                    " header = excluded.header",
+                    (
+                        tab["id"], tab["title"], tab["status"],
+                        datetime.fromisoformat(tab["created_at"]).timestamp(),
+                        datetime.fromisoformat(tab["last_accessed"]).timestamp(),
+                        keep + len(new_messages),
+                        json.dumps(tab, default=str)
+                    )
+                )
+
+    def load_tab(self, tab_id: str) -> Optional[Dict[str, Any]]:
+        """Full tab dict (with messages), or None if unknown or archived."""
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT header FROM tabs WHERE id = ? AND archived = 0", (tab_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            messages = conn.execute(
+                "SELECT data FROM messages WHERE tab_id = ? ORDER BY seq", (tab_id,)
+            ).fetchall()
+        tab = json.loads(row[0])
+        tab["messages"] = [json.loads(data) for (data,) in messages]
+        return tab
+
+    def get_messages(self, tab_id: str, start: int = 0,
+                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Page of a tab's messages, seeking straight to ``start`` on the primary key.
+
+        Args:
+            tab_id: Tab to read
+            start: Position of the first message
+            limit: Maximum messages (None for all)
+        """
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT data FROM messages WHERE tab_id = ? AND seq >= ? ORDER BY seq LIMIT ?",
+                (tab_id, start, -1 if limit is None else limit)
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def list_tabs(self, limit: Optional[int] = None,
+                  before: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Summaries of live tabs, most recently accessed first.
+
+        Args:
+            limit: Maximum tabs (None for all)
+            before: Last summary of the previous page (keyset cursor)
+        """
+        query = f"SELECT {self._SUMMARY_COLUMNS} FROM tabs WHERE archived = 0"
+        params: List[Any] = []
+        if before is not None:
+            query += " AND (last_accessed, id) < (?, ?)"
+            params += [datetime.fromisoformat(before["last_accessed"]).timestamp(), before["id"]]
+        query += " ORDER BY last_accessed DESC, id DESC LIMIT ?"
+        params.append(-1 if limit is None else limit)
+
+        with self._lock:
+            rows = self._connection().execute(query, params).fetchall()
+        return [self._summary(row) for row in rows]
+
+    def delete_tab(self, tab_id: str) -> None:
+        """Delete a tab with its messages and checkpoints."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM messages WHERE tab_id = ?", (tab_id,))
+                conn.execute("DELETE FROM checkpoints WHERE tab_id = ?", (tab_id,))
+                conn.execute("DELETE FROM tabs WHERE id = ?", (tab_id,))
+
+    # ------------------------------------------------------------------
+    # Checkpoints
+    # ------------------------------------------------------------------
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        """Store a checkpoint dict (ChatCheckpoint.to_dict())."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO checkpoints (id, tab_id, timestamp, data)"
+                    " VALUES (?, ?, ?, ?)",
+                    (
+                        checkpoint["id"], checkpoint["tab_id"],
+                        datetime.fromisoformat(checkpoint["timestamp"]).timestamp(),
+                        json.dumps(checkpoint, default=str)
+                    )
+                )
+
+    def load_checkpoints(self, tab_id: str) -> List[Dict[str, Any]]:
+        """Checkpoint dicts of a tab, newest first."""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT data FROM checkpoints WHERE tab_id = ? ORDER BY timestamp DESC", (tab_id,)
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def cleanup(self, cutoff: float) -> Dict[str, int]:
+        """
+        Archive tabs and delete checkpoints older than a cutoff.
+
+        Archived tabs keep their messages but disappear from list_tabs()
+        and load_tab().
+
+        Args:
+            cutoff: POSIX timestamp
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                archived = conn.execute(
+                    "UPDATE tabs SET archived = 1 WHERE archived = 0 AND last_accessed < ?", (cutoff,)
+                ).rowcount
+                deleted = conn.execute(
+                    "DELETE FROM checkpoints WHERE timestamp < ?", (cutoff,)
+                ).rowcount
+        return {"tabs_archived": archived, "checkpoints_deleted": deleted}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        with self._lock:
+            conn = self._connection()
+            tabs = conn.execute("SELECT COUNT(*) FROM tabs WHERE archived = 0").fetchone()[0]
+            messages = conn.execute("SELECT COALESCE(SUM(message_count), 0) FROM tabs").fetchone()[0]
+            checkpoints = conn.execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0]
+        return {"tabs": tabs, "messages": messages, "checkpoints": checkpoints}
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,666 @@
+"""
+Code Graph - Persistent symbol and import graph for graph-based retrieval.
+
+Backs GraphTraversalRetriever with a SQLite database of what every file
+defines and imports:
+
+    files(file_id, path, mtime, size, module)
+    symbols(file_id, name, kind, line, signature)
+    imports(file_id, module, line)
+
+Python files are parsed with ``ast``; other languages use the Tree-sitter
+extractors when a grammar is loaded. Files are re-parsed only when their
+size or mtime changes. Import edges are resolved against the modules of
+indexed files into in-memory adjacency lists, so k-hop "related code"
+queries are plain breadth-first searches that never touch the source.
+"""
+
+import ast
+import logging
+import posixpath
+import sqlite3
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Longest signature stored per symbol
+MAX_SIGNATURE_CHARS = 200
+
+
+def module_name(rel_path: str) -> str:
+    """Dotted module name of a file path relative to the repository root."""
+    path = Path(rel_path)
+    parts = list(path.with_suffix('').parts)
+    if parts and parts[-1] == '__init__':
+        parts = parts[:-1]
+    # src-layout packages are imported without the src/ prefix
+    if len(parts) > 1 and parts[0] == 'src':
+        parts = parts[1:]
+    return '.'.join(parts)
+
+
+def parse_python_graph(source: str, module: str, is_package: bool = False) -> Dict[str, List]:
+    """
+    Extract symbols and absolute import targets from Python source.
+
+    Args:
+        source: File contents
+        module: Dotted module name of the file (resolves relative imports)
+        is_package: True for ``__init__.py`` files
+
+    Returns:
+        {'symbols': [(name, kind, line, signature)], 'imports': [(module, line)]}
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines()
+    package = module.split('.') if is_package else module.split('.')[:-1]
+
+    symbols = []
+    imports = []
+
+    def signature(node) -> str:
+        return lines[node.lineno - 1].strip()[:MAX_SIGNATURE_CHARS] if node.lineno <= len(lines) else ''
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            symbols.append((node.name, 'function', node.lineno, signature(node)))
+        elif isinstance(node, ast.ClassDef):
+            symbols.append((node.name, 'class', node.lineno, signature(node)))
+            for child in node.body:
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    symbols.append(
+                        (f"{node.name}.{child.name}", 'method', child.lineno, signature(child))
+                    )
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append((alias.name, node.lineno))
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package[:len(package) - (node.level - 1)] if node.level > 1 else package
+                prefix = '.'.join(base)
+                target = f"{prefix}.{node.module}" if node.module and prefix else (node.module or prefix)
+            else:
+                target = node.module or ''
+            if not target:
+                continue
+            # "from pkg import name" may import the submodule pkg.name
+            for alias in node.names:
+                if alias.name != '*':
+                    imports.append((f"{target}.{alias.name}", node.lineno))
+            imports.append((target, node.lineno))
+
+    return {'symbols': symbols, 'imports': imports}
+
+
+class CodeGraph:
+    """On-disk symbol/import graph with in-memory adjacency lists."""
+
+    SCHEMA_VERSION = 1
+
+    # Files re-parsed per write transaction during sync()
+    _BATCH_FILES = 200
+
+    # Source suffixes the graph understands
+    PYTHON_SUFFIXES = {'.py'}
+
+    def __init__(self, path: str, root_path: Path, tree_parser: Any = None):
+        """
+        Initialize code graph.
+
+        Args:
+            path: SQLite file to store the graph in (created on first use)
+            root_path: Directory indexed paths are stored relative to
+            tree_parser: TreeSitterParser used for non-Python files (optional)
+        """
+        self.path = Path(path)
+        self.root_path = Path(root_path)
+        self.tree_parser = tree_parser
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+        # In-memory view, loaded from the database on first use
+        self._loaded = False
+        self._paths: Dict[int, str] = {}
+        self._ids: Dict[str, int] = {}
+        self._module_to_file: Dict[str, int] = {}
+        self._file_modules: Dict[int, str] = {}
+        self._file_imports: Dict[int, Set[str]] = {}
+        # Every dotted prefix of an import target -> files importing below it
+        self._importers: Dict[str, Set[int]] = defaultdict(set)
+        self._out: Dict[int, Set[int]] = defaultdict(set)
+        self._in: Dict[int, Set[int]] = defaultdict(set)
+        # Files whose outgoing edges must be re-resolved
+        self._unresolved: Set[int] = set()
+
+        self.files_indexed = 0
+        self.files_removed = 0
+        self.last_sync_seconds = 0.0
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database lazily. Caller holds the lock."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_schema(conn)
+            self._conn = conn
+        return self._conn
+
+    def _create_schema(self, conn: sqlite3.Connection):
+        """Create tables, dropping a graph written with a different schema."""
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        if row is not None and int(row[0]) != self.SCHEMA_VERSION:
+            logger.info(f"Code graph schema changed ({row[0]} -> {self.SCHEMA_VERSION}), rebuilding")
+            for table in ('imports', 'symbols', 'files'):
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " file_id INTEGER PRIMARY KEY,"
+            " path TEXT UNIQUE NOT NULL,"
+            " mtime REAL NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " module TEXT NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS symbols ("
+            " file_id INTEGER NOT NULL,"
+            " name TEXT NOT NULL,"
+            " name_lower TEXT NOT NULL,"
+            " kind TEXT NOT NULL,"
+            " line INTEGER NOT NULL,"
+            " signature TEXT NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS imports ("
+            " file_id INTEGER NOT NULL,"
+            " module TEXT NOT NULL,"
+            " line INTEGER NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_symbols_file ON symbols (file_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_symbols_name ON symbols (name_lower)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_imports_file ON imports (file_id)")
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+            (str(self.SCHEMA_VERSION),)
+        )
+        conn.commit()
+
+    def _ensure_loaded(self):
+        """Build the in-memory adjacency lists from the database. Caller holds the lock."""
+        if self._loaded:
+            return
+        conn = self._connect()
+        for file_id, path, module in conn.execute("SELECT file_id, path, module FROM files"):
+            self._add_file(file_id, path, module)
+        imports: Dict[int, Set[str]] = defaultdict(set)
+        for file_id, target in conn.execute("SELECT file_id, module FROM imports"):
+            imports[file_id].add(target)
+        for file_id, targets in imports.items():
+            self._add_imports(file_id, targets)
+        self._unresolved.update(self._file_imports)
+        self._resolve_pending()
+        self._loaded = True
+
+    # ------------------------------------------------------------------
+    # Adjacency maintenance
+    # ------------------------------------------------------------------
+
+    def _resolve(self, target: str) -> Optional[int]:
+        """Map an import target to the indexed file defining the longest module prefix."""
+        parts = target.split('.')
+        for end in range(len(parts), 0, -1):
+            file_id = self._module_to_file.get('.'.join(parts[:end]))
+            if file_id is not None:
+                return file_id
+        return None
+
+    def _resolve_edges(self, file_id: int):
+        """Recompute the outgoing import edges of one file."""
+        for target_id in self._out.pop(file_id, set()):
+            self._in[target_id].discard(file_id)
+
+        targets = set()
+        for target in self._file_imports.get(file_id, ()):
+            target_id = self._resolve(target)
+            if target_id is not None and target_id != file_id:
+                targets.add(target_id)
+        if targets:
+            self._out[file_id] = targets
+            for target_id in targets:
+                self._in[target_id].add(file_id)
+
+    def _resolve_pending(self):
+        """Re-resolve edges of every file marked unresolved."""
+        for file_id in self._unresolved:
+            if file_id in self._paths:
+                self._resolve_edges(file_id)
+        self._unresolved.clear()
+
+    @staticmethod
+    def _prefixes(target: str) -> List[str]:
+        """'a.b.c' -> ['a', 'a.b', 'a.b.c']."""
+        parts = target.split('.')
+        return ['.'.join(parts[:end]) for end in range(1, len(parts) + 1)]
+
+    def _add_file(self, file_id: int, path: str, module: str):
+        """Register a file (and the module it defines) in memory."""
+        self._paths[file_id] = path
+        self._ids[path] = file_id
+        if module:
+            self._module_to_file[module] = file_id
+            self._file_modules[file_id] = module
+            # Imports that resolved to a shorter prefix may now resolve here
+            self._unresolved |= self._importers.get(module, set())
+
+    def _add_imports(self, file_id: int, targets: Set[str]):
+        """Register a file's import targets in memory."""
+        if not targets:
+            return
+        self._file_imports[file_id] = targets
+        for target in targets:
+            for prefix in self._prefixes(target):
+                self._importers[prefix].add(file_id)
+        self._unresolved.add(file_id)
+
+    def _forget_file(self, file_id: int):
+        """Drop a file from the in-memory graph."""
+        path = self._paths.pop(file_id, None)
+        self._ids.pop(path, None)
+        module = self._file_modules.pop(file_id, None)
+        if module is not None and self._module_to_file.get(module) == file_id:
+            del self._module_to_file[module]
+            # Importers of this module must fall back to another target
+            self._unresolved |= self._importers.get(module, set())
+        for target in self._file_imports.pop(file_id, ()):
+            for prefix in self._prefixes(target):
+                importers = self._importers.get(prefix)
+                if importers is not None:
+                    importers.discard(file_id)
+                    if not importers:
+                        del self._importers[prefix]
+        for target_id in self._out.pop(file_id, set()):
+            self._in[target_id].discard(file_id)
+        for source_id in self._in.pop(file_id, set()):
+            self._out[source_id].discard(file_id)
+            self._unresolved.add(source_id)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _relative(self, file_path: Path) -> str:
+        """Path key stored in the files table."""
+        file_path = Path(file_path)
+        try:
+            return file_path.relative_to(self.root_path).as_posix()
+        except ValueError:
+            return file_path.as_posix()
+
+    def supports(self, file_path: Path) -> bool:
+        """Check whether a file's language can be parsed into the graph."""
+        suffix = Path(file_path).suffix.lower()
+        if suffix in self.PYTHON_SUFFIXES:
+            return True
+        parser = self.tree_parser
+        return bool(
+            parser is not None and parser.available
+            and parser.language_map.get(suffix) in parser.parsers
+        )
+
+    def is_empty(self) -> bool:
+        """Check whether no file has been indexed yet."""
+        with self._lock:
+            return self._connect().execute("SELECT 1 FROM files LIMIT 1").fetchone() is None
+
+    def sync(self, files: Iterable[Path], prune: bool = True) -> Dict[str, int]:
+        """
+        Bring the graph in line with a list of files.
+
+        Only files whose size or mtime differ from the stored entry are parsed.
+
+        Args:
+            files: Source files that should be in the graph
+            prune: Drop indexed files that are not in ``files``
+
+        Returns:
+            Counts of indexed, removed and unchanged files
+        """
+        start_time = time.time()
+        indexed = removed = unchanged = 0
+
+        with self._lock:
+            conn = self._connect()
+            self._ensure_loaded()
+            stored = {
+                path: (file_id, mtime, size)
+                for file_id, path, mtime, size in conn.execute(
+                    "SELECT file_id, path, mtime, size FROM files"
+                )
+            }
+
+            seen = set()
+            pending = 0
+            for file_path in files:
+                file_path = Path(file_path)
+                if not self.supports(file_path):
+                    continue
+                rel = self._relative(file_path)
+                if rel in seen:
+                    continue
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                seen.add(rel)
+
+                entry = stored.get(rel)
+                if entry is not None and entry[1] == stat.st_mtime and entry[2] == stat.st_size:
+                    unchanged += 1
+                    continue
+
+                self._index_file(conn, file_path, rel, stat, entry[0] if entry else None)
+                indexed += 1
+                pending += 1
+                if pending >= self._BATCH_FILES:
+                    conn.commit()
+                    pending = 0
+
+            if prune:
+                for rel, (file_id, _, _) in stored.items():
+                    if rel not in seen:
+                        self._delete_file(conn, file_id)
+                        removed += 1
+            conn.commit()
+            self._resolve_pending()
+
+        self.files_indexed += indexed
+        self.files_removed += removed
+        self.last_sync_seconds = time.time() - start_time
+        logger.info(
+            f"Code graph synced in {self.last_sync_seconds:.2f}s "
+            f"({indexed} indexed, {removed} removed, {unchanged} unchanged)"
+        )
+        return {'indexed': indexed, 'removed': removed, 'unchanged': unchanged}
+
+    def update_file(self, file_path: Path) -> bool:
+        """
+        Re-parse one file, or drop it if it no longer exists.
+
+        Returns:
+            True if the graph changed
+        """
+        file_path = Path(file_path)
+        rel = self._relative(file_path)
+        with self._lock:
+            conn = self._connect()
+            self._ensure_loaded()
+            row = conn.execute(
+                "SELECT file_id, mtime, size FROM files WHERE path = ?", (rel,)
+            ).fetchone()
+            try:
+                stat = file_path.stat()
+            except OSError:
+                stat = None
+            if stat is None or not self.supports(file_path):
+                if row is None:
+                    return False
+                self._delete_file(conn, row[0])
+                conn.commit()
+                self._resolve_pending()
+                self.files_removed += 1
+                return True
+
+            if row is not None and row[1] == stat.st_mtime and row[2] == stat.st_size:
+                return False
+            self._index_file(conn, file_path, rel, stat, row[0] if row else None)
+            conn.commit()
+            self._resolve_pending()
+            self.files_indexed += 1
+            return True
+
+    def remove_file(self, file_path: Path) -> bool:
+        """
+        Drop a file from the graph.
+
+        Returns:
+            True if the file was indexed
+        """
+        rel = self._relative(file_path)
+        with self._lock:
+            conn = self._connect()
+            self._ensure_loaded()
+            row = conn.execute("SELECT file_id FROM files WHERE path = ?", (rel,)).fetchone()
+            if row is None:
+                return False
+            self._delete_file(conn, row[0])
+            conn.commit()
+            self._resolve_pending()
+            self.files_removed += 1
+            return True
+
+    def _extract(self, file_path: Path, rel: str) -> Tuple[str, Dict[str, List]]:
+        """Parse a file into (module, {'symbols': [...], 'imports': [...]})."""
+        if file_path.suffix.lower() in self.PYTHON_SUFFIXES:
+            module = module_name(rel)
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                source = f.read()
+            return module, parse_python_graph(source, module, file_path.name == '__init__.py')
+
+        # Other languages: modules are extension-less paths ("src/util"), and
+        # relative specifiers ("./util") are resolved against the file's folder
+        module = posixpath.splitext(rel)[0]
+        if module.endswith('/index'):
+            module = module[:-len('/index')]
+        parsed = self.tree_parser.parse_file(file_path) or {}
+        symbols = [
+            (item['name'], kind, item.get('line', 0), item.get('signature', '')[:MAX_SIGNATURE_CHARS])
+            for kind, key in (('function', 'functions'), ('class', 'classes'))
+            for item in parsed.get(key, [])
+        ]
+        imports = []
+        for target in parsed.get('imports', []):
+            if target.startswith('.'):
+                target = posixpath.splitext(
+                    posixpath.normpath(posixpath.join(posixpath.dirname(rel), target))
+                )[0]
+            imports.append((target, 0))
+        return module, {'symbols': symbols, 'imports': imports}
+
+    def _index_file(self, conn: sqlite3.Connection, file_path: Path, rel: str,
+                    stat, file_id: Optional[int]):
+        """Parse a file and replace its graph rows. Caller holds the lock."""
+        try:
+            module, graph = self._extract(file_path, rel)
+        except (OSError, SyntaxError, ValueError) as e:
+            # Keep the file (and its module) in the graph without edges
+            logger.debug(f"Failed to parse {file_path}: {e}")
+            module = module_name(rel) if file_path.suffix.lower() in self.PYTHON_SUFFIXES \
+                else posixpath.splitext(rel)[0]
+            graph = {'symbols': [], 'imports': []}
+
+        if file_id is None:
+            file_id = conn.execute(
+                "INSERT INTO files (path, mtime, size, module) VALUES (?, ?, ?, ?)",
+                (rel, stat.st_mtime, stat.st_size, module)
+            ).lastrowid
+        else:
+            conn.execute("DELETE FROM symbols WHERE file_id = ?", (file_id,))
+            conn.execute("DELETE FROM imports WHERE file_id = ?", (file_id,))
+            conn.execute(
+                "UPDATE files SET mtime = ?, size = ?, module = ? WHERE file_id = ?",
+                (stat.st_mtime, stat.st_size, module, file_id)
+            )
+            self._forget_file(file_id)
+
+        conn.executemany(
+            "INSERT INTO symbols (file_id, name, name_lower, kind, line, signature)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (file_id, name, name.rsplit('.', 1)[-1].lower(), kind, line, signature)
+                for name, kind, line, signature in graph['symbols']
+            ]
+        )
+        conn.executemany(
+            "INSERT INTO imports (file_id, module, line) VALUES (?, ?, ?)",
+            [(file_id, target, line) for target, line in graph['imports']]
+        )
+
+        # Edges are re-resolved once the caller's batch is done
+        self._add_file(file_id, rel, module)
+        self._add_imports(file_id, {target for target, _ in graph['imports']})
+
+    def _delete_file(self, conn: sqlite3.Connection, file_id: int):
+        """Remove a file and its graph rows. Caller holds the lock."""
+        conn.execute("DELETE FROM symbols WHERE file_id = ?", (file_id,))
+        conn.execute("DELETE FROM imports WHERE file_id = ?", (file_id,))
+        conn.execute("DELETE FROM files WHERE file_id = ?", (file_id,))
+        self._forget_file(file_id)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def find_symbols(self, names: List[str], limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Look up symbols by (case-insensitive) name.
+
+        Args:
+            names: Symbol names; methods match on their own name
+            limit: Maximum number of symbols to return
+
+        Returns:
+            Symbol dicts (file_path, name, kind, line, signature)
+        """
+        names = list(dict.fromkeys(name.lower() for name in names))
+        if not names:
+            return []
+        placeholders = ",".join("?" * len(names))
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT f.path, s.name, s.kind, s.line, s.signature FROM symbols s"
+                " JOIN files f ON f.file_id = s.file_id"
+                f" WHERE s.name_lower IN ({placeholders})"
+                " ORDER BY s.kind = 'method', f.path, s.line LIMIT ?",
+                [*names, limit]
+            ).fetchall()
+        return [
+            {'file_path': self.root_path / path, 'name': name, 'kind': kind,
+             'line': line, 'signature': signature}
+            for path, name, kind, line, signature in rows
+        ]
+
+    def find_modules(self, names: List[str]) -> List[Path]:
+        """Files whose module name (or its last component) matches one of ``names``."""
+        names = {name.lower() for name in names}
+        with self._lock:
+            self._ensure_loaded()
+            return [
+                self.root_path / self._paths[file_id]
+                for module, file_id in self._module_to_file.items()
+                if module.lower() in names or module.rsplit('.', 1)[-1].lower() in names
+            ]
+
+    def neighbors(self, file_path: Path, k: int = 2, direction: str = 'both') -> Dict[Path, int]:
+        """
+        Files within ``k`` import hops of a file.
+
+        Args:
+            file_path: Starting file
+            k: Maximum number of hops
+            direction: 'imports' (dependencies), 'imported_by' (dependents) or 'both'
+
+        Returns:
+            Mapping of neighbour path to hop distance (the start file excluded)
+        """
+        rel = self._relative(file_path)
+        with self._lock:
+            self._ensure_loaded()
+            start = self._ids.get(rel)
+            if start is None:
+                return {}
+
+            edges: List[Callable[[int], Set[int]]] = []
+            if direction in ('imports', 'both'):
+                edges.append(lambda node: self._out.get(node, set()))
+            if direction in ('imported_by', 'both'):
+                edges.append(lambda node: self._in.get(node, set()))
+
+            distances = {start: 0}
+            queue = deque([start])
+            while queue:
+                node = queue.popleft()
+                if distances[node] >= k:
+                    continue
+                for next_nodes in edges:
+                    for neighbor in next_nodes(node):
+                        if neighbor not in distances:
+                            distances[neighbor] = distances[node] + 1
+                            queue.append(neighbor)
+
+            return {
+                self.root_path / self._paths[node]: hops
+                for node, hops in distances.items() if node != start
+            }
+
+    def file_symbols(self, file_path: Path, limit: int = 10) -> List[Dict[str, Any]]:
+        """Top-level functions and classes defined in a file, in source order."""
+        rel = self._relative(file_path)
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT s.name, s.kind, s.line, s.signature FROM symbols s"
+                " JOIN files f ON f.file_id = s.file_id"
+                " WHERE f.path = ? AND s.kind != 'method' ORDER BY s.line LIMIT ?",
+                (rel, limit)
+            ).fetchall()
+        return [
+            {'name': name, 'kind': kind, 'line': line, 'signature': signature}
+            for name, kind, line, signature in rows
+        ]
+
+    def get_stats(self) -> Dict:
+        """Get graph statistics."""
+        with self._lock:
+            conn = self._connect()
+            self._ensure_loaded()
+            files = conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            symbols = conn.execute("SELECT COUNT(*) FROM symbols").fetchone()[0]
+            edges = sum(len(targets) for targets in self._out.values())
+        return {
+            'path': str(self.path),
+            'files': files,
+            'symbols': symbols,
+            'import_edges': edges,
+            'files_indexed': self.files_indexed,
+            'files_removed': self.files_removed,
+            'last_sync_seconds': round(self.last_sync_seconds, 3)
+        }
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._loaded = False
+            self._paths.clear()
+            self._ids.clear()
+            self._module_to_file.clear()
+            self._file_modules.clear()
+            self._file_imports.clear()
+            self._unresolved.clear()
+            self._importers.clear()
+            self._out.clear()
+            self._in.clear()
@@ -105,9 +105,12 @@ class TorqConsole:
         self.git_manager = GitManager(self.repo_path)
         self.ai_integration = AIIntegration(model=model, config=config)
         self.file_monitor = FileMonitor(self.repo_path)
+        self.context_manager.watch(self.file_monitor)
 
         # Initialize LLM infrastructure
         self.llm_manager = LLMManager(config)
+        if self.llm_manager.semantic_search is not None:
+            self.context_manager.attach_semantic_search(self.llm_manager.semantic_search)
         self.web_search_provider = WebSearchProvider()
 
         # Initialize advanced swarm orchestrator with enhanced features
@@ -189,6 +192,12 @@ class TorqConsole:
 
     async def initialize_async(self):
         """Async initialization for components that need it"""
+        # Start file monitoring so context indexes see edits as they happen
+        try:
+            await self.file_monitor.start()
+        except Exception as e:
+            self.logger.error(f"Failed to start file monitoring: {e}")
+
         try:
             # Initialize enhanced MCP integration
             await self.enhanced_mcp.initialize()
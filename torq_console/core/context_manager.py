@@ -6,7 +6,6 @@ Tree-sitter integration, and memory-efficient caching for enhanced AI pair progr
 """
 
 import asyncio
-import linecache
 import logging
 import re
 import json
@@ -16,10 +15,11 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional, Union, Set, Tuple, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from collections import defaultdict, OrderedDict
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 import weakref
 import os
+import fnmatch
 
 # Pre-compiled regex patterns for hot paths
 _WORD_PATTERN = re.compile(r'\b\w+\b')
@@ -37,6 +37,8 @@ except ImportError:
 from .config import TorqConfig
 from .logger import setup_logger
 from .executor_pool import get_executor
+from .keyword_index import KeywordIndex
+from .code_graph import CodeGraph
 
 
 @dataclass
@@ -314,25 +316,98 @@ class TreeSitterParser:
             self.logger.error(f"Error parsing {file_path}: {e}")
             return None
 
+    # Grammar node types per construct (shared across the loaded languages)
+    FUNCTION_NODE_TYPES = {
+        'function_definition', 'function_declaration', 'method_definition',
+        'method_declaration', 'function_item', 'constructor_declaration'
+    }
+    CLASS_NODE_TYPES = {
+        'class_definition', 'class_declaration', 'interface_declaration',
+        'struct_item', 'enum_item', 'trait_item', 'struct_specifier', 'type_spec'
+    }
+    IMPORT_NODE_TYPES = {
+        'import_statement', 'import_from_statement', 'import_declaration',
+        'import_spec', 'use_declaration', 'preproc_include'
+    }
+    STRING_NODE_TYPES = {
+        'string', 'string_literal', 'interpreted_string_literal',
+        'raw_string_literal', 'system_lib_string', 'string_fragment'
+    }
+
+    @staticmethod
+    def _walk(node: Any):
+        """Iterate over a node and all of its descendants (pre-order)."""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(reversed(current.children))
+
+    @staticmethod
+    def _node_text(node: Any, source: bytes) -> str:
+        """Source text covered by a node."""
+        return source[node.start_byte:node.end_byte].decode('utf-8', errors='ignore')
+
+    def _definition(self, node: Any, source: bytes, kind: str) -> Optional[Dict[str, Any]]:
+        """Describe a function/class node by name, line and first source line."""
+        name_node = node.child_by_field_name('name')
+        if name_node is None:
+            return None
+        text = self._node_text(node, source)
+        return {
+            'name': self._node_text(name_node, source),
+            'kind': kind,
+            'line': node.start_point[0] + 1,
+            'end_line': node.end_point[0] + 1,
+            'signature': text.splitlines()[0].strip() if text else ''
+        }
+
     def _extract_symbols(self, tree: Any, source: bytes) -> List[Dict[str, Any]]:
         """Extract symbols from parse tree."""
-        # This would implement symbol extraction logic
-        return []
+        symbols = []
+        for node in self._walk(tree.root_node):
+            if node.type in self.FUNCTION_NODE_TYPES:
+                symbol = self._definition(node, source, 'function')
+            elif node.type in self.CLASS_NODE_TYPES:
+                symbol = self._definition(node, source, 'class')
+            else:
+                continue
+            if symbol is not None:
+                symbols.append(symbol)
+        return symbols
 
     def _extract_imports(self, tree: Any, source: bytes, language: str) -> List[str]:
         """Extract import statements."""
-        # This would implement import extraction logic
-        return []
+        imports = []
+        for node in self._walk(tree.root_node):
+            if node.type not in self.IMPORT_NODE_TYPES:
+                continue
+
+            target = None
+            # JS/TS/Go/C: the module is a string literal ("./util", <stdio.h>)
+            for child in self._walk(node):
+                if child.type in self.STRING_NODE_TYPES:
+                    target = self._node_text(child, source).strip('"\'`<>')
+                    break
+            # Python/Java/Rust: the module is a dotted/scoped name
+            if target is None:
+                name_node = node.child_by_field_name('module_name') or \
+                    node.child_by_field_name('argument') or \
+                    next((c for c in node.children
+                          if c.type in ('dotted_name', 'scoped_identifier', 'identifier')), None)
+                if name_node is not None:
+                    target = self._node_text(name_node, source).replace('::', '.')
+            if target:
+                imports.append(target)
+        return imports
 
     def _extract_functions(self, tree: Any, source: bytes, language: str) -> List[Dict[str, Any]]:
         """Extract function definitions."""
-        # This would implement function extraction logic
-        return []
+        return [s for s in self._extract_symbols(tree, source) if s['kind'] == 'function']
 
     def _extract_classes(self, tree: Any, source: bytes, language: str) -> List[Dict[str, Any]]:
         """Extract class definitions."""
-        # This would implement class extraction logic
-        return []
+        return [s for s in self._extract_symbols(tree, source) if s['kind'] == 'class']
 
 
 class AtSymbolParser:
@@ -402,114 +477,165 @@ class AtSymbolParser:
 
 class KeywordRetriever:
     """
-    Keyword-based context retrieval with inverted index.
+    Keyword-based context retrieval with a persistent inverted index.
 
-    Uses an inverted index (keyword -> [(file, lines)]) for O(m + k) search
-    instead of O(n * terms) file scanning.
+    Postings live on disk in a KeywordIndex (keyword -> {file: [(line, token)]})
+    for O(m + k) search instead of O(n * terms) file scanning. The index is
+    loaded from disk at startup, refreshed incrementally in the background
+    and kept current by FileMonitor events.
     """
 
-    def __init__(self, cache: LRUCache):
+    # Directories never indexed
+    IGNORE_DIRS = {
+        '__pycache__', 'node_modules', '.git', '.venv', 'venv', 'env',
+        'build', 'dist', '.pytest_cache', '.mypy_cache', '.torq-index',
+        'target', '.idea', '.vscode'
+    }
+
+    def __init__(self, cache: LRUCache, index_path: Optional[Path] = None):
         self.cache = cache
         self.logger = logging.getLogger(__name__)
         self.executor = get_executor()
 
-        # Inverted index: keyword -> {file_path: [line_numbers]}
-        self.inverted_index: Dict[str, Dict[Path, List[int]]] = {}
+        # On-disk inverted index (default: <root>/.torq-index/keywords.sqlite)
+        self.index_path = index_path
+        self.index: Optional[KeywordIndex] = None
+        self.index_root: Optional[Path] = None
         self.index_timestamp: Optional[datetime] = None
         self.index_lock = asyncio.Lock()
-        # Rebuild index every 5 minutes or on first search
+        # Re-stat the tree in the background at most every 5 minutes;
+        # FileMonitor events keep the index current in between
         self.index_ttl_seconds = 300
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._extra_patterns: Set[str] = set()
+        # Bumped whenever the index changes; part of the result cache key
+        self._index_generation = 0
+
+    def _open_index(self, root_path: Path) -> KeywordIndex:
+        """Open (or switch to) the on-disk index for a root directory."""
+        if self.index is not None and self.index_root == root_path:
+            return self.index
+        if self.index is not None:
+            self.index.close()
+
+        index_path = self.index_path or root_path / '.torq-index' / 'keywords.sqlite'
+        self.index = KeywordIndex(str(index_path), root_path)
+        self.index_root = root_path
+        self.index_timestamp = None
+        self._extra_patterns.clear()
+        return self.index
 
     async def _ensure_index_built(self, root_path: Path, file_patterns: List[str] = None) -> None:
-        """Ensure inverted index is built and up-to-date."""
+        """Ensure the inverted index exists; refresh stale entries without blocking."""
         async with self.index_lock:
-            # Check if index needs rebuild
-            if self.index_timestamp is None or \
-               (datetime.now() - self.index_timestamp).total_seconds() > self.index_ttl_seconds:
-
-                self.logger.info("Building inverted index...")
-                start_time = datetime.now()
-
-                files_to_index = await self._get_files_to_search(root_path, file_patterns)
-                new_index: Dict[str, Dict[Path, List[int]]] = defaultdict(lambda: defaultdict(list))
-
-                # Process files in batches
-                for file_path in files_to_index[:500]:  # Index up to 500 files
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            for line_num, line in enumerate(f, 1):
-                                line_lower = line.lower()
-                                # Extract words and index them (pre-compiled regex)
-                                for match in _WORD_PATTERN.finditer(line_lower):
-                                    word = match.group()
-                                    if len(word) > 2:  # Skip very short words
-                                        new_index[word][file_path].append(line_num)
-                    except Exception:
-                        continue  # Skip problematic files
-
-                self.inverted_index = dict(new_index)
-                self.index_timestamp = datetime.now()
-
-                elapsed = (datetime.now() - start_time).total_seconds()
-                self.logger.info(f"Inverted index built in {elapsed:.2f}s "
-                               f"({len(self.inverted_index)} keywords, {len(files_to_index)} files)")
+            index = self._open_index(root_path)
+            if file_patterns:
+                new_patterns = set(file_patterns) - self._extra_patterns
+                self._extra_patterns.update(file_patterns)
+            else:
+                new_patterns = set()
+
+            loop = asyncio.get_running_loop()
+            if await loop.run_in_executor(self.executor, index.is_empty) or new_patterns:
+                # Nothing on disk yet (or files outside the indexed set were
+                # requested): this query has to wait for the build
+                self.logger.info("Building keyword index...")
+                await self._refresh_index(root_path)
+            elif self._is_stale() and (self._refresh_task is None or self._refresh_task.done()):
+                # Serve this query from the persisted index and catch up
+                # with offline changes in the background
+                self._refresh_task = asyncio.create_task(self._refresh_index(root_path))
+
+    def _is_stale(self) -> bool:
+        """Check whether the tree has not been re-stat'ed recently."""
+        return self.index_timestamp is None or \
+            (datetime.now() - self.index_timestamp).total_seconds() > self.index_ttl_seconds
+
+    async def _refresh_index(self, root_path: Path) -> None:
+        """Re-index files whose size or mtime changed and drop deleted ones."""
+        try:
+            loop = asyncio.get_running_loop()
+            files = await self._get_files_to_search(root_path)
+            for pattern in list(self._extra_patterns):
+                files.extend(await self._get_files_to_search(root_path, [pattern]))
+            stats = await loop.run_in_executor(self.executor, self.index.sync, files)
+            self.index_timestamp = datetime.now()
+            if stats['indexed'] or stats['removed']:
+                self._index_generation += 1
+        except Exception as e:
+            self.logger.error(f"Keyword index refresh error: {e}")
 
-    async def search(self, query: str, root_path: Path, file_patterns: List[str] = None) -> List[ContextMatch]:
-        """Search for keyword matches using inverted index."""
-        # Use MD5 for cache key generation only (not for security)
-        cache_key = f"keyword:{hashlib.md5(f'{query}:{root_path}:{file_patterns}'.encode(), usedforsecurity=False).hexdigest()}"
+    def on_file_event(self, path: Path, event_type: Optional[str] = None) -> None:
+        """
+        FileMonitor callback: update the postings of a single changed file.
 
-        # Check cache first
-        cached_result = self.cache.get(cache_key)
-        if cached_result:
-            return cached_result
+        Args:
+            path: Changed file
+            event_type: 'created', 'modified', 'deleted' or 'moved'
+        """
+        if self.index is None:
+            return
+        path = Path(path)
+        try:
+            if event_type == 'deleted' or not path.is_file():
+                changed = self.index.remove_file(path)
+            elif self._should_index(path, self.index_root):
+                changed = self.index.update_file(path)
+            else:
+                return
+            if changed:
+                self._index_generation += 1
+        except Exception as e:
+            self.logger.warning(f"Keyword index update failed for {path}: {e}")
 
-        matches = []
+    async def search(self, query: str, root_path: Path, file_patterns: List[str] = None) -> List[ContextMatch]:
+        """Search for keyword matches, ranked with BM25F over the inverted index."""
         search_terms = self._extract_keywords(query)
-
         if not search_terms:
-            return matches
+            return []
 
+        matches = []
         try:
             # Ensure index is built
             await self._ensure_index_built(root_path, file_patterns)
 
-            # Use inverted index for O(m + k) lookup instead of O(n * terms) scan
-            candidate_files: Dict[Path, Set[int]] = defaultdict(set)
-
-            for term in search_terms:
-                term_lower = term.lower()
-                if term_lower in self.inverted_index:
-                    for file_path, line_numbers in self.inverted_index[term_lower].items():
-                        candidate_files[file_path].update(line_numbers)
-
-            # Read only the relevant lines from candidate files using linecache
-            search_terms_lower = [term.lower() for term in search_terms]
-            num_search_terms = len(search_terms)
-            for file_path, line_numbers in candidate_files.items():
-                try:
-                    file_str = str(file_path)
-                    for line_num in sorted(line_numbers)[:10]:  # Top 10 lines per file
-                        line_content = linecache.getline(file_str, line_num).strip()
-                        if line_content:
-                            # Calculate relevance score
-                            line_lower = line_content.lower()
-                            score = sum(1 for term in search_terms_lower if term in line_lower)
-                            if score > 0:
-                                matches.append(ContextMatch(
-                                    pattern=query,
-                                    match_type='keyword',
-                                    content=line_content,
-                                    file_path=file_path,
-                                    line_number=line_num,
-                                    score=float(score) / num_search_terms
-                                ))
-                except Exception:
-                    continue
-            linecache.clearcache()
-
-            # Sort by relevance score
-            matches.sort(key=lambda x: x.score, reverse=True)
+            # Use MD5 for cache key generation only (not for security)
+            cache_key = f"keyword:{hashlib.md5(f'{query}:{root_path}:{file_patterns}:{self._index_generation}'.encode(), usedforsecurity=False).hexdigest()}"
+
+            # Check cache first
+            cached_result = self.cache.get(cache_key)
+            if cached_result:
+                return cached_result
+
+            # Rank lines with BM25F straight from the index; snippets are
+            # stored alongside the postings, so no files are read here
+            file_filter = None
+            if file_patterns:
+                file_filter = lambda path: self._matches_patterns(path, root_path, file_patterns)
+
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(
+                self.executor,
+                lambda: self.index.search(search_terms, limit=50, file_filter=file_filter)
+            )
+
+            # Normalize to 0..1 so scores stay comparable with other retrievers
+            top_score = results[0]['score'] if results else 0.0
+            for result in results:
+                matches.append(ContextMatch(
+                    pattern=query,
+                    match_type='keyword',
+                    content=result['content'],
+                    file_path=result['file_path'],
+                    line_number=result['line_number'],
+                    score=result['score'] / top_score if top_score else 0.0,
+                    metadata={
+                        'bm25': round(result['score'], 4),
+                        'matched_terms': result['matched_terms'],
+                        'phrase': round(result['phrase'], 4),
+                        'proximity': round(result['proximity'], 4)
+                    }
+                ))
 
             # Cache results
             self.cache.put(cache_key, matches[:50], ttl_seconds=1800)  # 30 minutes
@@ -519,6 +645,20 @@ class KeywordRetriever:
 
         return matches[:50]  # Return top 50 matches
 
+    @staticmethod
+    def _matches_patterns(file_path: Path, root_path: Path, patterns: List[str]) -> bool:
+        """Check a file against glob patterns relative to the root."""
+        try:
+            rel = file_path.relative_to(root_path).as_posix()
+        except ValueError:
+            rel = file_path.as_posix()
+        for pattern in patterns:
+            if fnmatch.fnmatch(rel, pattern):
+                return True
+            if pattern.startswith('**/') and fnmatch.fnmatch(rel, pattern[3:]):
+                return True
+        return False
+
     def _extract_keywords(self, query: str) -> List[str]:
         """Extract keywords from query."""
         # Remove common words and extract meaningful terms
@@ -530,7 +670,12 @@ class KeywordRetriever:
         return keywords
 
     async def _get_files_to_search(self, root_path: Path, patterns: List[str] = None) -> List[Path]:
-        """Get list of files to search."""
+        """Get list of files to search (globbing runs in the shared thread pool)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._list_files, root_path, patterns)
+
+    def _list_files(self, root_path: Path, patterns: List[str] = None) -> List[Path]:
+        """Glob indexable text files under root_path."""
         files = []
 
         if patterns:
@@ -546,10 +691,10 @@ class KeywordRetriever:
                 except Exception:
                     continue
 
-        # Filter out binary files and large files
+        # Filter out ignored directories, binary files and large files
         text_files = []
         for file_path in files:
-            if file_path.is_file() and self._is_text_file(file_path):
+            if self._should_index(file_path, root_path) and file_path.is_file():
                 try:
                     if file_path.stat().st_size < 1024 * 1024:  # 1MB limit
                         text_files.append(file_path)
@@ -558,6 +703,16 @@ class KeywordRetriever:
 
         return text_files
 
+    def _should_index(self, file_path: Path, root_path: Optional[Path] = None) -> bool:
+        """Check a path against ignored directories and text-file detection."""
+        try:
+            parts = file_path.relative_to(root_path).parts if root_path else file_path.parts
+        except ValueError:
+            return False
+        if any(part in self.IGNORE_DIRS for part in parts):
+            return False
+        return self._is_text_file(file_path)
+
     def _is_text_file(self, file_path: Path) -> bool:
         """Check if file is a text file."""
         try:
@@ -609,48 +764,142 @@ class KeywordRetriever:
 
 
 class SemanticRetriever:
-    """Semantic context retrieval using embeddings."""
+    """
+    Semantic context retrieval using embeddings.
 
-    def __init__(self, cache: LRUCache):
+    Delegates to an indexer.SemanticSearch instance (usually the one owned by
+    LLMManager) once attached; disabled until then, since it requires the
+    optional embedding dependencies. An unindexed codebase is embedded in the
+    background, and searches return nothing until that has finished.
+    """
+
+    def __init__(self, cache: LRUCache, semantic_search: Any = None):
         self.cache = cache
         self.logger = logging.getLogger(__name__)
+        self.executor = get_executor()
+        self.semantic_search = None
         self.enabled = False  # Disabled by default, requires additional dependencies
+        self._index_task: Optional[asyncio.Future] = None
+        if semantic_search is not None:
+            self.attach(semantic_search)
 
-    async def search(self, query: str, root_path: Path, file_patterns: List[str] = None) -> List[ContextMatch]:
+    def attach(self, semantic_search: Any) -> None:
+        """
+        Use an indexer.SemanticSearch instance for vector search.
+
+        Args:
+            semantic_search: SemanticSearch instance, or None to disable
+        """
+        self.semantic_search = semantic_search
+        self.enabled = semantic_search is not None
+        self._index_task = None
+
+    async def search(self, query: str, root_path: Path, file_patterns: List[str] = None,
+                     k: int = 20) -> List[ContextMatch]:
         """Search for semantic matches."""
         if not self.enabled:
             return []
+        if not self.semantic_search.indexed:
+            self._start_indexing()
+            return []
 
-        # Placeholder for semantic search implementation
-        # This would require embedding models and vector search
-        return []
+        # Use MD5 for cache key generation only (not for security)
+        cache_key = f"semantic:{hashlib.md5(f'{query}:{root_path}:{k}'.encode(), usedforsecurity=False).hexdigest()}"
+        cached_result = self.cache.get(cache_key)
+        if cached_result:
+            return cached_result
+
+        matches = []
+        try:
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(self.executor, self.semantic_search.search, query, k)
+
+            for result in results:
+                file_path = result.get('file') or result.get('path')
+                matches.append(ContextMatch(
+                    pattern=query,
+                    match_type='semantic',
+                    content=result.get('code') or result.get('docstring') or result.get('name', ''),
+                    file_path=Path(file_path) if file_path else None,
+                    line_number=result.get('line'),
+                    score=float(result.get('relevance_score', 0.0)),
+                    metadata={
+                        'type': result.get('type'),
+                        'name': result.get('name'),
+                        'distance': result.get('distance')
+                    }
+                ))
+
+            self.cache.put(cache_key, matches, ttl_seconds=1800)
+
+        except Exception as e:
+            self.logger.error(f"Semantic search error: {e}")
+
+        return matches
+
+    def _start_indexing(self) -> None:
+        """Index the codebase in the background unless that is already running."""
+        if self._index_task is not None and not self._index_task.done():
+            return
+        self.logger.info("Indexing codebase for semantic search in the background...")
+        loop = asyncio.get_running_loop()
+        self._index_task = loop.run_in_executor(self.executor, self._index_sync)
+
+    def _index_sync(self) -> None:
+        try:
+            self.semantic_search.index_codebase()
+        except Exception as e:
+            self.logger.error(f"Semantic indexing failed: {e}")
 
 
 class GraphTraversalRetriever:
-    """Graph-based context retrieval using code relationships."""
+    """
+    Graph-based context retrieval using code relationships.
 
-    def __init__(self, cache: LRUCache, tree_parser: TreeSitterParser):
+    Symbols and imports live in a persistent CodeGraph that is refreshed
+    incrementally; queries seed on matching symbols/modules and expand k
+    import hops over in-memory adjacency lists, without re-parsing files.
+    """
+
+    def __init__(self, cache: LRUCache, tree_parser: TreeSitterParser,
+                 graph_path: Optional[Path] = None):
         self.cache = cache
         self.tree_parser = tree_parser
         self.logger = logging.getLogger(__name__)
+        self.executor = get_executor()
+
+        # On-disk graph (default: <root>/.torq-index/graph.sqlite)
+        self.graph_path = graph_path
+        self.graph: Optional[CodeGraph] = None
+        self.graph_root: Optional[Path] = None
+        self.graph_timestamp: Optional[datetime] = None
+        self.graph_lock = asyncio.Lock()
+        self.graph_ttl_seconds = 300
+        self.max_hops = 2
+        self._refresh_task: Optional[asyncio.Task] = None
+        # Bumped whenever the graph changes; part of the result cache key
+        self._graph_generation = 0
 
     async def search(self, query: str, root_path: Path, file_patterns: List[str] = None) -> List[ContextMatch]:
         """Search using graph traversal of code relationships."""
-        # Use MD5 for cache key generation only (not for security)
-        cache_key = f"graph:{hashlib.md5(f'{query}:{root_path}'.encode(), usedforsecurity=False).hexdigest()}"
-
-        cached_result = self.cache.get(cache_key)
-        if cached_result:
-            return cached_result
-
         matches = []
 
         try:
-            # Build code dependency graph
+            # Build (or load) the code dependency graph
             graph = await self._build_dependency_graph(root_path, file_patterns)
 
+            # Use MD5 for cache key generation only (not for security)
+            cache_key = f"graph:{hashlib.md5(f'{query}:{root_path}:{self._graph_generation}'.encode(), usedforsecurity=False).hexdigest()}"
+
+            cached_result = self.cache.get(cache_key)
+            if cached_result:
+                return cached_result
+
             # Find related nodes based on query
-            related_nodes = self._find_related_nodes(graph, query)
+            loop = asyncio.get_running_loop()
+            related_nodes = await loop.run_in_executor(
+                self.executor, self._find_related_nodes, graph, query
+            )
 
             # Convert nodes to context matches
             for node in related_nodes:
@@ -673,21 +922,146 @@ class GraphTraversalRetriever:
 
         return matches
 
-    async def _build_dependency_graph(self, root_path: Path, patterns: List[str] = None) -> Dict[str, Any]:
-        """Build dependency graph from code structure."""
-        graph = {
-            'nodes': {},
-            'edges': []
-        }
+    async def _build_dependency_graph(self, root_path: Path, patterns: List[str] = None) -> CodeGraph:
+        """Open the persisted code graph, building it only if it does not exist yet."""
+        async with self.graph_lock:
+            if self.graph is None or self.graph_root != root_path:
+                if self.graph is not None:
+                    self.graph.close()
+                graph_path = self.graph_path or root_path / '.torq-index' / 'graph.sqlite'
+                self.graph = CodeGraph(str(graph_path), root_path, self.tree_parser)
+                self.graph_root = root_path
+                self.graph_timestamp = None
+
+            loop = asyncio.get_running_loop()
+            if await loop.run_in_executor(self.executor, self.graph.is_empty):
+                self.logger.info("Building code graph...")
+                await self._refresh_graph(root_path)
+            elif (self.graph_timestamp is None or
+                  (datetime.now() - self.graph_timestamp).total_seconds() > self.graph_ttl_seconds) \
+                    and (self._refresh_task is None or self._refresh_task.done()):
+                self._refresh_task = asyncio.create_task(self._refresh_graph(root_path))
+
+            return self.graph
+
+    async def _refresh_graph(self, root_path: Path) -> None:
+        """Re-parse files whose size or mtime changed and drop deleted ones."""
+        try:
+            loop = asyncio.get_running_loop()
+            files = await loop.run_in_executor(self.executor, self._list_files, root_path)
+            stats = await loop.run_in_executor(self.executor, self.graph.sync, files)
+            self.graph_timestamp = datetime.now()
+            if stats['indexed'] or stats['removed']:
+                self._graph_generation += 1
+        except Exception as e:
+            self.logger.error(f"Code graph refresh error: {e}")
 
-        # This would implement graph building logic
-        # For now, return empty graph
-        return graph
+    def _list_files(self, root_path: Path) -> List[Path]:
+        """Glob source files the graph can parse."""
+        suffixes = set(CodeGraph.PYTHON_SUFFIXES)
+        if self.tree_parser.available:
+            suffixes |= {ext for ext, lang in self.tree_parser.language_map.items()
+                         if lang in self.tree_parser.parsers}
 
-    def _find_related_nodes(self, graph: Dict[str, Any], query: str) -> List[Dict[str, Any]]:
+        files = []
+        for suffix in suffixes:
+            for file_path in root_path.glob(f'**/*{suffix}'):
+                rel_parts = file_path.relative_to(root_path).parts
+                if any(part in KeywordRetriever.IGNORE_DIRS for part in rel_parts):
+                    continue
+                if file_path.is_file():
+                    files.append(file_path)
+        return files
+
+    def on_file_event(self, path: Path, event_type: Optional[str] = None) -> None:
+        """
+        FileMonitor callback: update the graph for a single changed file.
+
+        Args:
+            path: Changed file
+            event_type: 'created', 'modified', 'deleted' or 'moved'
+        """
+        if self.graph is None:
+            return
+        path = Path(path)
+        try:
+            rel_parts = path.relative_to(self.graph_root).parts
+        except ValueError:
+            return
+        if any(part in KeywordRetriever.IGNORE_DIRS for part in rel_parts):
+            return
+        try:
+            if event_type == 'deleted':
+                changed = self.graph.remove_file(path)
+            else:
+                changed = self.graph.update_file(path)
+            if changed:
+                self._graph_generation += 1
+        except Exception as e:
+            self.logger.warning(f"Code graph update failed for {path}: {e}")
+
+    async def related_files(self, file_path: Path, root_path: Path, k: int = None,
+                            direction: str = 'both') -> Dict[Path, int]:
+        """
+        Files within k import hops of a file.
+
+        Args:
+            file_path: Starting file
+            root_path: Repository root
+            k: Maximum hops (default: self.max_hops)
+            direction: 'imports', 'imported_by' or 'both'
+
+        Returns:
+            Mapping of related file to hop distance
+        """
+        graph = await self._build_dependency_graph(root_path)
+        return graph.neighbors(file_path, k or self.max_hops, direction)
+
+    def _find_related_nodes(self, graph: CodeGraph, query: str) -> List[Dict[str, Any]]:
         """Find nodes related to query using graph traversal."""
-        # This would implement graph search algorithms
-        return []
+        names = [word for word in _WORD_PATTERN.findall(query) if len(word) > 2]
+        if not names:
+            return []
+
+        nodes = []
+        seed_files: Dict[Path, str] = {}
+
+        # Seeds: symbols named in the query, then modules named in the query
+        for symbol in graph.find_symbols(names):
+            nodes.append({
+                'type': symbol['kind'],
+                'content': symbol['signature'],
+                'file': str(symbol['file_path']),
+                'line': symbol['line'],
+                'relevance': 1.0,
+                'metadata': {'symbol': symbol['name'], 'hops': 0}
+            })
+            seed_files.setdefault(symbol['file_path'], symbol['name'])
+        for module_path in graph.find_modules(names):
+            seed_files.setdefault(module_path, module_path.stem)
+
+        # Expand k import hops from every seed file
+        related: Dict[Path, Tuple[int, str]] = {}
+        for seed_path, seed_name in seed_files.items():
+            for path, hops in graph.neighbors(seed_path, self.max_hops).items():
+                if path in seed_files:
+                    continue
+                if path not in related or hops < related[path][0]:
+                    related[path] = (hops, seed_name)
+
+        for path, (hops, seed_name) in related.items():
+            symbols = graph.file_symbols(path)
+            nodes.append({
+                'type': 'import',
+                'content': "\n".join(s['signature'] for s in symbols) or path.name,
+                'file': str(path),
+                'line': symbols[0]['line'] if symbols else None,
+                'relevance': 0.8 / hops,
+                'metadata': {'hops': hops, 'related_to': seed_name}
+            })
+
+        nodes.sort(key=lambda node: node['relevance'], reverse=True)
+        return nodes[:30]
 
 
 class ContextManager:
@@ -698,6 +1072,9 @@ class ContextManager:
     and memory-efficient caching for enhanced AI pair programming.
     """
 
+    # Reciprocal-rank fusion constant (Cormack et al. use 60)
+    RRF_K = 60
+
     def __init__(self, config: TorqConfig, root_path: Path = None):
         self.config = config
         self.root_path = root_path or Path.cwd()
@@ -720,8 +1097,33 @@ class ContextManager:
         # Use shared thread pool
         self.executor = get_executor()
 
+        # Hybrid retrieval: RRF weights per retriever and context size limit
+        self.retriever_weights: Dict[str, float] = {'keyword': 1.0, 'semantic': 1.0, 'graph': 0.5}
+        self.context_token_budget = int(os.getenv('TORQ_CONTEXT_TOKEN_BUDGET', '4000'))
+        # Seconds each retriever gets before hybrid search fuses without it
+        self.retriever_timeout = float(os.getenv('TORQ_RETRIEVER_TIMEOUT', '3.0'))
+
         self.logger.info(f"ContextManager initialized at {self.root_path}")
 
+    def attach_semantic_search(self, semantic_search: Any) -> None:
+        """
+        Enable semantic retrieval backed by an indexer.SemanticSearch instance.
+
+        Args:
+            semantic_search: SemanticSearch instance (e.g. LLMManager.semantic_search)
+        """
+        self.semantic_retriever.attach(semantic_search)
+
+    def watch(self, file_monitor) -> None:
+        """
+        Keep retriever indexes up to date from a FileMonitor's change events.
+
+        Args:
+            file_monitor: torq_console.utils.file_monitor.FileMonitor instance
+        """
+        file_monitor.add_callback(self.keyword_retriever.on_file_event)
+        file_monitor.add_callback(self.graph_retriever.on_file_event)
+
     async def parse_and_retrieve(self, text: str, context_type: str = "mixed") -> Dict[str, List[ContextMatch]]:
         """
         Parse @-symbols and retrieve relevant context.
@@ -741,14 +1143,15 @@ class ContextManager:
                 # No @-symbols found, use general context retrieval
                 return await self._retrieve_general_context(text, context_type)
 
-            # Process each @-symbol match
+            # Process all @-symbol matches concurrently
             results = {}
 
-            for match_type, args, full_match in at_matches:
-                self.logger.debug(f"Processing @{match_type}: {args}")
-
-                context_matches = await self._process_at_symbol(match_type, args, context_type)
+            all_context_matches = await asyncio.gather(*(
+                self._process_at_symbol(match_type, args, context_type)
+                for match_type, args, full_match in at_matches
+            ))
 
+            for (match_type, args, full_match), context_matches in zip(at_matches, all_context_matches):
                 if match_type not in results:
                     results[match_type] = []
                 results[match_type].extend(context_matches)
@@ -843,20 +1246,14 @@ class ContextManager:
 
     async def _retrieve_code_context(self, query: str, context_type: str) -> List[ContextMatch]:
         """Retrieve context for @code queries."""
-        matches = []
+        if context_type == "mixed":
+            return await self.hybrid_search(query)
 
         # Use appropriate retriever based on context_type
-        if context_type in ("keyword", "mixed"):
-            keyword_matches = await self.keyword_retriever.search(query, self.root_path)
-            matches.extend(keyword_matches)
-
-        if context_type in ("semantic", "mixed"):
-            semantic_matches = await self.semantic_retriever.search(query, self.root_path)
-            matches.extend(semantic_matches)
-
-        if context_type in ("graph", "mixed"):
-            graph_matches = await self.graph_retriever.search(query, self.root_path)
-            matches.extend(graph_matches)
+        retriever = self._retrievers().get(context_type)
+        if retriever is None:
+            return []
+        matches = await retriever.search(query, self.root_path)
 
         # Remove duplicates and sort by score
         unique_matches = self._deduplicate_matches(matches)
@@ -864,6 +1261,99 @@ class ContextManager:
 
         return unique_matches[:20]  # Return top 20 matches
 
+    def _retrievers(self) -> Dict[str, Any]:
+        """Retrievers used for hybrid search, keyed by context type."""
+        return {
+            'keyword': self.keyword_retriever,
+            'semantic': self.semantic_retriever,
+            'graph': self.graph_retriever
+        }
+
+    async def hybrid_search(self, query: str, token_budget: Optional[int] = None,
+                            max_results: int = 20) -> List[ContextMatch]:
+        """
+        Run keyword, semantic and graph retrieval concurrently and fuse the results.
+
+        Each retriever gets self.retriever_timeout seconds; the results of
+        those that answered in time are fused without waiting for the rest.
+        Rankings are combined with reciprocal-rank fusion (score = sum of
+        weight / (k + rank) over retrievers), so no retriever's raw score scale
+        dominates. Matches are taken best-first until the token budget is
+        spent.
+
+        Args:
+            query: Search query
+            token_budget: Maximum estimated tokens of context (default: self.context_token_budget)
+            max_results: Maximum number of matches to return
+
+        Returns:
+            Fused matches, best first
+        """
+        token_budget = self.context_token_budget if token_budget is None else token_budget
+        retrievers = self._retrievers()
+
+        results = await asyncio.gather(
+            *(asyncio.wait_for(retriever.search(query, self.root_path), self.retriever_timeout)
+              for retriever in retrievers.values()),
+            return_exceptions=True
+        )
+
+        fused: Dict[Tuple[str, Optional[int]], Dict[str, Any]] = {}
+        for name, result in zip(retrievers, results):
+            if isinstance(result, asyncio.TimeoutError):
+                self.logger.warning(f"{name} retriever timed out after {self.retriever_timeout}s")
+                continue
+            if isinstance(result, Exception):
+                self.logger.warning(f"{name} retriever failed: {result}")
+                continue
+            weight = self.retriever_weights.get(name, 1.0)
+            for rank, match in enumerate(self._deduplicate_matches(result), 1):
+                key = (str(match.file_path), match.line_number)
+                entry = fused.get(key)
+                if entry is None:
+                    entry = fused[key] = {'match': match, 'score': 0.0, 'ranks': {}}
+                elif len(match.content) > len(entry['match'].content):
+                    # Prefer the richest content (e.g. a whole function over one line)
+                    entry['match'] = match
+                entry['score'] += weight / (self.RRF_K + rank)
+                entry['ranks'][name] = rank
+
+        ranked = sorted(fused.values(), key=lambda entry: entry['score'], reverse=True)
+
+        selected = []
+        tokens_used = 0
+        for entry in ranked:
+            match = entry['match']
+            tokens = self._estimate_tokens(match.content)
+            if tokens_used + tokens > token_budget:
+                if selected:
+                    break
+                # Always return at least the best match
+            tokens_used += tokens
+            selected.append(ContextMatch(
+                pattern=match.pattern,
+                match_type=match.match_type,
+                content=match.content,
+                file_path=match.file_path,
+                line_number=match.line_number,
+                score=entry['score'],
+                timestamp=match.timestamp,
+                metadata={**match.metadata, 'rrf_ranks': entry['ranks']}
+            ))
+            if len(selected) >= max_results:
+                break
+
+        self.logger.debug(
+            f"Hybrid search fused {len(fused)} matches into {len(selected)} "
+            f"(~{tokens_used}/{token_budget} tokens)"
+        )
+        return selected
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Rough token count (~4 characters per token)."""
+        return max(1, len(text) // 4)
+
     async def _retrieve_docs_context(self, patterns: List[str], context_type: str) -> List[ContextMatch]:
         """Retrieve context for @docs patterns."""
         # Focus on documentation files
@@ -1009,6 +1499,15 @@ class ContextManager:
             # Clear caches
             self.cache.clear()
 
+            # Stop background refreshes and close the on-disk indexes
+            for task in (self.keyword_retriever._refresh_task, self.graph_retriever._refresh_task):
+                if task is not None and not task.done():
+                    task.cancel()
+            if self.keyword_retriever.index is not None:
+                self.keyword_retriever.index.close()
+            if self.graph_retriever.graph is not None:
+                self.graph_retriever.graph.close()
+
             # Shutdown executor
             self.executor.shutdown(wait=True)
 
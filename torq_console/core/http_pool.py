@@ -0,0 +1,416 @@
+"""
+Shared HTTP connection pool for TORQ Console.
+
+Prevents repeated TCP/TLS handshakes and file-descriptor exhaustion by
+sharing keep-alive connections across all LLM and search providers
+instead of opening a session (or several) per call.
+
+- aiohttp: one session per event loop, with a global and per-host
+  connection limit and a default timeout. Providers call request().
+- httpx: one async client per event loop and one sync client for SDKs
+  that take an ``http_client`` (Anthropic, OpenAI-compatible), using
+  HTTP/2 when the ``h2`` package is installed.
+
+Retries are opt-in per request and limited by a retry budget, so a
+struggling upstream sees at most ``TORQ_HTTP_RETRY_RATIO`` extra load
+rather than a retry storm.
+
+Usage:
+    from torq_console.core.http_pool import get_http_pool
+
+    async with get_http_pool().request("GET", url, params=params) as response:
+        data = await response.json()
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying on another connection (gateway/overload)
+RETRY_STATUSES = {502, 503, 504}
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Global shared pool
+_shared_pool: Optional["HTTPPool"] = None
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        logger.warning(f"Invalid {name} value: {os.getenv(name)}, using {default}")
+        return default
+
+
+class RetryBudget:
+    """
+    Allow retries only up to a fraction of recent requests.
+
+    Every request in the window earns ``ratio`` retries, plus a floor of
+    ``min_per_second`` so low-traffic callers can still retry.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_per_second: float = 1.0, window_seconds: float = 10.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.window_seconds = window_seconds
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+    def record_request(self) -> None:
+        """Count a first attempt."""
+        self._requests.append(time.monotonic())
+
+    def try_retry(self) -> bool:
+        """Spend a retry if the budget allows it."""
+        now = time.monotonic()
+        self._trim(now)
+        allowed = len(self._requests) * self.ratio + self.min_per_second * self.window_seconds
+        if len(self._retries) >= allowed:
+            return False
+        self._retries.append(now)
+        return True
+
+
+class HTTPPool:
+    """Keep-alive HTTP sessions shared by every provider."""
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30.0,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 120.0,
+        retry_budget: Optional[RetryBudget] = None
+    ):
+        """
+        Initialize HTTP pool.
+
+        Args:
+            limit: Maximum open connections in total
+            limit_per_host: Maximum open connections per host
+            keepalive_timeout: Seconds an idle connection is kept
+            connect_timeout: Default connect timeout in seconds
+            read_timeout: Default socket read timeout in seconds
+            retry_budget: Retry budget shared by all requests
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(connect=connect_timeout, sock_read=read_timeout)
+        self.retry_budget = retry_budget or RetryBudget()
+
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._httpx_async: Dict[Optional[asyncio.AbstractEventLoop], Any] = {}
+        self._httpx_sync = None
+
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.retries = 0
+        self.retries_denied = 0
+        self._hosts: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {"requests": 0, "in_flight": 0, "errors": 0, "total_ms": 0.0}
+        )
+
+    # ------------------------------------------------------------------
+    # aiohttp
+    # ------------------------------------------------------------------
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_create(session, ctx, params):
+            self.connections_created += 1
+
+        async def on_reuse(session, ctx, params):
+            self.connections_reused += 1
+
+        trace.on_connection_create_end.append(on_create)
+        trace.on_connection_reuseconn.append(on_reuse)
+        return trace
+
+    async def session(self) -> aiohttp.ClientSession:
+        """The pooled aiohttp session of the running event loop."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            # Sessions of loops that have since closed are dead weight
+            for other in [l for l in self._sessions if l.is_closed()]:
+                del self._sessions[other]
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                trace_configs=[self._trace_config()]
+            )
+            self._sessions[loop] = session
+        return session
+
+    @asynccontextmanager
+    async def request(
+        self,
+        method: str,
+        url: str,
+        retries: Optional[int] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Send a request over a pooled connection.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            retries: Extra attempts on connection errors, timeouts and
+                502/503/504 (default: 2 for GET/HEAD/OPTIONS, 0 otherwise;
+                LLM calls are retried by the provider fallback layer)
+            **kwargs: Passed to aiohttp (json, params, headers, timeout, ...)
+
+        Yields:
+            The response; its connection returns to the pool on exit
+        """
+        method = method.upper()
+        if retries is None:
+            retries = 2 if method in IDEMPOTENT_METHODS else 0
+        host = urlsplit(url).netloc
+        stats = self._hosts[host]
+        session = await self.session()
+
+        self.retry_budget.record_request()
+        attempt = 0
+        while True:
+            stats["requests"] += 1
+            stats["in_flight"] += 1
+            start = time.perf_counter()
+            response = None
+            try:
+                response = await session.request(method, url, **kwargs)
+                if response.status not in RETRY_STATUSES or not self._may_retry(attempt, retries):
+                    break
+                response.release()
+                response = None
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if not self._may_retry(attempt, retries):
+                    raise
+            finally:
+                # Any attempt without a response to hand over (retried status,
+                # connection error, invalid URL, cancellation) is done here
+                if response is None:
+                    stats["in_flight"] -= 1
+                    stats["errors"] += 1
+
+            attempt += 1
+            logger.debug(f"Retrying {method} {host} (attempt {attempt + 1})")
+            await asyncio.sleep(min(2.0, 0.1 * 2 ** attempt) * random.uniform(0.5, 1.0))
+
+        try:
+            yield response
+        finally:
+            response.release()
+            stats["in_flight"] -= 1
+            stats["total_ms"] += (time.perf_counter() - start) * 1000
+
+    def _may_retry(self, attempt: int, retries: int) -> bool:
+        if attempt >= retries:
+            return False
+        if not self.retry_budget.try_retry():
+            self.retries_denied += 1
+            return False
+        self.retries += 1
+        return True
+
+    # ------------------------------------------------------------------
+    # httpx (for SDK clients)
+    # ------------------------------------------------------------------
+
+    def _httpx_limits(self):
+        return httpx.Limits(
+            max_connections=self.limit,
+            max_keepalive_connections=self.limit_per_host,
+            keepalive_expiry=self.keepalive_timeout
+        )
+
+    def _httpx_timeout(self):
+        return httpx.Timeout(self.timeout.sock_read, connect=self.timeout.connect)
+
+    def httpx_client(self):
+        """
+        Shared httpx.AsyncClient for SDKs (None if httpx is not installed).
+
+        Like the aiohttp sessions, there is one client per event loop, since
+        its connections belong to the loop that opened them. Callers outside
+        a running loop (e.g. provider constructors) share one more client,
+        which must then only be used from a single loop.
+        """
+        if not HTTPX_AVAILABLE:
+            return None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        client = self._httpx_async.get(loop)
+        if client is None or client.is_closed:
+            for other in [l for l in self._httpx_async if l is not None and l.is_closed()]:
+                del self._httpx_async[other]
+
+            async def on_request(request):
+                self._hosts[request.url.host]["requests"] += 1
+
+            client = httpx.AsyncClient(
+                limits=self._httpx_limits(),
+                timeout=self._httpx_timeout(),
+                http2=HTTP2_AVAILABLE,
+                event_hooks={"request": [on_request]}
+            )
+            self._httpx_async[loop] = client
+        return client
+
+    def httpx_sync_client(self):
+        """Shared blocking httpx.Client for sync SDKs (None if httpx is not installed)."""
+        if not HTTPX_AVAILABLE:
+            return None
+        if self._httpx_sync is None or self._httpx_sync.is_closed:
+            def on_request(request):
+                self._hosts[request.url.host]["requests"] += 1
+
+            self._httpx_sync = httpx.Client(
+                limits=self._httpx_limits(),
+                timeout=self._httpx_timeout(),
+                http2=HTTP2_AVAILABLE,
+                event_hooks={"request": [on_request]}
+            )
+        return self._httpx_sync
+
+    # ------------------------------------------------------------------
+    # Lifecycle and metrics
+    # ------------------------------------------------------------------
+
+    async def close(self) -> None:
+        """Close every pooled session and client."""
+        for loop, session in list(self._sessions.items()):
+            if not session.closed and not loop.is_closed():
+                if loop is asyncio.get_running_loop():
+                    await session.close()
+        self._sessions.clear()
+        running = asyncio.get_running_loop()
+        for loop, client in list(self._httpx_async.items()):
+            if loop is None or loop is running:
+                await client.aclose()
+        self._httpx_async.clear()
+        if self._httpx_sync is not None:
+            self._httpx_sync.close()
+            self._httpx_sync = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        created = self.connections_created
+        return {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "http2": HTTP2_AVAILABLE,
+            "sessions": sum(1 for s in self._sessions.values() if not s.closed),
+            "connections_created": created,
+            "connections_reused": self.connections_reused,
+            "reuse_rate": round(self.connections_reused / (created + self.connections_reused), 3)
+            if created + self.connections_reused else 0.0,
+            "retries": self.retries,
+            "retries_denied": self.retries_denied,
+            "hosts": {
+                host: {
+                    **{k: int(v) for k, v in stats.items() if k != "total_ms"},
+                    "avg_ms": round(stats["total_ms"] / stats["requests"], 1) if stats["requests"] else 0.0
+                }
+                for host, stats in self._hosts.items()
+            }
+        }
+
+
+def get_http_pool() -> HTTPPool:
+    """
+    Get the shared HTTP pool.
+
+    Sized by TORQ_HTTP_POOL_LIMIT (default 100), TORQ_HTTP_POOL_PER_HOST
+    (default 10) and TORQ_HTTP_RETRY_RATIO (default 0.1).
+
+    Returns:
+        Shared HTTPPool instance
+    """
+    global _shared_pool
+
+    if _shared_pool is None:
+        try:
+            ratio = float(os.getenv("TORQ_HTTP_RETRY_RATIO", "0.1"))
+        except ValueError:
+            ratio = 0.1
+        _shared_pool = HTTPPool(
+            limit=_env_int("TORQ_HTTP_POOL_LIMIT", 100),
+            limit_per_host=_env_int("TORQ_HTTP_POOL_PER_HOST", 10),
+            retry_budget=RetryBudget(ratio=ratio)
+        )
+        logger.info(
+            f"Created shared HTTP pool (limit={_shared_pool.limit}, "
+            f"per_host={_shared_pool.limit_per_host}, http2={HTTP2_AVAILABLE})"
+        )
+
+    return _shared_pool
+
+
+async def close_http_pool() -> None:
+    """
+    Close the shared HTTP pool.
+
+    Should be called during application shutdown.
+    """
+    global _shared_pool
+
+    if _shared_pool is not None:
+        logger.info("Closing shared HTTP pool")
+        await _shared_pool.close()
+        _shared_pool = None
+
+
+def get_http_pool_stats() -> Dict[str, Any]:
+    """
+    Get statistics about the shared HTTP pool.
+
+    Returns:
+        Dictionary with pool statistics
+    """
+    if _shared_pool is None:
+        return {"initialized": False}
+    return {"initialized": True, **_shared_pool.get_stats()}
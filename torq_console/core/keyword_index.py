@@ -0,0 +1,593 @@
+"""
+Keyword Index - Persistent, incrementally maintained inverted index.
+
+Backs KeywordRetriever with a SQLite database that survives restarts, so the
+first keyword query after startup reads postings from disk instead of
+re-tokenizing the repository:
+
+    files(file_id, path, mtime, size, num_lines, num_tokens)
+    lines(file_id, line, text)           snippet of every indexed line
+    postings(term, file_id, positions)   packed (line, token, line_length)
+
+Each source line is a BM25 document. ``search()`` ranks lines with BM25F
+over the line body and the file path, boosted for query terms that appear
+as a phrase or close together, and returns stored snippets, so queries do
+no file I/O.
+
+Files are re-tokenized only when their size or mtime changes. The database
+runs in WAL mode with separate reader and writer connections, so searches
+keep being served while a refresh is writing.
+"""
+
+import logging
+import math
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r'\b\w+\b')
+
+# Words this short are not indexed
+MIN_WORD_LENGTH = 3
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase index terms."""
+    return [
+        word for word in _WORD_PATTERN.findall(text.lower())
+        if len(word) >= MIN_WORD_LENGTH
+    ]
+
+
+def _pack_positions(positions: List[Tuple[int, int, int]]) -> bytes:
+    """Pack (line, token, line_length) triples into a flat uint32 array."""
+    packed = array('I')
+    for triple in positions:
+        packed.extend(triple)
+    return packed.tobytes()
+
+
+def _unpack_positions(blob: bytes) -> List[Tuple[int, int, int]]:
+    """Inverse of _pack_positions."""
+    packed = array('I')
+    packed.frombytes(blob)
+    return list(zip(packed[0::3], packed[1::3], packed[2::3]))
+
+
+def _min_window(positions: List[List[int]]) -> int:
+    """Smallest token span containing one position from every list."""
+    events = sorted(
+        (pos, idx) for idx, term_positions in enumerate(positions) for pos in term_positions
+    )
+    counts = [0] * len(positions)
+    covered = 0
+    best = None
+    left = 0
+    for pos, idx in events:
+        if counts[idx] == 0:
+            covered += 1
+        counts[idx] += 1
+        while covered == len(positions):
+            left_pos, left_idx = events[left]
+            span = pos - left_pos + 1
+            if best is None or span < best:
+                best = span
+            counts[left_idx] -= 1
+            if counts[left_idx] == 0:
+                covered -= 1
+            left += 1
+    return best or 1
+
+
+class KeywordIndex:
+    """On-disk inverted index of term -> file -> (line, token) positions."""
+
+    SCHEMA_VERSION = 2
+
+    # BM25F parameters: per-line body field plus the file path field
+    K1 = 1.2
+    B = 0.75
+    BODY_WEIGHT = 1.0
+    PATH_WEIGHT = 2.0
+
+    # Score multipliers for query terms adjacent in order / close together
+    PHRASE_BOOST = 1.0
+    PROXIMITY_BOOST = 0.5
+
+    # Longest snippet stored per line
+    MAX_SNIPPET_CHARS = 300
+
+    # Files re-tokenized per write transaction during sync()
+    _BATCH_FILES = 200
+
+    def __init__(self, path: str, root_path: Path):
+        """
+        Initialize keyword index.
+
+        Args:
+            path: SQLite file to store the index in (created on first use)
+            root_path: Directory indexed paths are stored relative to
+        """
+        self.path = Path(path)
+        self.root_path = Path(root_path)
+        self._write_conn: Optional[sqlite3.Connection] = None
+        self._read_conn: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self.files_indexed = 0
+        self.files_removed = 0
+        self.last_sync_seconds = 0.0
+        # Cached (documents, tokens) corpus totals; reset on every write
+        self._totals: Optional[Tuple[int, int]] = None
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def _writer(self) -> sqlite3.Connection:
+        """Open the writer connection lazily. Caller holds the write lock."""
+        if self._write_conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_schema(conn)
+            self._write_conn = conn
+        return self._write_conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """Open the reader connection lazily. Caller holds the read lock."""
+        if self._read_conn is None:
+            with self._write_lock:
+                self._writer()
+            self._read_conn = sqlite3.connect(
+                str(self.path), check_same_thread=False, timeout=30
+            )
+        return self._read_conn
+
+    def _create_schema(self, conn: sqlite3.Connection):
+        """Create tables, dropping an index written with a different schema."""
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        if row is not None and int(row[0]) != self.SCHEMA_VERSION:
+            logger.info(f"Keyword index schema changed ({row[0]} -> {self.SCHEMA_VERSION}), rebuilding")
+            conn.execute("DROP TABLE IF EXISTS postings")
+            conn.execute("DROP TABLE IF EXISTS lines")
+            conn.execute("DROP TABLE IF EXISTS files")
+
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " file_id INTEGER PRIMARY KEY,"
+            " path TEXT UNIQUE NOT NULL,"
+            " mtime REAL NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " num_lines INTEGER NOT NULL DEFAULT 0,"
+            " num_tokens INTEGER NOT NULL DEFAULT 0)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS lines ("
+            " file_id INTEGER NOT NULL,"
+            " line INTEGER NOT NULL,"
+            " text TEXT NOT NULL,"
+            " PRIMARY KEY (file_id, line)) WITHOUT ROWID"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS postings ("
+            " term TEXT NOT NULL,"
+            " file_id INTEGER NOT NULL,"
+            " positions BLOB NOT NULL,"
+            " PRIMARY KEY (term, file_id)) WITHOUT ROWID"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_postings_file ON postings (file_id)")
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+            (str(self.SCHEMA_VERSION),)
+        )
+        conn.commit()
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _relative(self, file_path: Path) -> str:
+        """Path key stored in the files table."""
+        file_path = Path(file_path)
+        try:
+            return file_path.relative_to(self.root_path).as_posix()
+        except ValueError:
+            return file_path.as_posix()
+
+    def is_empty(self) -> bool:
+        """Check whether no file has been indexed yet."""
+        with self._read_lock:
+            return self._reader().execute("SELECT 1 FROM files LIMIT 1").fetchone() is None
+
+    def sync(self, files: Iterable[Path], prune: bool = True) -> Dict[str, int]:
+        """
+        Bring the index in line with a list of files.
+
+        Only files whose size or mtime differ from the stored entry are read.
+
+        Args:
+            files: Files that should be indexed
+            prune: Drop indexed files that are not in ``files``
+
+        Returns:
+            Counts of indexed, removed and unchanged files
+        """
+        start_time = time.time()
+        indexed = removed = unchanged = 0
+
+        with self._write_lock:
+            conn = self._writer()
+            stored = {
+                path: (file_id, mtime, size)
+                for file_id, path, mtime, size in conn.execute(
+                    "SELECT file_id, path, mtime, size FROM files"
+                )
+            }
+
+            seen = set()
+            pending = 0
+            for file_path in files:
+                rel = self._relative(file_path)
+                if rel in seen:
+                    continue
+                try:
+                    stat = Path(file_path).stat()
+                except OSError:
+                    continue
+                seen.add(rel)
+
+                entry = stored.get(rel)
+                if entry is not None and entry[1] == stat.st_mtime and entry[2] == stat.st_size:
+                    unchanged += 1
+                    continue
+
+                self._index_file(conn, Path(file_path), rel, stat, entry[0] if entry else None)
+                indexed += 1
+                pending += 1
+                if pending >= self._BATCH_FILES:
+                    conn.commit()
+                    pending = 0
+
+            if prune:
+                for rel, (file_id, _, _) in stored.items():
+                    if rel not in seen:
+                        self._delete_file(conn, file_id)
+                        removed += 1
+            conn.commit()
+            self._totals = None
+
+        self.files_indexed += indexed
+        self.files_removed += removed
+        self.last_sync_seconds = time.time() - start_time
+        logger.info(
+            f"Keyword index synced in {self.last_sync_seconds:.2f}s "
+            f"({indexed} indexed, {removed} removed, {unchanged} unchanged)"
+        )
+        return {'indexed': indexed, 'removed': removed, 'unchanged': unchanged}
+
+    def update_file(self, file_path: Path) -> bool:
+        """
+        Re-index one file, or drop it if it no longer exists.
+
+        Returns:
+            True if the index changed
+        """
+        file_path = Path(file_path)
+        rel = self._relative(file_path)
+        with self._write_lock:
+            conn = self._writer()
+            row = conn.execute(
+                "SELECT file_id, mtime, size FROM files WHERE path = ?", (rel,)
+            ).fetchone()
+            try:
+                stat = file_path.stat()
+            except OSError:
+                if row is None:
+                    return False
+                self._delete_file(conn, row[0])
+                conn.commit()
+                self._totals = None
+                self.files_removed += 1
+                return True
+
+            if row is not None and row[1] == stat.st_mtime and row[2] == stat.st_size:
+                return False
+            self._index_file(conn, file_path, rel, stat, row[0] if row else None)
+            conn.commit()
+            self._totals = None
+            self.files_indexed += 1
+            return True
+
+    def remove_file(self, file_path: Path) -> bool:
+        """
+        Drop a file from the index.
+
+        Returns:
+            True if the file was indexed
+        """
+        rel = self._relative(file_path)
+        with self._write_lock:
+            conn = self._writer()
+            row = conn.execute("SELECT file_id FROM files WHERE path = ?", (rel,)).fetchone()
+            if row is None:
+                return False
+            self._delete_file(conn, row[0])
+            conn.commit()
+            self._totals = None
+            self.files_removed += 1
+            return True
+
+    def _index_file(self, conn: sqlite3.Connection, file_path: Path, rel: str,
+                    stat, file_id: Optional[int]):
+        """Tokenize a file and replace its postings. Caller holds the write lock."""
+        postings: Dict[str, List[Tuple[int, int, int]]] = defaultdict(list)
+        snippets: List[Tuple[int, str]] = []
+        num_tokens = 0
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                for line_num, line in enumerate(f, 1):
+                    words = tokenize(line)
+                    if not words:
+                        continue
+                    length = len(words)
+                    num_tokens += length
+                    for token_pos, word in enumerate(words):
+                        postings[word].append((line_num, token_pos, length))
+                    snippets.append((line_num, line.strip()[:self.MAX_SNIPPET_CHARS]))
+        except OSError as e:
+            logger.debug(f"Skipping {file_path}: {e}")
+            return
+
+        if file_id is None:
+            file_id = conn.execute(
+                "INSERT INTO files (path, mtime, size, num_lines, num_tokens)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (rel, stat.st_mtime, stat.st_size, len(snippets), num_tokens)
+            ).lastrowid
+        else:
+            conn.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+            conn.execute("DELETE FROM lines WHERE file_id = ?", (file_id,))
+            conn.execute(
+                "UPDATE files SET mtime = ?, size = ?, num_lines = ?, num_tokens = ?"
+                " WHERE file_id = ?",
+                (stat.st_mtime, stat.st_size, len(snippets), num_tokens, file_id)
+            )
+
+        conn.executemany(
+            "INSERT INTO postings (term, file_id, positions) VALUES (?, ?, ?)",
+            [(term, file_id, _pack_positions(positions)) for term, positions in postings.items()]
+        )
+        conn.executemany(
+            "INSERT INTO lines (file_id, line, text) VALUES (?, ?, ?)",
+            [(file_id, line_num, text) for line_num, text in snippets]
+        )
+
+    @staticmethod
+    def _delete_file(conn: sqlite3.Connection, file_id: int):
+        """Remove a file, its postings and snippets. Caller holds the write lock."""
+        conn.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+        conn.execute("DELETE FROM lines WHERE file_id = ?", (file_id,))
+        conn.execute("DELETE FROM files WHERE file_id = ?", (file_id,))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def lookup(self, terms: List[str]) -> Dict[Path, Dict[str, List[Tuple[int, int]]]]:
+        """
+        Fetch postings for a set of terms.
+
+        Args:
+            terms: Lowercase index terms
+
+        Returns:
+            file path -> term -> list of (line, token) positions
+        """
+        terms = list(dict.fromkeys(terms))
+        if not terms:
+            return {}
+
+        placeholders = ",".join("?" * len(terms))
+        results: Dict[Path, Dict[str, List[Tuple[int, int]]]] = defaultdict(dict)
+        with self._read_lock:
+            rows = self._reader().execute(
+                "SELECT p.term, f.path, p.positions FROM postings p"
+                " JOIN files f ON f.file_id = p.file_id"
+                f" WHERE p.term IN ({placeholders})",
+                terms
+            ).fetchall()
+
+        for term, rel, blob in rows:
+            results[self.root_path / rel][term] = [
+                (line, token) for line, token, _ in _unpack_positions(blob)
+            ]
+        return dict(results)
+
+    def _corpus_totals(self, conn: sqlite3.Connection) -> Tuple[int, int]:
+        """Number of indexed lines and tokens. Caller holds the read lock."""
+        if self._totals is None:
+            docs, tokens = conn.execute(
+                "SELECT COALESCE(SUM(num_lines), 0), COALESCE(SUM(num_tokens), 0) FROM files"
+            ).fetchone()
+            self._totals = (docs, tokens)
+        return self._totals
+
+    def search(
+        self,
+        terms: List[str],
+        limit: int = 50,
+        max_per_file: int = 10,
+        file_filter: Optional[Callable[[Path], bool]] = None
+    ) -> List[Dict]:
+        """
+        Rank indexed lines for a query with BM25F plus phrase/proximity boosts.
+
+        Each line is a document with two fields: its own tokens (length
+        normalized) and the tokens of its file path. Lines where consecutive
+        query terms appear next to each other get a phrase boost, and lines
+        whose matched terms fall in a narrow token window get a proximity
+        boost.
+
+        Args:
+            terms: Lowercase query terms, in query order
+            limit: Maximum number of lines to return
+            max_per_file: Maximum number of lines returned per file
+            file_filter: Optional predicate restricting which files may match
+
+        Returns:
+            Result dicts (file_path, line_number, content, score,
+            matched_terms, phrase, proximity), best first
+        """
+        terms = list(dict.fromkeys(terms))
+        if not terms:
+            return []
+
+        placeholders = ",".join("?" * len(terms))
+        with self._read_lock:
+            conn = self._reader()
+            num_docs, num_tokens = self._corpus_totals(conn)
+            rows = conn.execute(
+                "SELECT p.term, p.file_id, f.path, p.positions FROM postings p"
+                " JOIN files f ON f.file_id = p.file_id"
+                f" WHERE p.term IN ({placeholders})",
+                terms
+            ).fetchall()
+        if not rows or not num_docs:
+            return []
+
+        term_index = {term: i for i, term in enumerate(terms)}
+        doc_freq = [0] * len(terms)
+        paths: Dict[int, Path] = {}
+        # (file_id, line) -> [line_length, positions per query term]
+        docs: Dict[Tuple[int, int], list] = {}
+
+        for term, file_id, rel, blob in rows:
+            t = term_index[term]
+            lines_seen = set()
+            path = paths.get(file_id)
+            if path is None:
+                path = paths[file_id] = self.root_path / rel
+            allowed = file_filter is None or file_filter(path)
+            for line, token, length in _unpack_positions(blob):
+                lines_seen.add(line)
+                if not allowed:
+                    continue
+                doc = docs.get((file_id, line))
+                if doc is None:
+                    doc = docs[(file_id, line)] = [length, [[] for _ in terms]]
+                doc[1][t].append(token)
+            # Document frequency counts every line, filtered or not
+            doc_freq[t] += len(lines_seen)
+
+        avg_length = num_tokens / num_docs
+        idf = [math.log(1 + (num_docs - df + 0.5) / (df + 0.5)) for df in doc_freq]
+        path_terms = {file_id: set(tokenize(path.as_posix())) for file_id, path in paths.items()}
+
+        scored = []
+        for (file_id, line), (length, positions) in docs.items():
+            norm = 1 - self.B + self.B * length / avg_length
+            in_path = path_terms[file_id]
+            bm25 = 0.0
+            matched = []
+            for t, term in enumerate(terms):
+                tf = self.BODY_WEIGHT * len(positions[t]) / norm
+                if term in in_path:
+                    tf += self.PATH_WEIGHT
+                if tf:
+                    bm25 += idf[t] * tf / (self.K1 + tf)
+                if positions[t]:
+                    matched.append(t)
+
+            phrase = proximity = 0.0
+            if len(matched) > 1:
+                adjacent = sum(
+                    1 for t in range(len(terms) - 1)
+                    if positions[t] and positions[t + 1]
+                    and set(positions[t + 1]) & {p + 1 for p in positions[t]}
+                )
+                phrase = adjacent / (len(terms) - 1)
+                window = _min_window([positions[t] for t in matched])
+                proximity = (len(matched) - 1) / (window - 1) if window > 1 else 1.0
+
+            score = bm25 * (1 + self.PHRASE_BOOST * phrase + self.PROXIMITY_BOOST * proximity)
+            scored.append((score, file_id, line, [terms[t] for t in matched], phrase, proximity))
+
+        scored.sort(key=lambda item: (-item[0], item[1], item[2]))
+
+        top = []
+        per_file: Dict[int, int] = defaultdict(int)
+        for item in scored:
+            if per_file[item[1]] >= max_per_file:
+                continue
+            per_file[item[1]] += 1
+            top.append(item)
+            if len(top) >= limit:
+                break
+
+        snippets = self._get_snippets([(file_id, line) for _, file_id, line, *_ in top])
+        return [
+            {
+                'file_path': paths[file_id],
+                'line_number': line,
+                'content': snippets.get((file_id, line), ''),
+                'score': score,
+                'matched_terms': matched,
+                'phrase': phrase,
+                'proximity': proximity
+            }
+            for score, file_id, line, matched, phrase, proximity in top
+        ]
+
+    def _get_snippets(self, keys: List[Tuple[int, int]]) -> Dict[Tuple[int, int], str]:
+        """Fetch stored line text for (file_id, line) pairs."""
+        by_file: Dict[int, List[int]] = defaultdict(list)
+        for file_id, line in keys:
+            by_file[file_id].append(line)
+
+        snippets = {}
+        with self._read_lock:
+            conn = self._reader()
+            for file_id, lines in by_file.items():
+                placeholders = ",".join("?" * len(lines))
+                for line, text in conn.execute(
+                    f"SELECT line, text FROM lines WHERE file_id = ? AND line IN ({placeholders})",
+                    [file_id, *lines]
+                ):
+                    snippets[(file_id, line)] = text
+        return snippets
+
+    def get_stats(self) -> Dict:
+        """Get index statistics."""
+        with self._read_lock:
+            conn = self._reader()
+            files = conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            terms = conn.execute("SELECT COUNT(DISTINCT term) FROM postings").fetchone()[0]
+        return {
+            'path': str(self.path),
+            'files': files,
+            'terms': terms,
+            'files_indexed': self.files_indexed,
+            'files_removed': self.files_removed,
+            'last_sync_seconds': round(self.last_sync_seconds, 3)
+        }
+
+    def close(self):
+        """Close the underlying database connections."""
+        with self._read_lock:
+            if self._read_conn is not None:
+                self._read_conn.close()
+                self._read_conn = None
+        with self._write_lock:
+            if self._write_conn is not None:
+                self._write_conn.close()
+                self._write_conn = None
@@ -7,9 +7,13 @@ with performance-optimized batching and async processing.
 
 import asyncio
 import json
+import queue
+import re
+import threading
 import time
 import logging
 from datetime import datetime, timedelta
+from enum import Enum
 from typing import Dict, List, Optional, Any, Callable, AsyncGenerator
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
@@ -60,6 +64,30 @@ class TelemetryConfig:
             self.storage_path = Path.home() / ".torq_console" / "telemetry.db"
 
 
+_json_encoder = json.JSONEncoder(default=str)
+
+
+def _encode_json(value: Any) -> str:
+    """json.dumps with a shared encoder; empty dicts skip encoding entirely."""
+    if isinstance(value, dict) and not value:
+        return '{}'
+    return _json_encoder.encode(value)
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def _set_future_result(future: asyncio.Future, result: Any):
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_future_exception(future: asyncio.Future, exc: BaseException):
+    if not future.done():
+        future.set_exception(exc)
+
+
 class TelemetryStorage:
     """Abstract base class for telemetry storage backends."""
 
@@ -88,18 +116,62 @@ class TelemetryStorage:
         """Get storage statistics."""
         raise NotImplementedError
 
+    async def close(self):
+        """Release resources held by the backend."""
 
-class SQLiteTelemetryStorage(TelemetryStorage):
-    """SQLite-based telemetry storage."""
 
-    def __init__(self, db_path: Path):
-        self.db_path = db_path
-        self._lock = asyncio.Lock()
+class SQLiteTelemetryStorage(TelemetryStorage):
+    """
+    SQLite-based telemetry storage.
+
+    Writes go through a dedicated writer thread that owns one persistent
+    WAL-mode connection. Each store_events batch becomes a single
+    transaction of executemany inserts, using constant SQL so the
+    connection's statement cache prepares each insert once. The event
+    loop only enqueues the batch and awaits its result; when
+    max_pending_batches are already queued, store_events waits for room
+    off the loop instead of blocking it.
+    """
+
+    _INSERT_EVENT = """
+        INSERT OR REPLACE INTO events (
+            id, event_type, timestamp, session_id, run_id, severity,
+            source, version, trace_id, span_id, parent_span_id,
+            data, tags, context, duration_ms, cpu_usage_percent, memory_usage_mb
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    _INSERT_AGENT_RUN = """
+        INSERT OR REPLACE INTO agent_runs (
+            run_id, agent_name, agent_type, status, start_time,
+            end_time, duration_ms, input_tokens, output_tokens,
+            total_tokens, success, error_message
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def __init__(self, db_path: Path, max_pending_batches: int = 64):
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._jobs: queue.Queue = queue.Queue(maxsize=max_pending_batches)
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
         self._init_database()
 
+    def _connection(self) -> sqlite3.Connection:
+        """Open the writer connection lazily. Used only by the writer thread (and __init__)."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Keep the event indexes' hot pages cached across batches (32 MB)
+            conn.execute("PRAGMA cache_size=-32768")
+            self._conn = conn
+        return self._conn
+
     def _init_database(self):
         """Initialize the SQLite database."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connection()
         cursor = conn.cursor()
 
         # Create events table
@@ -154,67 +226,120 @@ class SQLiteTelemetryStorage(TelemetryStorage):
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_agent_runs_start_time ON agent_runs(start_time)')
 
         conn.commit()
-        conn.close()
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _ensure_writer(self):
+        """Start the writer thread on first use (and again after close)."""
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    name="torq-telemetry-writer",
+                    daemon=True,
+                )
+                self._writer.start()
+
+    def _writer_loop(self):
+        """Run queued jobs in order until a None sentinel arrives."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            func, args, loop, future = job
+            try:
+                callback, value = _set_future_result, func(*args)
+            except Exception as e:
+                callback, value = _set_future_exception, e
+            try:
+                loop.call_soon_threadsafe(callback, future, value)
+            except RuntimeError:
+                pass  # The submitting loop has closed
+
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def _submit(self, func: Callable, *args) -> Any:
+        """Run func(*args) on the writer thread and await its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        job = (func, args, loop, future)
+        self._ensure_writer()
+        try:
+            self._jobs.put_nowait(job)
+        except queue.Full:
+            # Backpressure: wait for the writer to catch up without blocking the loop
+            await loop.run_in_executor(None, self._jobs.put, job)
+        return await future
+
+    async def close(self):
+        """Finish queued writes and close the writer connection."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None and writer.is_alive():
+            await asyncio.get_running_loop().run_in_executor(None, self._jobs.put, None)
+            await asyncio.get_running_loop().run_in_executor(None, writer.join)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
 
     async def store_events(self, events: List[TorqEvent]) -> bool:
         """Store a batch of events."""
-        async with self._lock:
-            try:
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
+        if not events:
+            return True
+        return await self._submit(self._write_events, list(events))
 
-                for event in events:
-                    event_dict = event.to_dict()
-
-                    # Store main event
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO events (
-                            id, event_type, timestamp, session_id, run_id, severity,
-                            source, version, trace_id, span_id, parent_span_id,
-                            data, tags, context, duration_ms, cpu_usage_percent, memory_usage_mb
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        event_dict['event_id'],
-                        event_dict['event_type'],
-                        event_dict['timestamp'],
-                        event_dict['session_id'],
-                        event_dict['run_id'],
-                        event_dict['severity'],
-                        event_dict['source'],
-                        event_dict['version'],
-                        event_dict['trace_id'],
-                        event_dict['span_id'],
-                        event_dict['parent_span_id'],
-                        json.dumps(event_dict['data']),
-                        json.dumps(event_dict['tags']),
-                        json.dumps(event_dict['context']),
-                        event_dict['duration_ms'],
-                        event_dict['cpu_usage_percent'],
-                        event_dict['memory_usage_mb']
-                    ))
-
-                    # Store agent run specific data
-                    if event.event_type == TorqEventType.AGENT_RUN:
-                        self._store_agent_run(cursor, event)
-
-                conn.commit()
-                conn.close()
-                return True
+    def _write_events(self, events: List[TorqEvent]) -> bool:
+        """Insert a batch in one transaction. Runs on the writer thread."""
+        try:
+            event_rows = [self._event_row(event) for event in events]
+            run_rows = [
+                self._agent_run_row(event) for event in events
+                if event.event_type == TorqEventType.AGENT_RUN
+            ]
+            conn = self._connection()
+            with conn:
+                conn.executemany(self._INSERT_EVENT, event_rows)
+                if run_rows:
+                    conn.executemany(self._INSERT_AGENT_RUN, run_rows)
+            return True
 
-            except Exception as e:
-                logging.error(f"Failed to store events: {e}")
-                return False
+        except Exception as e:
+            logging.error(f"Failed to store events: {e}")
+            return False
 
-    def _store_agent_run(self, cursor: sqlite3.Cursor, event: TorqEvent):
-        """Store agent run specific data."""
+    @staticmethod
+    def _event_row(event: TorqEvent) -> tuple:
+        """Column values for the events table, read straight off the event."""
+        return (
+            event.event_id,
+            _enum_value(event.event_type),
+            event.timestamp.isoformat() if isinstance(event.timestamp, datetime) else event.timestamp,
+            event.session_id,
+            event.run_id,
+            _enum_value(event.severity),
+            event.source,
+            event.version,
+            event.trace_id,
+            event.span_id,
+            event.parent_span_id,
+            _encode_json(event.data),
+            _encode_json(event.tags),
+            _encode_json(event.context),
+            event.duration_ms,
+            event.cpu_usage_percent,
+            event.memory_usage_mb,
+        )
+
+    @staticmethod
+    def _agent_run_row(event: TorqEvent) -> tuple:
+        """Column values for the agent_runs table."""
         data = event.data
-        cursor.execute('''
-            INSERT OR REPLACE INTO agent_runs (
-                run_id, agent_name, agent_type, status, start_time,
-                end_time, duration_ms, input_tokens, output_tokens,
-                total_tokens, success, error_message
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        return (
             event.run_id,
             data.get('agent_name', ''),
             data.get('agent_type', ''),
@@ -227,7 +352,7 @@ class SQLiteTelemetryStorage(TelemetryStorage):
             data.get('total_tokens'),
             data.get('success', True),
             data.get('error_message')
-        ))
+        )
 
     async def get_events(
         self,
@@ -296,34 +421,27 @@ class SQLiteTelemetryStorage(TelemetryStorage):
 
     async def cleanup_old_events(self, cutoff_date: datetime) -> int:
         """Clean up events older than cutoff date."""
-        async with self._lock:
-            try:
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-
-                cutoff_str = cutoff_date.isoformat()
+        return await self._submit(self._delete_old_events, cutoff_date.isoformat())
 
+    def _delete_old_events(self, cutoff_str: str) -> int:
+        """Delete old rows and VACUUM. Runs on the writer thread."""
+        try:
+            conn = self._connection()
+            with conn:
                 # Delete old events
-                cursor.execute("DELETE FROM events WHERE timestamp < ?", (cutoff_str,))
-                events_deleted = cursor.rowcount
+                events_deleted = conn.execute("DELETE FROM events WHERE timestamp < ?", (cutoff_str,)).rowcount
 
                 # Delete old agent runs
-                cursor.execute("DELETE FROM agent_runs WHERE start_time < ?", (cutoff_str,))
-                runs_deleted = cursor.rowcount
-
-                conn.commit()
-                conn.close()
+                runs_deleted = conn.execute("DELETE FROM agent_runs WHERE start_time < ?", (cutoff_str,)).rowcount
 
-                # VACUUM to reclaim space
-                conn = sqlite3.connect(self.db_path)
-                conn.execute("VACUUM")
-                conn.close()
+            # VACUUM to reclaim space
+            conn.execute("VACUUM")
 
-                return events_deleted + runs_deleted
+            return events_deleted + runs_deleted
 
-            except Exception as e:
-                logging.error(f"Failed to cleanup old events: {e}")
-                return 0
+        except Exception as e:
+            logging.error(f"Failed to cleanup old events: {e}")
+            return 0
 
     async def get_statistics(self) -> Dict[str, Any]:
         """Get storage statistics."""
@@ -544,6 +662,7 @@ class TelemetryCollector:
         self._flush_task: Optional[asyncio.Task] = None
         self._processing = False
         self._shutdown_event = asyncio.Event()
+        self._flush_requested = asyncio.Event()
 
         # Statistics
         self._stats = {
@@ -557,9 +676,9 @@ class TelemetryCollector:
 
         # PII filtering
         self._pii_patterns = [
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Email
-            r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b',  # Credit card
-            r'\b\d{3}-\d{2}-\d{4}\b',  # SSN
+            re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.IGNORECASE),  # Email
+            re.compile(r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b', re.IGNORECASE),  # Credit card
+            re.compile(r'\b\d{3}-\d{2}-\d{4}\b', re.IGNORECASE),  # SSN
         ]
 
     def _create_storage(self) -> TelemetryStorage:
@@ -579,7 +698,9 @@ class TelemetryCollector:
             return
 
         self._processing = True
-        self._shutdown_event.clear()
+        # Fresh events bound to the loop this collector now runs on
+        self._shutdown_event = asyncio.Event()
+        self._flush_requested = asyncio.Event()
 
         # Start flush task
         self._flush_task = asyncio.create_task(self._flush_loop())
@@ -594,16 +715,15 @@ class TelemetryCollector:
         self._processing = False
         self._shutdown_event.set()
 
-        # Cancel flush task
+        # Wake the flush task and let any in-flight flush finish
+        self._flush_requested.set()
         if self._flush_task:
-            self._flush_task.cancel()
-            try:
-                await self._flush_task
-            except asyncio.CancelledError:
-                pass
+            await self._flush_task
+            self._flush_task = None
 
         # Flush remaining events
         await self._flush_events()
+        await self.storage.close()
 
         logging.info("Telemetry collector stopped")
 
@@ -632,6 +752,9 @@ class TelemetryCollector:
         try:
             await self._event_queue.put(event)
             self._stats['events_collected'] += 1
+            # Flush full batches now rather than at the next interval
+            if self._event_queue.qsize() >= self.config.batch_size:
+                self._flush_requested.set()
             return True
         except asyncio.QueueFull:
             self._stats['events_dropped'] += 1
@@ -695,57 +818,54 @@ class TelemetryCollector:
 
         return summary
 
-    async def _sanitize_event(self, event: TorqEvent) -> TorqEvent:
+    def _sanitize_event(self, event: TorqEvent) -> TorqEvent:
         """Sanitize PII from event data."""
-        import re
-
-        # Create a copy to avoid modifying the original
-        sanitized_data = event.data.copy()
-        sanitized_context = event.context.copy()
-
-        # Sanitize specified fields
-        for field in self.config.sanitize_fields:
-            if field in sanitized_data and isinstance(sanitized_data[field], str):
-                for pattern in self._pii_patterns:
-                    sanitized_data[field] = re.sub(pattern, '[REDACTED]', sanitized_data[field], flags=re.IGNORECASE)
-
-            if field in sanitized_context and isinstance(sanitized_context[field], str):
-                for pattern in self._pii_patterns:
-                    sanitized_context[field] = re.sub(pattern, '[REDACTED]', sanitized_context[field], flags=re.IGNORECASE)
-
-        # Create new event with sanitized data
-        return type(event)(
-            event_id=event.event_id,
-            event_type=event.event_type,
-            timestamp=event.timestamp,
-            session_id=event.session_id,
-            run_id=event.run_id,
-            severity=event.severity,
-            source=event.source,
-            version=event.version,
-            trace_id=event.trace_id,
-            span_id=event.span_id,
-            parent_span_id=event.parent_span_id,
-            data=sanitized_data,
-            tags=event.tags,
-            context=sanitized_context,
-            duration_ms=event.duration_ms,
-            cpu_usage_percent=event.cpu_usage_percent,
-            memory_usage_mb=event.memory_usage_mb
-        )
+        sanitized_data = self._sanitize_fields(event.data)
+        sanitized_context = self._sanitize_fields(event.context)
+
+        if sanitized_data is None and sanitized_context is None:
+            return event
+
+        # Shallow copy (including subclass fields) to avoid modifying the original;
+        # skips re-running __init__, which costs more than the sanitizing itself
+        sanitized = object.__new__(type(event))
+        sanitized.__dict__.update(event.__dict__)
+        if sanitized_data is not None:
+            sanitized.data = sanitized_data
+        if sanitized_context is not None:
+            sanitized.context = sanitized_context
+        return sanitized
+
+    def _sanitize_fields(self, values: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Copy of values with PII redacted from sanitize_fields, or None if nothing to sanitize."""
+        sanitized = None
+        for field_name in self.config.sanitize_fields:
+            value = values.get(field_name)
+            if not isinstance(value, str):
+                continue
+            if sanitized is None:
+                sanitized = values.copy()
+            for pattern in self._pii_patterns:
+                value = pattern.sub('[REDACTED]', value)
+            sanitized[field_name] = value
+        return sanitized
 
     async def _flush_loop(self):
         """Background task to flush events periodically."""
         while self._processing:
             try:
                 await asyncio.wait_for(
-                    self._shutdown_event.wait(),
+                    self._flush_requested.wait(),
                     timeout=self.config.flush_interval_seconds
                 )
-                break  # Shutdown event was set
             except asyncio.TimeoutError:
-                # Flush interval reached
-                await self._flush_events()
+                pass  # Flush interval reached
+
+            if self._shutdown_event.is_set():
+                break  # stop() flushes the remainder
+
+            self._flush_requested.clear()
+            await self._flush_events()
 
     async def _flush_events(self):
         """Flush queued events to storage."""
@@ -11,12 +11,14 @@ Provides semantic code search capabilities using:
 
 from .code_scanner import CodeScanner
 from .embeddings import EmbeddingGenerator
+from .embedding_cache import EmbeddingCache
 from .vector_store import VectorStore
 from .semantic_search import SemanticSearch
 
 __all__ = [
     'CodeScanner',
     'EmbeddingGenerator',
+    'EmbeddingCache',
     'VectorStore',
     'SemanticSearch'
 ]
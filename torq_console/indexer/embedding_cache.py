@@ -0,0 +1,210 @@
+"""
+Embedding Cache - Disk-backed cache of embeddings keyed by content hash.
+
+Stores one float32 vector per (model_name, sha256(text)) in SQLite so that
+re-indexing unchanged code (branch switches, fresh containers with a shared
+volume) never runs the embedding model again.
+
+Cache hits are read-only: recency is tracked in memory and written back
+together with the next insert, eviction or close().
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """Persistent, size-bounded embedding cache with batch lookups."""
+
+    # Bound-parameter chunk size for IN (...) queries
+    _CHUNK = 500
+
+    def __init__(self, path: str, max_entries: int = 500_000):
+        """
+        Initialize embedding cache.
+
+        Args:
+            path: SQLite file to store embeddings in (created on first use)
+            max_entries: Entry count above which least-recently-used rows are evicted
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._count: Optional[int] = None
+        # (model, text_hash) -> last hit time, not yet written to disk
+        self._last_used: Dict[Tuple[str, bytes], float] = {}
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database lazily. Caller holds the lock."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " model TEXT NOT NULL,"
+                " text_hash BLOB NOT NULL,"
+                " vector BLOB NOT NULL,"
+                " last_used REAL NOT NULL,"
+                " PRIMARY KEY (model, text_hash))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embeddings_last_used"
+                " ON embeddings (last_used)"
+            )
+            self._conn = conn
+            self._count = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        return self._conn
+
+    @staticmethod
+    def text_hash(text: str) -> bytes:
+        """SHA-256 digest used as the cache key for a text."""
+        return hashlib.sha256(text.encode('utf-8')).digest()
+
+    def get_many(self, model_name: str, texts: List[str]) -> Dict[int, np.ndarray]:
+        """
+        Look up embeddings for a batch of texts.
+
+        Args:
+            model_name: Embedding model the vectors were produced by
+            texts: Texts to look up
+
+        Returns:
+            Mapping of position in ``texts`` to cached embedding
+        """
+        if not texts:
+            return {}
+
+        positions: Dict[bytes, List[int]] = {}
+        for i, text in enumerate(texts):
+            positions.setdefault(self.text_hash(text), []).append(i)
+        hashes = list(positions)
+
+        found: Dict[int, np.ndarray] = {}
+        with self._lock:
+            conn = self._connect()
+            hit_hashes = []
+            for start in range(0, len(hashes), self._CHUNK):
+                chunk = hashes[start:start + self._CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT text_hash, vector FROM embeddings"
+                    f" WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model_name, *chunk]
+                )
+                for text_hash, blob in rows:
+                    vector = np.frombuffer(blob, dtype='float32')
+                    for i in positions[text_hash]:
+                        found[i] = vector
+                    hit_hashes.append(text_hash)
+
+            now = time.time()
+            for text_hash in hit_hashes:
+                self._last_used[(model_name, text_hash)] = now
+
+            self.hits += len(found)
+            self.misses += len(texts) - len(found)
+        return found
+
+    def put_many(self, model_name: str, texts: List[str], embeddings: np.ndarray):
+        """
+        Store embeddings for a batch of texts, evicting old entries if needed.
+
+        Args:
+            model_name: Embedding model the vectors were produced by
+            texts: Texts that were embedded
+            embeddings: Array of embeddings (N x dim), row-aligned with ``texts``
+        """
+        if not texts:
+            return
+
+        now = time.time()
+        rows = {
+            self.text_hash(text): np.ascontiguousarray(vector, dtype='float32').tobytes()
+            for text, vector in zip(texts, embeddings)
+        }
+        with self._lock:
+            conn = self._connect()
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (model, text_hash, vector, last_used)"
+                " VALUES (?, ?, ?, ?)",
+                [(model_name, h, blob, now) for h, blob in rows.items()]
+            )
+            self._count += conn.total_changes - before
+
+            self._flush_last_used(conn)
+            if self._count > self.max_entries:
+                self._evict(conn)
+            conn.commit()
+
+    def _flush_last_used(self, conn: sqlite3.Connection):
+        """Write buffered hit times to disk (uncommitted). Caller holds the lock."""
+        if not self._last_used:
+            return
+        conn.executemany(
+            "UPDATE embeddings SET last_used = ? WHERE model = ? AND text_hash = ?",
+            [(used, model, h) for (model, h), used in self._last_used.items()]
+        )
+        self._last_used.clear()
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least-recently-used rows down to 90% of capacity. Caller holds the lock."""
+        target = int(self.max_entries * 0.9)
+        excess = self._count - target
+        before = conn.total_changes
+        conn.execute(
+            "DELETE FROM embeddings WHERE rowid IN ("
+            " SELECT rowid FROM embeddings ORDER BY last_used LIMIT ?)",
+            (excess,)
+        )
+        evicted = conn.total_changes - before
+        self._count -= evicted
+        self.evictions += evicted
+        logger.debug(f"Evicted {evicted} cached embeddings")
+
+    def clear(self):
+        """Delete every cached embedding."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM embeddings")
+            conn.commit()
+            self._count = 0
+            self._last_used.clear()
+
+    def get_stats(self) -> Dict:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'path': str(self.path),
+                'entries': self._count if self._count is not None else 0,
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._flush_last_used(self._conn)
+                self._conn.commit()
+                self._conn.close()
+                self._conn = None
@@ -9,22 +9,30 @@ import logging
 from typing import List, Optional
 import numpy as np
 
+from .embedding_cache import EmbeddingCache
+
 logger = logging.getLogger(__name__)
 
 
 class EmbeddingGenerator:
     """Generate semantic embeddings for code search."""
 
-    def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
+    def __init__(
+        self,
+        model_name: str = 'all-MiniLM-L6-v2',
+        cache: Optional[EmbeddingCache] = None
+    ):
         """
         Initialize embedding generator.
 
         Args:
             model_name: Sentence-BERT model to use
+            cache: Optional persistent cache; cached texts skip the model
         """
         self.model_name = model_name
         self.model = None
         self.embedding_dim = 384  # Dimension for all-MiniLM-L6-v2
+        self.cache = cache
 
     def _load_model(self):
         """Lazy load the Sentence-BERT model."""
@@ -47,7 +55,8 @@ class EmbeddingGenerator:
         self,
         texts: List[str],
         batch_size: int = 100,
-        show_progress: bool = False
+        show_progress: bool = False,
+        use_cache: bool = True
     ) -> np.ndarray:
         """
         Generate embeddings for a list of texts.
@@ -56,6 +65,7 @@ class EmbeddingGenerator:
             texts: List of text strings to embed
             batch_size: Batch size for processing
             show_progress: Show progress bar
+            use_cache: Read and populate the persistent cache (if configured)
 
         Returns:
             NumPy array of embeddings (N x embedding_dim)
@@ -63,6 +73,35 @@ class EmbeddingGenerator:
         if not texts:
             return np.array([])
 
+        if self.cache is None or not use_cache:
+            return self._encode(texts, batch_size, show_progress)
+
+        cached = self.cache.get_many(self.model_name, texts)
+        missing = [i for i in range(len(texts)) if i not in cached]
+        if not missing:
+            logger.info(f"Loaded {len(texts)} embeddings from cache")
+            return np.vstack([cached[i] for i in range(len(texts))])
+
+        new_texts = [texts[i] for i in missing]
+        new_embeddings = self._encode(new_texts, batch_size, show_progress)
+        self.cache.put_many(self.model_name, new_texts, new_embeddings)
+
+        embeddings = np.empty((len(texts), new_embeddings.shape[1]), dtype=new_embeddings.dtype)
+        for i, vector in cached.items():
+            embeddings[i] = vector
+        embeddings[missing] = new_embeddings
+        logger.info(
+            f"Embeddings: {len(cached)} from cache, {len(missing)} generated"
+        )
+        return embeddings
+
+    def _encode(
+        self,
+        texts: List[str],
+        batch_size: int,
+        show_progress: bool
+    ) -> np.ndarray:
+        """Run the Sentence-BERT model over texts."""
         self._load_model()
 
         try:
@@ -78,17 +117,18 @@ class EmbeddingGenerator:
             logger.error(f"Failed to generate embeddings: {e}")
             raise
 
-    def generate_single_embedding(self, text: str) -> np.ndarray:
+    def generate_single_embedding(self, text: str, use_cache: bool = True) -> np.ndarray:
         """
         Generate embedding for a single text.
 
         Args:
             text: Text string to embed
+            use_cache: Read and populate the persistent cache (if configured)
 
         Returns:
             NumPy array of embedding (embedding_dim,)
         """
-        return self.generate_embeddings([text], batch_size=1)[0]
+        return self.generate_embeddings([text], batch_size=1, use_cache=use_cache)[0]
 
     def compute_similarity(
         self,
@@ -210,7 +250,8 @@ class EmbeddingGenerator:
         return {
             'model_name': self.model_name,
             'embedding_dim': self.embedding_dim,
-            'max_seq_length': self.model.max_seq_length if self.model else None
+            'max_seq_length': self.model.max_seq_length if self.model else None,
+            'cache': self.cache.get_stats() if self.cache else None
         }
 
 
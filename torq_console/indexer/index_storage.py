@@ -0,0 +1,453 @@
+"""
+Index Storage - Memory-mapped, pickle-free on-disk format for the vector store.
+
+An index directory holds one active *segment*; ``CURRENT`` names it:
+
+    <index_dir>/
+        CURRENT                    name of the live segment
+        segment-<ns>/
+            vectors.f32            float32 rows (N x dim), np.memmap
+            norms.f32              squared L2 norm per row
+            labels.i64             FAISS label per row (ascending)
+            ids.i64                document ID per row
+            tombstones.i64         labels of deleted rows
+            index.faiss            ANN structure over the first ann_rows rows
+            metadata.sqlite        meta key/values + documents(doc_id, label, metadata)
+
+The column files are append-only. Incremental saves append new rows and
+tombstones to the active segment and then commit the new row counts in
+SQLite, so a crash mid-append leaves a tail that is ignored and overwritten
+by the next append. Compaction writes a fresh segment and atomically points
+``CURRENT`` at it, so readers never observe a half-written index.
+
+Vectors are opened with ``np.memmap``, so several worker processes loading
+the same index share page-cache pages and startup cost does not depend on
+index size.
+"""
+
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CURRENT_FILE = 'CURRENT'
+SEGMENT_PREFIX = 'segment-'
+METADATA_FILE = 'metadata.sqlite'
+ANN_INDEX_FILE = 'index.faiss'
+TOMBSTONES_FILE = 'tombstones.i64'
+
+
+def has_segment(path: str) -> bool:
+    """Check whether a directory contains a segment-format index."""
+    return (Path(path) / CURRENT_FILE).exists()
+
+
+def exclusion_selector(labels: Iterable[int]):
+    """
+    Build a FAISS selector that rejects the given labels.
+
+    Returns a tuple whose last element is the selector; the other elements
+    must be kept alive for as long as it is used.
+    """
+    import faiss
+
+    labels = np.fromiter(labels, dtype='int64')
+    batch = faiss.IDSelectorBatch(labels)
+    # IDSelectorNot does not own its argument
+    return batch, faiss.IDSelectorNot(batch)
+
+
+def filtered_search_params(index, selector):
+    """
+    SearchParameters applying ``selector`` to a search on ``index``.
+
+    Parameter objects override the index's own nprobe/efSearch, so the
+    current values are carried over.
+    """
+    import faiss
+
+    if isinstance(index, faiss.IndexIVF):
+        return faiss.SearchParametersIVF(sel=selector, nprobe=index.nprobe)
+    if isinstance(index, faiss.IndexIDMap):
+        inner = faiss.downcast_index(index.index)
+        if isinstance(inner, faiss.IndexHNSW):
+            return faiss.SearchParametersHNSW(sel=selector, efSearch=inner.hnsw.efSearch)
+    return faiss.SearchParameters(sel=selector)
+
+
+def write_segment(
+    path: str,
+    vectors: np.ndarray,
+    labels: np.ndarray,
+    ids: np.ndarray,
+    documents: Dict[int, Dict],
+    meta: Dict,
+    ann_index=None
+) -> Path:
+    """
+    Write a new segment and make it current.
+
+    Args:
+        path: Index directory
+        vectors: float32 rows (N x dim), one per label
+        labels: FAISS label of each row
+        ids: Document ID of each row
+        documents: doc_id -> metadata dict
+        meta: Store-level settings (dimension, index_type, ...)
+        ann_index: FAISS index over all rows to persist (optional)
+
+    Returns:
+        Path of the written segment
+    """
+    root = Path(path)
+    root.mkdir(parents=True, exist_ok=True)
+
+    segment = root / f"{SEGMENT_PREFIX}{time.time_ns()}"
+    tmp_segment = segment.with_name(segment.name + '.tmp')
+    tmp_segment.mkdir()
+
+    order = np.argsort(labels, kind='stable')
+    vectors = np.ascontiguousarray(vectors[order], dtype='float32')
+    labels = np.ascontiguousarray(labels[order], dtype='int64')
+    ids = np.ascontiguousarray(ids[order], dtype='int64')
+
+    vectors.tofile(tmp_segment / 'vectors.f32')
+    _norms(vectors).tofile(tmp_segment / 'norms.f32')
+    labels.tofile(tmp_segment / 'labels.i64')
+    ids.tofile(tmp_segment / 'ids.i64')
+    (tmp_segment / TOMBSTONES_FILE).touch()
+
+    if ann_index is not None:
+        import faiss
+        faiss.write_index(ann_index, str(tmp_segment / ANN_INDEX_FILE))
+
+    doc_labels = dict(zip(ids.tolist(), labels.tolist()))
+    conn = sqlite3.connect(str(tmp_segment / METADATA_FILE))
+    try:
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        conn.execute(
+            "CREATE TABLE documents ("
+            "doc_id INTEGER PRIMARY KEY, label INTEGER NOT NULL, metadata TEXT NOT NULL)"
+        )
+        conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            [(k, json.dumps(v)) for k, v in {
+                **meta,
+                'rows': len(ids),
+                'tombstones': 0,
+                'ann_rows': len(ids) if ann_index is not None else 0
+            }.items()]
+        )
+        conn.executemany(
+            "INSERT INTO documents (doc_id, label, metadata) VALUES (?, ?, ?)",
+            (
+                (doc_id, doc_labels[doc_id], json.dumps(doc, default=str))
+                for doc_id, doc in documents.items()
+            )
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_segment, segment)
+
+    # Point CURRENT at the new segment atomically
+    tmp_current = root / (CURRENT_FILE + '.tmp')
+    tmp_current.write_text(segment.name, encoding='utf-8')
+    os.replace(tmp_current, root / CURRENT_FILE)
+
+    _remove_stale_segments(root, keep=segment.name)
+    return segment
+
+
+def append_segment(
+    path: str,
+    vectors: np.ndarray,
+    labels: np.ndarray,
+    ids: np.ndarray,
+    documents: Dict[int, Dict],
+    removed_ids: Iterable[int],
+    tombstones: Iterable[int],
+    meta: Dict
+):
+    """
+    Append rows and tombstones to the current segment.
+
+    Column files are truncated back to the committed row counts (dropping
+    the tail of an interrupted append), extended and fsynced; the new
+    counts and document rows are then committed in one SQLite transaction.
+
+    Args:
+        path: Index directory
+        vectors: float32 rows to append (N x dim)
+        labels: Label of each new row; all greater than the existing labels
+        ids: Document ID of each new row
+        documents: doc_id -> metadata for the new rows
+        removed_ids: Document IDs whose metadata is dropped
+        tombstones: Labels of existing rows to mark deleted
+        meta: Store-level settings to update
+    """
+    root = Path(path)
+    segment = root / (root / CURRENT_FILE).read_text(encoding='utf-8').strip()
+
+    order = np.argsort(labels, kind='stable')
+    vectors = np.ascontiguousarray(vectors[order], dtype='float32')
+    labels = np.ascontiguousarray(labels[order], dtype='int64')
+    ids = np.ascontiguousarray(ids[order], dtype='int64')
+    tombstones = np.fromiter(tombstones, dtype='int64')
+
+    conn = sqlite3.connect(str(segment / METADATA_FILE))
+    try:
+        stored = {
+            key: json.loads(value)
+            for key, value in conn.execute("SELECT key, value FROM meta")
+        }
+        rows = int(stored['rows'])
+        dead = int(stored['tombstones'])
+        dimension = int(stored['dimension'])
+
+        _append_column(segment / 'vectors.f32', rows * dimension * 4, vectors)
+        _append_column(segment / 'norms.f32', rows * 4, _norms(vectors))
+        _append_column(segment / 'labels.i64', rows * 8, labels)
+        _append_column(segment / 'ids.i64', rows * 8, ids)
+        _append_column(segment / TOMBSTONES_FILE, dead * 8, tombstones)
+
+        doc_labels = dict(zip(ids.tolist(), labels.tolist()))
+        with conn:
+            conn.executemany(
+                "DELETE FROM documents WHERE doc_id = ?",
+                [(int(doc_id),) for doc_id in removed_ids]
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO documents (doc_id, label, metadata) VALUES (?, ?, ?)",
+                [
+                    (doc_id, doc_labels[doc_id], json.dumps(doc, default=str))
+                    for doc_id, doc in documents.items()
+                ]
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [(k, json.dumps(v)) for k, v in {
+                    **meta,
+                    'rows': rows + len(ids),
+                    'tombstones': dead + len(tombstones)
+                }.items()]
+            )
+    finally:
+        conn.close()
+
+
+def _norms(vectors: np.ndarray) -> np.ndarray:
+    """Squared L2 norm of each row."""
+    return np.einsum('ij,ij->i', vectors, vectors).astype('float32')
+
+
+def _append_column(path: Path, committed_bytes: int, values: np.ndarray):
+    """Truncate a column file to its committed length and append values."""
+    with open(path, 'r+b') as f:
+        f.truncate(committed_bytes)
+        f.seek(committed_bytes)
+        f.write(values.tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _remove_stale_segments(root: Path, keep: str):
+    """Delete superseded segments; readers that still map them keep their inodes."""
+    for child in root.iterdir():
+        if child.is_dir() and child.name.startswith(SEGMENT_PREFIX) and child.name != keep:
+            shutil.rmtree(child, ignore_errors=True)
+
+
+class MappedIndex:
+    """Read-only view of an on-disk segment backed by np.memmap and SQLite."""
+
+    def __init__(self, path: str):
+        """
+        Open the current segment of an index directory.
+
+        Args:
+            path: Index directory containing CURRENT
+        """
+        root = Path(path)
+        self.root = root
+        self.segment = root / (root / CURRENT_FILE).read_text(encoding='utf-8').strip()
+
+        db_path = self.segment / METADATA_FILE
+        self._conn = sqlite3.connect(
+            f"file:{db_path.as_posix()}?mode=ro",
+            uri=True,
+            check_same_thread=False
+        )
+
+        self.ann_index = None
+        ann_file = self.segment / ANN_INDEX_FILE
+        if ann_file.exists():
+            import faiss
+            self.ann_index = faiss.read_index(str(ann_file), faiss.IO_FLAG_MMAP)
+
+        self.refresh()
+
+    def refresh(self):
+        """Re-read the committed row counts and remap the column files."""
+        self.meta = {
+            key: json.loads(value)
+            for key, value in self._conn.execute("SELECT key, value FROM meta")
+        }
+        self.dimension = int(self.meta['dimension'])
+        # Segments written before appends were supported are read-only
+        self.appendable = 'rows' in self.meta
+        self.rows = int(self.meta['rows'] if self.appendable else self.meta['count'])
+        self.ann_rows = int(self.meta.get(
+            'ann_rows', self.rows if self.ann_index is not None else 0
+        ))
+
+        self.vectors = self._map('vectors.f32', 'float32', (self.rows, self.dimension))
+        self.norms = self._map('norms.f32', 'float32', (self.rows,))
+        self.labels = self._map('labels.i64', 'int64', (self.rows,))
+        self.ids = self._map('ids.i64', 'int64', (self.rows,))
+        self.tombstones = self._map(
+            TOMBSTONES_FILE, 'int64', (int(self.meta.get('tombstones', 0)),)
+        )
+        self.count = self.rows - len(self.tombstones)
+        self.exclude(())
+
+    def _map(self, name: str, dtype: str, shape: Tuple[int, ...]) -> np.ndarray:
+        """Memory-map one column file (empty files cannot be mapped)."""
+        if shape[0] == 0:
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(self.segment / name, dtype=dtype, mode='r', shape=shape)
+
+    def exclude(self, labels: Iterable[int]):
+        """
+        Hide rows from search in addition to the persisted tombstones.
+
+        Args:
+            labels: Labels deleted since the segment was last written
+        """
+        dead = np.union1d(self.tombstones, np.fromiter(labels, dtype='int64'))
+        self._dead_rows = np.searchsorted(self.labels, dead)
+        self._live_count = self.rows - len(dead)
+        self._selector = exclusion_selector(dead) if len(dead) else None
+
+    def live_mask(self) -> np.ndarray:
+        """Boolean mask of rows that are not tombstoned."""
+        mask = np.ones(self.rows, dtype=bool)
+        mask[self._dead_rows] = False
+        return mask
+
+    def search(self, query_embeddings: np.ndarray, k: int) -> List[List[Tuple[int, float]]]:
+        """
+        Search the segment, returning (doc_id, squared L2 distance) per query.
+
+        Rows covered by the ANN structure are searched through FAISS; rows
+        appended after it was built are scanned exactly over the memory map.
+        """
+        if self._live_count == 0:
+            return [[] for _ in range(len(query_embeddings))]
+        k = min(k, self._live_count)
+
+        candidates = [[] for _ in range(len(query_embeddings))]
+        if self.ann_index is not None and self.ann_rows:
+            params = None
+            if self._selector is not None:
+                params = filtered_search_params(self.ann_index, self._selector[-1])
+            distances, labels = self.ann_index.search(
+                query_embeddings, min(k, self.ann_rows), params=params
+            )
+            rows = np.searchsorted(self.labels, labels)
+            for hits, query_dists, query_labels, query_rows in zip(
+                candidates, distances, labels, rows
+            ):
+                hits.extend(
+                    (float(dist), int(row))
+                    for dist, label, row in zip(query_dists, query_labels, query_rows)
+                    if label >= 0
+                )
+
+        start = self.ann_rows if self.ann_index is not None else 0
+        if start < self.rows:
+            self._scan(query_embeddings, k, start, candidates)
+
+        all_hits = []
+        for hits in candidates:
+            hits.sort()
+            all_hits.append([(int(self.ids[row]), dist) for dist, row in hits[:k]])
+        return all_hits
+
+    def _scan(self, query_embeddings: np.ndarray, k: int, start: int, candidates: List[List]):
+        """Exact search over rows[start:], adding (distance, row) candidates."""
+        vectors = self.vectors[start:]
+        # ||x - q||^2 = ||x||^2 - 2 x.q + ||q||^2
+        query_norms = np.einsum('ij,ij->i', query_embeddings, query_embeddings)
+        distances = self.norms[None, start:] - 2.0 * (query_embeddings @ vectors.T)
+        distances += query_norms[:, None]
+        np.maximum(distances, 0.0, out=distances)
+
+        dead = self._dead_rows[self._dead_rows >= start] - start
+        distances[:, dead] = np.inf
+
+        n = len(vectors)
+        if k < n:
+            top = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        else:
+            top = np.tile(np.arange(n), (len(query_embeddings), 1))
+
+        for hits, query_dists, query_top in zip(candidates, distances, top):
+            hits.extend(
+                (float(query_dists[row]), start + int(row))
+                for row in query_top
+                if query_dists[row] != np.inf
+            )
+
+    def labels_for(self, doc_ids: List[int]) -> Dict[int, int]:
+        """Map live document IDs to their labels."""
+        if not self.appendable:
+            # No label column; document IDs are unique in these segments
+            mask = np.isin(self.ids, doc_ids)
+            return dict(zip(self.ids[mask].tolist(), self.labels[mask].tolist()))
+        return dict(self._select("doc_id, label", doc_ids))
+
+    def get_documents(self, doc_ids: List[int]) -> Dict[int, Dict]:
+        """Fetch metadata for a set of document IDs."""
+        return {
+            doc_id: json.loads(metadata)
+            for doc_id, metadata in self._select("doc_id, metadata", doc_ids)
+        }
+
+    def _select(self, columns: str, doc_ids: List[int]) -> Iterator[Tuple]:
+        """Select columns from the documents table for a set of IDs."""
+        # Stay below SQLite's bound-parameter limit
+        for start in range(0, len(doc_ids), 500):
+            chunk = doc_ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            yield from self._conn.execute(
+                f"SELECT {columns} FROM documents WHERE doc_id IN ({placeholders})",
+                chunk
+            )
+
+    def live_ids(self) -> np.ndarray:
+        """Document IDs of the live rows, in row order."""
+        return np.asarray(self.ids[self.live_mask()])
+
+    def iter_documents(self) -> Iterator[Tuple[int, Dict]]:
+        """Iterate over all live (doc_id, metadata) pairs in row order."""
+        ids = self.live_ids().tolist()
+        docs = self.get_documents(ids)
+        for doc_id in ids:
+            yield doc_id, docs[doc_id]
+
+    def close(self):
+        """Release the SQLite connection and memory maps."""
+        self._conn.close()
+        self.vectors = self.norms = self.labels = self.ids = self.tombstones = None
+        self.ann_index = None
+        self._selector = None
@@ -5,15 +5,21 @@ Provides <500ms semantic search over entire codebase with automatic
 context formatting for LLM integration.
 """
 
+import json
 import logging
+import os
+import threading
 import time
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional
 from pathlib import Path
 from dataclasses import dataclass, field
 from collections import defaultdict
 
+import numpy as np
+
 from .code_scanner import CodeScanner
 from .embeddings import EmbeddingGenerator
+from .embedding_cache import EmbeddingCache
 from .vector_store import VectorStore
 
 logger = logging.getLogger(__name__)
@@ -32,6 +38,12 @@ class PerformanceMetrics:
     embedding_generation_time_seconds: float = 0.0
     index_build_time_seconds: float = 0.0
 
+    # Incremental indexing metrics
+    incremental_updates: int = 0
+    files_reindexed: int = 0
+    files_removed: int = 0
+    last_update_time_seconds: float = 0.0
+
     # Search metrics
     total_searches: int = 0
     total_search_time_seconds: float = 0.0
@@ -81,7 +93,11 @@ class PerformanceMetrics:
                 'total_structures_indexed': self.total_structures_indexed,
                 'indexing_time_seconds': round(self.indexing_time_seconds, 2),
                 'embedding_generation_time_seconds': round(self.embedding_generation_time_seconds, 2),
-                'index_build_time_seconds': round(self.index_build_time_seconds, 2)
+                'index_build_time_seconds': round(self.index_build_time_seconds, 2),
+                'incremental_updates': self.incremental_updates,
+                'files_reindexed': self.files_reindexed,
+                'files_removed': self.files_removed,
+                'last_update_time_seconds': round(self.last_update_time_seconds, 3)
             },
             'search': {
                 'total_searches': self.total_searches,
@@ -107,11 +123,21 @@ class PerformanceMetrics:
 class SemanticSearch:
     """High-level semantic code search API with performance tracking."""
 
+    MANIFEST_FILE = 'manifest.json'
+    MANIFEST_VERSION = 1
+
+    # Structures embedded per pipeline step while the scan is still running
+    EMBED_PIPELINE_BATCH = 512
+
     def __init__(
         self,
         codebase_path: str,
         index_path: Optional[str] = None,
-        auto_index: bool = True
+        auto_index: bool = True,
+        index_type: str = 'flat',
+        index_params: Optional[Dict] = None,
+        embedding_cache_path: Optional[str] = None,
+        scan_workers: Optional[int] = None
     ):
         """
         Initialize semantic search.
@@ -120,18 +146,37 @@ class SemanticSearch:
             codebase_path: Path to codebase root
             index_path: Path to save/load index (default: codebase_path/.torq-index)
             auto_index: Automatically index codebase on init
+            index_type: Vector index type ('flat', 'ivf_flat', 'hnsw', 'ivf_pq');
+                ignored when an existing index is loaded from index_path
+            index_params: ANN tuning overrides (see VectorStore.DEFAULT_INDEX_PARAMS)
+            embedding_cache_path: SQLite file for the persistent embedding cache
+                (default: $TORQ_EMBEDDING_CACHE or index_path/embeddings.sqlite)
+            scan_workers: Parser processes for full scans (default: all cores)
         """
         self.codebase_path = Path(codebase_path)
+        self.scan_workers = scan_workers
         self.index_path = Path(index_path) if index_path else self.codebase_path / '.torq-index'
 
         # Initialize components
         self.scanner = CodeScanner(str(self.codebase_path))
-        self.embedder = EmbeddingGenerator()
-        self.vector_store = VectorStore(dimension=self.embedder.embedding_dim)
+        cache_path = embedding_cache_path or os.getenv(
+            'TORQ_EMBEDDING_CACHE', str(self.index_path / 'embeddings.sqlite')
+        )
+        self.embedder = EmbeddingGenerator(cache=EmbeddingCache(cache_path))
+        self.vector_store = VectorStore(
+            dimension=self.embedder.embedding_dim,
+            index_type=index_type,
+            index_params=index_params
+        )
 
         self.indexed = False
         self.index_time = None
 
+        # Per-file content hashes/mtimes for incremental re-indexing
+        # (relative_path -> {'sha256', 'mtime', 'size'})
+        self.file_manifest: Dict[str, Dict] = {}
+        self._index_lock = threading.RLock()
+
         # Performance metrics
         self.metrics = PerformanceMetrics()
 
@@ -143,54 +188,81 @@ class SemanticSearch:
         if auto_index and not self.indexed:
             self.index_codebase()
 
-    def index_codebase(self, force: bool = False):
+    def index_codebase(self, force: bool = False, incremental: bool = False):
         """
         Index the entire codebase.
 
         Args:
             force: Force re-indexing even if index exists
+            incremental: Only re-parse and re-embed files whose content changed
+                since the last run (falls back to a full build when no
+                manifest is available)
         """
+        if incremental and self.indexed and self.file_manifest:
+            self.update_index()
+            return
+
         if self.indexed and not force:
             logger.info("Codebase already indexed")
             return
 
+        with self._index_lock:
+            self._full_index()
+
+    def _full_index(self):
+        """Scan, embed and index every file, replacing any existing index."""
         logger.info(f"Starting codebase indexing: {self.codebase_path}")
         start_time = time.time()
 
-        # Scan codebase
+        # Scan and embed as a pipeline: parser processes keep working while
+        # completed batches are embedded here
+        structures = []
+        embedding_batches = []
+        pending = []
+        embed_time = 0.0
         scan_start = time.time()
-        structures = self.scanner.scan_codebase()
-        scan_time = time.time() - scan_start
-        logger.info(f"Scanned {len(structures)} code structures in {scan_time:.2f}s")
+        for batch in self.scanner.iter_structures(workers=self.scan_workers):
+            pending.extend(batch)
+            while len(pending) >= self.EMBED_PIPELINE_BATCH:
+                chunk = pending[:self.EMBED_PIPELINE_BATCH]
+                pending = pending[self.EMBED_PIPELINE_BATCH:]
+                embed_start = time.time()
+                embedding_batches.append(self._embed_structures(chunk))
+                embed_time += time.time() - embed_start
+                structures.extend(chunk)
+        if pending:
+            embed_start = time.time()
+            embedding_batches.append(self._embed_structures(pending))
+            embed_time += time.time() - embed_start
+            structures.extend(pending)
+        scan_time = time.time() - scan_start - embed_time
+        logger.info(
+            f"Scanned {len(structures)} code structures in {scan_time:.2f}s, "
+            f"generated embeddings in {embed_time:.2f}s"
+        )
 
         if not structures:
             logger.warning("No code structures found to index")
             return
 
-        # Format for embedding
-        texts = [
-            self.embedder.format_code_for_embedding(s)
-            for s in structures
-        ]
-
-        # Generate embeddings (batch processing)
-        logger.info("Generating embeddings...")
-        embed_start = time.time()
-        embeddings = self.embedder.generate_embeddings(
-            texts,
-            batch_size=100,
-            show_progress=True
-        )
-        embed_time = time.time() - embed_start
-        logger.info(f"Generated embeddings in {embed_time:.2f}s")
+        embeddings = np.vstack(embedding_batches)
 
-        # Add to vector store
+        # Add to vector store (replacing anything from a previous run)
         logger.info("Building vector index...")
         index_start = time.time()
-        self.vector_store.add_vectors(embeddings, structures)
+        self.vector_store.clear()
+        doc_ids = self.vector_store.add_vectors(embeddings, structures)
         index_time = time.time() - index_start
         logger.info(f"Built index in {index_time:.2f}s")
 
+        # Record per-file hashes so later runs can be incremental
+        self.file_manifest = {
+            s['relative_path']: self._manifest_entry(s)
+            for s in structures
+            if 'relative_path' in s
+        }
+        self._record_doc_ids(structures, doc_ids)
+
         # Save index
         self._save_index()
 
@@ -214,6 +286,231 @@ class SemanticSearch:
             f"{scanner_stats['classes_found']} classes"
         )
 
+    def update_index(self) -> Dict[str, int]:
+        """
+        Incrementally bring the index up to date with the working tree.
+
+        Files whose size and mtime match the manifest are skipped without
+        being read; the rest are hashed and only re-parsed and re-embedded
+        when their content actually changed. Vectors for deleted or modified
+        files are removed.
+
+        Returns:
+            Counts of added, modified, deleted and unchanged files
+        """
+        if not self.indexed or not self.file_manifest:
+            self.index_codebase(force=True)
+            return {
+                'added': len(self.file_manifest),
+                'modified': 0,
+                'deleted': 0,
+                'unchanged': 0
+            }
+
+        with self._index_lock:
+            current = {
+                f['relative_path']: f for f in self.scanner.scan_files()
+            }
+            deleted = [rel for rel in self.file_manifest if rel not in current]
+
+            changed = []
+            added = 0
+            for rel, file_info in current.items():
+                entry = self.file_manifest.get(rel)
+                if entry is None:
+                    added += 1
+                    changed.append(file_info)
+                elif self._has_changed(entry, file_info):
+                    changed.append(file_info)
+
+            self._apply_file_changes(changed, deleted)
+
+            return {
+                'added': added,
+                'modified': len(changed) - added,
+                'deleted': len(deleted),
+                'unchanged': len(current) - len(changed)
+            }
+
+    def update_files(self, paths: Iterable) -> Dict[str, int]:
+        """
+        Re-index specific files, e.g. from file-system change events.
+
+        Args:
+            paths: Absolute or codebase-relative file paths that were
+                created, modified or deleted
+
+        Returns:
+            Counts of updated and deleted files
+        """
+        if not self.indexed:
+            logger.debug("Codebase not indexed yet, ignoring file updates")
+            return {'updated': 0, 'deleted': 0}
+
+        with self._index_lock:
+            changed = []
+            deleted = []
+            for path in paths:
+                file_path = Path(path)
+                if not file_path.is_absolute():
+                    file_path = self.codebase_path / file_path
+                rel_path = self.scanner.relative_path(file_path)
+                if rel_path is None:
+                    logger.debug(f"Ignoring change outside {self.codebase_path}: {path}")
+                    continue
+                # Watchers report absolute paths; match the scanner's form
+                file_path = self.codebase_path / rel_path
+                if not self.scanner.is_indexable(file_path):
+                    continue
+
+                rel = str(rel_path)
+                if not file_path.is_file():
+                    if rel in self.file_manifest:
+                        deleted.append(rel)
+                    continue
+
+                file_info = self.scanner.scan_file(file_path)
+                if file_info is None:
+                    continue
+                entry = self.file_manifest.get(rel)
+                if entry is None or self._has_changed(entry, file_info):
+                    changed.append(file_info)
+
+            self._apply_file_changes(changed, deleted)
+            return {'updated': len(changed), 'deleted': len(deleted)}
+
+    def watch(self, file_monitor) -> None:
+        """
+        Keep the index up to date from a FileMonitor's change events.
+
+        Args:
+            file_monitor: torq_console.utils.file_monitor.FileMonitor instance
+        """
+        file_monitor.add_callback(self._on_file_event)
+        logger.info(f"Watching {self.codebase_path} for incremental re-indexing")
+
+    def _on_file_event(self, path, event_type: Optional[str] = None):
+        """FileMonitor callback: re-index a single changed path."""
+        try:
+            self.update_files([path])
+        except Exception as e:
+            logger.warning(f"Incremental re-index failed for {path}: {e}")
+
+    def _has_changed(self, entry: Dict, file_info: Dict) -> bool:
+        """
+        Check a file against its manifest entry.
+
+        Size and mtime are compared first so unchanged files are never read;
+        a touched-but-identical file only has its mtime refreshed.
+        """
+        if (entry.get('size') == file_info.get('size')
+                and entry.get('mtime') == file_info.get('mtime')):
+            return False
+
+        digest = self.scanner.compute_file_hash(file_info['path'])
+        if digest is not None and digest == entry.get('sha256'):
+            entry['mtime'] = file_info.get('mtime')
+            entry['size'] = file_info.get('size')
+            return False
+
+        file_info['sha256'] = digest
+        return True
+
+    def _apply_file_changes(self, changed: List[Dict], deleted: List[str]):
+        """Remove stale vectors and embed the structures of changed files."""
+        if not changed and not deleted:
+            return
+
+        start_time = time.time()
+        stale = set(deleted) | {f['relative_path'] for f in changed}
+
+        stale_ids = []
+        untracked = set()
+        for rel in stale:
+            entry = self.file_manifest.get(rel)
+            if entry is None:
+                continue
+            if 'doc_ids' in entry:
+                stale_ids.extend(entry['doc_ids'])
+            else:
+                untracked.add(rel)
+        if untracked:
+            # Manifest written before document IDs were tracked
+            stale_ids.extend(
+                doc_id for doc_id in self.vector_store.get_all_ids()
+                if self._document_relative_path(
+                    self.vector_store.get_document(doc_id)
+                ) in untracked
+            )
+        if stale_ids:
+            self.vector_store.remove_ids(stale_ids)
+
+        for rel in deleted:
+            self.file_manifest.pop(rel, None)
+
+        if changed:
+            structures = self.scanner.scan_paths(changed)
+            embeddings = self._embed_structures(structures)
+            doc_ids = self.vector_store.add_vectors(embeddings, structures)
+            for file_info in changed:
+                self.file_manifest[file_info['relative_path']] = (
+                    self._manifest_entry(file_info)
+                )
+            self._record_doc_ids(structures, doc_ids)
+
+        self._save_index()
+
+        elapsed = time.time() - start_time
+        self.metrics.incremental_updates += 1
+        self.metrics.files_reindexed += len(changed)
+        self.metrics.files_removed += len(deleted)
+        self.metrics.last_update_time_seconds = elapsed
+        self.metrics.total_structures_indexed = self.vector_store.get_stats()['total_vectors']
+
+        logger.info(
+            f"Incremental update in {elapsed:.2f}s: "
+            f"{len(changed)} files re-indexed, {len(deleted)} removed"
+        )
+
+    def _embed_structures(self, structures: List[Dict], show_progress: bool = False):
+        """Format structures and generate their embeddings."""
+        texts = [
+            self.embedder.format_code_for_embedding(s)
+            for s in structures
+        ]
+        return self.embedder.generate_embeddings(
+            texts,
+            batch_size=100,
+            show_progress=show_progress
+        )
+
+    def _manifest_entry(self, file_info: Dict) -> Dict:
+        """Build a manifest entry (hash, mtime, size) for a scanned file."""
+        digest = file_info.get('sha256') or self.scanner.compute_file_hash(file_info['path'])
+        return {
+            'sha256': digest,
+            'mtime': file_info.get('mtime'),
+            'size': file_info.get('size')
+        }
+
+    def _record_doc_ids(self, structures: List[Dict], doc_ids: List[int]):
+        """Store the vector-store IDs produced by each file in its manifest entry."""
+        for structure, doc_id in zip(structures, doc_ids):
+            entry = self.file_manifest.get(self._document_relative_path(structure))
+            if entry is not None:
+                entry.setdefault('doc_ids', []).append(doc_id)
+
+    def _document_relative_path(self, doc: Dict) -> Optional[str]:
+        """Map an indexed document back to the codebase-relative file it came from."""
+        if 'relative_path' in doc:
+            return doc['relative_path']
+        if 'file' in doc:
+            try:
+                return str(Path(doc['file']).relative_to(self.codebase_path))
+            except ValueError:
+                return doc['file']
+        return None
+
     def search(
         self,
         query: str,
@@ -237,8 +534,9 @@ class SemanticSearch:
 
         start_time = time.time()
 
-        # Generate query embedding
-        query_embedding = self.embedder.generate_single_embedding(query)
+        # Generate query embedding; one-off queries bypass the persistent
+        # cache so concurrent searches never wait on its lock or disk
+        query_embedding = self.embedder.generate_single_embedding(query, use_cache=False)
 
         # Search vector store
         results = self.vector_store.search(query_embedding, k=k*2)  # Get extra for filtering
@@ -359,15 +657,23 @@ class SemanticSearch:
         logger.info("Performance metrics reset")
 
     def _save_index(self):
-        """Save index to disk."""
+        """Save index and file manifest to disk."""
         try:
             self.vector_store.save(str(self.index_path))
+            manifest_file = self.index_path / self.MANIFEST_FILE
+            tmp_file = manifest_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': self.MANIFEST_VERSION,
+                    'files': self.file_manifest
+                }, f)
+            tmp_file.replace(manifest_file)
             logger.info(f"Index saved to {self.index_path}")
         except Exception as e:
             logger.error(f"Failed to save index: {e}")
 
     def _load_index(self):
-        """Load index from disk."""
+        """Load index and file manifest from disk."""
         try:
             self.vector_store.load(str(self.index_path))
             self.indexed = True
@@ -375,6 +681,21 @@ class SemanticSearch:
         except Exception as e:
             logger.warning(f"Failed to load index: {e}")
             self.indexed = False
+            return
+
+        manifest_file = self.index_path / self.MANIFEST_FILE
+        if not manifest_file.exists():
+            # Older index without hashes: the next incremental run rebuilds fully
+            self.file_manifest = {}
+            return
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.MANIFEST_VERSION:
+                self.file_manifest = data.get('files', {})
+        except Exception as e:
+            logger.warning(f"Failed to load index manifest: {e}")
+            self.file_manifest = {}
 
 
 if __name__ == "__main__":
@@ -2,83 +2,309 @@
 Vector Store - FAISS-based vector database for fast similarity search.
 
 Provides <500ms semantic search over code embeddings using FAISS.
+Indexes are persisted in the memory-mapped segment format from
+index_storage, so loading is O(1) in index size, read-only workers
+share page-cache pages and incremental saves only append.
 """
 
 import logging
-import pickle
 import threading
-from typing import List, Dict, Tuple, Optional
+import time
+from typing import List, Dict, Set, Tuple, Optional
 import numpy as np
 from pathlib import Path
 
+from .index_storage import (
+    MappedIndex,
+    append_segment,
+    exclusion_selector,
+    filtered_search_params,
+    has_segment,
+    write_segment
+)
+
 logger = logging.getLogger(__name__)
 
 
 class VectorStore:
-    """FAISS vector database for semantic code search with thread-safety."""
-
-    def __init__(self, dimension: int = 384):
+    """
+    FAISS vector database for semantic code search with thread-safety.
+
+    Every vector is addressed by a stable integer document ID. Internally the
+    FAISS index is keyed by *labels*; a document's label changes when it is
+    upserted, so deletes and upserts only tombstone the old label instead of
+    touching the index. Tombstoned rows are skipped at search time and
+    physically dropped by compact(), which runs automatically once they
+    exceed ``compaction_ratio`` of the index.
+
+    Index types:
+        flat:     exact IndexFlatL2 search (default, best below ~100K vectors)
+        ivf_flat: inverted lists over full vectors, tuned with ``nprobe``
+        hnsw:     HNSW graph, tuned with ``ef_search``
+        ivf_pq:   inverted lists over product-quantized codes (lowest RAM)
+
+    IVF indexes are trained on the first batch passed to add_vectors().
+
+    After load() or save() the store serves searches straight from the
+    memory-mapped segment. Later additions go to a small exact in-memory
+    delta index and deletions are held as tombstones over the segment; the
+    next save() appends both to the segment instead of rewriting it.
+    """
+
+    FORMAT_VERSION = 4
+
+    INDEX_TYPES = ('flat', 'ivf_flat', 'hnsw', 'ivf_pq')
+
+    DEFAULT_INDEX_PARAMS = {
+        'nlist': None,           # IVF cells; None = 4*sqrt(N) at training time
+        'nprobe': 16,            # IVF cells visited per query
+        'hnsw_m': 32,            # HNSW neighbours per node
+        'ef_construction': 200,  # HNSW build-time beam width
+        'ef_search': 64,         # HNSW query-time beam width
+        'pq_m': None,            # PQ sub-quantizers; None = largest divisor <= dim/8
+        'pq_nbits': 8            # bits per PQ code
+    }
+
+    def __init__(
+        self,
+        dimension: int = 384,
+        compaction_ratio: float = 0.25,
+        index_type: str = 'flat',
+        index_params: Optional[Dict] = None
+    ):
         """
         Initialize vector store.
 
         Args:
             dimension: Embedding dimension (384 for all-MiniLM-L6-v2)
+            compaction_ratio: Fraction of tombstoned rows that triggers compact()
+            index_type: One of INDEX_TYPES
+            index_params: Overrides for DEFAULT_INDEX_PARAMS
         """
+        if index_type not in self.INDEX_TYPES:
+            raise ValueError(
+                f"Unknown index type: {index_type} (expected one of {self.INDEX_TYPES})"
+            )
         self.dimension = dimension
+        self.compaction_ratio = compaction_ratio
+        self.index_type = index_type
+        self.index_params = {**self.DEFAULT_INDEX_PARAMS, **(index_params or {})}
         self.index = None
-        self.documents = []
+        self.documents: Dict[int, Dict] = {}   # doc_id -> metadata
+        self._id_to_label: Dict[int, int] = {}
+        self._label_to_id: Dict[int, int] = {}
+        self._dead_labels: Set[int] = set()
+        self._dead_selector = None  # cached IDSelector excluding _dead_labels
+        self._removed_ids: Set[int] = set()  # segment documents deleted since save
+        self._next_id = 0
+        self._next_label = 0
+        self._mapped: Optional[MappedIndex] = None  # segment backing the store
         self._lock = threading.RLock()  # Thread-safe operations
         self._init_index()
 
     def _init_index(self):
-        """Initialize FAISS index."""
+        """Initialize FAISS index (IVF types are created untrained on first add)."""
         try:
             import faiss
-            # Use IndexFlatL2 for exact search (fast for <100K vectors)
-            self.index = faiss.IndexFlatL2(self.dimension)
-            logger.info(f"Initialized FAISS index (dimension={self.dimension})")
         except ImportError:
             logger.error("faiss-cpu not installed")
             raise ImportError("Install with: pip install faiss-cpu")
 
+        if self.index_type == 'flat':
+            # Use IndexFlatL2 for exact search (fast for <100K vectors),
+            # wrapped so rows are addressed by label rather than position
+            self.index = faiss.IndexIDMap2(faiss.IndexFlatL2(self.dimension))
+        elif self.index_type == 'hnsw':
+            hnsw = faiss.IndexHNSWFlat(self.dimension, self.index_params['hnsw_m'])
+            hnsw.hnsw.efConstruction = self.index_params['ef_construction']
+            self.index = faiss.IndexIDMap2(hnsw)
+            self._apply_search_params()
+        else:
+            # Trained lazily in _train_index()
+            self.index = None
+        logger.info(
+            f"Initialized FAISS {self.index_type} index (dimension={self.dimension})"
+        )
+
+    def _init_delta(self):
+        """Create the exact index holding rows added since the segment was written."""
+        import faiss
+        self.index = faiss.IndexIDMap2(faiss.IndexFlatL2(self.dimension))
+
+    def _train_index(self, sample: np.ndarray):
+        """Build and train an IVF index on the first batch of vectors."""
+        import faiss
+
+        n = len(sample)
+        nlist = self.index_params['nlist'] or int(4 * np.sqrt(n))
+        # FAISS wants ~39 training points per centroid
+        nlist = max(1, min(nlist, n // 39))
+
+        quantizer = faiss.IndexFlatL2(self.dimension)
+        if self.index_type == 'ivf_pq':
+            pq_m = self.index_params['pq_m'] or self._default_pq_m(self.dimension)
+            # Each PQ codebook needs at least 2**nbits training points
+            nbits = min(self.index_params['pq_nbits'], max(1, int(np.log2(n))))
+            index = faiss.IndexIVFPQ(quantizer, self.dimension, nlist, pq_m, nbits)
+        else:
+            index = faiss.IndexIVFFlat(quantizer, self.dimension, nlist)
+
+        start = time.time()
+        index.train(sample)
+        # IVF indexes carry their own IDs; a hashtable direct map lets them
+        # both reconstruct and remove by label
+        index.set_direct_map_type(faiss.DirectMap.Hashtable)
+        self.index = index
+        self._apply_search_params()
+        logger.info(
+            f"Trained {self.index_type} index on {n} vectors "
+            f"(nlist={nlist}) in {time.time() - start:.2f}s"
+        )
+
+    @staticmethod
+    def _default_pq_m(dimension: int) -> int:
+        """Largest sub-quantizer count <= dimension/8 that divides the dimension."""
+        for m in range(max(1, dimension // 8), 0, -1):
+            if dimension % m == 0:
+                return m
+        return 1
+
+    def _apply_search_params(self, index=None):
+        """Push nprobe/efSearch onto the live (or given) FAISS index."""
+        index = index if index is not None else self.index
+        if index is None:
+            return
+        import faiss
+        if self.index_type in ('ivf_flat', 'ivf_pq'):
+            index.nprobe = min(self.index_params['nprobe'], index.nlist)
+        elif self.index_type == 'hnsw':
+            faiss.downcast_index(index.index).hnsw.efSearch = (
+                self.index_params['ef_search']
+            )
+
+    def set_search_params(
+        self,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None
+    ):
+        """
+        Tune the recall/latency trade-off of ANN indexes (thread-safe).
+
+        Args:
+            nprobe: IVF cells visited per query
+            ef_search: HNSW query-time beam width
+        """
+        with self._lock:
+            if nprobe is not None:
+                self.index_params['nprobe'] = nprobe
+            if ef_search is not None:
+                self.index_params['ef_search'] = ef_search
+            if self._mapped is not None:
+                self._apply_search_params(self._mapped.ann_index)
+            else:
+                self._apply_search_params()
+
     def add_vectors(
         self,
         embeddings: np.ndarray,
-        metadata: List[Dict]
-    ):
+        metadata: List[Dict],
+        ids: Optional[List[int]] = None
+    ) -> List[int]:
         """
         Add embeddings to the index (thread-safe).
 
         Args:
             embeddings: NumPy array of embeddings (N x dimension)
             metadata: List of metadata dicts for each embedding
+            ids: Optional document IDs; new IDs are allocated when omitted
+
+        Returns:
+            Document IDs of the added vectors
         """
         if len(embeddings) == 0:
             logger.warning("No embeddings to add")
-            return
+            return []
 
         if len(embeddings) != len(metadata):
             raise ValueError("Embeddings and metadata must have same length")
 
         with self._lock:
-            # Ensure correct dtype and shape
-            embeddings = np.ascontiguousarray(embeddings.astype('float32'))
-
-            # Add to FAISS index
-            self.index.add(embeddings)
-            self.documents.extend(metadata)
+            if ids is None:
+                ids = list(range(self._next_id, self._next_id + len(metadata)))
+            else:
+                ids = [int(i) for i in ids]
+                if len(ids) != len(metadata):
+                    raise ValueError("IDs and metadata must have same length")
+                existing = self._existing_ids(ids)
+                if existing:
+                    raise ValueError(
+                        f"Document IDs already present: {existing[:5]} "
+                        "(use upsert_vectors to replace them)"
+                    )
+
+            self._add_rows(embeddings, metadata, ids)
 
             logger.info(
-                f"Added {len(embeddings)} vectors. "
-                f"Total: {self.index.ntotal} vectors"
+                f"Added {len(ids)} vectors. "
+                f"Total: {self._count()} vectors"
             )
+            return ids
+
+    def upsert_vectors(
+        self,
+        ids: List[int],
+        embeddings: np.ndarray,
+        metadata: List[Dict]
+    ) -> List[int]:
+        """
+        Insert or replace vectors by document ID (thread-safe).
+
+        Cost is proportional to len(ids): replaced rows are tombstoned rather
+        than removed from the index.
+
+        Args:
+            ids: Document IDs to insert or replace
+            embeddings: NumPy array of embeddings (N x dimension)
+            metadata: List of metadata dicts for each embedding
+
+        Returns:
+            Document IDs of the upserted vectors
+        """
+        if len(embeddings) != len(metadata) or len(ids) != len(metadata):
+            raise ValueError("IDs, embeddings and metadata must have same length")
+
+        with self._lock:
+            ids = [int(i) for i in ids]
+            self._tombstone(ids)
+            self._add_rows(embeddings, metadata, ids)
+            self._maybe_compact()
+            return ids
+
+    def remove_ids(self, ids: List[int]) -> int:
+        """
+        Remove vectors by document ID (thread-safe).
+
+        Cost is proportional to len(ids); the index itself is only rewritten
+        when compaction is triggered.
+
+        Args:
+            ids: Document IDs to remove
+
+        Returns:
+            Number of documents removed
+        """
+        with self._lock:
+            removed = self._tombstone([int(i) for i in ids])
+            self._maybe_compact()
+            if removed:
+                logger.info(f"Removed {removed} vectors")
+            return removed
 
     def remove_vectors(self, indices: List[int]):
         """
-        Remove vectors by indices (thread-safe).
+        Remove vectors by position in get_all_documents() (thread-safe).
 
-        Note: FAISS IndexFlatL2 doesn't support direct removal.
-        This rebuilds the index without the specified indices.
+        Kept for backward compatibility; prefer remove_ids().
 
         Args:
             indices: List of document indices to remove
@@ -88,49 +314,193 @@ class VectorStore:
                 logger.warning("No indices to remove")
                 return
 
-            # Get current embeddings
-            if self.index.ntotal == 0:
+            if self._count() == 0:
                 logger.warning("Index is empty, nothing to remove")
                 return
 
-            # Create set of indices to remove for fast lookup
-            remove_set = set(indices)
-
-            # Filter documents and rebuild
-            new_documents = []
-            keep_indices = []
+            doc_ids = self.get_all_ids()
+            self.remove_ids([doc_ids[i] for i in indices if 0 <= i < len(doc_ids)])
 
-            for i, doc in enumerate(self.documents):
-                if i not in remove_set:
-                    new_documents.append(doc)
-                    keep_indices.append(i)
+    def compact(self):
+        """
+        Physically drop tombstoned rows from the FAISS index (thread-safe).
 
-            if not keep_indices:
-                # All vectors removed, clear index
-                self.clear()
+        A store backed by a segment rewrites the segment without them.
+        """
+        with self._lock:
+            if self._mapped is not None:
+                if len(self._mapped.tombstones) or self._dead_labels:
+                    self._write_full(str(self._mapped.root))
                 return
-
-            # Reconstruct embeddings for kept documents
-            # Note: This is inefficient for large indices
-            # Consider using IndexIDMap for production use
-            logger.warning(
-                f"Removing {len(indices)} vectors requires index rebuild. "
-                "Consider using IndexIDMap for frequent deletions."
+            if not self._dead_labels:
+                return
+            if self.index_type == 'hnsw':
+                # HNSW graphs cannot delete nodes; rebuild from the live rows
+                self._rebuild_index()
+            else:
+                dead = np.fromiter(
+                    self._dead_labels, dtype='int64', count=len(self._dead_labels)
+                )
+                self.index.remove_ids(dead)
+            logger.debug(f"Compacted {len(self._dead_labels)} tombstoned vectors")
+            self._dead_labels.clear()
+            self._dead_selector = None
+
+    def _rebuild_index(self):
+        """Re-create the index from the live rows, keeping their labels. Caller holds the lock."""
+        labels = np.fromiter(
+            self._label_to_id, dtype='int64', count=len(self._label_to_id)
+        )
+        vectors = self.index.reconstruct_batch(labels) if len(labels) else None
+        self._init_index()
+        if vectors is not None:
+            if self.index is None:
+                self._train_index(vectors)
+            self.index.add_with_ids(vectors, labels)
+
+    def _build_ann_index(self, vectors: np.ndarray, labels: np.ndarray):
+        """Build an index_type index over the given rows, leaving self.index alone."""
+        delta = self.index
+        try:
+            self._init_index()
+            if len(labels):
+                if self.index is None:
+                    self._train_index(vectors)
+                self.index.add_with_ids(vectors, labels)
+            return self.index
+        finally:
+            self.index = delta
+
+    def _add_rows(self, embeddings: np.ndarray, metadata: List[Dict], ids: List[int]):
+        """Append rows under fresh labels. Caller holds the lock."""
+        # Ensure correct dtype and shape
+        embeddings = np.ascontiguousarray(embeddings.astype('float32'))
+
+        if self.index is None:
+            self._train_index(embeddings)
+
+        labels = np.arange(self._next_label, self._next_label + len(ids), dtype='int64')
+        self.index.add_with_ids(embeddings, labels)
+        self._next_label += len(ids)
+
+        for doc_id, label, meta in zip(ids, labels.tolist(), metadata):
+            self.documents[doc_id] = meta
+            self._id_to_label[doc_id] = label
+            self._label_to_id[label] = doc_id
+        self._next_id = max(self._next_id, max(ids) + 1)
+
+    def _tombstone(self, ids: List[int]) -> int:
+        """Detach documents from their labels. Caller holds the lock."""
+        labels = []
+        for doc_id in ids:
+            label = self._id_to_label.pop(doc_id, None)
+            if label is None:
+                continue
+            del self._label_to_id[label]
+            del self.documents[doc_id]
+            labels.append(label)
+        removed = len(labels)
+
+        if self._mapped is None:
+            self._dead_labels.update(labels)
+        else:
+            if labels:
+                # Unsaved rows live in the small exact delta; drop them outright
+                self.index.remove_ids(np.array(labels, dtype='int64'))
+            segment_labels = self._mapped.labels_for(
+                [doc_id for doc_id in ids if doc_id not in self._removed_ids]
             )
+            if segment_labels:
+                self._removed_ids.update(segment_labels)
+                self._dead_labels.update(segment_labels.values())
+                self._mapped.exclude(self._dead_labels)
+                removed += len(segment_labels)
+
+        if removed:
+            self._dead_selector = None
+        return removed
+
+    def _existing_ids(self, ids: List[int]) -> List[int]:
+        """Subset of ids that name live documents. Caller holds the lock."""
+        existing = [doc_id for doc_id in ids if doc_id in self.documents]
+        if self._mapped is not None:
+            existing.extend(self._mapped.labels_for(
+                [doc_id for doc_id in ids if doc_id not in self._removed_ids]
+            ))
+        return existing
+
+    def _maybe_compact(self):
+        """Compact once tombstones exceed the configured ratio. Caller holds the lock."""
+        if not self._dead_labels:
+            return
+        if self._count() == 0:
+            self.clear()
+        elif self._mapped is not None:
+            # Segment tombstones are compacted by save()
+            return
+        elif len(self._dead_labels) > self.compaction_ratio * self.index.ntotal:
+            self.compact()
 
-            # Get all vectors (FAISS-specific method)
-            all_vectors = self.index.reconstruct_n(0, self.index.ntotal)
-            kept_vectors = all_vectors[keep_indices]
-
-            # Rebuild index
-            self._init_index()
-            self.documents = []
+    def _search_index(
+        self,
+        query_embeddings: np.ndarray,
+        k: int
+    ) -> List[List[Tuple[int, float]]]:
+        """Run a FAISS search and map live labels to document IDs. Caller holds the lock."""
+        # Ensure correct shape and dtype
+        if query_embeddings.ndim == 1:
+            query_embeddings = query_embeddings.reshape(1, -1)
+        query_embeddings = np.ascontiguousarray(query_embeddings.astype('float32'))
+
+        hits = self._search_memory(query_embeddings, k)
+        if self._mapped is None:
+            return hits
+
+        return [
+            sorted(segment_hits + delta_hits, key=lambda hit: hit[1])[:k]
+            for segment_hits, delta_hits in zip(
+                self._mapped.search(query_embeddings, k), hits
+            )
+        ]
 
-            # Re-add kept vectors
-            if len(kept_vectors) > 0:
-                self.add_vectors(kept_vectors, new_documents)
+    def _search_memory(
+        self,
+        query_embeddings: np.ndarray,
+        k: int
+    ) -> List[List[Tuple[int, float]]]:
+        """Search the in-memory FAISS index. Caller holds the lock."""
+        if self.index is None or self.index.ntotal == 0:
+            return [[] for _ in range(len(query_embeddings))]
+
+        distances, labels = self.index.search(
+            query_embeddings,
+            min(k, self.index.ntotal),
+            params=self._search_parameters() if self._mapped is None else None
+        )
+
+        all_hits = []
+        for query_dists, query_labels in zip(distances, labels):
+            hits = []
+            for dist, label in zip(query_dists, query_labels):
+                doc_id = self._label_to_id.get(int(label))
+                if doc_id is None:
+                    continue
+                hits.append((doc_id, float(dist)))
+            all_hits.append(hits)
+        return all_hits
+
+    def _search_parameters(self):
+        """
+        FAISS search parameters that filter out tombstoned labels. Caller holds the lock.
 
-            logger.info(f"Removed {len(indices)} vectors")
+        Filtering inside the index keeps the cost of a search independent of
+        the tombstone count and lets ANN indexes return k live rows.
+        """
+        if not self._dead_labels:
+            return None
+        if self._dead_selector is None:
+            self._dead_selector = exclusion_selector(self._dead_labels)
+        return filtered_search_params(self.index, self._dead_selector[-1])
 
     def search(
         self,
@@ -148,26 +518,32 @@ class VectorStore:
             List of (document_metadata, distance) tuples
         """
         with self._lock:
-            if self.index.ntotal == 0:
+            if self._count() == 0:
                 logger.warning("Index is empty")
                 return []
 
-            # Ensure correct shape and dtype
-            if query_embedding.ndim == 1:
-                query_embedding = query_embedding.reshape(1, -1)
-            query_embedding = query_embedding.astype('float32')
+            hits = self._search_index(query_embedding, k)[0]
+            return self._with_documents(hits)
 
-            # Search
-            k = min(k, self.index.ntotal)  # Can't retrieve more than we have
-            distances, indices = self.index.search(query_embedding, k)
+    def search_ids(
+        self,
+        query_embedding: np.ndarray,
+        k: int = 10
+    ) -> List[Tuple[int, float]]:
+        """
+        Search for top-K similar documents, returning document IDs (thread-safe).
 
-            # Format results
-            results = []
-            for dist, idx in zip(distances[0], indices[0]):
-                if idx < len(self.documents):
-                    results.append((self.documents[idx], float(dist)))
+        Args:
+            query_embedding: Query embedding (dimension,)
+            k: Number of results to return
 
-            return results
+        Returns:
+            List of (document_id, distance) tuples
+        """
+        with self._lock:
+            if self._count() == 0:
+                return []
+            return self._search_index(query_embedding, k)[0]
 
     def batch_search(
         self,
@@ -185,116 +561,306 @@ class VectorStore:
             List of result lists, one per query
         """
         with self._lock:
-            if self.index.ntotal == 0:
+            if self._count() == 0:
                 logger.warning("Index is empty")
                 return [[] for _ in range(len(query_embeddings))]
 
-            # Ensure correct shape and dtype
-            if query_embeddings.ndim == 1:
-                query_embeddings = query_embeddings.reshape(1, -1)
-            query_embeddings = query_embeddings.astype('float32')
-
-            # Search
-            k = min(k, self.index.ntotal)
-            distances, indices = self.index.search(query_embeddings, k)
-
-            # Format results
-            all_results = []
-            for query_dists, query_indices in zip(distances, indices):
-                results = []
-                for dist, idx in zip(query_dists, query_indices):
-                    if idx < len(self.documents):
-                        results.append((self.documents[idx], float(dist)))
-                all_results.append(results)
-
-            return all_results
+            return [
+                self._with_documents(hits)
+                for hits in self._search_index(query_embeddings, k)
+            ]
+
+    def _with_documents(self, hits: List[Tuple[int, float]]) -> List[Tuple[Dict, float]]:
+        """Attach metadata to (doc_id, distance) hits. Caller holds the lock."""
+        docs = self.documents
+        if self._mapped is not None:
+            docs = {
+                **self._mapped.get_documents(
+                    [doc_id for doc_id, _ in hits if doc_id not in self.documents]
+                ),
+                **self.documents
+            }
+        return [(docs[doc_id], dist) for doc_id, dist in hits]
 
     def save(self, path: str):
         """
         Save index and documents to disk (thread-safe).
 
+        The first save writes a full segment (see index_storage) and the
+        store then serves searches from it. Later saves to the same path
+        append the rows and tombstones recorded since; the segment is only
+        rewritten once tombstones, or rows not covered by the ANN structure,
+        exceed ``compaction_ratio`` of it. For ivf_pq indexes the stored raw
+        vectors of a full write are PQ reconstructions.
+
         Args:
             path: Directory path to save to
         """
         with self._lock:
             try:
-                import faiss
-                save_path = Path(path)
-                save_path.mkdir(parents=True, exist_ok=True)
-
-                # Save FAISS index
-                index_file = save_path / 'index.faiss'
-                faiss.write_index(self.index, str(index_file))
-
-                # Save documents
-                docs_file = save_path / 'documents.pkl'
-                with open(docs_file, 'wb') as f:
-                    pickle.dump(self.documents, f)
+                mapped = self._mapped
+                if mapped is not None and mapped.root.resolve() == Path(path).resolve():
+                    if not self.documents and not self._dead_labels:
+                        return
+                    if self._needs_rewrite():
+                        self._write_full(path)
+                    else:
+                        self._append()
+                else:
+                    self._write_full(path)
 
                 logger.info(f"Saved index to {path}")
             except Exception as e:
                 logger.error(f"Failed to save index: {e}")
                 raise
 
+    def _needs_rewrite(self) -> bool:
+        """Whether the next save should compact the segment. Caller holds the lock."""
+        mapped = self._mapped
+        if not mapped.appendable:
+            return True
+        rows = mapped.rows + len(self.documents)
+        dead = len(mapped.tombstones) + len(self._dead_labels)
+        unindexed = rows - mapped.ann_rows if self.index_type != 'flat' else 0
+        limit = self.compaction_ratio * rows
+        return dead > limit or unindexed > limit
+
+    def _segment_meta(self) -> Dict:
+        """Store-level settings recorded in the segment. Caller holds the lock."""
+        return {
+            'format_version': self.FORMAT_VERSION,
+            'dimension': self.dimension,
+            'index_type': self.index_type,
+            'index_params': self.index_params,
+            'next_id': self._next_id,
+            'next_label': self._next_label
+        }
+
+    def _memory_rows(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(vectors, labels, ids) of the in-memory rows. Caller holds the lock."""
+        labels = np.fromiter(
+            self._label_to_id, dtype='int64', count=len(self._label_to_id)
+        )
+        ids = np.fromiter(
+            self._label_to_id.values(), dtype='int64', count=len(labels)
+        )
+        if len(labels):
+            vectors = self.index.reconstruct_batch(labels)
+        else:
+            vectors = np.zeros((0, self.dimension), dtype='float32')
+        return vectors, labels, ids
+
+    def _write_full(self, path: str):
+        """Write every live row to a new segment and serve from it. Caller holds the lock."""
+        if self._mapped is None:
+            # Drop tombstones so they are not persisted
+            self.compact()
+            vectors, labels, ids = self._memory_rows()
+            documents = self.documents
+            ann_index = self.index
+        else:
+            mask = self._mapped.live_mask()
+            delta_vectors, delta_labels, delta_ids = self._memory_rows()
+            vectors = np.vstack([self._mapped.vectors[mask], delta_vectors])
+            labels = np.concatenate([self._mapped.labels[mask], delta_labels])
+            ids = np.concatenate([self._mapped.ids[mask], delta_ids])
+            documents = {
+                **dict(self._mapped.iter_documents()), **self.documents
+            }
+            ann_index = None
+            if self.index_type != 'flat':
+                ann_index = self._build_ann_index(vectors, labels)
+
+        write_segment(
+            path,
+            vectors=vectors,
+            labels=labels,
+            ids=ids,
+            documents=documents,
+            meta=self._segment_meta(),
+            ann_index=ann_index if self.index_type != 'flat' else None
+        )
+        self._attach(MappedIndex(path))
+
+    def _append(self):
+        """Append in-memory rows and tombstones to the segment. Caller holds the lock."""
+        vectors, labels, ids = self._memory_rows()
+        append_segment(
+            str(self._mapped.root),
+            vectors=vectors,
+            labels=labels,
+            ids=ids,
+            documents=self.documents,
+            removed_ids=self._removed_ids,
+            tombstones=self._dead_labels,
+            meta=self._segment_meta()
+        )
+        mapped = self._mapped
+        mapped.refresh()
+        self._attach(mapped)
+        logger.debug(
+            f"Appended {len(ids)} rows and {mapped.meta['tombstones']} "
+            f"total tombstones to {mapped.segment}"
+        )
+
+    def _attach(self, mapped: MappedIndex):
+        """Serve from a segment with an empty delta. Caller holds the lock."""
+        if self._mapped is mapped:
+            # Refreshed in place; keep it open
+            self._mapped = None
+        self._reset_state()
+        self._mapped = mapped
+        self._init_delta()
+        self._apply_search_params(mapped.ann_index)
+
     def load(self, path: str):
         """
         Load index and documents from disk (thread-safe).
 
+        Segment-format indexes are memory-mapped rather than read, so this
+        returns in constant time; metadata is fetched from SQLite per hit.
+        Searches keep reading the mapped segment after later mutations.
+        Legacy ``index.faiss`` + ``documents.pkl`` directories are still
+        read (and rewritten in the new format on the next save()).
+
         Args:
             path: Directory path to load from
         """
         with self._lock:
             try:
-                import faiss
                 load_path = Path(path)
 
-                # Load FAISS index
-                index_file = load_path / 'index.faiss'
-                if not index_file.exists():
-                    raise FileNotFoundError(f"Index file not found: {index_file}")
-                self.index = faiss.read_index(str(index_file))
-
-                # Load documents with security check
-                docs_file = load_path / 'documents.pkl'
-                if not docs_file.exists():
-                    raise FileNotFoundError(f"Documents file not found: {docs_file}")
-                
-                # Security check: Verify file permissions (Unix systems)
-                if hasattr(docs_file, 'stat'):
-                    file_stat = docs_file.stat()
-                    import os
-                    if os.name != 'nt' and (file_stat.st_mode & 0o002):  # world-writable
-                        logger.warning(
-                            f"Security Warning: {docs_file} is world-writable. "
-                            "Refusing to load pickle file that could be tampered with."
+                if has_segment(str(load_path)):
+                    mapped = MappedIndex(str(load_path))
+                    if mapped.dimension != self.dimension:
+                        mapped.close()
+                        raise ValueError(
+                            f"Index dimension {mapped.dimension} does not match "
+                            f"store dimension {self.dimension}"
                         )
-                        raise PermissionError(f"Insecure file permissions on {docs_file}")
-                
-                # Load pickle file from trusted source
-                with open(docs_file, 'rb') as f:
-                    self.documents = pickle.load(f)
-
-                logger.info(f"Loaded index from {path} ({self.index.ntotal} vectors)")
+                    self.index_type = mapped.meta.get('index_type', 'flat')
+                    self.index_params = {
+                        **self.DEFAULT_INDEX_PARAMS, **mapped.meta.get('index_params', {})
+                    }
+                    self._next_id = mapped.meta['next_id']
+                    self._next_label = mapped.meta['next_label']
+                    self._attach(mapped)
+                    logger.info(f"Mapped index from {path} ({mapped.count} vectors)")
+                    return
+
+                self._load_pickle(load_path)
+                logger.info(f"Loaded legacy index from {path} ({len(self.documents)} vectors)")
             except Exception as e:
                 logger.error(f"Failed to load index: {e}")
                 raise
 
+    def _load_pickle(self, load_path: Path):
+        """Read the legacy FAISS + pickle layout. Caller holds the lock."""
+        import faiss
+        import pickle
+
+        # Load FAISS index
+        index_file = load_path / 'index.faiss'
+        if not index_file.exists():
+            raise FileNotFoundError(f"Index file not found: {index_file}")
+        index = faiss.read_index(str(index_file))
+
+        # Load documents with security check
+        docs_file = load_path / 'documents.pkl'
+        if not docs_file.exists():
+            raise FileNotFoundError(f"Documents file not found: {docs_file}")
+
+        # Security check: Verify file permissions (Unix systems)
+        if hasattr(docs_file, 'stat'):
+            file_stat = docs_file.stat()
+            import os
+            if os.name != 'nt' and (file_stat.st_mode & 0o002):  # world-writable
+                logger.warning(
+                    f"Security Warning: {docs_file} is world-writable. "
+                    "Refusing to load pickle file that could be tampered with."
+                )
+                raise PermissionError(f"Insecure file permissions on {docs_file}")
+
+        # Load pickle file from trusted source
+        with open(docs_file, 'rb') as f:
+            documents = pickle.load(f)
+
+        # Legacy positional format: re-key rows 0..N-1 as IDs
+        self._load_legacy(index, documents)
+
+    def _count(self) -> int:
+        """Number of live documents. Caller holds the lock."""
+        count = len(self.documents)
+        if self._mapped is not None:
+            count += self._mapped.count - len(self._dead_labels)
+        return count
+
+    def _reset_state(self):
+        """Drop all in-memory and mapped state. Caller holds the lock."""
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+        self.documents = {}
+        self._id_to_label = {}
+        self._label_to_id = {}
+        self._dead_labels = set()
+        self._dead_selector = None
+        self._removed_ids = set()
+
+    def _load_legacy(self, index, documents: List[Dict]):
+        """Migrate a positional (pre-ID) index into the ID-addressed layout."""
+        vectors = index.reconstruct_n(0, index.ntotal) if index.ntotal else None
+        self.index_type = 'flat'
+        self._reset_state()
+        self._init_index()
+        self._next_id = 0
+        self._next_label = 0
+        if vectors is not None and len(documents):
+            self._add_rows(vectors, documents, list(range(len(documents))))
+
     def get_stats(self) -> Dict:
         """Get vector store statistics (thread-safe)."""
         with self._lock:
+            index_rows = self.index.ntotal if self.index else 0
+            tombstones = len(self._dead_labels)
+            if self._mapped is not None:
+                index_rows += self._mapped.rows
+                tombstones += len(self._mapped.tombstones)
             return {
-                'total_vectors': self.index.ntotal if self.index else 0,
+                'total_vectors': self._count(),
                 'dimension': self.dimension,
-                'total_documents': len(self.documents)
+                'index_type': self.index_type,
+                'total_documents': self._count(),
+                'index_rows': index_rows,
+                'tombstones': tombstones,
+                'memory_mapped': self._mapped is not None
             }
 
     def clear(self):
         """Clear all vectors and documents (thread-safe)."""
         with self._lock:
+            self._reset_state()
             self._init_index()
-            self.documents = []
+            self._next_label = 0
             logger.info("Cleared vector store")
 
+    def get_document(self, doc_id: int) -> Optional[Dict]:
+        """
+        Get document metadata by document ID (thread-safe).
+
+        Args:
+            doc_id: Document ID
+
+        Returns:
+            Document metadata or None if the ID is unknown
+        """
+        with self._lock:
+            if doc_id in self.documents:
+                return self.documents[doc_id]
+            if self._mapped is None or doc_id in self._removed_ids:
+                return None
+            return self._mapped.get_documents([doc_id]).get(doc_id)
+
     def get_document_by_index(self, index: int) -> Optional[Dict]:
         """
         Get document metadata by index (thread-safe).
@@ -306,14 +872,27 @@ class VectorStore:
             Document metadata or None if index out of range
         """
         with self._lock:
-            if 0 <= index < len(self.documents):
-                return self.documents[index]
-            return None
+            if not 0 <= index < self._count():
+                return None
+            if self._mapped is not None:
+                return self.get_document(self.get_all_ids()[index])
+            return list(self.documents.values())[index]
 
     def get_all_documents(self) -> List[Dict]:
         """Get all document metadata (thread-safe)."""
         with self._lock:
-            return self.documents.copy()
+            documents = list(self.documents.values())
+            if self._mapped is not None:
+                documents[:0] = [doc for _, doc in self._mapped.iter_documents()]
+            return documents
+
+    def get_all_ids(self) -> List[int]:
+        """Get all document IDs in insertion order (thread-safe)."""
+        with self._lock:
+            ids = list(self.documents)
+            if self._mapped is not None:
+                ids[:0] = self._mapped.live_ids().tolist()
+            return ids
 
 
 if __name__ == "__main__":
@@ -12,6 +12,8 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+from ..core.http_pool import get_http_pool
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -103,21 +105,21 @@ class PerplexitySearchAPI:
         payload = {k: v for k, v in payload.items() if v is not None}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/chat/completions",
-                    json=payload,
-                    headers=self.headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._parse_response(data, query, model)
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Perplexity API error {response.status}: {error_text}")
-                        raise Exception(f"Perplexity API error: {response.status} - {error_text}")
+            async with get_http_pool().request(
+                "POST",
+                f"{self.base_url}/chat/completions",
+                json=payload,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+
+                if response.status == 200:
+                    data = await response.json()
+                    return self._parse_response(data, query, model)
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Perplexity API error {response.status}: {error_text}")
+                    raise Exception(f"Perplexity API error: {response.status} - {error_text}")
 
         except asyncio.TimeoutError:
             logger.error("Perplexity API request timed out")
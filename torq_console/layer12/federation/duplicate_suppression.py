@@ -230,12 +230,16 @@ class DuplicateSuppressionService:
     async def check_claim(
         self,
         envelope: FederatedClaimEnvelope,
+        cleanup: bool = True,
+        content_hash: str | None = None,
     ) -> DuplicateSuppressionResult:
         """
         Check if a claim is a duplicate.
 
         Args:
             envelope: The envelope containing the claim to check
+            cleanup: Expire old records first (batch callers do this once per batch)
+            content_hash: Precomputed _compute_content_hash(envelope.artifact)
 
         Returns:
             DuplicateSuppressionResult indicating if this is a duplicate
@@ -248,10 +252,12 @@ class DuplicateSuppressionService:
         self._total_checked += 1
 
         # Clean up expired entries
-        self._cleanup_expired_entries()
+        if cleanup:
+            self._cleanup_expired_entries()
 
         # Compute content hash
-        content_hash = self._compute_content_hash(envelope.artifact)
+        if content_hash is None:
+            content_hash = self._compute_content_hash(envelope.artifact)
         claim_id = self._generate_claim_id(envelope.artifact, content_hash)
 
         # Check if we've seen this claim before
@@ -302,6 +308,7 @@ class DuplicateSuppressionService:
         self,
         envelope: FederatedClaimEnvelope,
         claim_id: str | None = None,
+        content_hash: str | None = None,
     ) -> str:
         """
         Register a new claim as processed.
@@ -312,6 +319,7 @@ class DuplicateSuppressionService:
         Args:
             envelope: The envelope containing the claim
             claim_id: Optional pre-computed claim ID
+            content_hash: Optional pre-computed content hash
 
         Returns:
             The claim ID for this claim
@@ -319,7 +327,8 @@ class DuplicateSuppressionService:
         now = datetime.utcnow()
 
         # Compute content hash and claim ID
-        content_hash = self._compute_content_hash(envelope.artifact)
+        if content_hash is None:
+            content_hash = self._compute_content_hash(envelope.artifact)
         if claim_id is None:
             claim_id = self._generate_claim_id(envelope.artifact, content_hash)
 
@@ -368,7 +368,6 @@ class FederationIdentityGuard:
         Raises:
             QuarantineException: If envelope should be quarantined
         """
-        reasons: list[str] = []
         node_id = envelope.source_node_id
 
         # Step 1: Validate identity
@@ -390,6 +389,34 @@ class FederationIdentityGuard:
             presented_credentials,
         )
 
+        return await self.decide_inbound_trust(envelope, identity_result)
+
+    async def decide_inbound_trust(
+        self,
+        envelope: FederatedClaimEnvelope,
+        identity_result: IdentityValidationResult,
+        signature_result: SignatureVerificationResult | None = None,
+        trust_profile: NodeTrustProfile | None = None,
+    ) -> InboundTrustDecision:
+        """
+        Make the trust decision for an envelope from an identity check.
+
+        Steps 2-4 of evaluate_inbound_trust. Batch callers pass results
+        they have already computed so they are not repeated per claim.
+
+        Args:
+            envelope: The inbound federated claim envelope
+            identity_result: Identity validation result for the source node
+            signature_result: Signature verification result for the envelope
+                (verified here if None)
+            trust_profile: Trust profile of the source node (looked up if None)
+
+        Returns:
+            InboundTrustDecision with decision outcome
+        """
+        reasons: list[str] = []
+        node_id = envelope.source_node_id
+
         identity_valid = identity_result.is_valid
         reasons.extend([f"Identity: {r}" for r in identity_result.reasons])
 
@@ -419,7 +446,8 @@ class FederationIdentityGuard:
                 )
 
         # Step 2: Verify signature
-        signature_result = await self.verify_artifact_signature(envelope)
+        if signature_result is None:
+            signature_result = await self.verify_artifact_signature(envelope)
         signature_valid = signature_result.is_valid
         reasons.extend([f"Signature: {r}" for r in signature_result.reasons])
 
@@ -448,19 +476,19 @@ class FederationIdentityGuard:
             )
 
         # Step 3: Get trust baseline
-        try:
-            trust_profile = await self.get_node_trust_baseline(node_id)
-            node_trust_score = trust_profile.baseline_trust_score
-        except UnknownNodeError:
-            node_trust_score = 0.0
-            reasons.append("Node not found in trust registry")
+        if trust_profile is None:
+            try:
+                trust_profile = await self.get_node_trust_baseline(node_id)
+            except UnknownNodeError:
+                reasons.append("Node not found in trust registry")
+        node_trust_score = trust_profile.baseline_trust_score if trust_profile else 0.0
 
         # Step 4: Make final decision
         decision = self._make_trust_decision(
             node_trust_score=node_trust_score,
             identity_valid=identity_valid,
             signature_valid=signature_valid,
-            trust_profile=trust_profile if 'trust_profile' in locals() else None,
+            trust_profile=trust_profile,
         )
 
         result = InboundTrustDecision(
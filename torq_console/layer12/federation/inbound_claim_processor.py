@@ -21,8 +21,9 @@ The processor follows a strict sequence:
 """
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Literal
+from typing import Any, Literal, Sequence
 from pydantic import BaseModel, Field
 
 from torq_console.layer12.federation.config import FederationConfig, default_config
@@ -313,6 +314,22 @@ class ProcessorConfig(BaseModel):
     )
 
 
+@dataclass
+class _EnvelopeChecks:
+    """
+    Per-envelope work done up front by process_claims.
+
+    None fields are computed in the pipeline as in process_claim.
+    """
+
+    identity_result: IdentityValidationResult | None = None
+    signature_result: SignatureVerificationResult | None = None
+    trust_profile: NodeTrustProfile | None = None
+    eligibility_hash: str | None = None
+    signature_hash: str | None = None
+    content_hash: str | None = None
+
+
 # ============================================================================
 # Main Processor
 # ============================================================================
@@ -432,6 +449,116 @@ class InboundFederatedClaimProcessor:
         Returns:
             ClaimProcessingResult with complete processing outcome
         """
+        return await self._process_envelope(
+            envelope,
+            skip_replay_check=skip_replay_check,
+            skip_duplicate_check=skip_duplicate_check,
+            force_accept=force_accept,
+        )
+
+    async def process_claims(
+        self,
+        envelopes: Sequence[FederatedClaimEnvelope],
+        skip_replay_check: bool = False,
+        skip_duplicate_check: bool = False,
+        force_accept: bool = False,  # For testing only
+    ) -> list[ClaimProcessingResult]:
+        """
+        Process a batch of inbound federated claims.
+
+        Envelopes run through the process_claim pipeline in order, each
+        seeing the safeguard, replay and duplicate state left by the ones
+        before it, so the results match calling process_claim on each
+        envelope in turn. Work that does not depend on that state is done
+        once for the whole batch:
+        - identity validation and trust baseline lookup once per source node
+        - signature verification once per envelope (reused for the trust decision)
+        - eligibility, replay and duplicate hashes computed up front
+        - expired replay/duplicate/similarity entries pruned once, not per claim
+
+        Args:
+            envelopes: Inbound claim envelopes, in arrival order
+            skip_replay_check: Skip replay protection check (testing)
+            skip_duplicate_check: Skip duplicate check (testing)
+            force_accept: Force acceptance regardless of validation (testing)
+
+        Returns:
+            ClaimProcessingResult per envelope, in the same order
+        """
+        checks = await self._precompute_checks(envelopes)
+
+        # Expire tracking entries once for the batch
+        if self.config.enable_replay_protection and not skip_replay_check:
+            self.replay_protection._cleanup_expired_entries()
+        if self.config.enable_duplicate_suppression and not skip_duplicate_check:
+            self.duplicate_suppression._cleanup_expired_entries()
+        if self.config.enable_eligibility_filter and self.eligibility_filter:
+            self.eligibility_filter.prune_similarity_hashes()
+
+        results = []
+        for envelope, envelope_checks in zip(envelopes, checks):
+            results.append(await self._process_envelope(
+                envelope,
+                skip_replay_check=skip_replay_check,
+                skip_duplicate_check=skip_duplicate_check,
+                force_accept=force_accept,
+                checks=envelope_checks,
+            ))
+        return results
+
+    async def _precompute_checks(
+        self,
+        envelopes: Sequence[FederatedClaimEnvelope],
+    ) -> list[_EnvelopeChecks | None]:
+        """
+        Stateless checks for a batch, grouped by source node where possible.
+
+        An envelope whose checks raise gets None and is processed exactly
+        as by process_claim, which reports the error for that claim only.
+        """
+        identities: dict[str, IdentityValidationResult] = {}
+        trust_profiles: dict[str, NodeTrustProfile | None] = {}
+        checks: list[_EnvelopeChecks | None] = []
+
+        for envelope in envelopes:
+            node_id = envelope.source_node_id
+            try:
+                if node_id not in identities:
+                    identities[node_id] = await self.identity_guard.validate_node_identity(
+                        node_id=node_id,
+                        credentials=self.identity_guard._node_registry.get(node_id),
+                    )
+                    # Profiles not registered yet are created on first use by
+                    # decide_inbound_trust, as in the per-claim path
+                    trust_profiles[node_id] = self.identity_guard._trust_profiles.get(node_id)
+
+                envelope_checks = _EnvelopeChecks(
+                    identity_result=identities[node_id],
+                    signature_result=await self.identity_guard.verify_artifact_signature(envelope),
+                    trust_profile=trust_profiles[node_id],
+                )
+                if self.eligibility_filter and not self.eligibility_filter.disable_similarity_check:
+                    envelope_checks.eligibility_hash = self.eligibility_filter.similarity_hash(envelope.artifact)
+                if self.config.enable_replay_protection:
+                    envelope_checks.signature_hash = self.replay_protection._compute_signature_hash(envelope)
+                if self.config.enable_duplicate_suppression:
+                    envelope_checks.content_hash = self.duplicate_suppression._compute_content_hash(envelope.artifact)
+                checks.append(envelope_checks)
+            except Exception as e:
+                self.logger.debug(f"Batch precheck failed for {envelope.envelope_id}: {e}")
+                checks.append(None)
+
+        return checks
+
+    async def _process_envelope(
+        self,
+        envelope: FederatedClaimEnvelope,
+        skip_replay_check: bool = False,
+        skip_duplicate_check: bool = False,
+        force_accept: bool = False,
+        checks: _EnvelopeChecks | None = None,
+    ) -> ClaimProcessingResult:
+        """Run the process_claim pipeline, using batch precomputed checks if given."""
         started_at = datetime.utcnow()
         envelope_id = envelope.envelope_id
         source_node = envelope.source_node_id
@@ -453,14 +580,20 @@ class InboundFederatedClaimProcessor:
             self._normalize_envelope(envelope)
 
             # Step 2: Validate identity
-            identity_result = await self.identity_guard.validate_node_identity(
-                node_id=envelope.source_node_id,
-                credentials=self.identity_guard._node_registry.get(envelope.source_node_id),
-            )
+            if checks:
+                identity_result = checks.identity_result
+            else:
+                identity_result = await self.identity_guard.validate_node_identity(
+                    node_id=envelope.source_node_id,
+                    credentials=self.identity_guard._node_registry.get(envelope.source_node_id),
+                )
             result.identity_validation = identity_result
 
             # Step 3: Verify signature
-            signature_result = await self.identity_guard.verify_artifact_signature(envelope)
+            if checks:
+                signature_result = checks.signature_result
+            else:
+                signature_result = await self.identity_guard.verify_artifact_signature(envelope)
             result.signature_verification = signature_result
 
             # Early rejection checks
@@ -485,6 +618,8 @@ class InboundFederatedClaimProcessor:
                     envelope.artifact,
                     envelope_id,
                     source_node,
+                    similarity_hash=checks.eligibility_hash if checks else None,
+                    prune=checks is None,
                 )
                 result.eligibility_result = eligibility_result
 
@@ -533,15 +668,15 @@ class InboundFederatedClaimProcessor:
             # Step 4: Replay protection
             if self.config.enable_replay_protection and not skip_replay_check:
                 try:
-                    replay_result = await self.replay_protection.check_envelope(envelope)
+                    replay_result = await self.replay_protection.check_envelope(
+                        envelope,
+                        cleanup=checks is None,
+                        signature_hash=checks.signature_hash if checks else None,
+                    )
                     result.replay_protection = replay_result
                 except ReplayAttackError as e:
-                    result.replay_protection = ReplayProtectionResult(
-                        is_replay=True,
-                        envelope_id=envelope_id,
-                        check_type="unknown",
-                        blocked_reason=str(e),
-                    )
+                    # The error carries the failed check's result
+                    result.replay_protection = ReplayProtectionResult.model_validate(e.details)
                     if self.config.block_replays:
                         return self._reject_result(
                             result,
@@ -552,7 +687,11 @@ class InboundFederatedClaimProcessor:
             # Step 5: Duplicate suppression
             duplicate_result = None
             if self.config.enable_duplicate_suppression and not skip_duplicate_check:
-                duplicate_result = await self.duplicate_suppression.check_claim(envelope)
+                duplicate_result = await self.duplicate_suppression.check_claim(
+                    envelope,
+                    cleanup=checks is None,
+                    content_hash=checks.content_hash if checks else None,
+                )
                 result.duplicate_suppression = duplicate_result
 
                 if duplicate_result.is_duplicate and self.config.quarantine_duplicates:
@@ -565,7 +704,15 @@ class InboundFederatedClaimProcessor:
                     )
 
             # Step 6: Trust evaluation
-            trust_decision = await self.identity_guard.evaluate_inbound_trust(envelope)
+            if checks:
+                trust_decision = await self.identity_guard.decide_inbound_trust(
+                    envelope,
+                    identity_result=checks.identity_result,
+                    signature_result=checks.signature_result,
+                    trust_profile=checks.trust_profile,
+                )
+            else:
+                trust_decision = await self.identity_guard.evaluate_inbound_trust(envelope)
             result.trust_decision = trust_decision
 
             if not force_accept:
@@ -651,10 +798,16 @@ class InboundFederatedClaimProcessor:
 
             # Register as seen (after all validations pass)
             if self.config.enable_replay_protection:
-                self.replay_protection.mark_envelope_seen(envelope)
+                self.replay_protection.mark_envelope_seen(
+                    envelope,
+                    signature_hash=checks.signature_hash if checks else None,
+                )
 
             if self.config.enable_duplicate_suppression:
-                claim_id = self.duplicate_suppression.register_claim(envelope)
+                claim_id = self.duplicate_suppression.register_claim(
+                    envelope,
+                    content_hash=checks.content_hash if checks else None,
+                )
                 result.claim_id = claim_id
 
             # Step 10: Audit logging
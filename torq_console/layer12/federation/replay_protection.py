@@ -170,6 +170,8 @@ class ReplayProtectionService:
         self,
         envelope: FederatedClaimEnvelope,
         skip_timestamp_check: bool = False,
+        cleanup: bool = True,
+        signature_hash: str | None = None,
     ) -> ReplayProtectionResult:
         """
         Check if an envelope has been replayed.
@@ -182,6 +184,8 @@ class ReplayProtectionService:
         Args:
             envelope: The envelope to check
             skip_timestamp_check: Skip timestamp validation
+            cleanup: Expire old entries first (batch callers do this once per batch)
+            signature_hash: Precomputed _compute_signature_hash(envelope)
 
         Returns:
             ReplayProtectionResult indicating if this is a replay
@@ -192,7 +196,8 @@ class ReplayProtectionService:
         self._total_checked += 1
 
         # Clean up expired entries before checking
-        self._cleanup_expired_entries()
+        if cleanup:
+            self._cleanup_expired_entries()
 
         envelope_id = envelope.envelope_id
 
@@ -234,7 +239,7 @@ class ReplayProtectionService:
 
         # Check 3: Signature hash tracking
         if self.config.enable_signature_hash_tracking:
-            sig_hash = self._compute_signature_hash(envelope)
+            sig_hash = signature_hash or self._compute_signature_hash(envelope)
             if sig_hash in self._signature_hashes:
                 first_seen = self._signature_hashes[sig_hash]
                 self._replays_detected += 1
@@ -259,7 +264,11 @@ class ReplayProtectionService:
             check_type="envelope_id",
         )
 
-    def mark_envelope_seen(self, envelope: FederatedClaimEnvelope) -> None:
+    def mark_envelope_seen(
+        self,
+        envelope: FederatedClaimEnvelope,
+        signature_hash: str | None = None,
+    ) -> None:
         """
         Mark an envelope as seen to prevent future replays.
 
@@ -268,6 +277,7 @@ class ReplayProtectionService:
 
         Args:
             envelope: The envelope to mark as seen
+            signature_hash: Precomputed _compute_signature_hash(envelope)
         """
         now = datetime.utcnow()
         envelope_id = envelope.envelope_id
@@ -280,7 +290,7 @@ class ReplayProtectionService:
 
         # Track signature hash
         if self.config.enable_signature_hash_tracking:
-            sig_hash = self._compute_signature_hash(envelope)
+            sig_hash = signature_hash or self._compute_signature_hash(envelope)
             self._signature_hashes[sig_hash] = now
             # Move to end (most recently used)
             self._signature_hashes.move_to_end(sig_hash)
@@ -13,6 +13,7 @@ Without this safeguard, the federation layer could be overwhelmed
 by low-quality or malicious content, degrading the value of collective intelligence.
 """
 
+import hashlib
 import logging
 from collections import defaultdict
 from datetime import datetime, timedelta
@@ -188,6 +189,8 @@ class FederationEligibilityFilter:
         artifact: FederatedArtifactPayload,
         envelope_id: str,
         source_node_id: str,
+        similarity_hash: str | None = None,
+        prune: bool = True,
     ) -> EligibilityResult:
         """
         Check if a claim is eligible for federation.
@@ -196,6 +199,9 @@ class FederationEligibilityFilter:
             artifact: The artifact payload to check
             envelope_id: Envelope ID
             source_node_id: Source node ID
+            similarity_hash: Precomputed similarity_hash(artifact)
+            prune: Expire old similarity hashes first (batch callers
+                call prune_similarity_hashes once per batch instead)
 
         Returns:
             EligibilityResult with eligibility status
@@ -224,7 +230,7 @@ class FederationEligibilityFilter:
         scores["rate_limit_remaining"] = float(remaining_quota)
 
         # 5. Check similarity (near-duplicate prevention)
-        similarity_score = self._check_similarity(artifact, envelope_id, reasons, scores)
+        similarity_score = self._check_similarity(artifact, envelope_id, reasons, scores, similarity_hash, prune)
 
         # Calculate overall score
         overall_score = self._calculate_overall_score(scores)
@@ -377,12 +383,28 @@ class FederationEligibilityFilter:
         scores["spam"] = 1.0 - spam_score
         return spam_score
 
+    @staticmethod
+    def similarity_hash(artifact: FederatedArtifactPayload) -> str:
+        """Near-duplicate key for an artifact (normalised claim text and type)."""
+        content = f"{artifact.claim_text.lower().strip()}|{artifact.artifact_type}"
+        return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+    def prune_similarity_hashes(self) -> None:
+        """Forget similarity hashes older than 24 hours."""
+        cutoff = datetime.utcnow() - timedelta(hours=24)
+        self._claim_hashes = {
+            k: v for k, v in self._claim_hashes.items()
+            if v > cutoff
+        }
+
     def _check_similarity(
         self,
         artifact: FederatedArtifactPayload,
         envelope_id: str,
         reasons: list[str],
         scores: dict[str, float],
+        claim_hash: str | None = None,
+        prune: bool = True,
     ) -> float:
         """Check for similarity to existing claims."""
         # Skip similarity check if disabled (for simulation)
@@ -390,18 +412,13 @@ class FederationEligibilityFilter:
             scores["similarity"] = 1.0
             return 1.0
 
-        import hashlib
-
         # Create content hash
-        content = f"{artifact.claim_text.lower().strip()}|{artifact.artifact_type}"
-        claim_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
+        if claim_hash is None:
+            claim_hash = self.similarity_hash(artifact)
 
         # Clean old hashes
-        cutoff = datetime.utcnow() - timedelta(hours=24)
-        self._claim_hashes = {
-            k: v for k, v in self._claim_hashes.items()
-            if v > cutoff
-        }
+        if prune:
+            self.prune_similarity_hashes()
 
         # Check for near-duplicate
         if claim_hash in self._claim_hashes:
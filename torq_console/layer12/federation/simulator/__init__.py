@@ -59,6 +59,7 @@ from .scenarios import (
 )
 
 from .metrics import FederationMetricsAggregator
+from .claim_batch import ClaimBatch, NodeIndex
 
 from .health_index import (
     FederationHealthIndexCalculator,
@@ -76,6 +77,14 @@ from .processor_adapter import (
     ProcessedSimulationClaimResult,
     process_claims_batch,
 )
+from .sweep import (
+    SAFEGUARD_CONFIGS,
+    SweepRun,
+    SweepResult,
+    build_sweep,
+    run_sweep,
+    aggregate_records,
+)
 
 from .assertions import (
     AssertionRegistry,
@@ -128,6 +137,8 @@ __all__ = [
 
     # Metrics
     "FederationMetricsAggregator",
+    "ClaimBatch",
+    "NodeIndex",
 
     # Health Index
     "FederationHealthIndexCalculator",
@@ -143,6 +154,14 @@ __all__ = [
     "ProcessedSimulationClaimResult",
     "process_claims_batch",
 
+    # Sweeps
+    "SAFEGUARD_CONFIGS",
+    "SweepRun",
+    "SweepResult",
+    "build_sweep",
+    "run_sweep",
+    "aggregate_records",
+
     # Assertions
     "AssertionRegistry",
     "AssertionResult",
@@ -0,0 +1,267 @@
+"""
+Columnar Claim Batches for Federation Simulator
+
+Layer 12 Phase 2A — Federation Stability Validation Harness
+
+A ClaimBatch holds one round's claims as NumPy columns (source node index,
+domain code, stance code, accepted flag, confidence, provenance quality),
+built in a single pass over the SimulatedClaim objects. Diversity,
+concentration and trust metrics are then computed from bincounts over
+those columns instead of rebuilding Counters from claim lists per metric.
+"""
+
+import math
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import Domain, SimulatedClaim, SimulatedNode, Stance
+
+
+DOMAINS: List[Domain] = list(Domain)
+STANCES: List[Stance] = list(Stance)
+DOMAIN_CODES: Dict[Domain, int] = {domain: i for i, domain in enumerate(DOMAINS)}
+STANCE_CODES: Dict[Stance, int] = {stance: i for i, stance in enumerate(STANCES)}
+
+
+# ============================================================================
+# Node Index
+# ============================================================================
+
+class NodeIndex:
+    """
+    Node ID <-> column index mapping.
+
+    Batches built with the same NodeIndex share node columns, so their
+    per-node counts line up and they can be concatenated.
+    """
+
+    def __init__(self, node_ids: Iterable[str] = ()):
+        self.ids: List[str] = []
+        self.positions: Dict[str, int] = {}
+        for node_id in node_ids:
+            self.add(node_id)
+
+    @classmethod
+    def from_nodes(cls, nodes: Sequence[SimulatedNode]) -> "NodeIndex":
+        """Index nodes by their position in ``nodes``."""
+        return cls(node.node_id for node in nodes)
+
+    def add(self, node_id: str) -> int:
+        """Index of node_id, assigning the next one if unseen."""
+        idx = self.positions.get(node_id)
+        if idx is None:
+            idx = self.positions[node_id] = len(self.ids)
+            self.ids.append(node_id)
+        return idx
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+# ============================================================================
+# Claim Batch
+# ============================================================================
+
+class ClaimBatch:
+    """
+    One round's claims in columnar form.
+
+    ``node_index`` holds positions in ``nodes`` (a NodeIndex).
+    """
+
+    def __init__(
+        self,
+        node_index: np.ndarray,
+        domain: np.ndarray,
+        stance: np.ndarray,
+        accepted: np.ndarray,
+        confidence: np.ndarray,
+        provenance_quality: np.ndarray,
+        nodes: NodeIndex,
+    ):
+        self.node_index = node_index
+        self.domain = domain
+        self.stance = stance
+        self.accepted = accepted
+        self.confidence = confidence
+        self.provenance_quality = provenance_quality
+        self.nodes = nodes
+
+    @classmethod
+    def from_claims(
+        cls,
+        claims: Sequence[SimulatedClaim],
+        accepted: Optional[Iterable[bool]] = None,
+        nodes: Optional[NodeIndex] = None,
+    ) -> "ClaimBatch":
+        """
+        Build a batch from claim objects.
+
+        Args:
+            claims: Claims in the round
+            accepted: Acceptance flag per claim (default: all accepted)
+            nodes: Node index, extended in place with unseen source nodes
+                (default: a new index in order of first appearance)
+
+        Returns:
+            ClaimBatch over the claims, in order
+        """
+        if nodes is None:
+            nodes = NodeIndex()
+
+        # One attribute sweep per column; np.fromiter avoids per-element array writes
+        n = len(claims)
+        sources = [claim.source_node_id for claim in claims]
+        for source in dict.fromkeys(sources):
+            nodes.add(source)
+        node_index = np.fromiter(map(nodes.positions.__getitem__, sources), dtype=np.int32, count=n)
+        domains = np.fromiter(map(DOMAIN_CODES.__getitem__, [c.domain for c in claims]), dtype=np.int8, count=n)
+        stances = np.fromiter(map(STANCE_CODES.__getitem__, [c.stance for c in claims]), dtype=np.int8, count=n)
+        confidence = np.fromiter([c.confidence for c in claims], dtype=np.float64, count=n)
+        provenance = np.fromiter([c.provenance_quality for c in claims], dtype=np.float64, count=n)
+
+        if accepted is None:
+            accepted_flags = np.ones(n, dtype=bool)
+        else:
+            accepted_flags = np.fromiter(accepted, dtype=bool, count=n)
+
+        return cls(node_index, domains, stances, accepted_flags, confidence, provenance, nodes)
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Sequence[Any],
+        nodes: Optional[NodeIndex] = None,
+    ) -> "ClaimBatch":
+        """Build a batch from ProcessedSimulationClaimResult objects."""
+        return cls.from_claims(
+            [r.claim for r in results],
+            accepted=(r.accepted for r in results),
+            nodes=nodes,
+        )
+
+    @classmethod
+    def concat(cls, batches: Sequence["ClaimBatch"]) -> "ClaimBatch":
+        """Concatenate batches that share a node index."""
+        if not batches:
+            return cls.from_claims([])
+        return cls(
+            np.concatenate([b.node_index for b in batches]),
+            np.concatenate([b.domain for b in batches]),
+            np.concatenate([b.stance for b in batches]),
+            np.concatenate([b.accepted for b in batches]),
+            np.concatenate([b.confidence for b in batches]),
+            np.concatenate([b.provenance_quality for b in batches]),
+            batches[0].nodes,
+        )
+
+    def __len__(self) -> int:
+        return len(self.node_index)
+
+    def select(self, mask: np.ndarray) -> "ClaimBatch":
+        """Sub-batch of the rows where mask is True."""
+        return ClaimBatch(
+            self.node_index[mask],
+            self.domain[mask],
+            self.stance[mask],
+            self.accepted[mask],
+            self.confidence[mask],
+            self.provenance_quality[mask],
+            self.nodes,
+        )
+
+    def accepted_only(self) -> "ClaimBatch":
+        return self.select(self.accepted)
+
+    # ------------------------------------------------------------------
+    # Counts (computed once per batch)
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def node_counts(self) -> np.ndarray:
+        """Claims per node, indexed like ``nodes``."""
+        return np.bincount(self.node_index, minlength=len(self.nodes))
+
+    @cached_property
+    def node_accepted_counts(self) -> np.ndarray:
+        """Accepted claims per node, indexed like ``nodes``."""
+        return np.bincount(self.node_index[self.accepted], minlength=len(self.nodes))
+
+    @cached_property
+    def domain_counts(self) -> np.ndarray:
+        """Claims per domain, indexed like ``DOMAINS``."""
+        return np.bincount(self.domain, minlength=len(DOMAINS))
+
+    @cached_property
+    def stance_counts(self) -> np.ndarray:
+        """Claims per stance, indexed like ``STANCES``."""
+        return np.bincount(self.stance, minlength=len(STANCES))
+
+    @cached_property
+    def domain_stance_counts(self) -> np.ndarray:
+        """Claims per (domain, stance), shape (len(DOMAINS), len(STANCES))."""
+        flat = self.domain.astype(np.int64) * len(STANCES) + self.stance
+        return np.bincount(flat, minlength=len(DOMAINS) * len(STANCES)).reshape(len(DOMAINS), len(STANCES))
+
+    @cached_property
+    def domain_node_counts(self) -> np.ndarray:
+        """Claims per (domain, node), shape (len(DOMAINS), len(nodes))."""
+        n_nodes = len(self.nodes)
+        flat = self.domain.astype(np.int64) * n_nodes + self.node_index
+        return np.bincount(flat, minlength=len(DOMAINS) * n_nodes).reshape(len(DOMAINS), n_nodes)
+
+    @cached_property
+    def active_node_counts(self) -> np.ndarray:
+        """Claims per node that submitted at least one claim, ascending."""
+        counts = self.node_counts
+        return np.sort(counts[counts > 0])
+
+
+# ============================================================================
+# Vectorised metric helpers
+# ============================================================================
+
+def shannon_entropy(counts: np.ndarray) -> float:
+    """Shannon entropy (bits) of a count vector; zero counts are ignored."""
+    total = counts.sum()
+    if total == 0:
+        return 0.0
+    p = counts[counts > 0] / total
+    return float(-(p * np.log2(p)).sum())
+
+
+def normalized_entropy(counts: np.ndarray) -> float:
+    """Entropy divided by log2 of the number of categories present (0 if fewer than 2)."""
+    present = int(np.count_nonzero(counts))
+    if present < 2:
+        return 0.0
+    return min(1.0, shannon_entropy(counts) / math.log2(present))
+
+
+def herfindahl_index(counts: np.ndarray) -> float:
+    """Sum of squared shares."""
+    total = counts.sum()
+    if total == 0:
+        return 0.0
+    shares = counts / total
+    return float((shares * shares).sum())
+
+
+def top_shares(counts: np.ndarray) -> Tuple[float, float]:
+    """Share of the largest, and of the two largest, counts."""
+    total = counts.sum()
+    if total == 0:
+        return 0.0, 0.0
+    active = counts[counts > 0]
+    if len(active) < 2:
+        top_1 = float(active.max() / total)
+        return top_1, top_1
+    top = np.partition(active, len(active) - 2)[-2:]
+    return float(top[1] / total), float(top.sum() / total)
+
+
+def node_trust_array(nodes: Sequence[SimulatedNode]) -> np.ndarray:
+    """Current trust of each node, in node order."""
+    return np.fromiter((n.state.current_trust for n in nodes), dtype=np.float64, count=len(nodes))
@@ -14,6 +14,8 @@ import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from .models import (
     Domain,
     NodeBehaviorProfile,
@@ -48,6 +50,14 @@ from .metrics import (
     FederationCollapseRiskCalculator,
 )
 from .health_index import FederationHealthIndexCalculator
+from .claim_batch import (
+    ClaimBatch,
+    NodeIndex,
+    herfindahl_index,
+    node_trust_array,
+    normalized_entropy,
+    top_shares,
+)
 from .processor_adapter import ProcessorAdapter, process_claims_batch
 
 logger = logging.getLogger(__name__)
@@ -454,8 +464,11 @@ class AsyncFederationSimulationExecutor:
             round_context=round_context,
         )
 
+        # Columnar view of the round, shared by the trust update and all metrics
+        batch = ClaimBatch.from_results(processed_results, NodeIndex.from_nodes(nodes))
+
         # Update node trust based on results
-        await self._update_node_trust(nodes, processed_results)
+        await self._update_node_trust(nodes, batch)
 
         # Create round data
         round_end = datetime.utcnow()
@@ -475,7 +488,7 @@ class AsyncFederationSimulationExecutor:
 
         # Set additional metrics
         if self.enable_metrics and self.metrics_aggregator:
-            round_metrics = self._calculate_round_metrics(round_data, nodes)
+            round_metrics = self._calculate_round_metrics(round_data, nodes, batch)
             round_data.diversity_metrics = round_metrics.get("diversity", {})
             round_data.concentration_metrics = round_metrics.get("concentration", {})
             round_data.trust_metrics = round_metrics.get("trust", {})
@@ -492,9 +505,7 @@ class AsyncFederationSimulationExecutor:
         round_summary = self._create_round_summary(
             round_num=round_num,
             round_start=round_start,
-            claims=claims,
-            nodes=nodes,
-            processed_results=processed_results,
+            batch=batch,
         )
         round_data.round_summary = round_summary
 
@@ -504,27 +515,25 @@ class AsyncFederationSimulationExecutor:
         self,
         round_num: int,
         round_start: datetime,
-        claims: List[SimulatedClaim],
-        nodes: List[SimulatedNode],
-        processed_results: List,
+        batch: ClaimBatch,
     ) -> RoundSummary:
         """Create a RoundSummary for predictive metrics calculation."""
         # Calculate diversity metrics
-        topic_entropy = self._calculate_topic_entropy(claims)
-        stance_entropy = self._calculate_stance_entropy(claims)
+        topic_entropy = self._calculate_topic_entropy(batch)
+        stance_entropy = self._calculate_stance_entropy(batch)
 
         # Calculate concentration metrics with top node shares
-        gini = self._calculate_gini_coefficient(claims)
-        hhi = self._calculate_hhi(claims)
-        top_1_share, top_2_share = self._calculate_top_node_shares(claims)
+        gini = self._calculate_gini_coefficient(batch)
+        hhi = self._calculate_hhi(batch)
+        top_1_share, top_2_share = self._calculate_top_node_shares(batch)
 
         # Calculate minority ratio and contradiction retention
-        minority_ratio = self._calculate_minority_ratio(claims)
-        contradiction_retention = self._calculate_contradiction_retention(claims, stance_entropy)
+        minority_ratio = self._calculate_minority_ratio(batch)
+        contradiction_retention = self._calculate_contradiction_retention(batch, stance_entropy)
 
         # Count accepted and rejected
-        accepted_count = sum(1 for r in processed_results if r.accepted)
-        rejected_count = len(processed_results) - accepted_count
+        accepted_count = int(batch.accepted.sum())
+        rejected_count = len(batch) - accepted_count
 
         # Calculate diversity and concentration scores for predictive metrics
         diversity_score = (
@@ -558,33 +567,17 @@ class AsyncFederationSimulationExecutor:
             concentration_score=concentration_score,
         )
 
-    def _calculate_top_node_shares(self, claims: List[SimulatedClaim]) -> Tuple[float, float]:
+    def _calculate_top_node_shares(self, batch: ClaimBatch) -> Tuple[float, float]:
         """Calculate the share of claims from the top 1 and top 2 nodes."""
-        from collections import Counter
-
-        if not claims:
-            return 0.0, 0.0
-
-        source_counts = Counter(c.source_node_id for c in claims)
-        total = len(claims)
-
-        if total == 0:
-            return 0.0, 0.0
+        return top_shares(batch.node_counts)
 
-        sorted_counts = sorted(source_counts.values(), reverse=True)
-
-        top_1_share = sorted_counts[0] / total if sorted_counts else 0.0
-        top_2_share = sum(sorted_counts[:2]) / total if len(sorted_counts) >= 2 else top_1_share
-
-        return top_1_share, top_2_share
-
-    def _calculate_minority_ratio(self, claims: List[SimulatedClaim]) -> float:
+    def _calculate_minority_ratio(self, batch: ClaimBatch) -> float:
         """Calculate the ratio of minority viewpoint contributions."""
-        top_1_share, _ = self._calculate_top_node_shares(claims)
+        top_1_share, _ = self._calculate_top_node_shares(batch)
         # Minority is what the dominant node doesn't control
         return 1.0 - top_1_share
 
-    def _calculate_contradiction_retention(self, claims: List[SimulatedClaim], stance_entropy: float) -> float:
+    def _calculate_contradiction_retention(self, batch: ClaimBatch, stance_entropy: float) -> float:
         """Calculate how well contradiction is being preserved."""
         # Use stance entropy as a proxy for contradiction retention
         # Higher stance entropy with multiple stances suggests healthy contradiction
@@ -593,23 +586,19 @@ class AsyncFederationSimulationExecutor:
     async def _update_node_trust(
         self,
         nodes: List[SimulatedNode],
-        results: List,
+        batch: ClaimBatch,
     ) -> None:
         """Update node trust based on processing results."""
-        for node in nodes:
-            # Find results for this node's claims
-            node_results = [r for r in results if r.claim.source_node_id == node.node_id]
+        # Per-node claim and acceptance counts, indexed like nodes
+        totals = batch.node_counts
+        accepted = batch.node_accepted_counts
 
-            if not node_results:
-                continue
-
-            # Calculate trust adjustment
-            accepted = sum(1 for r in node_results if r.accepted)
-            rejected = len(node_results) - accepted
+        for i in np.flatnonzero(totals):
+            node = nodes[i]
 
             # Simple trust update: increase for accepted, decrease for rejected
-            if len(node_results) > 0:
-                acceptance_rate = accepted / len(node_results)
+            if totals[i] > 0:
+                acceptance_rate = float(accepted[i] / totals[i])
                 trust_delta = (acceptance_rate - 0.5) * 0.05  # Small adjustments
 
                 # Apply trust volatility
@@ -671,20 +660,21 @@ class AsyncFederationSimulationExecutor:
         self,
         round_data: SimulationRound,
         nodes: List[SimulatedNode],
+        batch: ClaimBatch,
     ) -> Dict[str, Dict[str, float]]:
         """Calculate metrics for a round."""
         metrics = {}
 
         # Diversity metrics
         metrics["diversity"] = {
-            "topic_entropy": self._calculate_topic_entropy(round_data.claims),
-            "stance_entropy": self._calculate_stance_entropy(round_data.claims),
+            "topic_entropy": self._calculate_topic_entropy(batch),
+            "stance_entropy": self._calculate_stance_entropy(batch),
         }
 
         # Concentration metrics
-        gini = self._calculate_gini_coefficient(round_data.claims)
-        hhi = self._calculate_hhi(round_data.claims)
-        top_1_share, top_2_share = self._calculate_top_node_shares(round_data.claims)
+        gini = self._calculate_gini_coefficient(batch)
+        hhi = self._calculate_hhi(batch)
+        top_1_share, top_2_share = self._calculate_top_node_shares(batch)
 
         metrics["concentration"] = {
             "gini": gini,
@@ -694,104 +684,54 @@ class AsyncFederationSimulationExecutor:
         }
 
         # Trust metrics
+        trust = node_trust_array(nodes)
         metrics["trust"] = {
-            "average_trust": sum(n.state.current_trust for n in nodes) / len(nodes),
-            "trust_volatility": self._calculate_trust_volatility(nodes),
+            "average_trust": float(trust.mean()),
+            "trust_volatility": self._calculate_trust_volatility(trust),
         }
 
         # Quality metrics
-        accepted = sum(1 for r in round_data.processed_claims if r.accepted)
         metrics["quality"] = {
-            "acceptance_rate": accepted / len(round_data.processed_claims) if round_data.processed_claims else 0.0,
+            "acceptance_rate": float(batch.accepted.mean()) if len(batch) else 0.0,
         }
 
         # Resilience metrics
         metrics["resilience"] = {
-            "throughput": len(round_data.claims),
+            "throughput": len(batch),
         }
 
         return metrics
 
-    def _calculate_topic_entropy(self, claims: List[SimulatedClaim]) -> float:
+    def _calculate_topic_entropy(self, batch: ClaimBatch) -> float:
         """Calculate Shannon entropy of topic distribution."""
-        from collections import Counter
-        import math
-
-        domains = [c.domain for c in claims]
-        if not domains:
-            return 0.0
-
-        counts = Counter(domains)
-        total = len(domains)
-        entropy = -sum((count / total) * math.log2(count / total) for count in counts.values())
-        return min(1.0, entropy / math.log2(len(counts))) if len(counts) > 1 else 0.0
+        return normalized_entropy(batch.domain_counts)
 
-    def _calculate_stance_entropy(self, claims: List[SimulatedClaim]) -> float:
+    def _calculate_stance_entropy(self, batch: ClaimBatch) -> float:
         """Calculate Shannon entropy of stance distribution."""
-        from collections import Counter
-        import math
+        return normalized_entropy(batch.stance_counts)
 
-        stances = [c.stance for c in claims]
-        if not stances:
-            return 0.0
-
-        counts = Counter(stances)
-        total = len(stances)
-        entropy = -sum((count / total) * math.log2(count / total) for count in counts.values())
-        return min(1.0, entropy / math.log2(len(counts))) if len(counts) > 1 else 0.0
-
-    def _calculate_gini_coefficient(self, claims: List[SimulatedClaim]) -> float:
+    def _calculate_gini_coefficient(self, batch: ClaimBatch) -> float:
         """Calculate Gini coefficient of claim distribution."""
-        if not claims:
-            return 0.0
-
-        from collections import Counter
-        source_counts = Counter(c.source_node_id for c in claims)
-        values = sorted(source_counts.values())
-
-        if len(values) == 1:
-            return 0.0
-
+        values = batch.active_node_counts
         n = len(values)
-        total = sum(values)
-
-        if total == 0:
+        if n <= 1:
             return 0.0
 
-        cumulative = 0
-        for i, val in enumerate(values):
-            cumulative += (n - i + 1) * val
+        total = values.sum()
+        cumulative = ((n - np.arange(n) + 1) * values).sum()
 
         gini = (2 * cumulative) / (n * total) - (n + 1) / n
-        return max(0.0, min(1.0, gini))
+        return float(max(0.0, min(1.0, gini)))
 
-    def _calculate_hhi(self, claims: List[SimulatedClaim]) -> float:
+    def _calculate_hhi(self, batch: ClaimBatch) -> float:
         """Calculate Herfindahl-Hirschman Index."""
-        if not claims:
-            return 0.0
-
-        from collections import Counter
-        source_counts = Counter(c.source_node_id for c in claims)
-        total = len(claims)
-
-        if total == 0:
-            return 0.0
+        return herfindahl_index(batch.node_counts)
 
-        hhi = sum((count / total) ** 2 for count in source_counts.values())
-        return hhi
-
-    def _calculate_trust_volatility(self, nodes: List[SimulatedNode]) -> float:
-        """Calculate trust volatility across nodes."""
-        if not nodes:
-            return 0.0
-
-        trusts = [n.state.current_trust for n in nodes]
-        if len(trusts) < 2:
+    def _calculate_trust_volatility(self, trust: np.ndarray) -> float:
+        """Calculate trust volatility (population std dev) across nodes."""
+        if len(trust) < 2:
             return 0.0
-
-        mean = sum(trusts) / len(trusts)
-        variance = sum((t - mean) ** 2 for t in trusts) / len(trusts)
-        return variance ** 0.5
+        return float(trust.std())
 
     def _calculate_safeguard_effectiveness(self) -> Dict[str, float]:
         """Calculate safeguard effectiveness scores."""
@@ -33,6 +33,15 @@ from .models import (
     AuthorityCaptureAccelerationResult,
     FederationCollapseRiskResult,
 )
+from .claim_batch import (
+    STANCES,
+    STANCE_CODES,
+    ClaimBatch,
+    NodeIndex,
+    herfindahl_index,
+    shannon_entropy,
+    top_shares,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +81,70 @@ def unwrap_claims(items: List[Any]) -> List[SimulatedClaim]:
     return [unwrap_claim(item) for item in items]
 
 
+# ============================================================================
+# Columnar Round Data
+# ============================================================================
+
+def round_batches(simulation_data: Dict[str, Any], key: str = "accepted_claims") -> List[ClaimBatch]:
+    """
+    Per-round ClaimBatches for ``key`` ("accepted_claims" or "processed_claims").
+
+    Built once per simulation_data and cached in it, with one NodeIndex
+    shared by every batch, so each calculator reuses the same columns.
+    """
+    cache = simulation_data.setdefault("claim_batches", {})
+    if key not in cache:
+        nodes = simulation_data.setdefault("node_index", NodeIndex())
+        batches = []
+        for round_data in simulation_data["rounds"]:
+            items = round_data.get(key, [])
+            batches.append(ClaimBatch.from_claims(
+                unwrap_claims(items),
+                accepted=(getattr(item, 'accepted', True) for item in items),
+                nodes=nodes,
+            ))
+        cache[key] = batches
+    return cache[key]
+
+
+def combined_batch(simulation_data: Dict[str, Any], key: str = "accepted_claims") -> ClaimBatch:
+    """All rounds' ClaimBatches for ``key`` concatenated (cached)."""
+    cache = simulation_data.setdefault("claim_batches", {})
+    combined_key = f"{key}:all"
+    if combined_key not in cache:
+        cache[combined_key] = ClaimBatch.concat(round_batches(simulation_data, key))
+    return cache[combined_key]
+
+
+def trust_matrix(simulation_data: Dict[str, Any]) -> np.ndarray:
+    """
+    Node trust per round, shape (rounds, nodes); NaN where a node has no score.
+
+    Columns follow the shared NodeIndex.
+    """
+    nodes = simulation_data.setdefault("node_index", NodeIndex())
+    rounds = simulation_data["rounds"]
+    for round_data in rounds:
+        for node_id in round_data.get("node_trust_scores", {}):
+            nodes.add(node_id)
+
+    matrix = np.full((len(rounds), len(nodes)), np.nan)
+    for r, round_data in enumerate(rounds):
+        scores = round_data.get("node_trust_scores", {})
+        if scores:
+            columns = [nodes.positions[node_id] for node_id in scores]
+            matrix[r, columns] = list(scores.values())
+    return matrix
+
+
+# Stance pairs counted as contradictory, as a symmetric (stance x stance) mask
+CONTRADICTION_MASK = np.zeros((len(STANCES), len(STANCES)), dtype=bool)
+for _a, _b in [(Stance.SUPPORT, Stance.OPPOSE), (Stance.SUPPORT, Stance.CONDITIONAL),
+               (Stance.OPPOSE, Stance.CONDITIONAL)]:
+    CONTRADICTION_MASK[STANCE_CODES[_a], STANCE_CODES[_b]] = True
+    CONTRADICTION_MASK[STANCE_CODES[_b], STANCE_CODES[_a]] = True
+
+
 # ============================================================================
 # Base Metric Calculator
 # ============================================================================
@@ -101,28 +174,10 @@ class TopicEntropyCalculator(MetricCalculator):
 
     def calculate(self, simulation_data: Dict[str, Any]) -> float:
         """Calculate topic entropy for accepted claims."""
-        rounds = simulation_data["rounds"]
-        domain_claims = defaultdict(int)
-        total_claims = 0
-
-        for round_data in rounds:
-            for claim in round_data.get("accepted_claims", []):
-                domain_claims[claim.domain] += 1
-                total_claims += 1
-
-        if total_claims == 0:
-            return 0.0
-
-        # Calculate Shannon entropy
-        entropy = 0.0
-        for count in domain_claims.values():
-            if count > 0:
-                p = count / total_claims
-                entropy -= p * math.log2(p)
+        entropy = shannon_entropy(combined_batch(simulation_data).domain_counts)
 
         # Normalize to 0-1 range (max log2(8) = 3 for 8 domains)
-        max_entropy = math.log2(8) if domain_claims else 1.0
-        return self.validate_range(entropy / max_entropy)
+        return self.validate_range(entropy / math.log2(8))
 
 
 class StanceEntropyCalculator(MetricCalculator):
@@ -130,28 +185,10 @@ class StanceEntropyCalculator(MetricCalculator):
 
     def calculate(self, simulation_data: Dict[str, Any]) -> float:
         """Calculate stance entropy for accepted claims."""
-        rounds = simulation_data["rounds"]
-        stance_claims = defaultdict(int)
-        total_claims = 0
-
-        for round_data in rounds:
-            for claim in round_data.get("accepted_claims", []):
-                stance_claims[claim.stance] += 1
-                total_claims += 1
-
-        if total_claims == 0:
-            return 0.0
-
-        # Calculate Shannon entropy
-        entropy = 0.0
-        for count in stance_claims.values():
-            if count > 0:
-                p = count / total_claims
-                entropy -= p * math.log2(p)
+        entropy = shannon_entropy(combined_batch(simulation_data).stance_counts)
 
         # Normalize to 0-1 range (max log2(5) = 2.32 for 5 stances)
-        max_entropy = math.log2(5) if stance_claims else 1.0
-        return self.validate_range(entropy / max_entropy)
+        return self.validate_range(entropy / math.log2(5))
 
 
 class MinorityViewpointSurvivalCalculator(MetricCalculator):
@@ -159,42 +196,22 @@ class MinorityViewpointSurvivalCalculator(MetricCalculator):
 
     def calculate(self, simulation_data: Dict[str, Any]) -> float:
         """Calculate if minority viewpoints are preserved."""
-        rounds = simulation_data["rounds"]
         domain_minority_threshold = 0.15  # 15% threshold for minority
 
-        # Track stance distribution by domain
-        domain_stance_dist = defaultdict(lambda: defaultdict(int))
-        total_domain_claims = defaultdict(int)
-
-        for round_data in rounds:
-            for claim in round_data.get("accepted_claims", []):
-                domain_stance_dist[claim.domain][claim.stance] += 1
-                total_domain_claims[claim.domain] += 1
-
-        # Calculate minority survival
-        minority_survival_count = 0
-        total_domains = 0
-
-        for domain, stance_counts in domain_stance_dist.items():
-            if total_domain_claims[domain] > 0:
-                total_domains += 1
-
-                # Find minority stances (those below threshold)
-                total_in_domain = total_domain_claims[domain]
-                minority_stances = [
-                    stance for stance, count in stance_counts.items()
-                    if count / total_in_domain < domain_minority_threshold
-                ]
-
-                # Minority survives if any minority stance has at least 1 claim
-                minority_survival_count += len([
-                    s for s in minority_stances
-                    if stance_counts[s] >= 1
-                ])
+        # Stance distribution by domain, for domains with any claims
+        domain_stance = combined_batch(simulation_data).domain_stance_counts
+        totals = domain_stance.sum(axis=1)
+        domain_stance = domain_stance[totals > 0]
+        totals = totals[totals > 0]
 
+        total_domains = len(totals)
         if total_domains == 0:
             return 0.0
 
+        # Minority stances: present, but below the threshold share of their domain
+        shares = domain_stance / totals[:, None]
+        minority_survival_count = int(((domain_stance >= 1) & (shares < domain_minority_threshold)).sum())
+
         # Return ratio of domains with preserved minority viewpoints
         return self.validate_range(minority_survival_count / total_domains)
 
@@ -204,33 +221,17 @@ class ContradictionRetentionCalculator(MetricCalculator):
 
     def calculate(self, simulation_data: Dict[str, Any]) -> float:
         """Calculate rate of legitimate contradictions in accepted claims."""
-        rounds = simulation_data["rounds"]
         contradiction_claims = 0
         total_claims = 0
 
-        # Define contradictory stance pairs
-        contradiction_pairs = [
-            (Stance.SUPPORT, Stance.OPPOSE),
-            (Stance.SUPPORT, Stance.CONDITIONAL),
-            (Stance.OPPOSE, Stance.CONDITIONAL),
-        ]
-
-        for round_data in rounds:
-            for claim in round_data.get("accepted_claims", []):
-                total_claims += 1
-
-                # Find contradictory claims in same domain
-                for other_claim in round_data.get("accepted_claims", []):
-                    if (claim.domain == other_claim.domain and
-                        claim.claim_id != other_claim.claim_id):
-
-                        # Check if stances are contradictory
-                        stance_pair = (claim.stance, other_claim.stance)
-                        reverse_pair = (other_claim.stance, claim.stance)
+        for batch in round_batches(simulation_data):
+            total_claims += len(batch)
 
-                        if stance_pair in contradiction_pairs or reverse_pair in contradiction_pairs:
-                            contradiction_claims += 1
-                            break
+            # A claim is contradicted if its domain holds any claim of a
+            # contradictory stance in the same round
+            domain_stance = batch.domain_stance_counts
+            contradicted = (domain_stance @ CONTRADICTION_MASK.T) > 0
+            contradiction_claims += int(domain_stance[contradicted].sum())
 
         if total_claims == 0:
             return 0.0
@@ -280,21 +281,14 @@ class GiniCoefficientCalculator(MetricCalculator):
 
     def calculate(self, simulation_data: Dict[str, Any]) -> float:
         """Calculate Gini coefficient of node influence."""
-        rounds = simulation_data["rounds"]
-        node_influence = defaultdict(int)
-        total_influence = 0
-
-        # Calculate influence from accepted claims
-        for round_data in rounds:
-            for claim in round_data.get("accepted_claims", []):
-                node_influence[claim.source_node_id] += 1
-                total_influence += 1
+        # Influence from accepted claims, ascending over nodes with any
+        sorted_influences = combined_batch(simulation_data).active_node_counts.tolist()
+        total_influence = sum(sorted_influences)
 
         if total_influence == 0:
             return 0.0
 
         # Calculate Gini coefficient
-        sorted_influences = sorted(node_influence.values())
         n = len(sorted_influences)
 
         if n == 1:
@@ -315,25 +309,8 @@ class HerfindahlIndexCalculator(MetricCalculator):
 
     def calculate(self, simulation_data: Dict[str, Any]) -> float:
         """Calculate HHI for node influence."""
-        rounds = simulation_data["rounds"]
-        node_influence = defaultdict(int)
-        total_influence = 0
-
-        # Calculate influence from accepted claims
-        for round_data in rounds:
-            for claim in round_data.get("accepted_claims", []):
-                node_influence[claim.source_node_id] += 1
-                total_influence += 1
-
-        if total_influence == 0:
-            return 0.0
-
-        # Calculate HHI
-        hhi = 0.0
-        for influence in node_influence.values():
-            share = influence / total_influence
-            hhi += share * share
-
+        # Influence from accepted claims
+        hhi = herfindahl_index(combined_batch(simulation_data).node_counts)
         return self.validate_range(hhi)
 
 
@@ -342,22 +319,9 @@ class TopNodeConcentrationCalculator(MetricCalculator):
 
     def calculate(self, simulation_data: Dict[str, Any]) -> float:
         """Calculate share of influence from top node."""
-        rounds = simulation_data["rounds"]
-        node_influence = defaultdict(int)
-
-        # Calculate influence from accepted claims
-        for round_data in rounds:
-            for claim in round_data.get("accepted_claims", []):
-                node_influence[claim.source_node_id] += 1
-
-        if not node_influence:
-            return 0.0
-
-        # Find top node's share
-        max_influence = max(node_influence.values())
-        total_influence = sum(node_influence.values())
-
-        return self.validate_range(max_influence / total_influence if total_influence > 0 else 0.0)
+        # Influence from accepted claims
+        top_1_share, _ = top_shares(combined_batch(simulation_data).node_counts)
+        return self.validate_range(top_1_share)
 
 
 class DomainLeadershipBalanceCalculator(MetricCalculator):
@@ -365,30 +329,18 @@ class DomainLeadershipBalanceCalculator(MetricCalculator):
 
     def calculate(self, simulation_data: Dict[str, Any]) -> float:
         """Calculate balance of domain leadership across nodes."""
-        rounds = simulation_data["rounds"]
-        domain_leadership = defaultdict(lambda: defaultdict(int))
+        # Claims by domain and node, for domains with any claims
+        domain_nodes = combined_batch(simulation_data).domain_node_counts
+        totals = domain_nodes.sum(axis=1)
+        domain_nodes = domain_nodes[totals > 0]
+        totals = totals[totals > 0]
 
-        # Track claims by domain and node
-        for round_data in rounds:
-            for claim in round_data.get("accepted_claims", []):
-                domain_leadership[claim.domain][claim.source_node_id] += 1
-
-        # Calculate HHI for each domain and average
-        hhi_scores = []
-        for domain, node_claims in domain_leadership.items():
-            total_domain_claims = sum(node_claims.values())
-            if total_domain_claims > 0:
-                domain_hhi = 0.0
-                for claims in node_claims.values():
-                    share = claims / total_domain_claims
-                    domain_hhi += share * share
-                hhi_scores.append(domain_hhi)
-
-        if not hhi_scores:
+        if len(totals) == 0:
             return 1.0  # Perfect balance if no data
 
-        # Average HHI across domains (lower = more balanced)
-        avg_hhi = sum(hhi_scores) / len(hhi_scores)
+        # HHI for each domain, averaged (lower = more balanced)
+        shares = domain_nodes / totals[:, None]
+        avg_hhi = float((shares * shares).sum(axis=1).mean())
         return 1.0 - self.validate_range(avg_hhi)  # Invert so higher = more balanced
 
 
@@ -433,31 +385,19 @@ class TrustDriftCalculator(MetricCalculator):
 
     def calculate(self, simulation_data: Dict[str, Any]) -> float:
         """Calculate average trust drift across all nodes."""
-        rounds = simulation_data["rounds"]
-        total_drift = 0
-        node_drifts = defaultdict(list)
+        # Trust history per node (columns), over rounds (rows)
+        trust = trust_matrix(simulation_data)
+        observed = ~np.isnan(trust)
+        tracked = observed.sum(axis=0) > 1
 
-        # Track trust changes over rounds
-        for round_data in rounds:
-            for node_id, trust_score in round_data.get("node_trust_scores", {}).items():
-                node_drifts[node_id].append(trust_score)
-
-        # Calculate drift for each node
-        drift_sum = 0
-        drift_count = 0
-
-        for node_id, trust_history in node_drifts.items():
-            if len(trust_history) > 1:
-                first_trust = trust_history[0]
-                last_trust = trust_history[-1]
-                drift = abs(last_trust - first_trust)
-                drift_sum += drift
-                drift_count += 1
-
-        if drift_count == 0:
+        if not tracked.any():
             return 1.0  # No drift = stable
 
-        avg_drift = drift_sum / drift_count
+        # Drift between each node's first and last observation
+        columns = np.flatnonzero(tracked)
+        first = observed[:, columns].argmax(axis=0)
+        last = len(trust) - 1 - observed[::-1, columns].argmax(axis=0)
+        avg_drift = float(np.abs(trust[last, columns] - trust[first, columns]).mean())
         return 1.0 - self.validate_range(avg_drift)  # Invert so higher = more stable
 
 
@@ -466,29 +406,15 @@ class TrustVolatilityCalculator(MetricCalculator):
 
     def calculate(self, simulation_data: Dict[str, Any]) -> float:
         """Calculate trust volatility across nodes."""
-        rounds = simulation_data["rounds"]
-        node_volatility = defaultdict(list)
+        # Trust history per node (columns), over rounds (rows)
+        trust = trust_matrix(simulation_data)
+        tracked = (~np.isnan(trust)).sum(axis=0) > 1
 
-        # Track trust changes over rounds
-        for round_data in rounds:
-            for node_id, trust_score in round_data.get("node_trust_scores", {}).items():
-                node_volatility[node_id].append(trust_score)
-
-        # Calculate volatility (standard deviation) for each node
-        volatility_sum = 0
-        volatility_count = 0
-
-        for node_id, trust_history in node_volatility.items():
-            if len(trust_history) > 1:
-                trust_array = np.array(trust_history)
-                volatility = np.std(trust_array)
-                volatility_sum += volatility
-                volatility_count += 1
-
-        if volatility_count == 0:
+        if not tracked.any():
             return 1.0  # No volatility = stable
 
-        avg_volatility = volatility_sum / volatility_count
+        # Volatility (standard deviation) for each node, averaged
+        avg_volatility = float(np.nanstd(trust[:, tracked], axis=0).mean())
         return 1.0 - self.validate_range(avg_volatility)  # Invert so higher = more stable
 
 
@@ -576,22 +502,12 @@ class SpamDetectionRateCalculator(MetricCalculator):
 
     def calculate(self, simulation_data: Dict[str, Any]) -> float:
         """Calculate rate of spam claims detected and rejected."""
-        rounds = simulation_data["rounds"]
-        spam_detected = 0
-        total_spam = 0
+        processed = combined_batch(simulation_data, "processed_claims")
 
-        for round_data in rounds:
-            processed_claims = round_data.get("processed_claims", [])
-            for item in processed_claims:
-                claim = unwrap_claim(item)
-                # Check if rejected (works for both SimulatedClaim and ProcessedSimulationClaimResult)
-                is_rejected = not getattr(item, 'accepted', True)
-
-                # Assume claims with very low confidence are potential spam
-                if claim.confidence < 0.4:
-                    total_spam += 1
-                    if is_rejected:
-                        spam_detected += 1
+        # Assume claims with very low confidence are potential spam
+        spam = processed.confidence < 0.4
+        total_spam = int(spam.sum())
+        spam_detected = int((spam & ~processed.accepted).sum())
 
         if total_spam == 0:
             return 1.0  # No spam to detect = good
@@ -639,24 +555,12 @@ class FalseRejectionRateCalculator(MetricCalculator):
 
     def calculate(self, simulation_data: Dict[str, Any]) -> float:
         """Calculate rate of high-quality content incorrectly rejected."""
-        rounds = simulation_data["rounds"]
-        false_rejections = 0
-        total_high_quality = 0
-
-        for round_data in rounds:
-            processed_claims = round_data.get("processed_claims", [])
-            for item in processed_claims:
-                claim = unwrap_claim(item)
-                # Check if rejected
-                is_rejected = not getattr(item, 'accepted', True)
+        processed = combined_batch(simulation_data, "processed_claims")
 
-                quality_score = claim.confidence * claim.provenance_quality
-
-                # Consider high quality if score > 0.7
-                if quality_score > 0.7:
-                    total_high_quality += 1
-                    if is_rejected:
-                        false_rejections += 1
+        # Consider high quality if score > 0.7
+        high_quality = processed.confidence * processed.provenance_quality > 0.7
+        total_high_quality = int(high_quality.sum())
+        false_rejections = int((high_quality & ~processed.accepted).sum())
 
         if total_high_quality == 0:
             return 1.0  # No high quality content = no false rejections
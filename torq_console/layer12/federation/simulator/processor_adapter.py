@@ -7,7 +7,6 @@ Adapter layer that converts simulated claims into real federation processor
 requests and normalizes responses back into simulator-friendly results.
 """
 
-import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -203,54 +202,132 @@ class ProcessorAdapter:
                 force_accept=False,
             )
 
-            # Calculate latency
-            latency_ms = (
-                processing_result.processing_completed_at -
-                processing_result.processing_started_at
-            ).total_seconds() * 1000
-
-            # Extract safeguard results
-            safeguard_events = self._extract_safeguard_events(processing_result)
-
-            # Build normalized result
-            result = ProcessedSimulationClaimResult(
-                claim=sim_claim,
-                accepted=(processing_result.status == "accepted"),
-                status=processing_result.status,
-                rejection_reason=self._extract_rejection_reason(processing_result),
-                eligibility_decision=self._extract_eligibility_decision(processing_result),
-                similarity_risk=self._extract_similarity_risk(processing_result),
-                plurality_flags=self._extract_plurality_flags(processing_result),
-                allocative_flags=self._extract_allocative_flags(processing_result),
-                trust_adjustment=self._extract_trust_adjustment(processing_result),
-                effective_trust=self._extract_effective_trust(processing_result, origin_node),
-                contradiction_detected=self._extract_contradiction_detected(processing_result),
-                processing_latency_ms=latency_ms,
-                safeguard_events=safeguard_events,
-            )
+            return self._normalize_result(sim_claim, origin_node, processing_result)
 
-            self.logger.debug(
-                f"Claim {sim_claim.claim_id} processed: {result.status} "
-                f"(latency: {latency_ms:.2f}ms)"
-            )
+        except Exception as e:
+            return self._error_result(sim_claim, started_at, e)
+
+    async def process_simulated_claims(
+        self,
+        claims: List[tuple[SimulatedClaim, Union[SimulatedNode, 'SimulatedNetworkNode']]],
+        round_context: Optional[Dict[str, Any]] = None,
+    ) -> List[ProcessedSimulationClaimResult]:
+        """
+        Process simulated claims through the processor's batch API.
 
-            return result
+        Results match calling process_simulated_claim on each claim in
+        order; see InboundFederatedClaimProcessor.process_claims.
 
-        except Exception as e:
-            self.logger.error(
-                f"Error processing claim {sim_claim.claim_id}: {e}",
-                exc_info=True
-            )
-            return ProcessedSimulationClaimResult(
-                claim=sim_claim,
-                accepted=False,
-                status="error",
-                rejection_reason=f"Processing error: {str(e)}",
-                processing_latency_ms=(
-                    datetime.utcnow() - started_at
-                ).total_seconds() * 1000,
-                error=str(e),
+        Args:
+            claims: List of (claim, origin node) tuples
+            round_context: Optional round/simulation context
+
+        Returns:
+            ProcessedSimulationClaimResult per claim, in input order
+        """
+        round_num = round_context.get("round_num", 0) if round_context else 0
+        scenario_name = round_context.get("scenario_name", "unknown") if round_context else "unknown"
+
+        started_at = datetime.utcnow()
+        results: List[Optional[ProcessedSimulationClaimResult]] = [None] * len(claims)
+        envelopes = []
+        positions = []
+
+        for i, (sim_claim, origin_node) in enumerate(claims):
+            try:
+                envelopes.append(self._build_processor_request(
+                    sim_claim=sim_claim,
+                    origin_node=origin_node,
+                    round_num=round_num,
+                    scenario_name=scenario_name,
+                ))
+                positions.append(i)
+            except Exception as e:
+                results[i] = self._error_result(sim_claim, started_at, e)
+
+        try:
+            processing_results = await self.processor.process_claims(
+                envelopes,
+                skip_replay_check=False,
+                skip_duplicate_check=False,
+                force_accept=False,
             )
+        except Exception as e:
+            processing_results = [e] * len(envelopes)
+
+        for i, processing_result in zip(positions, processing_results):
+            sim_claim, origin_node = claims[i]
+            if isinstance(processing_result, Exception):
+                results[i] = self._error_result(sim_claim, started_at, processing_result)
+                continue
+            try:
+                results[i] = self._normalize_result(sim_claim, origin_node, processing_result)
+            except Exception as e:
+                results[i] = self._error_result(sim_claim, started_at, e)
+
+        return results
+
+    def _normalize_result(
+        self,
+        sim_claim: SimulatedClaim,
+        origin_node: Union[SimulatedNode, 'SimulatedNetworkNode'],
+        processing_result: Any,
+    ) -> ProcessedSimulationClaimResult:
+        """Convert a ClaimProcessingResult into a ProcessedSimulationClaimResult."""
+        # Calculate latency
+        latency_ms = (
+            processing_result.processing_completed_at -
+            processing_result.processing_started_at
+        ).total_seconds() * 1000
+
+        # Extract safeguard results
+        safeguard_events = self._extract_safeguard_events(processing_result)
+
+        # Build normalized result
+        result = ProcessedSimulationClaimResult(
+            claim=sim_claim,
+            accepted=(processing_result.status == "accepted"),
+            status=processing_result.status,
+            rejection_reason=self._extract_rejection_reason(processing_result),
+            eligibility_decision=self._extract_eligibility_decision(processing_result),
+            similarity_risk=self._extract_similarity_risk(processing_result),
+            plurality_flags=self._extract_plurality_flags(processing_result),
+            allocative_flags=self._extract_allocative_flags(processing_result),
+            trust_adjustment=self._extract_trust_adjustment(processing_result),
+            effective_trust=self._extract_effective_trust(processing_result, origin_node),
+            contradiction_detected=self._extract_contradiction_detected(processing_result),
+            processing_latency_ms=latency_ms,
+            safeguard_events=safeguard_events,
+        )
+
+        self.logger.debug(
+            f"Claim {sim_claim.claim_id} processed: {result.status} "
+            f"(latency: {latency_ms:.2f}ms)"
+        )
+
+        return result
+
+    def _error_result(
+        self,
+        sim_claim: SimulatedClaim,
+        started_at: datetime,
+        error: Exception,
+    ) -> ProcessedSimulationClaimResult:
+        """Result for a claim that could not be processed."""
+        self.logger.error(
+            f"Error processing claim {sim_claim.claim_id}: {error}",
+            exc_info=error,
+        )
+        return ProcessedSimulationClaimResult(
+            claim=sim_claim,
+            accepted=False,
+            status="error",
+            rejection_reason=f"Processing error: {str(error)}",
+            processing_latency_ms=(
+                datetime.utcnow() - started_at
+            ).total_seconds() * 1000,
+            error=str(error),
+        )
 
     def _build_processor_request(
         self,
@@ -291,7 +368,7 @@ class ProcessorAdapter:
                 "stance": stance_str,
                 "round": round_num,
                 "scenario": scenario_name,
-                "adversarial_mode": getattr(origin_node.behavior_profile, 'adversarial_mode', None) or "none",
+                "adversarial_mode": getattr(self._node_profile(origin_node), 'adversarial_mode', None) or "none",
                 "quality_level": getattr(sim_claim, 'quality_level', 'medium'),
             },
             tags=[domain_str, stance_str, scenario_name],
@@ -334,6 +411,11 @@ class ProcessorAdapter:
 
         return envelope
 
+    @staticmethod
+    def _node_profile(node: Union[SimulatedNode, 'SimulatedNetworkNode']) -> Any:
+        """Behavior profile of either node type (Phase 2B: behavior_profile, Phase 2A: profile)."""
+        return getattr(node, 'behavior_profile', None) or getattr(node, 'profile', None)
+
     def _extract_safeguard_events(
         self,
         processing_result: Any,
@@ -452,7 +534,7 @@ async def process_claims_batch(
     round_context: Optional[Dict[str, Any]] = None,
 ) -> List[ProcessedSimulationClaimResult]:
     """
-    Process a batch of claims concurrently.
+    Process a batch of claims through the processor's batch API.
 
     Args:
         adapter: The processor adapter
@@ -462,28 +544,4 @@ async def process_claims_batch(
     Returns:
         List of processed results in same order as input
     """
-    tasks = [
-        adapter.process_simulated_claim(claim, node, round_context)
-        for claim, node in claims
-    ]
-
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Handle any exceptions that occurred
-    processed_results = []
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            claim, node = claims[i]
-            processed_results.append(
-                ProcessedSimulationClaimResult(
-                    claim=claim,
-                    accepted=False,
-                    status="error",
-                    rejection_reason=f"Exception during processing: {str(result)}",
-                    error=str(result),
-                )
-            )
-        else:
-            processed_results.append(result)
-
-    return processed_results
+    return await adapter.process_simulated_claims(claims, round_context)
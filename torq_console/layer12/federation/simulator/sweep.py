@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Parallel Scenario Sweeps for Federation Simulator
+
+Layer 12 Phase 2A — Federation Stability Validation Harness
+
+Runs the cross product of scenarios x seeds x safeguard configurations
+through AsyncFederationSimulationExecutor on a process pool. Each run is
+seeded from (scenario, seed), so its report does not depend on which
+worker ran it or in what order. Completed runs are appended to a JSONL
+file as they finish; re-running the same sweep against that file skips
+them, so an interrupted sweep resumes where it stopped. At the end the
+per-run metrics are aggregated into distributions per (scenario,
+safeguard configuration).
+
+Example:
+    python -m torq_console.layer12.federation.simulator.sweep \\
+        --scenarios all --seeds 0-99 --safeguards simulation production \\
+        --workers 8 --output sweep.jsonl
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .executor_async import create_async_executor
+from .models import SimulationReport
+from .scenarios import SCENARIO_REGISTRY, get_scenario
+
+logger = logging.getLogger(__name__)
+
+
+# Executor keyword arguments per named safeguard configuration
+SAFEGUARD_CONFIGS: Dict[str, Dict[str, bool]] = {
+    # Eligibility filter only, with permissive thresholds (the simulator default)
+    "simulation": {"simulation_mode": True, "enable_all_safeguards": True},
+    # All safeguard engines at production thresholds
+    "production": {"simulation_mode": False, "enable_all_safeguards": True},
+    # No safeguard engines
+    "none": {"simulation_mode": False, "enable_all_safeguards": False},
+}
+
+# SimulationMetrics fields recorded per run and aggregated across runs
+METRIC_FIELDS = (
+    "overall_health_index",
+    "diversity_health",
+    "influence_balance",
+    "trust_stability",
+    "quality_integrity",
+    "resilience",
+    "topic_entropy",
+    "stance_entropy",
+    "gini_coefficient",
+    "herfindahl_index",
+    "average_trust_drift",
+    "trust_volatility",
+    "acceptance_rate",
+    "rejection_rate",
+    "spam_detected_rate",
+    "duplicate_suppression_rate",
+)
+
+
+# ============================================================================
+# Sweep Runs
+# ============================================================================
+
+@dataclass(frozen=True)
+class SweepRun:
+    """One (scenario, seed, safeguard configuration) simulation."""
+
+    scenario: str
+    seed: int
+    safeguards: str = "simulation"
+
+    @property
+    def run_id(self) -> str:
+        return f"{self.scenario}/{self.safeguards}/seed={self.seed}"
+
+    @property
+    def rng_seed(self) -> int:
+        """
+        Seed for the simulator's RNGs.
+
+        Derived from scenario and seed only, so every safeguard
+        configuration of the same run starts from the same random stream
+        and differences between configurations are not sampling noise.
+        """
+        digest = hashlib.sha256(f"{self.scenario}:{self.seed}".encode()).digest()
+        return int.from_bytes(digest[:4], "big")
+
+
+def build_sweep(
+    scenarios: Iterable[str],
+    seeds: Iterable[int],
+    safeguards: Iterable[str] = ("simulation",),
+) -> List[SweepRun]:
+    """
+    Cross product of scenarios, seeds and safeguard configurations.
+
+    Raises:
+        ValueError: If a scenario or safeguard configuration is unknown
+    """
+    scenarios, seeds, safeguards = list(scenarios), list(seeds), list(safeguards)
+    for name in scenarios:
+        if name not in SCENARIO_REGISTRY:
+            raise ValueError(f"Unknown scenario: {name}. Available: {list(SCENARIO_REGISTRY.keys())}")
+    for name in safeguards:
+        if name not in SAFEGUARD_CONFIGS:
+            raise ValueError(f"Unknown safeguard config: {name}. Available: {list(SAFEGUARD_CONFIGS.keys())}")
+
+    return [
+        SweepRun(scenario=scenario, seed=seed, safeguards=config)
+        for scenario in scenarios
+        for config in safeguards
+        for seed in seeds
+    ]
+
+
+# ============================================================================
+# Worker Side
+# ============================================================================
+
+def report_record(run: SweepRun, report: SimulationReport) -> Dict[str, Any]:
+    """JSON-serialisable summary of a report (round data is not kept)."""
+    predictive = {}
+    if report.eddr_result is not None:
+        predictive["eddr"] = report.eddr_result.eddr
+    if report.aca_result is not None:
+        predictive["aca"] = report.aca_result.aca
+    if report.fcri_result is not None:
+        predictive["fcri"] = report.fcri_result.fcri
+        predictive["fcri_status"] = str(report.fcri_result.status)
+        predictive["primary_driver"] = report.fcri_result.primary_driver
+
+    return {
+        "run_id": run.run_id,
+        "scenario": run.scenario,
+        "seed": run.seed,
+        "safeguards": run.safeguards,
+        "status": "ok",
+        "success_rate": report.success_rate,
+        "execution_time_seconds": report.execution_time.total_seconds(),
+        "metrics": {name: getattr(report.metrics, name) for name in METRIC_FIELDS},
+        "predictive_metrics": predictive,
+        "safeguard_triggers": dict(report.guardian_triggers_detected),
+        "failure_points": list(report.failure_points),
+    }
+
+
+def execute_run(run: SweepRun) -> Dict[str, Any]:
+    """
+    Run one simulation in this process and summarise it.
+
+    A fresh executor is built per run so processor state (identity
+    registrations, rate limits, duplicate caches) never carries over.
+    Failures are returned as ``status: "error"`` records, not raised.
+    """
+    random.seed(run.rng_seed)
+    np.random.seed(run.rng_seed)
+    try:
+        executor = create_async_executor(**SAFEGUARD_CONFIGS[run.safeguards])
+        report = asyncio.run(executor.run_simulation(get_scenario(run.scenario)))
+        return report_record(run, report)
+    except Exception as e:
+        return {
+            "run_id": run.run_id,
+            "scenario": run.scenario,
+            "seed": run.seed,
+            "safeguards": run.safeguards,
+            "status": "error",
+            "error": f"{type(e).__name__}: {e}",
+            "traceback": traceback.format_exc(),
+        }
+
+
+def _execute_chunk(runs: Sequence[SweepRun]) -> List[Dict[str, Any]]:
+    """Pool task: several runs per submission to amortise IPC."""
+    return [execute_run(run) for run in runs]
+
+
+def _init_worker(log_level: int) -> None:
+    logging.getLogger("torq_console").setLevel(log_level)
+
+
+# ============================================================================
+# Results File
+# ============================================================================
+
+def load_records(path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Latest record per run_id in a sweep JSONL file.
+
+    A partially written last line (from an interrupted sweep) is ignored.
+    """
+    records: Dict[str, Dict[str, Any]] = {}
+    if not path.exists():
+        return records
+    with open(path) as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping unreadable line {line_num} in {path}")
+                continue
+            records[record["run_id"]] = record
+    return records
+
+
+def _drop_partial_line(path: Path) -> None:
+    """Truncate an unterminated last line so appended records start on a new line."""
+    if not path.exists():
+        return
+    with open(path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+
+def _percentile_summary(values: List[float]) -> Dict[str, float]:
+    arr = np.asarray(values, dtype=np.float64)
+    p05, p50, p95 = np.percentile(arr, [5, 50, 95])
+    return {
+        "n": int(arr.size),
+        "mean": float(arr.mean()),
+        "std": float(arr.std()),
+        "min": float(arr.min()),
+        "p05": float(p05),
+        "median": float(p50),
+        "p95": float(p95),
+        "max": float(arr.max()),
+    }
+
+
+def aggregate_records(records: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Metric distributions per (scenario, safeguard configuration).
+
+    Returns:
+        ``{"<scenario>/<safeguards>": {"runs": n, "errors": n,
+        "metrics": {metric: {n, mean, std, min, p05, median, p95, max}},
+        "fcri_status": {status: count}}}``
+    """
+    groups: Dict[str, Dict[str, Any]] = {}
+    samples: Dict[str, Dict[str, List[float]]] = {}
+
+    for record in records:
+        key = f"{record['scenario']}/{record['safeguards']}"
+        group = groups.setdefault(key, {"runs": 0, "errors": 0, "metrics": {}, "fcri_status": {}})
+        if record.get("status") != "ok":
+            group["errors"] += 1
+            continue
+        group["runs"] += 1
+
+        values = samples.setdefault(key, {})
+        flat = dict(record["metrics"])
+        flat["success_rate"] = record["success_rate"]
+        for name in ("eddr", "aca", "fcri"):
+            if name in record["predictive_metrics"]:
+                flat[name] = record["predictive_metrics"][name]
+        for name, value in flat.items():
+            values.setdefault(name, []).append(value)
+
+        status = record["predictive_metrics"].get("fcri_status")
+        if status is not None:
+            group["fcri_status"][status] = group["fcri_status"].get(status, 0) + 1
+
+    for key, values in samples.items():
+        groups[key]["metrics"] = {name: _percentile_summary(v) for name, v in values.items()}
+    return dict(sorted(groups.items()))
+
+
+# ============================================================================
+# Sweep Runner
+# ============================================================================
+
+@dataclass
+class SweepResult:
+    """Outcome of run_sweep."""
+
+    output_path: Path
+    total_runs: int
+    completed: int = 0  # Finished in this invocation
+    skipped: int = 0  # Already in the results file
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+    aggregates: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def runs_per_second(self) -> float:
+        return self.completed / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+def run_sweep(
+    runs: Sequence[SweepRun],
+    output_path: Path,
+    max_workers: Optional[int] = None,
+    chunksize: int = 1,
+    resume: bool = True,
+    worker_log_level: int = logging.WARNING,
+    progress_callback: Optional[Callable[[Dict[str, Any], int, int], None]] = None,
+) -> SweepResult:
+    """
+    Run a sweep on a process pool, streaming records to ``output_path``.
+
+    Args:
+        runs: Runs to execute (see build_sweep)
+        output_path: JSONL results file; one record per finished run
+        max_workers: Worker processes (default: os.cpu_count()); 1 runs in-process
+        chunksize: Runs per pool task; raise it when single runs are
+            short enough that IPC overhead shows (records are written per task)
+        resume: Skip runs that already have an "ok" record in output_path;
+            if False, output_path is truncated first
+        worker_log_level: Log level for torq_console loggers in workers
+        progress_callback: Called with (record, done, total) as runs finish
+
+    Returns:
+        SweepResult with counts and aggregates over every "ok" record
+        in the file for the requested runs
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+
+    if resume:
+        existing = load_records(output_path)
+        _drop_partial_line(output_path)
+    else:
+        output_path.write_text("")
+        existing = {}
+
+    done_ids = {run_id for run_id, record in existing.items() if record.get("status") == "ok"}
+    pending = [run for run in runs if run.run_id not in done_ids]
+    result = SweepResult(output_path=output_path, total_runs=len(runs), skipped=len(runs) - len(pending))
+    workers = max_workers or os.cpu_count() or 1
+
+    logger.info(
+        f"Sweep: {len(runs)} runs, {result.skipped} already done, "
+        f"{len(pending)} to run on {min(workers, max(1, len(pending)))} workers"
+    )
+
+    with open(output_path, "a") as out:
+        def record_done(record: Dict[str, Any]) -> None:
+            # One line per run, flushed so an interrupted sweep keeps its finished runs
+            out.write(json.dumps(record, default=str) + "\n")
+            out.flush()
+            existing[record["run_id"]] = record
+            if record["status"] == "ok":
+                result.completed += 1
+            else:
+                result.failed += 1
+                logger.warning(f"Run {record['run_id']} failed: {record['error']}")
+            if progress_callback:
+                progress_callback(record, result.skipped + result.completed + result.failed, result.total_runs)
+
+        if workers == 1 or len(pending) <= 1:
+            _init_worker(worker_log_level)
+            for run in pending:
+                record_done(execute_run(run))
+        else:
+            chunks = [pending[i:i + chunksize] for i in range(0, len(pending), chunksize)]
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(chunks)),
+                initializer=_init_worker,
+                initargs=(worker_log_level,),
+            ) as pool:
+                futures = [pool.submit(_execute_chunk, chunk) for chunk in chunks]
+                for future in as_completed(futures):
+                    for record in future.result():
+                        record_done(record)
+
+    result.elapsed_seconds = time.perf_counter() - start
+    requested = {run.run_id for run in runs}
+    result.aggregates = aggregate_records(
+        record for run_id, record in existing.items() if run_id in requested
+    )
+    return result
+
+
+# ============================================================================
+# Command Line
+# ============================================================================
+
+def parse_seeds(values: Sequence[str]) -> List[int]:
+    """Seeds from values like ``7`` or ``0-99`` (inclusive ranges)."""
+    seeds: List[int] = []
+    for value in values:
+        if "-" in value.lstrip("-"):
+            low, high = value.split("-", 1)
+            seeds.extend(range(int(low), int(high) + 1))
+        else:
+            seeds.append(int(value))
+    return seeds
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="TORQ Federation Simulation Sweep Runner")
+    parser.add_argument("--scenarios", nargs="+", default=["all"],
+                        help="Scenario names, or 'all' (default: all)")
+    parser.add_argument("--seeds", nargs="+", default=["0-9"],
+                        help="Seeds and inclusive ranges, e.g. 0-99 200 (default: 0-9)")
+    parser.add_argument("--safeguards", nargs="+", default=["simulation"],
+                        choices=list(SAFEGUARD_CONFIGS.keys()),
+                        help="Safeguard configurations (default: simulation)")
+    parser.add_argument("--workers", "-w", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=1, help="Runs per pool task (default: 1)")
+    parser.add_argument("--output", "-o", default="sweep_results.jsonl", help="JSONL results file")
+    parser.add_argument("--summary-file", default=None,
+                        help="Aggregate summary file (default: <output>.summary.json)")
+    parser.add_argument("--no-resume", action="store_true",
+                        help="Discard existing results in --output instead of resuming")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print each finished run")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    logging.getLogger("torq_console.layer12").setLevel(logging.WARNING)
+    logger.setLevel(logging.INFO)
+
+    scenarios = list(SCENARIO_REGISTRY.keys()) if args.scenarios == ["all"] else args.scenarios
+    runs = build_sweep(scenarios, parse_seeds(args.seeds), args.safeguards)
+
+    def progress(record, done, total):
+        if args.verbose or record["status"] != "ok":
+            health = record.get("metrics", {}).get("overall_health_index")
+            detail = f"HI: {health:.3f}" if health is not None else record.get("error")
+            print(f"[{done}/{total}] {record['run_id']}: {detail}")
+
+    result = run_sweep(
+        runs,
+        Path(args.output),
+        max_workers=args.workers,
+        chunksize=args.chunksize,
+        resume=not args.no_resume,
+        progress_callback=progress,
+    )
+
+    print("\n" + "=" * 80)
+    print("SWEEP SUMMARY")
+    print("=" * 80)
+    print(f"Runs: {result.total_runs} ({result.completed} run, {result.skipped} resumed, {result.failed} failed)")
+    print(f"Elapsed: {result.elapsed_seconds:.2f}s ({result.runs_per_second:.1f} runs/s)")
+    for key, group in result.aggregates.items():
+        health = group["metrics"].get("overall_health_index")
+        fcri = group["metrics"].get("fcri")
+        line = f"{key}: {group['runs']} runs"
+        if health:
+            line += f", HI {health['mean']:.3f} ± {health['std']:.3f} [p05 {health['p05']:.3f}, p95 {health['p95']:.3f}]"
+        if fcri:
+            line += f", FCRI median {fcri['median']:.3f}"
+        if group["errors"]:
+            line += f", {group['errors']} errors"
+        print(line)
+
+    summary_file = args.summary_file or f"{args.output}.summary.json"
+    with open(summary_file, "w") as f:
+        json.dump({"args": vars(args), "aggregates": result.aggregates}, f, indent=2)
+    print(f"\nSummary saved to: {summary_file}")
+
+
+if __name__ == "__main__":
+    main()
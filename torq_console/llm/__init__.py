@@ -9,6 +9,7 @@ This module provides:
 """
 
 from .manager import LLMManager
+from .tier_router import TierRouter
 from .providers.base import BaseLLMProvider, MockLLMProvider
 from .providers.claude import ClaudeProvider
 from .providers.deepseek import DeepSeekProvider
@@ -17,6 +18,7 @@ from .providers.glm import GLMProvider
 
 __all__ = [
     'LLMManager',
+    'TierRouter',
     'BaseLLMProvider',
     'MockLLMProvider',
     'ClaudeProvider',
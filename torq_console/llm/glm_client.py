@@ -16,6 +16,8 @@ import logging
 from typing import Optional, Dict, Any, List, AsyncIterator
 from openai import OpenAI
 
+from torq_console.core.http_pool import get_http_pool
+
 logger = logging.getLogger("TORQ.LLM.GLM")
 
 
@@ -52,10 +54,11 @@ class GLMClient:
         self.model = model
         self.base_url = base_url
 
-        # Use OpenAI SDK for Z.AI API compatibility
+        # Use OpenAI SDK for Z.AI API compatibility, over the shared connection pool
         self.client = OpenAI(
             api_key=self.api_key,
-            base_url=self.base_url
+            base_url=self.base_url,
+            http_client=get_http_pool().httpx_sync_client()
         ) if self.api_key else None
 
         logger.info(f"GLM client initialized with model: {model} at {base_url}")
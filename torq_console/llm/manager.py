@@ -8,7 +8,7 @@ to the appropriate provider based on the request type and available models.
 import os
 import asyncio
 import time
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, AsyncIterator
 import logging
 
 from .providers.deepseek import DeepSeekProvider
@@ -30,7 +30,16 @@ from torq_console.indexer.semantic_search import SemanticSearch
 # Provider Fallback Integration
 from torq_console.generation_meta import GenerationMeta, ExecutionMode
 from torq_console.ui.web_ai_fix import AIResponseError, AITimeoutError, ProviderError
-from torq_console.llm.provider_fallback import ProviderFallbackExecutor, ProviderChainConfig
+from torq_console.llm.provider_fallback import (
+    ProviderFallbackExecutor, ProviderChainConfig, ProviderAttempt, AttemptStatus, ErrorCategory
+)
+from .providers.base import STREAM_BUFFER_CHUNKS
+from .tier_router import TierRouter
+
+# Standard-tier order used when streaming falls back without a configured chain
+DEFAULT_STREAM_CHAIN = ['deepseek', 'ollama', 'claude']
+
+_STREAM_END = object()
 
 
 class LLMManager:
@@ -59,6 +68,9 @@ class LLMManager:
         self._init_llama_cpp()
         self._init_glm()
 
+        # Latency-aware tier routing for chat_with_routing()
+        self.tier_router = TierRouter()
+
         # Session 3: Initialize codebase indexer (optional)
         self.semantic_search = None
         self._init_codebase_indexer()
@@ -256,9 +268,15 @@ class LLMManager:
             self.logger.info(f"Initializing codebase indexer for: {codebase_path}")
 
             # Initialize semantic search with auto-indexing disabled (will index on first search)
+            # Vector index type: flat (exact) or an ANN backend for large repos
+            index_type = self.config.get(
+                'codebase_index_type', os.getenv('CODEBASE_INDEX_TYPE', 'flat')
+            )
+
             self.semantic_search = SemanticSearch(
                 codebase_path=codebase_path,
-                auto_index=False
+                auto_index=False,
+                index_type=index_type
             )
 
             self.logger.info(f"Codebase indexer initialized successfully for {codebase_path}")
@@ -418,6 +436,201 @@ class LLMManager:
             self.logger.error(f"Chat failed with provider {provider_name}: {e}")
             return f"I apologize, but I encountered an error: {e}"
 
+    async def stream_chat(
+        self,
+        provider_name: str,
+        messages: List[Dict[str, str]],
+        system_message: Optional[str] = None,
+        use_fallback: bool = True,
+        first_chunk_timeout: Optional[float] = None,
+        max_buffer: int = STREAM_BUFFER_CHUNKS,
+        meta: Optional[GenerationMeta] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat response as text chunks.
+
+        The provider stream runs in a producer task that may read at most
+        ``max_buffer`` chunks ahead of the caller (backpressure). Closing
+        the iterator or cancelling the consuming task cancels the producer
+        and with it the provider request. If a provider fails before its
+        first chunk the next provider in the chain is tried; once text has
+        been yielded a failure is raised to the caller, since a response
+        cannot be spliced from two models. Content policy errors never
+        fall back.
+
+        Args:
+            provider_name: Name of the provider to try first
+            messages: Conversation history
+            system_message: Optional system message
+            use_fallback: Try further providers if this one fails to start
+            first_chunk_timeout: Seconds to wait for a provider's first chunk
+            max_buffer: Chunks the provider may run ahead of the caller
+            meta: Optional GenerationMeta to populate with attempts
+            **kwargs: Additional parameters for the provider
+
+        Yields:
+            Response text chunks
+
+        Raises:
+            AIResponseError: Non-retryable error, or a failure mid-stream
+            ProviderError: No provider could start streaming
+        """
+        chain = self._stream_chain(provider_name, use_fallback)
+        if not chain:
+            raise ProviderError(f"Provider '{provider_name}' not available")
+
+        if meta is not None:
+            meta.provider_attempts = []
+        last_error: Optional[Exception] = None
+
+        for name in chain:
+            provider = self.providers[name]
+            attempt = ProviderAttempt(provider=name, model=getattr(provider, 'model', 'unknown'))
+            queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffer)
+            producer = asyncio.create_task(
+                self._pump_stream(provider, messages, system_message, queue, kwargs)
+            )
+            t0 = time.time()
+            started = False
+
+            try:
+                while True:
+                    if started or first_chunk_timeout is None:
+                        item = await queue.get()
+                    else:
+                        try:
+                            item = await asyncio.wait_for(queue.get(), first_chunk_timeout)
+                        except asyncio.TimeoutError:
+                            raise AITimeoutError(
+                                f"No output from {name} within {first_chunk_timeout}s"
+                            )
+                    if item is _STREAM_END:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    if not started:
+                        started = True
+                        self.logger.info(
+                            f"Streaming from {name}: first chunk after {int((time.time() - t0) * 1000)}ms"
+                        )
+                    yield item
+
+            except Exception as e:
+                attempt.latency_ms = int((time.time() - t0) * 1000)
+                attempt.error_category = self._stream_error_category(e)
+                attempt.error_code = getattr(e, 'code', None) or type(e).__name__
+                self._record_stream_attempt(meta, attempt)
+
+                if started or attempt.error_category == ErrorCategory.AI_ERROR:
+                    raise
+                self.logger.warning(f"Stream from {name} failed before first chunk: {e}")
+                last_error = e
+                continue
+
+            finally:
+                if not producer.done():
+                    producer.cancel()
+                    try:
+                        await producer
+                    except asyncio.CancelledError:
+                        pass
+
+            attempt.status = AttemptStatus.SUCCESS
+            attempt.latency_ms = int((time.time() - t0) * 1000)
+            self._record_stream_attempt(meta, attempt)
+            if meta is not None:
+                meta.provider = name
+                meta.model = attempt.model
+                meta.latency_ms = attempt.latency_ms
+            return
+
+        raise ProviderError(
+            f"All providers failed to stream. Last error: {last_error}", cause=last_error
+        ) from last_error
+
+    async def stream_query(self, provider_name: str, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream the response to a single prompt (see stream_chat()).
+
+        Args:
+            provider_name: Name of the provider to try first
+            prompt: The query prompt
+            **kwargs: Additional parameters for stream_chat()
+
+        Yields:
+            Response text chunks
+        """
+        async for chunk in self.stream_chat(
+            provider_name, [{"role": "user", "content": prompt}], **kwargs
+        ):
+            yield chunk
+
+    def _stream_chain(self, provider_name: str, use_fallback: bool) -> List[str]:
+        """Registered providers to try for a stream, requested one first."""
+        first = self.provider_aliases.get(provider_name, provider_name)
+        chain = [first]
+        if use_fallback:
+            if self.fallback_executor is not None:
+                chain += self.fallback_executor.chain_config.direct_chain
+            else:
+                chain += DEFAULT_STREAM_CHAIN
+
+        resolved = []
+        for name in chain:
+            name = self.provider_aliases.get(name, name)
+            if name in self.providers and name not in resolved:
+                resolved.append(name)
+        return resolved
+
+    async def _pump_stream(
+        self,
+        provider: Any,
+        messages: List[Dict[str, str]],
+        system_message: Optional[str],
+        queue: asyncio.Queue,
+        kwargs: Dict[str, Any]
+    ) -> None:
+        """Feed a provider's chunks into a bounded queue, ending with a sentinel or the error."""
+        try:
+            if hasattr(provider, 'stream_chat'):
+                async for chunk in provider.stream_chat(messages, system_message, **kwargs):
+                    if chunk:
+                        await queue.put(chunk)
+            else:
+                # Providers without streaming answer in one chunk
+                await queue.put(await provider.chat(messages, system_message, **kwargs))
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_STREAM_END)
+
+    @staticmethod
+    def _stream_error_category(error: Exception) -> ErrorCategory:
+        """Error category of a failed stream, mirroring the fallback executor."""
+        if isinstance(error, AITimeoutError):
+            return ErrorCategory.TIMEOUT
+        if isinstance(error, ProviderError):
+            return ErrorCategory.PROVIDER_ERROR
+        if isinstance(error, AIResponseError):
+            return ErrorCategory.AI_ERROR
+        return ErrorCategory.EXCEPTION
+
+    @staticmethod
+    def _record_stream_attempt(meta: Optional[GenerationMeta], attempt: ProviderAttempt) -> None:
+        """Append an attempt to the metadata, if the caller asked for it."""
+        if meta is None:
+            return
+        meta.provider_attempts.append(attempt.to_dict())
+        meta.fallback_used = len(meta.provider_attempts) > 1
+        if attempt.status == AttemptStatus.SUCCESS:
+            meta.error = None
+            meta.error_category = None
+        else:
+            meta.error_category = attempt.error_category.value
+            if meta.fallback_reason is None:
+                meta.fallback_reason = f"{attempt.error_category.value}:{attempt.error_code}"
+
     async def search_query(self, query: str, provider_name: Optional[str] = None) -> str:
         """
         Handle search-like queries with enhanced AI assistance.
@@ -580,113 +793,62 @@ Please provide:
             self.logger.warning(f"Cannot switch to provider '{provider_name}' - not available")
             return False
 
-    def _should_use_fast_tier(self, messages: List[Dict]) -> bool:
-        """
-        Determine if query should use fast llama.cpp tier.
-
-        Criteria:
-        - Total message content < 200 tokens
-        - Simple query patterns (search, find, list, classify, yes/no)
-        - No complex reasoning required
-
-        Args:
-            messages: List of message dicts
-
-        Returns:
-            True if fast tier should be used
-        """
-        # Calculate approximate token count
-        total_chars = sum(len(str(msg.get('content', ''))) for msg in messages)
-        approx_tokens = total_chars / 4  # Rough estimate: 1 token = 4 chars
-
-        if approx_tokens > 200:
-            return False
-
-        # Check for simple query patterns
-        last_message = messages[-1].get('content', '').lower() if messages else ''
-        simple_patterns = ['search', 'find', 'list', 'classify', 'is ', 'does ', 'can ', 'what is', 'who is']
-
-        if any(pattern in last_message for pattern in simple_patterns):
-            return True
-
-        return False
-
-    def _should_use_balanced_tier(self, messages: List[Dict]) -> bool:
-        """
-        Determine if query should use balanced llama.cpp tier.
-
-        Criteria:
-        - Total message content 200-1000 tokens
-        - Medium complexity (synthesis, summarization)
-        - Not mission-critical
-
-        Args:
-            messages: List of message dicts
-
-        Returns:
-            True if balanced tier should be used
-        """
-        total_chars = sum(len(str(msg.get('content', ''))) for msg in messages)
-        approx_tokens = total_chars / 4
-
-        if 200 <= approx_tokens <= 1000:
-            return True
-
-        return False
-
     async def chat_with_routing(
         self,
         messages: List[Dict[str, str]],
+        min_quality: Optional[int] = None,
         **kwargs
     ) -> str:
         """
-        Intelligent routing based on query complexity.
+        Latency-aware routing across provider tiers.
 
-        Routing Logic:
-        1. Fast tier (llama.cpp): Simple queries <200 tokens (target: 1-3s)
-        2. Balanced tier (llama.cpp): Medium queries 200-1000 tokens (target: 8-15s)
-        3. Standard tier (Ollama/DeepSeek): Complex queries >1000 tokens (20-40s)
-        4. Premium tier (Claude): Mission-critical or fallback
+        Routing Logic (see TierRouter):
+        1. The request needs a minimum tier quality: fast (llama.cpp) for
+           simple queries <200 tokens, balanced (llama.cpp) for 200-1000
+           tokens, standard (DeepSeek/Ollama) beyond, premium (Claude/GLM)
+           when the caller asks for it
+        2. Among providers meeting it, the one with the lowest expected
+           latency (EWMA latency, load, error rate) is used; premium leads
+           only for requests that ask for it
+        3. Premium requests are hedged with a second premium provider, and
+           requests to a tier whose p95 exceeds its deadline with premium
+        4. On failure the remaining candidates are tried in order
 
         Args:
             messages: List of message dicts with 'role' and 'content'
+            min_quality: Override the required tier quality (1-4)
             **kwargs: Additional parameters
 
         Returns:
             Response string
         """
-        # Check if fast tier available and appropriate
-        if 'llama_cpp_fast' in self.providers and self._should_use_fast_tier(messages):
-            try:
-                self.logger.info("Routing to fast tier (llama.cpp)")
-                provider = self.providers['llama_cpp_fast']
-                return await provider.complete_fast(messages, **kwargs)
-            except Exception as e:
-                self.logger.warning(f"Fast tier failed: {e}, falling back...")
-
-        # Check if balanced tier available and appropriate
-        if 'llama_cpp_quality' in self.providers and self._should_use_balanced_tier(messages):
-            try:
-                self.logger.info("Routing to balanced tier (llama.cpp)")
-                provider = self.providers['llama_cpp_quality']
-                return await provider.complete_quality(messages, **kwargs)
-            except Exception as e:
-                self.logger.warning(f"Balanced tier failed: {e}, falling back...")
-
-        # Fall back to existing chat method (Ollama/DeepSeek/Claude)
-        self.logger.info("Routing to standard tier (Ollama/DeepSeek/Claude)")
-
-        # Use existing provider selection logic
-        if 'deepseek' in self.providers:
-            provider_name = 'deepseek'
-        elif 'ollama' in self.providers:
-            provider_name = 'ollama'
-        elif 'claude' in self.providers:
-            provider_name = 'claude'
-        else:
+        decision = self.tier_router.route(messages, self.providers, min_quality)
+        if decision is None:
             raise ValueError("No LLM providers available")
 
-        return await self.chat(provider_name=provider_name, messages=messages, **kwargs)
+        self.logger.info(
+            f"Routing to {decision.tier} tier ({decision.provider}, "
+            f"expected {decision.expected_ms:.0f}ms)"
+        )
+        try:
+            return await self.tier_router.run(
+                decision, lambda name: self._call_tier_provider(name, messages, **kwargs)
+            )
+        except Exception as e:
+            self.logger.error(f"Routed chat failed on every provider: {e}")
+            return f"I apologize, but I encountered an error: {e}"
+
+    async def _call_tier_provider(self, provider_name: str, messages: List[Dict[str, str]], **kwargs) -> str:
+        """Call one provider the way its tier expects; errors propagate to the router."""
+        provider = self.providers[provider_name]
+        if provider_name == 'llama_cpp_fast':
+            return await provider.complete_fast(messages, **kwargs)
+        if provider_name == 'llama_cpp_quality':
+            return await provider.complete_quality(messages, **kwargs)
+        if isinstance(provider, GLMProvider):
+            # GLMProvider.chat() takes a single prompt
+            return await provider.chat_completion(messages, **kwargs)
+        return await provider.chat(messages, **kwargs)
 
     async def generate_response(
         self,
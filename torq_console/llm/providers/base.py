@@ -3,8 +3,61 @@ Base LLM provider interface for TORQ Console.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator, Callable, Iterable
 import asyncio
+import threading
+
+# Chunks a blocking stream may run ahead of its consumer
+STREAM_BUFFER_CHUNKS = 64
+
+_STREAM_END = object()
+
+
+async def iterate_in_thread(
+    make_iterator: Callable[[], Iterable[Any]],
+    max_buffer: int = STREAM_BUFFER_CHUNKS
+) -> AsyncIterator[Any]:
+    """
+    Consume a blocking iterator (SDK streams, llama.cpp) from a worker thread.
+
+    The thread stops pulling once ``max_buffer`` items are waiting, so a
+    slow consumer throttles generation instead of buffering it all, and
+    closing the async iterator stops the thread at its next item.
+
+    Args:
+        make_iterator: Called in the worker thread to create the iterator
+        max_buffer: Items the thread may produce ahead of the consumer
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffer)
+    stop = threading.Event()
+
+    def produce():
+        end: Any = _STREAM_END
+        try:
+            for item in make_iterator():
+                if stop.is_set():
+                    return
+                asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+        except Exception as e:
+            end = e
+        if not stop.is_set():
+            asyncio.run_coroutine_threadsafe(queue.put(end), loop).result()
+
+    loop.run_in_executor(None, produce)
+    try:
+        while True:
+            item = await queue.get()
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        # Unblock a producer waiting on a full queue so the thread can exit
+        while not queue.empty():
+            queue.get_nowait()
 
 
 class BaseLLMProvider(ABC):
@@ -47,12 +100,32 @@ class BaseLLMProvider(ABC):
         """Simple query interface for single prompts."""
         pass
 
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        system_message: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion as text chunks.
+
+        Providers without native streaming yield the complete response as a
+        single chunk; override to yield tokens as the model produces them.
+        """
+        if system_message is not None:
+            kwargs['system'] = system_message
+        yield await self.chat_completion(messages, **kwargs)
+
+    def supports_streaming(self) -> bool:
+        """Whether stream_chat() yields tokens as they are generated."""
+        return type(self).stream_chat is not BaseLLMProvider.stream_chat
+
     def get_capabilities(self) -> Dict[str, Any]:
         """Return provider capabilities."""
         return {
             'chat_completion': True,
             'text_generation': True,
-            'streaming': False,
+            'streaming': self.supports_streaming(),
             'max_tokens': self.config.get('max_tokens', 4096)
         }
 
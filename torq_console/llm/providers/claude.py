@@ -7,10 +7,11 @@ Provides integration with Anthropic Claude models including Sonnet 4.5.
 import os
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, AsyncIterator
 from anthropic import Anthropic, AsyncAnthropic
 
 from .base import BaseLLMProvider
+from torq_console.core.http_pool import get_http_pool
 
 # Import typed exceptions for proper error classification
 from torq_console.ui.web_ai_fix import AIResponseError, AITimeoutError, ProviderError
@@ -59,7 +60,8 @@ class ClaudeProvider(BaseLLMProvider):
 
         # Initialize Anthropic client
         if self.api_key:
-            self.client = AsyncAnthropic(api_key=self.api_key)
+            # Share keep-alive connections (HTTP/2 if available) with the other providers
+            self.client = AsyncAnthropic(api_key=self.api_key, http_client=get_http_pool().httpx_client())
             self.logger.info(f"Claude provider initialized with model: {self.model}")
         else:
             self.client = None
@@ -69,6 +71,35 @@ class ClaudeProvider(BaseLLMProvider):
         """Check if provider is properly configured."""
         return bool(self.api_key and self.client)
 
+    def _typed_error(self, e: Exception) -> Exception:
+        """Map an Anthropic SDK exception to the typed errors the fallback layer expects."""
+        # Check for content policy violations first (terminal, no fallback)
+        if _is_policy_violation(e):
+            self.logger.error(f"Content policy violation: {e}")
+            return AIResponseError(
+                f"Content policy violation: {str(e)}",
+                error_category="ai_error"
+            )
+
+        # Check for Anthropic API errors with status codes
+        if hasattr(e, 'status_code'):
+            status = e.status_code
+            if status == 429:
+                self.logger.error(f"Claude rate limited: {e}")
+                return ProviderError(f"Rate limited: {str(e)}", code="429")
+            elif status >= 500:
+                self.logger.error(f"Claude server error: {e}")
+                return ProviderError(f"Server error: {str(e)}", code=str(status))
+            elif status in [400, 401, 403, 404]:
+                # 400 with policy message already handled above
+                # 400 without policy, 401, 403, 404 are provider errors
+                self.logger.error(f"Claude provider error: {e}")
+                return ProviderError(f"Provider error: {str(e)}", code=str(status))
+
+        # Generic adapter exception
+        self.logger.error(f"Claude adapter exception: {e}")
+        return ProviderError(f"Claude adapter exception: {str(e)}")
+
     async def query(self, prompt: str, **kwargs) -> str:
         """
         Execute a simple query.
@@ -115,32 +146,7 @@ class ClaudeProvider(BaseLLMProvider):
             self.logger.error("Claude query timed out")
             raise AITimeoutError("Claude request timed out")
         except Exception as e:
-            # Check for content policy violations first (terminal, no fallback)
-            if _is_policy_violation(e):
-                self.logger.error(f"Content policy violation: {e}")
-                raise AIResponseError(
-                    f"Content policy violation: {str(e)}",
-                    error_category="ai_error"
-                )
-
-            # Check for Anthropic API errors with status codes
-            if hasattr(e, 'status_code'):
-                status = e.status_code
-                if status == 429:
-                    self.logger.error(f"Claude rate limited: {e}")
-                    raise ProviderError(f"Rate limited: {str(e)}", code="429")
-                elif status >= 500:
-                    self.logger.error(f"Claude server error: {e}")
-                    raise ProviderError(f"Server error: {str(e)}", code=str(status))
-                elif status in [400, 401, 403, 404]:
-                    # 400 with policy message already handled above
-                    # 400 without policy, 401, 403, 404 are provider errors
-                    self.logger.error(f"Claude provider error: {e}")
-                    raise ProviderError(f"Provider error: {str(e)}", code=str(status))
-
-            # Generic adapter exception
-            self.logger.error(f"Claude adapter exception: {e}")
-            raise ProviderError(f"Claude adapter exception: {str(e)}")
+            raise self._typed_error(e)
 
     async def chat(
         self,
@@ -201,32 +207,55 @@ class ClaudeProvider(BaseLLMProvider):
             self.logger.error("Claude chat timed out")
             raise AITimeoutError("Claude request timed out")
         except Exception as e:
-            # Check for content policy violations first (terminal, no fallback)
-            if _is_policy_violation(e):
-                self.logger.error(f"Content policy violation: {e}")
-                raise AIResponseError(
-                    f"Content policy violation: {str(e)}",
-                    error_category="ai_error"
-                )
-
-            # Check for Anthropic API errors with status codes
-            if hasattr(e, 'status_code'):
-                status = e.status_code
-                if status == 429:
-                    self.logger.error(f"Claude rate limited: {e}")
-                    raise ProviderError(f"Rate limited: {str(e)}", code="429")
-                elif status >= 500:
-                    self.logger.error(f"Claude server error: {e}")
-                    raise ProviderError(f"Server error: {str(e)}", code=str(status))
-                elif status in [400, 401, 403, 404]:
-                    # 400 with policy message already handled above
-                    # 400 without policy, 401, 403, 404 are provider errors
-                    self.logger.error(f"Claude provider error: {e}")
-                    raise ProviderError(f"Provider error: {str(e)}", code=str(status))
-
-            # Generic adapter exception
-            self.logger.error(f"Claude adapter exception: {e}")
-            raise ProviderError(f"Claude adapter exception: {str(e)}")
+            raise self._typed_error(e)
+
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        system_message: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a multi-turn chat as text deltas.
+
+        Extended thinking is left off so the first text token is not held
+        back behind the thinking budget.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            system_message: Optional system message
+            **kwargs: Additional parameters (temperature, max_tokens)
+
+        Yields:
+            Text chunks as Claude generates them
+        """
+        if not self.is_configured():
+            raise ProviderError("Claude provider not configured (missing API key)", code="401")
+
+        formatted_messages = [
+            {"role": msg.get('role', 'user'), "content": msg.get('content', '')}
+            for msg in messages
+            if msg.get('role', 'user') in ['user', 'assistant']
+        ]
+
+        try:
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=kwargs.get('max_tokens', 4096),
+                temperature=kwargs.get('temperature', 0.7),
+                system=system_message if system_message else "You are Claude, a helpful AI assistant specialized in coding, reasoning, and problem-solving.",
+                messages=formatted_messages
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+
+        except asyncio.TimeoutError:
+            self.logger.error("Claude stream timed out")
+            raise AITimeoutError("Claude request timed out")
+        except (AIResponseError, AITimeoutError, ProviderError):
+            raise
+        except Exception as e:
+            raise self._typed_error(e)
 
     async def code_generation(
         self,
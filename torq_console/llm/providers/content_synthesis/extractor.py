@@ -163,20 +163,22 @@ class ContentExtractor:
         """
         try:
             import aiohttp
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        return self.extract_from_html(html, url)
-                    else:
-                        self.logger.error(f"[CONTENT_EXTRACTOR] Failed to fetch URL: {response.status}")
-                        return ExtractedContent(
-                            title="Failed to fetch",
-                            main_content="",
-                            url=url,
-                            extraction_method="failed"
-                        )
+            from torq_console.core.http_pool import get_http_pool
+
+            async with get_http_pool().request(
+                "GET", url, timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 200:
+                    html = await response.text()
+                    return self.extract_from_html(html, url)
+                else:
+                    self.logger.error(f"[CONTENT_EXTRACTOR] Failed to fetch URL: {response.status}")
+                    return ExtractedContent(
+                        title="Failed to fetch",
+                        main_content="",
+                        url=url,
+                        extraction_method="failed"
+                    )
 
         except Exception as e:
             self.logger.error(f"[CONTENT_EXTRACTOR] Error fetching URL: {e}")
@@ -16,6 +16,8 @@ import logging
 import aiohttp
 from datetime import datetime, timedelta
 
+from torq_console.core.http_pool import get_http_pool
+
 # Import typed exceptions for proper error classification
 from torq_console.ui.web_ai_fix import AIResponseError, AITimeoutError, ProviderError
 
@@ -67,8 +69,14 @@ class DeepSeekProvider:
         self.default_max_tokens = 512  # Reduced from 4096 for faster responses
         self.default_temperature = 0.7
 
-        # Connection pooling session (reuse for better performance)
-        self.session = None
+        # Requests go through the shared HTTP pool; extended timeouts for complex synthesis
+        self.timeout = aiohttp.ClientTimeout(
+            total=120,     # Total timeout - increased for complex tasks
+            connect=10,    # Connection timeout
+            sock_read=90   # Socket read timeout - increased for LLM synthesis
+        )
+        # Streams may run longer than total; only the gap between events is bounded
+        self.stream_timeout = aiohttp.ClientTimeout(connect=10, sock_read=90)
 
         # Validate API key
         if not self.api_key:
@@ -91,17 +99,46 @@ class DeepSeekProvider:
         self.request_timestamps.append(now)
         return True
 
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create persistent session for connection pooling."""
-        if self.session is None or self.session.closed:
-            # Create persistent session with extended timeouts for complex synthesis
-            timeout = aiohttp.ClientTimeout(
-                total=120,     # Total timeout - increased for complex tasks
-                connect=10,    # Connection timeout
-                sock_read=90   # Socket read timeout - increased for LLM synthesis
+    def _request_headers(self) -> Dict[str, str]:
+        """HTTP headers for DeepSeek API requests."""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": "TORQ-CONSOLE/0.70.0"
+        }
+
+    def _raise_for_status(self, status: int, response_text: str) -> None:
+        """Raise the typed error for a non-200 DeepSeek response."""
+        # Parse error from response
+        try:
+            response_data = json.loads(response_text)
+            error_msg = response_data.get('error', {}).get('message', response_text)
+        except json.JSONDecodeError:
+            error_msg = response_text
+
+        # Check for content policy violations first (terminal, no fallback)
+        if _is_policy_violation(error_msg):
+            self.logger.error(f"Content policy violation: {error_msg}")
+            raise AIResponseError(
+                f"Content policy violation: {error_msg}",
+                error_category="ai_error"
             )
-            self.session = aiohttp.ClientSession(timeout=timeout)
-        return self.session
+
+        # Map HTTP status codes to appropriate error types
+        if status == 429:
+            self.logger.error(f"DeepSeek rate limited: {error_msg}")
+            raise ProviderError(f"Rate limited: {error_msg}", code="429")
+        elif status >= 500:
+            self.logger.error(f"DeepSeek server error: {error_msg}")
+            raise ProviderError(f"Server error: {error_msg}", code=str(status))
+        elif status in [400, 401, 403, 404]:
+            # 400 with policy already handled above
+            # 401, 403, 404 are provider errors
+            self.logger.error(f"DeepSeek provider error: {error_msg}")
+            raise ProviderError(f"Provider error: {error_msg}", code=str(status))
+        else:
+            self.logger.error(f"DeepSeek API error: {error_msg}")
+            raise ProviderError(f"API error: {error_msg}", code=str(status))
 
     async def _make_request(
         self,
@@ -125,19 +162,16 @@ class DeepSeekProvider:
             raise ProviderError("Rate limit exceeded", code="429")
 
         url = f"{self.base_url}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "TORQ-CONSOLE/0.70.0"
-        }
+        headers = self._request_headers()
 
         try:
             # Add timing diagnostics
             start_time = time.time()
 
-            # Use persistent session for connection pooling
-            session = await self._get_session()
-            async with session.post(url, json=data, headers=headers) as response:
+            # Pooled keep-alive connection shared with the other providers
+            async with get_http_pool().request(
+                "POST", url, json=data, headers=headers, timeout=self.timeout
+            ) as response:
                 # Read response before checking status
                 response_text = await response.text()
 
@@ -149,36 +183,7 @@ class DeepSeekProvider:
                     self.logger.info(f"DeepSeek API response time: {response_time:.2f}s")
                     return response_data
                 else:
-                    # Parse error from response
-                    try:
-                        response_data = json.loads(response_text)
-                        error_msg = response_data.get('error', {}).get('message', response_text)
-                    except json.JSONDecodeError:
-                        error_msg = response_text
-
-                    # Check for content policy violations first (terminal, no fallback)
-                    if _is_policy_violation(error_msg):
-                        self.logger.error(f"Content policy violation: {error_msg}")
-                        raise AIResponseError(
-                            f"Content policy violation: {error_msg}",
-                            error_category="ai_error"
-                        )
-
-                    # Map HTTP status codes to appropriate error types
-                    if response.status == 429:
-                        self.logger.error(f"DeepSeek rate limited: {error_msg}")
-                        raise ProviderError(f"Rate limited: {error_msg}", code="429")
-                    elif response.status >= 500:
-                        self.logger.error(f"DeepSeek server error: {error_msg}")
-                        raise ProviderError(f"Server error: {error_msg}", code=str(response.status))
-                    elif response.status in [400, 401, 403, 404]:
-                        # 400 with policy already handled above
-                        # 401, 403, 404 are provider errors
-                        self.logger.error(f"DeepSeek provider error: {error_msg}")
-                        raise ProviderError(f"Provider error: {error_msg}", code=str(response.status))
-                    else:
-                        self.logger.error(f"DeepSeek API error: {error_msg}")
-                        raise ProviderError(f"API error: {error_msg}", code=str(response.status))
+                    self._raise_for_status(response.status, response_text)
 
         except asyncio.TimeoutError:
             self.logger.error("DeepSeek request timed out")
@@ -193,6 +198,54 @@ class DeepSeekProvider:
             self.logger.error(f"DeepSeek adapter exception: {e}")
             raise ProviderError(f"DeepSeek adapter exception: {str(e)}", code="adapter_error")
 
+    async def _stream_request(
+        self,
+        endpoint: str,
+        data: Dict[str, Any]
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Make a streaming request to DeepSeek API.
+
+        Yields each server-sent event as it arrives; the socket read timeout
+        applies between events, not to the whole response.
+        """
+        if not self.api_key:
+            raise ProviderError("DeepSeek API key not configured", code="401")
+
+        if not await self._check_rate_limit():
+            raise ProviderError("Rate limit exceeded", code="429")
+
+        url = f"{self.base_url}{endpoint}"
+
+        try:
+            async with get_http_pool().request(
+                "POST", url, json=data, headers=self._request_headers(), timeout=self.stream_timeout
+            ) as response:
+                if response.status != 200:
+                    self._raise_for_status(response.status, await response.text())
+
+                async for raw_line in response.content:
+                    line = raw_line.decode('utf-8').strip()
+                    if not line.startswith("data:"):
+                        continue
+                    payload = line[len("data:"):].strip()
+                    if payload == "[DONE]":
+                        return
+                    yield json.loads(payload)
+
+        except asyncio.TimeoutError:
+            self.logger.error("DeepSeek stream timed out")
+            raise AITimeoutError("DeepSeek request timed out")
+        except aiohttp.ClientError as e:
+            self.logger.error(f"DeepSeek network error: {e}")
+            raise ProviderError(f"Network error: {str(e)}", code="network_error")
+        except (AIResponseError, AITimeoutError, ProviderError):
+            # Re-raise our typed exceptions
+            raise
+        except Exception as e:
+            self.logger.error(f"DeepSeek adapter exception: {e}")
+            raise ProviderError(f"DeepSeek adapter exception: {str(e)}", code="adapter_error")
+
     async def complete(
         self,
         messages: List[Dict[str, str]],
@@ -210,7 +263,7 @@ class DeepSeekProvider:
             model: Model name (default: deepseek-chat)
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
-            stream: Whether to use streaming (not yet implemented)
+            stream: Whether to use streaming (use stream_chat() for incremental output)
             **kwargs: Additional API parameters
 
         Returns:
@@ -304,6 +357,52 @@ class DeepSeekProvider:
         result = await self.complete(full_messages, **kwargs)
         return result.get('content', '')
 
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        system_message: Optional[str] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream a chat completion as text deltas.
+
+        Args:
+            messages: Conversation history
+            system_message: Optional system message
+            model: Model name (default: deepseek-chat)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional API parameters
+
+        Yields:
+            Text chunks as the model generates them
+        """
+        full_messages = []
+
+        if system_message:
+            full_messages.append({"role": "system", "content": system_message})
+
+        full_messages.extend(messages)
+
+        data = {
+            "model": model or self.default_model,
+            "messages": full_messages,
+            "max_tokens": max_tokens or self.default_max_tokens,
+            "temperature": temperature or self.default_temperature,
+            **kwargs,
+            "stream": True
+        }
+
+        async for event in self._stream_request("/v1/chat/completions", data):
+            choices = event.get('choices') or []
+            if choices:
+                content = (choices[0].get('delta') or {}).get('content')
+                if content:
+                    yield content
+
     async def search_and_answer(self, query: str, context: str = "") -> str:
         """
         Answer a query with optional context for search-like functionality.
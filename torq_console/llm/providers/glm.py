@@ -7,9 +7,9 @@ making it accessible via the LLM Manager and UI dropdown.
 
 import os
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator
 
-from .base import BaseLLMProvider
+from .base import BaseLLMProvider, iterate_in_thread
 from ..glm_client import GLMClient
 
 
@@ -137,6 +137,45 @@ class GLMProvider(BaseLLMProvider):
 
         return await self.generate(messages, temperature, max_tokens, **kwargs)
 
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        system_message: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion as text chunks.
+
+        The Z.AI SDK stream is blocking, so it is consumed from a worker
+        thread that pauses while the caller is behind.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            system_message: Optional system message
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+
+        Yields:
+            Text chunks as the model generates them
+        """
+        if not self.is_configured():
+            raise ValueError(
+                "GLM provider not configured. Please set GLM_API_KEY environment variable."
+            )
+
+        full_messages = []
+        if system_message:
+            full_messages.append({"role": "system", "content": system_message})
+        full_messages.extend(messages)
+
+        async for chunk in iterate_in_thread(
+            lambda: self.client.stream_chat(full_messages, temperature, max_tokens, **kwargs)
+        ):
+            yield chunk
+
     def get_model_info(self) -> Dict[str, Any]:
         """
         Get information about the GLM-4.6 model.
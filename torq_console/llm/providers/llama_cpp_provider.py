@@ -7,10 +7,12 @@ Optimized for code completion, fast queries, and structured outputs.
 
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, AsyncIterator
 from dataclasses import dataclass
 import json
 
+from .base import iterate_in_thread
+
 # Try to import llama-cpp-python (optional dependency)
 # Only warn if TORQ_LOCAL_LLM_ENABLED is explicitly set
 import os
@@ -373,6 +375,59 @@ class LlamaCppProvider:
         result = await self.complete(full_messages, **kwargs)
         return result.get('content', '')
 
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        system_message: Optional[str] = None,
+        config: Optional[CompletionConfig] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion token by token.
+
+        Generation runs in a worker thread that pauses while the caller is
+        behind, and stops at the next token once the caller closes the stream.
+
+        Args:
+            messages: Conversation history
+            system_message: Optional system message
+            config: Completion configuration
+            **kwargs: Additional parameters
+
+        Yields:
+            Generated text chunks
+        """
+        if not self.is_loaded and not self._load_model():
+            raise RuntimeError("llama.cpp model not available")
+
+        if config is None:
+            config = CompletionConfig()
+
+        full_messages = []
+
+        if system_message:
+            full_messages.append({'role': 'system', 'content': system_message})
+
+        full_messages.extend(messages)
+        prompt = self._messages_to_prompt(full_messages)
+
+        def generate():
+            for chunk in self.llm(
+                prompt=prompt,
+                max_tokens=config.max_tokens,
+                temperature=config.temperature,
+                top_p=config.top_p,
+                top_k=config.top_k,
+                repeat_penalty=config.repeat_penalty,
+                stop=config.stop or [],
+                echo=False,
+                stream=True
+            ):
+                yield chunk['choices'][0]['text']
+
+        async for text in iterate_in_thread(generate):
+            yield text
+
     async def query(self, prompt: str, **kwargs) -> str:
         """
         Simple query interface.
@@ -17,6 +17,8 @@ import logging
 import aiohttp
 from datetime import datetime
 
+from torq_console.core.http_pool import get_http_pool
+
 # Import typed exceptions for proper error classification
 from torq_console.ui.web_ai_fix import AIResponseError, AITimeoutError, ProviderError
 
@@ -60,24 +62,16 @@ class OllamaProvider:
         self.default_max_tokens = 2048  # Balanced for quality and speed
         self.default_temperature = 0.7
 
-        # Connection pooling session (reuse for better performance)
-        self.session = None
+        # Requests go through the shared HTTP pool; extended timeouts for local inference
+        self.timeout = aiohttp.ClientTimeout(
+            total=300,     # Total timeout - 5 minutes for large models
+            connect=10,    # Connection timeout
+            sock_read=180  # Socket read timeout - 3 minutes for inference
+        )
 
         self.logger.info(f"Ollama provider initialized with base URL: {base_url}")
         self.logger.info(f"Default model: {default_model}")
 
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create persistent session for connection pooling."""
-        if self.session is None or self.session.closed:
-            # Create persistent session with extended timeouts for local inference
-            timeout = aiohttp.ClientTimeout(
-                total=300,     # Total timeout - 5 minutes for large models
-                connect=10,    # Connection timeout
-                sock_read=180  # Socket read timeout - 3 minutes for inference
-            )
-            self.session = aiohttp.ClientSession(timeout=timeout)
-        return self.session
-
     async def _make_request(
         self,
         endpoint: str,
@@ -96,9 +90,13 @@ class OllamaProvider:
             # Add timing diagnostics
             start_time = time.time()
 
-            # Use persistent session for connection pooling
-            session = await self._get_session()
-            async with session.post(url, json=data, headers=headers) as response:
+            # Pooled keep-alive connection shared with the other providers
+            request_timeout = aiohttp.ClientTimeout(
+                total=self.timeout.total, connect=self.timeout.connect, sock_read=timeout
+            )
+            async with get_http_pool().request(
+                "POST", url, json=data, headers=headers, timeout=request_timeout
+            ) as response:
                 response_data = await response.json()
 
                 end_time = time.time()
@@ -124,7 +122,7 @@ class OllamaProvider:
             self.logger.error(f"Ollama adapter exception: {e}")
             raise ProviderError(f"Ollama adapter exception: {e}", code="adapter_error") from e
 
-    async def complete(
+    def _generate_request(
         self,
         messages: List[Dict[str, str]],
         model: Optional[str] = None,
@@ -133,21 +131,7 @@ class OllamaProvider:
         stream: bool = False,
         **kwargs
     ) -> Dict[str, Any]:
-        """
-        Generate completion using Ollama API.
-
-        Args:
-            messages: List of message dictionaries with 'role' and 'content'
-            model: Model name (default: deepseek-v3.2-exp)
-            max_tokens: Maximum tokens to generate
-            temperature: Sampling temperature
-            stream: Whether to use streaming (not yet implemented)
-            **kwargs: Additional API parameters
-
-        Returns:
-            Response dictionary with completion
-        """
-
+        """Build an /api/generate request body from OpenAI-style messages."""
         # Convert OpenAI-style messages to Ollama format
         prompt = self._convert_messages_to_prompt(messages)
 
@@ -155,7 +139,7 @@ class OllamaProvider:
         data = {
             "model": model or self.default_model,
             "prompt": prompt,
-            "stream": False,  # Ollama uses stream parameter directly
+            "stream": stream,  # Ollama uses stream parameter directly
             "options": {
                 "num_predict": max_tokens or self.default_max_tokens,
                 "temperature": temperature or self.default_temperature,
@@ -166,6 +150,83 @@ class OllamaProvider:
         if kwargs:
             data["options"].update(kwargs)
 
+        return data
+
+    async def _stream_request(
+        self,
+        endpoint: str,
+        data: Dict[str, Any]
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Make a streaming request to Ollama API.
+
+        Yields each newline-delimited JSON object as it arrives.
+        """
+        url = f"{self.base_url}{endpoint}"
+
+        try:
+            # No total timeout: only the gap between chunks is bounded
+            async with get_http_pool().request(
+                "POST", url, json=data, headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(connect=self.timeout.connect, sock_read=self.timeout.sock_read)
+            ) as response:
+                if response.status != 200:
+                    try:
+                        error_msg = json.loads(await response.text()).get('error', f'HTTP {response.status}')
+                    except ValueError:
+                        error_msg = f'HTTP {response.status}'
+                    raise ProviderError(f"Ollama API error: {error_msg}", code=str(response.status))
+
+                async for raw_line in response.content:
+                    line = raw_line.strip()
+                    if not line:
+                        continue
+                    event = json.loads(line)
+                    if event.get('error'):
+                        raise ProviderError(f"Ollama API error: {event['error']}", code="ollama_error")
+                    yield event
+                    if event.get('done'):
+                        return
+
+        except asyncio.TimeoutError as e:
+            self.logger.error(f"Ollama stream timed out: {e}")
+            raise AITimeoutError("Ollama request timed out") from e
+        except aiohttp.ClientError as e:
+            self.logger.error(f"Ollama network error: {e}")
+            raise ProviderError(f"Ollama network error: {e}", code="network_error") from e
+        except (AIResponseError, AITimeoutError, ProviderError):
+            # Re-raise our typed exceptions
+            raise
+        except Exception as e:
+            self.logger.error(f"Ollama adapter exception: {e}")
+            raise ProviderError(f"Ollama adapter exception: {e}", code="adapter_error") from e
+
+    async def complete(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        stream: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Generate completion using Ollama API.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            model: Model name (default: deepseek-v3.2-exp)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            stream: Whether to use streaming (use stream_chat() for incremental output)
+            **kwargs: Additional API parameters
+
+        Returns:
+            Response dictionary with completion
+        """
+
+        data = self._generate_request(messages, model, max_tokens, temperature, **kwargs)
+
         try:
             self.logger.debug(f"Making completion request with {len(messages)} messages to model: {model or self.default_model}")
             response = await self._make_request("/api/generate", data)
@@ -274,6 +335,41 @@ class OllamaProvider:
         result = await self.complete(full_messages, **kwargs)
         return result.get('content', '')
 
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        system_message: Optional[str] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream a chat completion as text chunks.
+
+        Args:
+            messages: Conversation history
+            system_message: Optional system message
+            model: Model name (default: the provider's default model)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional Ollama options
+
+        Yields:
+            Text chunks as the model generates them
+        """
+        full_messages = []
+
+        if system_message:
+            full_messages.append({"role": "system", "content": system_message})
+
+        full_messages.extend(messages)
+
+        data = self._generate_request(full_messages, model, max_tokens, temperature, stream=True, **kwargs)
+        async for event in self._stream_request("/api/generate", data):
+            if event.get('response'):
+                yield event['response']
+
     async def search_and_answer(self, query: str, context: str = "") -> str:
         """
         Answer a query with optional context for search-like functionality.
@@ -314,8 +410,7 @@ class OllamaProvider:
         """Perform a health check on the Ollama API."""
         try:
             # Check if Ollama service is running
-            session = await self._get_session()
-            async with session.get(f"{self.base_url}/api/tags") as response:
+            async with get_http_pool().request("GET", f"{self.base_url}/api/tags", timeout=self.timeout) as response:
                 if response.status == 200:
                     models_data = await response.json()
                     models = [m.get('name') for m in models_data.get('models', [])]
@@ -345,8 +440,7 @@ class OllamaProvider:
     async def list_models(self) -> List[str]:
         """List available models in Ollama."""
         try:
-            session = await self._get_session()
-            async with session.get(f"{self.base_url}/api/tags") as response:
+            async with get_http_pool().request("GET", f"{self.base_url}/api/tags", timeout=self.timeout) as response:
                 if response.status == 200:
                     models_data = await response.json()
                     return [m.get('name') for m in models_data.get('models', [])]
@@ -374,11 +468,4 @@ class OllamaProvider:
             return False
 
     async def close(self):
-        """Close the aiohttp session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-
-    def __del__(self):
-        """Cleanup when provider is destroyed."""
-        if self.session and not self.session.closed:
-            asyncio.create_task(self.session.close())
+        """Nothing to close: connections belong to the shared HTTP pool."""
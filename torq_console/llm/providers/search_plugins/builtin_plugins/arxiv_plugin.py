@@ -5,9 +5,11 @@ Searches arXiv.org for academic papers and preprints.
 Uses the arXiv API for searching scientific publications.
 """
 
-import aiohttp
 import xml.etree.ElementTree as ET
 from typing import List
+
+from torq_console.core.http_pool import get_http_pool
+
 from ..base import SearchPlugin, PluginMetadata, SearchResult
 
 
@@ -74,71 +76,70 @@ class ArXivSearchPlugin(SearchPlugin):
             }
 
             # Make request
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.api_url, params=params) as response:
-                    if response.status == 200:
-                        xml_content = await response.text()
-
-                        # Parse XML response
-                        root = ET.fromstring(xml_content)
-
-                        # Define namespace
-                        ns = {
-                            'atom': 'http://www.w3.org/2005/Atom',
-                            'arxiv': 'http://arxiv.org/schemas/atom'
-                        }
-
-                        # Parse entries
-                        for entry in root.findall('atom:entry', ns):
-                            # Extract paper information
-                            title_elem = entry.find('atom:title', ns)
-                            title = title_elem.text.strip() if title_elem is not None else ''
-
-                            summary_elem = entry.find('atom:summary', ns)
-                            abstract = summary_elem.text.strip()[:300] if summary_elem is not None else ''
-
-                            link_elem = entry.find('atom:id', ns)
-                            url = link_elem.text.strip() if link_elem is not None else ''
-
-                            published_elem = entry.find('atom:published', ns)
-                            published = published_elem.text if published_elem is not None else ''
-
-                            # Extract authors
-                            authors = []
-                            for author_elem in entry.findall('atom:author', ns):
-                                name_elem = author_elem.find('atom:name', ns)
-                                if name_elem is not None:
-                                    authors.append(name_elem.text.strip())
-
-                            author_str = ', '.join(authors[:3])  # First 3 authors
-                            if len(authors) > 3:
-                                author_str += f' et al. ({len(authors)} authors)'
-
-                            # Extract category
-                            category_elem = entry.find('arxiv:primary_category', ns)
-                            category = ''
-                            if category_elem is not None:
-                                category = category_elem.get('term', '')
-
-                            # Create search result
-                            result = SearchResult(
-                                title=title,
-                                snippet=abstract,
-                                url=url,
-                                source=f"arxiv:{category}",
-                                author=author_str,
-                                date_published=published,
-                                metadata={
-                                    'category': category,
-                                    'authors': authors,
-                                    'published': published
-                                }
-                            )
-
-                            results.append(result)
-
-                    else:
-                        self.logger.error(f"ArXiv API error: HTTP {response.status}")
+            async with get_http_pool().request("GET", self.api_url, params=params) as response:
+                if response.status == 200:
+                    xml_content = await response.text()
+
+                    # Parse XML response
+                    root = ET.fromstring(xml_content)
+
+                    # Define namespace
+                    ns = {
+                        'atom': 'http://www.w3.org/2005/Atom',
+                        'arxiv': 'http://arxiv.org/schemas/atom'
+                    }
+
+                    # Parse entries
+                    for entry in root.findall('atom:entry', ns):
+                        # Extract paper information
+                        title_elem = entry.find('atom:title', ns)
+                        title = title_elem.text.strip() if title_elem is not None else ''
+
+                        summary_elem = entry.find('atom:summary', ns)
+                        abstract = summary_elem.text.strip()[:300] if summary_elem is not None else ''
+
+                        link_elem = entry.find('atom:id', ns)
+                        url = link_elem.text.strip() if link_elem is not None else ''
+
+                        published_elem = entry.find('atom:published', ns)
+                        published = published_elem.text if published_elem is not None else ''
+
+                        # Extract authors
+                        authors = []
+                        for author_elem in entry.findall('atom:author', ns):
+                            name_elem = author_elem.find('atom:name', ns)
+                            if name_elem is not None:
+                                authors.append(name_elem.text.strip())
+
+                        author_str = ', '.join(authors[:3])  # First 3 authors
+                        if len(authors) > 3:
+                            author_str += f' et al. ({len(authors)} authors)'
+
+                        # Extract category
+                        category_elem = entry.find('arxiv:primary_category', ns)
+                        category = ''
+                        if category_elem is not None:
+                            category = category_elem.get('term', '')
+
+                        # Create search result
+                        result = SearchResult(
+                            title=title,
+                            snippet=abstract,
+                            url=url,
+                            source=f"arxiv:{category}",
+                            author=author_str,
+                            date_published=published,
+                            metadata={
+                                'category': category,
+                                'authors': authors,
+                                'published': published
+                            }
+                        )
+
+                        results.append(result)
+
+                else:
+                    self.logger.error(f"ArXiv API error: HTTP {response.status}")
 
         except Exception as e:
             self.logger.error(f"ArXiv search failed: {e}")
@@ -4,8 +4,10 @@ Hacker News Search Plugin
 Searches Hacker News for tech news and discussions using Algolia's HN Search API.
 """
 
-import aiohttp
 from typing import List
+
+from torq_console.core.http_pool import get_http_pool
+
 from ..base import SearchPlugin, PluginMetadata, SearchResult
 
 
@@ -69,53 +71,52 @@ class HackerNewsSearchPlugin(SearchPlugin):
             }
 
             # Make request
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.api_url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-
-                        # Parse results
-                        hits = data.get('hits', [])
-
-                        for hit in hits:
-                            # Extract story information
-                            title = hit.get('title', '')
-                            url = hit.get('url', '')
-
-                            # If no external URL, use HN discussion URL
-                            if not url:
-                                object_id = hit.get('objectID', '')
-                                url = f"https://news.ycombinator.com/item?id={object_id}"
-
-                            author = hit.get('author', '')
-                            points = hit.get('points', 0)
-                            num_comments = hit.get('num_comments', 0)
-                            created_at = hit.get('created_at', '')
-
-                            # Create snippet from title and metadata
-                            snippet = f"{points} points | {num_comments} comments"
-
-                            # Create search result
-                            result = SearchResult(
-                                title=title,
-                                snippet=snippet,
-                                url=url,
-                                source="hackernews",
-                                author=author,
-                                date_published=created_at,
-                                score=float(points),
-                                metadata={
-                                    'points': points,
-                                    'comments': num_comments,
-                                    'story_id': hit.get('objectID', ''),
-                                    'created_at': created_at
-                                }
-                            )
-
-                            results.append(result)
-
-                    else:
-                        self.logger.error(f"HackerNews API error: HTTP {response.status}")
+            async with get_http_pool().request("GET", self.api_url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+
+                    # Parse results
+                    hits = data.get('hits', [])
+
+                    for hit in hits:
+                        # Extract story information
+                        title = hit.get('title', '')
+                        url = hit.get('url', '')
+
+                        # If no external URL, use HN discussion URL
+                        if not url:
+                            object_id = hit.get('objectID', '')
+                            url = f"https://news.ycombinator.com/item?id={object_id}"
+
+                        author = hit.get('author', '')
+                        points = hit.get('points', 0)
+                        num_comments = hit.get('num_comments', 0)
+                        created_at = hit.get('created_at', '')
+
+                        # Create snippet from title and metadata
+                        snippet = f"{points} points | {num_comments} comments"
+
+                        # Create search result
+                        result = SearchResult(
+                            title=title,
+                            snippet=snippet,
+                            url=url,
+                            source="hackernews",
+                            author=author,
+                            date_published=created_at,
+                            score=float(points),
+                            metadata={
+                                'points': points,
+                                'comments': num_comments,
+                                'story_id': hit.get('objectID', ''),
+                                'created_at': created_at
+                            }
+                        )
+
+                        results.append(result)
+
+                else:
+                    self.logger.error(f"HackerNews API error: HTTP {response.status}")
 
         except Exception as e:
             self.logger.error(f"HackerNews search failed: {e}")
@@ -5,8 +5,10 @@ Searches Reddit posts and comments for relevant discussions.
 Uses Reddit's JSON API (no authentication required for read-only access).
 """
 
-import aiohttp
 from typing import List
+
+from torq_console.core.http_pool import get_http_pool
+
 from ..base import SearchPlugin, PluginMetadata, SearchResult
 
 
@@ -77,48 +79,47 @@ class RedditSearchPlugin(SearchPlugin):
             }
 
             # Make request
-            async with aiohttp.ClientSession() as session:
-                async with session.get(search_url, params=params, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-
-                        # Parse results
-                        posts = data.get('data', {}).get('children', [])
-
-                        for post_data in posts:
-                            post = post_data.get('data', {})
-
-                            # Extract post information
-                            title = post.get('title', '')
-                            selftext = post.get('selftext', '')[:300]  # First 300 chars
-                            url = f"{self.base_url}{post.get('permalink', '')}"
-                            subreddit = post.get('subreddit', '')
-                            author = post.get('author', '')
-                            score = post.get('score', 0)
-                            num_comments = post.get('num_comments', 0)
-
-                            # Create snippet from selftext or title
-                            snippet = selftext if selftext else title
-
-                            # Create search result
-                            result = SearchResult(
-                                title=title,
-                                snippet=snippet,
-                                url=url,
-                                source=f"reddit://r/{subreddit}",
-                                author=author,
-                                score=float(score),
-                                metadata={
-                                    'subreddit': subreddit,
-                                    'comments': num_comments,
-                                    'upvotes': score
-                                }
-                            )
-
-                            results.append(result)
-
-                    else:
-                        self.logger.error(f"Reddit API error: HTTP {response.status}")
+            async with get_http_pool().request("GET", search_url, params=params, headers=headers) as response:
+                if response.status == 200:
+                    data = await response.json()
+
+                    # Parse results
+                    posts = data.get('data', {}).get('children', [])
+
+                    for post_data in posts:
+                        post = post_data.get('data', {})
+
+                        # Extract post information
+                        title = post.get('title', '')
+                        selftext = post.get('selftext', '')[:300]  # First 300 chars
+                        url = f"{self.base_url}{post.get('permalink', '')}"
+                        subreddit = post.get('subreddit', '')
+                        author = post.get('author', '')
+                        score = post.get('score', 0)
+                        num_comments = post.get('num_comments', 0)
+
+                        # Create snippet from selftext or title
+                        snippet = selftext if selftext else title
+
+                        # Create search result
+                        result = SearchResult(
+                            title=title,
+                            snippet=snippet,
+                            url=url,
+                            source=f"reddit://r/{subreddit}",
+                            author=author,
+                            score=float(score),
+                            metadata={
+                                'subreddit': subreddit,
+                                'comments': num_comments,
+                                'upvotes': score
+                            }
+                        )
+
+                        results.append(result)
+
+                else:
+                    self.logger.error(f"Reddit API error: HTTP {response.status}")
 
         except Exception as e:
             self.logger.error(f"Reddit search failed: {e}")
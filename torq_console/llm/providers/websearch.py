@@ -19,6 +19,10 @@ import logging
 from datetime import datetime
 import re
 
+from ...core.executor_pool import get_executor
+from ...core.http_pool import get_http_pool
+from ...research.canonicalizer import normalize_url
+
 try:
     # Try importing MCP client for server-based search
     from ...mcp.client import MCPClient
@@ -70,6 +74,10 @@ except ImportError:
     EXPORT_AND_PROGRESS_AVAILABLE = False
 
 
+# Methods that return guidance rather than real search results; never raced
+SUGGESTION_METHODS = {'web_scraping', 'fallback_response'}
+
+
 class WebSearchProvider:
     """Enhanced web search provider with multiple search methods and real API integration."""
 
@@ -87,6 +95,12 @@ class WebSearchProvider:
         self.max_results = self.config.get('max_results', 10)
         self.search_timeout = self.config.get('timeout', 30)
 
+        # Fan-out mode: race the real search methods instead of trying them in turn
+        self.fanout = self.config.get('fanout', False)
+        self.fanout_stagger = self.config.get('fanout_stagger', 0.5)    # seconds between hedged starts
+        self.fanout_min_results = self.config.get('fanout_min_results', 5)
+        self.method_stats: Dict[str, Dict[str, int]] = {}
+
         # API Keys
         self.google_api_key = os.getenv('GOOGLE_SEARCH_API_KEY')
         self.google_engine_id = os.getenv('GOOGLE_SEARCH_ENGINE_ID')
@@ -190,7 +204,8 @@ class WebSearchProvider:
         self,
         query: str,
         max_results: Optional[int] = None,
-        search_type: str = "general"
+        search_type: str = "general",
+        fanout: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
         Perform web search using available methods.
@@ -199,6 +214,7 @@ class WebSearchProvider:
             query: Search query
             max_results: Maximum number of results
             search_type: Type of search (general, news, academic, etc.)
+            fanout: Race the search methods concurrently (default: config 'fanout')
 
         Returns:
             Dictionary with search results
@@ -215,8 +231,18 @@ class WebSearchProvider:
 
         self.logger.info(f"Performing search for: '{query}' using available methods")
 
+        methods = self.search_methods
+        if self.fanout if fanout is None else fanout:
+            fanout_results = await self._search_fanout(query, max_results, search_type)
+            if fanout_results:
+                results.update(fanout_results)
+                results['success'] = True
+                return results
+            # Nothing real came back: fall through to the guidance-only methods
+            methods = [m for m in self.search_methods if m in SUGGESTION_METHODS]
+
         # Try each search method in order
-        for method in self.search_methods:
+        for method in methods:
             try:
                 self.logger.debug(f"Attempting search with method: {method}")
                 method_results = await self._search_with_method(method, query, max_results, search_type)
@@ -245,6 +271,118 @@ class WebSearchProvider:
 
         return results
 
+    async def _search_fanout(
+        self,
+        query: str,
+        max_results: int,
+        search_type: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Race the real search methods with staggered (hedged) starts.
+
+        Methods start in priority order, each one ``fanout_stagger`` seconds
+        after the previous (or at once when the previous one finishes
+        without enough results). Results are merged and deduplicated by
+        normalized URL; as soon as ``fanout_min_results`` unique results are
+        in, the remaining methods are cancelled.
+
+        Returns:
+            Merged results, or None if no method returned anything
+        """
+        queue = [m for m in self.search_methods if m not in SUGGESTION_METHODS]
+        if not queue:
+            return None
+        priority = {method: i for i, method in enumerate(queue)}
+        target = min(self.fanout_min_results, max_results)
+        deadline = asyncio.get_running_loop().time() + self.search_timeout
+
+        running: Dict[asyncio.Task, str] = {}
+        merged: Dict[str, Dict[str, Any]] = {}
+        contributors: List[str] = []
+
+        def launch():
+            method = queue.pop(0)
+            self._method_stat(method)['launched'] += 1
+            task = asyncio.create_task(self._search_with_method(method, query, max_results, search_type))
+            running[task] = method
+
+        launch()
+        try:
+            while running and len(merged) < target:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                timeout = min(self.fanout_stagger, remaining) if queue else remaining
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    method = running.pop(task)
+                    added = 0
+                    if task.exception() is not None:
+                        self.logger.warning(f"[FANOUT] Search method {method} failed: {task.exception()}")
+                    elif task.result():
+                        added = self._merge_results(merged, task.result().get('results', []), method)
+                    if added:
+                        contributors.append(method)
+                    else:
+                        self._method_stat(method)['empty'] += 1
+
+                # Hedge: start the next method when the stagger elapses or one came back short
+                if queue and len(merged) < target:
+                    launch()
+        finally:
+            for task, method in running.items():
+                task.cancel()
+                self._method_stat(method)['cancelled'] += 1
+
+        if not merged:
+            return None
+
+        for method in contributors:
+            self._method_stat(method)['wins'] += 1
+        contributors.sort(key=priority.get)
+        ordered = sorted(merged.values(), key=lambda r: priority[r['_method']])
+        for result in ordered:
+            del result['_method']
+
+        self.logger.info(
+            f"[FANOUT] {len(merged)} unique results from {contributors} "
+            f"({len(running)} cancelled)"
+        )
+        return {
+            'results': ordered[:max_results],
+            'total_found': len(ordered),
+            'method_used': contributors[0],
+            'methods_used': contributors,
+            'fanout': True
+        }
+
+    @staticmethod
+    def _merge_results(merged: Dict[str, Dict[str, Any]], results: List[Dict[str, Any]], method: str) -> int:
+        """Add results not seen yet (by normalized URL); returns how many were new."""
+        added = 0
+        for result in results:
+            url = result.get('url')
+            if not url:
+                continue
+            key = normalize_url(url)
+            if key not in merged:
+                merged[key] = {**result, '_method': method}
+                added += 1
+        return added
+
+    def _method_stat(self, method: str) -> Dict[str, int]:
+        return self.method_stats.setdefault(
+            method, {'launched': 0, 'wins': 0, 'empty': 0, 'cancelled': 0}
+        )
+
+    def get_method_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-method fan-out statistics, including the share of races each method contributed to."""
+        return {
+            method: {**stats, 'win_rate': round(stats['wins'] / stats['launched'], 3) if stats['launched'] else 0.0}
+            for method, stats in self.method_stats.items()
+        }
+
     async def _apply_safety_checks(self, url: str, method: str) -> tuple[bool, str]:
         """
         Apply content safety checks before making web request.
@@ -467,63 +605,64 @@ class WebSearchProvider:
             self.logger.debug(f"[GOOGLE] Request URL: {url}")
             self.logger.debug(f"[GOOGLE] Request params: {params}")
 
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.search_timeout)) as session:
-                async with session.get(url, params=params) as response:
-                    self.logger.info(f"[GOOGLE] Response status: {response.status}")
-                    self.logger.debug(f"[GOOGLE] Response headers: {dict(response.headers)}")
-
-                    if response.status == 200:
-                        data = await response.json()
-                        self.logger.debug(f"[GOOGLE] Response data keys: {list(data.keys())}")
-
-                        items = data.get('items', [])
-                        self.logger.info(f"[GOOGLE] Found {len(items)} results")
-
-                        if 'searchInformation' in data:
-                            total_results = data['searchInformation'].get('totalResults', 0)
-                            self.logger.debug(f"[GOOGLE] Total results available: {total_results}")
-
-                        results = []
-                        for item in items:
-                            # Phase 2: Sanitize content before adding to results
-                            title = self._sanitize_content(item.get('title', ''), 'text')
-                            snippet = self._sanitize_content(item.get('snippet', ''), 'text')
-
-                            results.append({
-                                'title': title,
-                                'snippet': snippet,
-                                'url': item.get('link', ''),
-                                'source': 'google_custom_search',
-                                'timestamp': datetime.now().isoformat()
-                            })
-
-                        self.logger.info(f"[GOOGLE] Successfully formatted {len(results)} results")
-                        return {
-                            'results': results,
-                            'total_found': len(results),
-                            'method': 'google_custom_search',
-                            'api_used': 'Google Custom Search API'
-                        }
-                    else:
-                        error_text = await response.text()
-                        try:
-                            error_data = json.loads(error_text)
-                            error_message = error_data.get('error', {}).get('message', error_text)
-                            error_code = error_data.get('error', {}).get('code', response.status)
-                            self.logger.error(f"[GOOGLE] API error {error_code}: {error_message}")
-                            self.logger.error(f"[GOOGLE] Full error response: {error_text}")
-                        except:
-                            self.logger.error(f"[GOOGLE] API error ({response.status}): {error_text}")
-
-                        # Check for common errors
-                        if response.status == 403:
-                            self.logger.error("[GOOGLE] Authentication failed - check API key validity")
-                        elif response.status == 429:
-                            self.logger.error("[GOOGLE] Rate limit exceeded - daily quota reached")
-                        elif response.status == 400:
-                            self.logger.error("[GOOGLE] Bad request - check engine ID and parameters")
-
-                        return None
+            async with get_http_pool().request(
+                "GET", url, params=params, timeout=aiohttp.ClientTimeout(total=self.search_timeout)
+            ) as response:
+                self.logger.info(f"[GOOGLE] Response status: {response.status}")
+                self.logger.debug(f"[GOOGLE] Response headers: {dict(response.headers)}")
+
+                if response.status == 200:
+                    data = await response.json()
+                    self.logger.debug(f"[GOOGLE] Response data keys: {list(data.keys())}")
+
+                    items = data.get('items', [])
+                    self.logger.info(f"[GOOGLE] Found {len(items)} results")
+
+                    if 'searchInformation' in data:
+                        total_results = data['searchInformation'].get('totalResults', 0)
+                        self.logger.debug(f"[GOOGLE] Total results available: {total_results}")
+
+                    results = []
+                    for item in items:
+                        # Phase 2: Sanitize content before adding to results
+                        title = self._sanitize_content(item.get('title', ''), 'text')
+                        snippet = self._sanitize_content(item.get('snippet', ''), 'text')
+
+                        results.append({
+                            'title': title,
+                            'snippet': snippet,
+                            'url': item.get('link', ''),
+                            'source': 'google_custom_search',
+                            'timestamp': datetime.now().isoformat()
+                        })
+
+                    self.logger.info(f"[GOOGLE] Successfully formatted {len(results)} results")
+                    return {
+                        'results': results,
+                        'total_found': len(results),
+                        'method': 'google_custom_search',
+                        'api_used': 'Google Custom Search API'
+                    }
+                else:
+                    error_text = await response.text()
+                    try:
+                        error_data = json.loads(error_text)
+                        error_message = error_data.get('error', {}).get('message', error_text)
+                        error_code = error_data.get('error', {}).get('code', response.status)
+                        self.logger.error(f"[GOOGLE] API error {error_code}: {error_message}")
+                        self.logger.error(f"[GOOGLE] Full error response: {error_text}")
+                    except:
+                        self.logger.error(f"[GOOGLE] API error ({response.status}): {error_text}")
+
+                    # Check for common errors
+                    if response.status == 403:
+                        self.logger.error("[GOOGLE] Authentication failed - check API key validity")
+                    elif response.status == 429:
+                        self.logger.error("[GOOGLE] Rate limit exceeded - daily quota reached")
+                    elif response.status == 400:
+                        self.logger.error("[GOOGLE] Bad request - check engine ID and parameters")
+
+                    return None
 
         except asyncio.TimeoutError:
             self.logger.error(f"[GOOGLE] Request timeout after {self.search_timeout}s")
@@ -576,61 +715,62 @@ class WebSearchProvider:
             self.logger.debug(f"[BRAVE] Request params: {params}")
             self.logger.debug(f"[BRAVE] Request headers: {list(headers.keys())}")
 
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.search_timeout)) as session:
-                async with session.get(url, headers=headers, params=params) as response:
-                    self.logger.info(f"[BRAVE] Response status: {response.status}")
-                    self.logger.debug(f"[BRAVE] Response headers: {dict(response.headers)}")
-
-                    if response.status == 200:
-                        data = await response.json()
-                        self.logger.debug(f"[BRAVE] Response data keys: {list(data.keys())}")
-
-                        web_results = data.get('web', {}).get('results', [])
-                        self.logger.info(f"[BRAVE] Found {len(web_results)} web results")
-
-                        if 'query' in data:
-                            self.logger.debug(f"[BRAVE] Processed query: {data['query']}")
-
-                        results = []
-                        for item in web_results:
-                            # Phase 2: Sanitize content before adding to results
-                            title = self._sanitize_content(item.get('title', ''), 'text')
-                            snippet = self._sanitize_content(item.get('description', ''), 'text')
-
-                            results.append({
-                                'title': title,
-                                'snippet': snippet,
-                                'url': item.get('url', ''),
-                                'source': 'brave_search',
-                                'timestamp': datetime.now().isoformat()
-                            })
-
-                        self.logger.info(f"[BRAVE] Successfully formatted {len(results)} results")
-                        return {
-                            'results': results,
-                            'total_found': len(results),
-                            'method': 'brave_search',
-                            'api_used': 'Brave Search API'
-                        }
-                    else:
-                        error_text = await response.text()
-                        try:
-                            error_data = json.loads(error_text)
-                            error_message = error_data.get('message', error_text)
-                            self.logger.error(f"[BRAVE] API error ({response.status}): {error_message}")
-                            self.logger.error(f"[BRAVE] Full error response: {error_text}")
-                        except:
-                            self.logger.error(f"[BRAVE] API error ({response.status}): {error_text}")
-
-                        # Check for common errors
-                        if response.status == 401:
-                            self.logger.error("[BRAVE] Authentication failed - check API key validity")
-                        elif response.status == 429:
-                            self.logger.error("[BRAVE] Rate limit exceeded - monthly quota reached")
-                        elif response.status == 400:
-                            self.logger.error("[BRAVE] Bad request - check query parameters")
-
-                        return None
+            async with get_http_pool().request(
+                "GET", url, headers=headers, params=params, timeout=aiohttp.ClientTimeout(total=self.search_timeout)
+            ) as response:
+                self.logger.info(f"[BRAVE] Response status: {response.status}")
+                self.logger.debug(f"[BRAVE] Response headers: {dict(response.headers)}")
+
+                if response.status == 200:
+                    data = await response.json()
+                    self.logger.debug(f"[BRAVE] Response data keys: {list(data.keys())}")
+
+                    web_results = data.get('web', {}).get('results', [])
+                    self.logger.info(f"[BRAVE] Found {len(web_results)} web results")
+
+                    if 'query' in data:
+                        self.logger.debug(f"[BRAVE] Processed query: {data['query']}")
+
+                    results = []
+                    for item in web_results:
+                        # Phase 2: Sanitize content before adding to results
+                        title = self._sanitize_content(item.get('title', ''), 'text')
+                        snippet = self._sanitize_content(item.get('description', ''), 'text')
+
+                        results.append({
+                            'title': title,
+                            'snippet': snippet,
+                            'url': item.get('url', ''),
+                            'source': 'brave_search',
+                            'timestamp': datetime.now().isoformat()
+                        })
+
+                    self.logger.info(f"[BRAVE] Successfully formatted {len(results)} results")
+                    return {
+                        'results': results,
+                        'total_found': len(results),
+                        'method': 'brave_search',
+                        'api_used': 'Brave Search API'
+                    }
+                else:
+                    error_text = await response.text()
+                    try:
+                        error_data = json.loads(error_text)
+                        error_message = error_data.get('message', error_text)
+                        self.logger.error(f"[BRAVE] API error ({response.status}): {error_message}")
+                        self.logger.error(f"[BRAVE] Full error response: {error_text}")
+                    except:
+                        self.logger.error(f"[BRAVE] API error ({response.status}): {error_text}")
+
+                    # Check for common errors
+                    if response.status == 401:
+                        self.logger.error("[BRAVE] Authentication failed - check API key validity")
+                    elif response.status == 429:
+                        self.logger.error("[BRAVE] Rate limit exceeded - monthly quota reached")
+                    elif response.status == 400:
+                        self.logger.error("[BRAVE] Bad request - check query parameters")
+
+                    return None
 
         except asyncio.TimeoutError:
             self.logger.error(f"[BRAVE] Request timeout after {self.search_timeout}s")
@@ -666,10 +806,15 @@ class WebSearchProvider:
             # Select appropriate search method based on type
             if search_type == 'news':
                 self.logger.debug(f"Performing DuckDuckGo news search for: {query}")
-                search_results = list(ddgs.news(query, max_results=max_results))
+                ddgs_search = ddgs.news
             else:
                 self.logger.debug(f"Performing DuckDuckGo text search for: {query}")
-                search_results = list(ddgs.text(query, max_results=max_results))
+                ddgs_search = ddgs.text
+
+            # DDGS is blocking; keep it off the event loop so other methods can run
+            search_results = await asyncio.get_running_loop().run_in_executor(
+                get_executor(), lambda: list(ddgs_search(query, max_results=max_results))
+            )
 
             # Format results to match WebSearchProvider format
             for r in search_results:
@@ -0,0 +1,362 @@
+"""
+Latency-aware tier router for LLMManager.chat_with_routing.
+
+Each provider belongs to a tier with a quality level:
+
+    fast      (1)  llama.cpp fast settings      short lookups, yes/no, classify
+    balanced  (2)  llama.cpp quality settings   summaries, medium prompts
+    standard  (3)  DeepSeek / Ollama            long or complex prompts
+    premium   (4)  Claude / GLM                 mission-critical answers
+
+A request needs a minimum quality (from its size and shape, or given by the
+caller). Among providers at or above it, the router picks the one with the
+lowest expected latency: the EWMA of observed latency, stretched by the
+requests already in flight beyond the provider's concurrency and by its
+EWMA error rate (a failed call costs a retry elsewhere). Until a provider
+has been observed its tier's prior latency is used.
+
+The premium tier is opt-in as the first choice: it serves callers that ask
+for quality 4, or every request when nothing cheaper is available. It is
+always a fallback, and it backs up the cheaper tiers through hedging.
+Premium requests are hedged: if the primary has not answered after its
+EWMA latency plus a few EWMA deviations (roughly its p95), the same
+request goes to the next-best premium provider and the first answer wins.
+Requests to a cheaper tier whose primary has a p95 beyond the tier's
+deadline are hedged to the best premium provider at that deadline.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TierSpec:
+    """A routing tier: quality level, providers and their latency prior."""
+    name: str
+    quality: int
+    providers: List[str]
+    prior_latency_ms: float
+    concurrency: int = 8
+    hedge: bool = False
+    opt_in: bool = False
+    deadline_ms: Optional[float] = None
+
+
+DEFAULT_TIERS = [
+    TierSpec("fast", 1, ["llama_cpp_fast"], prior_latency_ms=2000, concurrency=1, deadline_ms=5000),
+    TierSpec("balanced", 2, ["llama_cpp_quality"], prior_latency_ms=10000, concurrency=1, deadline_ms=25000),
+    TierSpec("standard", 3, ["deepseek", "ollama"], prior_latency_ms=30000, deadline_ms=60000),
+    TierSpec("premium", 4, ["claude", "glm"], prior_latency_ms=20000, hedge=True, opt_in=True),
+]
+
+# Provider names that share one backend (and so one set of slots)
+DEFAULT_RESOURCES = {"llama_cpp_fast": "llama_cpp", "llama_cpp_quality": "llama_cpp"}
+
+SIMPLE_PATTERNS = ['search', 'find', 'list', 'classify', 'is ', 'does ', 'can ', 'what is', 'who is']
+
+
+@dataclass
+class ProviderStats:
+    """Observed behaviour of one provider."""
+    latency_ms: Optional[float] = None
+    deviation_ms: float = 0.0
+    error_rate: float = 0.0
+    requests: int = 0
+    failures: int = 0
+
+
+@dataclass
+class RouteDecision:
+    """Where a request goes, and what to try if that fails."""
+    tier: str
+    provider: str
+    quality: int
+    expected_ms: float
+    fallbacks: List[str] = field(default_factory=list)
+    hedge_provider: Optional[str] = None
+    hedge_delay_ms: Optional[float] = None
+
+
+class TierRouter:
+    """Route requests to the tier and provider with the lowest expected latency."""
+
+    def __init__(
+        self,
+        tiers: Optional[List[TierSpec]] = None,
+        resources: Optional[Dict[str, str]] = None,
+        alpha: float = 0.2,
+        hedge_deviations: float = 2.0,
+        max_error_rate: float = 0.9,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize tier router.
+
+        Args:
+            tiers: Tier definitions (default: DEFAULT_TIERS)
+            resources: Provider -> shared backend name for in-flight accounting
+            alpha: EWMA weight of the newest observation
+            hedge_deviations: Hedge after EWMA latency + this many EWMA deviations
+            max_error_rate: Cap on the error rate used in the latency penalty
+            clock: Monotonic clock in seconds (injectable for simulation)
+        """
+        self.tiers = tiers or DEFAULT_TIERS
+        self.resources = DEFAULT_RESOURCES if resources is None else resources
+        self.alpha = alpha
+        self.hedge_deviations = hedge_deviations
+        self.max_error_rate = max_error_rate
+        self.clock = clock
+
+        self._tier_of = {name: tier for tier in self.tiers for name in tier.providers}
+        self.stats: Dict[str, ProviderStats] = {name: ProviderStats() for name in self._tier_of}
+        self.in_flight: Dict[str, int] = {}
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    # ------------------------------------------------------------------
+    # Estimates
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def required_quality(messages: List[Dict[str, Any]]) -> int:
+        """
+        Minimum tier quality for a conversation.
+
+        Short lookups (<200 tokens matching a simple pattern) need the fast
+        tier, prompts up to 1000 tokens the balanced tier, longer ones the
+        standard tier.
+        """
+        approx_tokens = sum(len(str(msg.get('content', ''))) for msg in messages) / 4
+        last_message = str(messages[-1].get('content', '')).lower() if messages else ''
+
+        if approx_tokens <= 200 and any(pattern in last_message for pattern in SIMPLE_PATTERNS):
+            return 1
+        if approx_tokens <= 1000:
+            return 2
+        return 3
+
+    def _resource(self, provider: str) -> str:
+        return self.resources.get(provider, provider)
+
+    def expected_latency_ms(self, provider: str) -> float:
+        """Expected latency of a new request to a provider right now."""
+        tier = self._tier_of[provider]
+        stats = self.stats[provider]
+        latency = stats.latency_ms if stats.latency_ms is not None else tier.prior_latency_ms
+
+        # Requests beyond the provider's slots wait for earlier ones
+        queued = max(0, self.in_flight.get(self._resource(provider), 0) + 1 - tier.concurrency)
+        latency *= 1 + queued / tier.concurrency
+
+        # A failure costs roughly another attempt: geometric retries
+        return latency / (1 - min(stats.error_rate, self.max_error_rate))
+
+    def hedge_delay_ms(self, provider: str) -> float:
+        """How long to wait for a provider before hedging (about its p95)."""
+        stats = self.stats[provider]
+        if stats.latency_ms is None:
+            return self._tier_of[provider].prior_latency_ms
+        return stats.latency_ms + self.hedge_deviations * stats.deviation_ms
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def route(
+        self,
+        messages: List[Dict[str, Any]],
+        available: Iterable[str],
+        min_quality: Optional[int] = None
+    ) -> Optional[RouteDecision]:
+        """
+        Choose a provider for a request.
+
+        Args:
+            messages: Conversation to route
+            available: Provider names registered with the manager
+            min_quality: Override the quality derived from the messages
+
+        Returns:
+            RouteDecision, or None if no available provider meets the quality
+        """
+        quality = min_quality if min_quality is not None else self.required_quality(messages)
+        available = set(available)
+        eligible = sorted(
+            (name for tier in self.tiers if tier.quality >= quality
+             for name in tier.providers if name in available),
+            key=self.expected_latency_ms
+        )
+        # Opt-in tiers lead only when asked for (or nothing else can); they
+        # stay behind the others as fallbacks
+        candidates = ([name for name in eligible if self._is_requested(name, quality)] +
+                      [name for name in eligible if not self._is_requested(name, quality)])
+        if not candidates:
+            return None
+
+        primary = candidates[0]
+        tier = self._tier_of[primary]
+        decision = RouteDecision(
+            tier=tier.name,
+            provider=primary,
+            quality=quality,
+            expected_ms=self.expected_latency_ms(primary),
+            fallbacks=candidates[1:]
+        )
+        if tier.hedge:
+            backups = [name for name in candidates[1:] if self._tier_of[name] is tier]
+            if backups:
+                decision.hedge_provider = backups[0]
+                decision.hedge_delay_ms = self.hedge_delay_ms(primary)
+        elif tier.deadline_ms is not None:
+            p95 = max(self.hedge_delay_ms(primary), decision.expected_ms)
+            backups = [name for name in candidates[1:] if self._tier_of[name].hedge]
+            if p95 > tier.deadline_ms and backups:
+                decision.hedge_provider = backups[0]
+                decision.hedge_delay_ms = tier.deadline_ms
+        return decision
+
+    def _is_requested(self, provider: str, quality: int) -> bool:
+        tier = self._tier_of[provider]
+        return not tier.opt_in or tier.quality <= quality
+
+    # ------------------------------------------------------------------
+    # Observations
+    # ------------------------------------------------------------------
+
+    def begin(self, provider: str) -> float:
+        """Count a request as in flight; returns its start time for end()."""
+        resource = self._resource(provider)
+        self.in_flight[resource] = self.in_flight.get(resource, 0) + 1
+        return self.clock()
+
+    def end(self, provider: str, started: float, success: bool = True,
+            cancelled: bool = False) -> None:
+        """
+        Record a finished request.
+
+        Cancelled requests (hedge losers) only release their slot: their
+        latency is unknown, and treating it as a sample would bias the
+        EWMA towards the hedge delay.
+        """
+        resource = self._resource(provider)
+        self.in_flight[resource] = max(0, self.in_flight.get(resource, 0) - 1)
+        if cancelled or provider not in self.stats:
+            return
+
+        stats = self.stats[provider]
+        stats.requests += 1
+        stats.error_rate += self.alpha * ((0.0 if success else 1.0) - stats.error_rate)
+        if not success:
+            stats.failures += 1
+            return
+
+        latency = (self.clock() - started) * 1000
+        if stats.latency_ms is None:
+            stats.latency_ms = latency
+            stats.deviation_ms = latency / 2
+        else:
+            stats.deviation_ms += self.alpha * (abs(latency - stats.latency_ms) - stats.deviation_ms)
+            stats.latency_ms += self.alpha * (latency - stats.latency_ms)
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def _tracked(self, provider: str, call: Callable[[str], Awaitable[Any]]) -> Any:
+        started = self.begin(provider)
+        try:
+            result = await call(provider)
+        except asyncio.CancelledError:
+            self.end(provider, started, cancelled=True)
+            raise
+        except Exception:
+            self.end(provider, started, success=False)
+            raise
+        self.end(provider, started)
+        return result
+
+    async def _hedged(self, decision: RouteDecision, call: Callable[[str], Awaitable[Any]]) -> Any:
+        """Run the primary, adding the hedge provider if it is slow; first success wins."""
+        primary = asyncio.create_task(self._tracked(decision.provider, call))
+        done, _ = await asyncio.wait({primary}, timeout=decision.hedge_delay_ms / 1000)
+        if done and primary.exception() is None:
+            return primary.result()
+
+        self.hedges += 1
+        logger.info(
+            f"Hedging {decision.provider} with {decision.hedge_provider} "
+            f"after {decision.hedge_delay_ms:.0f}ms"
+        )
+        hedge = asyncio.create_task(self._tracked(decision.hedge_provider, call))
+        pending = {hedge} if done else {primary, hedge}
+        error: Optional[BaseException] = primary.exception() if done else None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def run(self, decision: RouteDecision, call: Callable[[str], Awaitable[Any]]) -> Any:
+        """
+        Execute a routed request.
+
+        Args:
+            decision: Result of route()
+            call: Coroutine function taking a provider name
+
+        Returns:
+            The first successful result; providers after the chosen (and
+            hedge) provider are tried in order of expected latency on failure
+        """
+        tried = {decision.provider}
+        try:
+            if decision.hedge_provider:
+                tried.add(decision.hedge_provider)
+                return await self._hedged(decision, call)
+            return await self._tracked(decision.provider, call)
+        except Exception as e:
+            error = e
+            logger.warning(f"{decision.tier} tier ({decision.provider}) failed: {e}, falling back...")
+
+        for provider in decision.fallbacks:
+            if provider in tried:
+                continue
+            try:
+                return await self._tracked(provider, call)
+            except Exception as e:
+                error = e
+                logger.warning(f"Fallback {provider} failed: {e}")
+        raise error
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get router statistics."""
+        return {
+            "providers": {
+                name: {
+                    "tier": self._tier_of[name].name,
+                    "ewma_latency_ms": round(stats.latency_ms, 1) if stats.latency_ms is not None else None,
+                    "ewma_deviation_ms": round(stats.deviation_ms, 1),
+                    "error_rate": round(stats.error_rate, 3),
+                    "in_flight": self.in_flight.get(self._resource(name), 0),
+                    "requests": stats.requests,
+                    "failures": stats.failures,
+                    "expected_latency_ms": round(self.expected_latency_ms(name), 1)
+                }
+                for name, stats in self.stats.items()
+            },
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins
+        }
@@ -9,11 +9,14 @@ Provides safe, idempotent node execution that prevents:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from uuid import uuid4
 
+from ..core.executor_pool import get_executor
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,6 +83,82 @@ class MissionNodeExecutor:
             IdempotencyViolationError: If node already in terminal state
             NodeExecutionError: If execution fails
         """
+        skipped = self._begin_node(mission_id, node_id, node_title, node_type)
+        if skipped:
+            return skipped
+
+        # Step 6: Execute the node
+        try:
+            output_data, confidence = self._execute_node_work(
+                node_title, node_type, executor_fn
+            )
+        except Exception as e:
+            # Mark as failed
+            self._transition_to_failed(node_id, str(e))
+            raise NodeExecutionError(f"Execution failed: {e}")
+
+        return self._finish_node(
+            mission_id, node_id, node_title, node_type, output_data, confidence
+        )
+
+    async def execute_node_async(
+        self,
+        mission_id: str,
+        node_id: str,
+        node_title: str,
+        node_type: str,
+        executor_fn: Optional[Callable[[str, str], Awaitable[Dict[str, Any]]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of execute_node for use inside a running event loop.
+
+        executor_fn is awaited on the loop; the blocking database steps
+        around it run on the shared thread pool, so many nodes can be in
+        flight at once.
+
+        Returns:
+            Execution result, as for execute_node
+
+        Raises:
+            NodeExecutionError: If execution fails
+        """
+        loop = asyncio.get_running_loop()
+        pool = get_executor()
+
+        skipped = await loop.run_in_executor(
+            pool, self._begin_node, mission_id, node_id, node_title, node_type
+        )
+        if skipped:
+            return skipped
+
+        try:
+            if executor_fn:
+                result = await executor_fn(node_title, node_type)
+                output_data, confidence = result.get("output", {}), result.get("confidence", 0.85)
+            else:
+                output_data, confidence = self._execute_node_work(node_title, node_type, None)
+        except Exception as e:
+            await loop.run_in_executor(pool, self._transition_to_failed, node_id, str(e))
+            raise NodeExecutionError(f"Execution failed: {e}") from e
+
+        return await loop.run_in_executor(
+            pool, self._finish_node,
+            mission_id, node_id, node_title, node_type, output_data, confidence
+        )
+
+    def _begin_node(
+        self,
+        mission_id: str,
+        node_id: str,
+        node_title: str,
+        node_type: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Claim a node for execution (steps 1-5).
+
+        Returns:
+            A skipped result if the node cannot be claimed, else None
+        """
         # Step 1: Get current state (database source of truth)
         current_state = self._get_node_state(node_id)
 
@@ -120,16 +199,18 @@ class MissionNodeExecutor:
             {"node_type": node_type}
         )
 
-        # Step 6: Execute the node
-        try:
-            output_data, confidence = self._execute_node_work(
-                node_title, node_type, executor_fn
-            )
-        except Exception as e:
-            # Mark as failed
-            self._transition_to_failed(node_id, str(e))
-            raise NodeExecutionError(f"Execution failed: {e}")
+        return None
 
+    def _finish_node(
+        self,
+        mission_id: str,
+        node_id: str,
+        node_title: str,
+        node_type: str,
+        output_data: Dict[str, Any],
+        confidence: float
+    ) -> Dict[str, Any]:
+        """Record a node's completion, events, handoff and dependents (steps 7-10)."""
         # Step 7: Transition to COMPLETED (atomic)
         if not self._try_transition_to_completed(node_id, output_data, confidence):
             # Someone else marked this completed?
@@ -10,11 +10,20 @@ The scheduler:
 - Tracks progress
 - Handles decision gates
 
+Ready nodes sit in a priority queue. Each node keeps a count of unfinished
+dependencies, decremented as dependencies complete, so readiness updates
+are O(1) per edge. Nodes run concurrently up to a global parallelism cap
+and a per-agent-type pool limit; a node whose agent pool is full waits
+without taking a global slot.
+
 Uses hardened executor for idempotent node execution and event emission.
 """
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import itertools
 import logging
 from collections import defaultdict, deque
 from datetime import datetime
@@ -25,8 +34,10 @@ from .models import (
     MissionGraph,
     MissionNode,
     MissionEdge,
+    MissionStatus,
     NodeType,
     NodeStatus,
+    NodePriority,
     EdgeType,
     AgentType,
     GateCondition,
@@ -38,6 +49,14 @@ from .executor import MissionNodeExecutor, MissionCompleter
 
 logger = logging.getLogger(__name__)
 
+# Lower runs first among ready nodes
+PRIORITY_RANK = {
+    NodePriority.CRITICAL: 0,
+    NodePriority.HIGH: 1,
+    NodePriority.MEDIUM: 2,
+    NodePriority.LOW: 3,
+}
+
 
 # ============================================================================
 # Scheduler State
@@ -56,13 +75,24 @@ class SchedulerState:
         self.running_nodes: Set[str] = set()
         self.completed_nodes: Set[str] = set()
         self.failed_nodes: Set[str] = set()
+        for node_id, status in self.node_states.items():
+            self.update_node_status(node_id, status)
+
+        self.node_map: Dict[str, MissionNode] = {n.id: n for n in graph.nodes}
+        # Reverse dependency index and unfinished-dependency counters
+        self.dependents: Dict[str, List[str]] = defaultdict(list)
+        self.remaining_deps: Dict[str, int] = {}
+        for node in graph.nodes:
+            for dep_id in node.depends_on_nodes:
+                self.dependents[dep_id].append(node.id)
+            self.remaining_deps[node.id] = sum(
+                1 for dep_id in node.depends_on_nodes
+                if dep_id not in self.completed_nodes
+            )
 
     def get_node(self, node_id: str) -> Optional[MissionNode]:
         """Get node by ID."""
-        for node in self.graph.nodes:
-            if node.id == node_id:
-                return node
-        return None
+        return self.node_map.get(node_id)
 
     def update_node_status(self, node_id: str, status: NodeStatus):
         """Update node status."""
@@ -85,31 +115,27 @@ class SchedulerState:
 
     def is_ready(self, node: MissionNode) -> bool:
         """Check if node is ready to execute."""
-        # Check current status
-        if self.node_states.get(node.id) != NodeStatus.PENDING:
+        # Check current status (READY is set as dependencies complete)
+        if self.node_states.get(node.id) not in (NodeStatus.PENDING, NodeStatus.READY):
             return False
 
         # Check if all dependencies are satisfied
-        for dep_id in node.depends_on_nodes:
-            if dep_id not in self.completed_nodes:
-                return False
+        return self.remaining_deps.get(node.id, 0) == 0
 
-        # Check if not blocked
-        if node.id in self.blocked_nodes:
-            return False
-
-        return True
+    def mark_dependencies_ready(self, node_id: str) -> List[str]:
+        """
+        Record that node_id completed and release its dependents.
 
-    def mark_dependencies_ready(self, node_id: str):
-        """Mark nodes that depend on this node as potentially ready."""
-        # Find edges where this node is the source
-        for edge in self.graph.edges:
-            if edge.source_node_id == node_id:
-                if edge.edge_type == EdgeType.DEPENDS_ON:
-                    target = self.get_node(edge.target_node_id)
-                    if target and target.depends_on_nodes.count(node_id) == len(target.depends_on_nodes):
-                        # All dependencies satisfied
-                        self.update_node_status(target.id, NodeStatus.READY)
+        Returns:
+            IDs of dependents whose last outstanding dependency this was
+        """
+        released = []
+        for target_id in self.dependents.get(node_id, []):
+            self.remaining_deps[target_id] -= 1
+            if self.remaining_deps[target_id] == 0 and self.node_states.get(target_id) == NodeStatus.PENDING:
+                self.update_node_status(target_id, NodeStatus.READY)
+                released.append(target_id)
+        return released
 
 
 # ============================================================================
@@ -134,12 +160,40 @@ class MissionGraphScheduler:
     - Atomic state transitions
     """
 
-    def __init__(self, supabase_client, executor=None):
+    def __init__(
+        self,
+        supabase_client,
+        executor=None,
+        max_parallel: int = 8,
+        agent_pool_limits: Optional[Dict[str, int]] = None,
+        default_agent_pool_limit: Optional[int] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            supabase_client: Database client
+            executor: Agent executor interface (for actual work)
+            max_parallel: Maximum nodes running at once
+            agent_pool_limits: Per-agent-type limits, e.g. {"specialist": 4, "synthesizer": 1}
+            default_agent_pool_limit: Limit for agent types not in agent_pool_limits (None: unlimited)
+        """
         self.supabase = supabase_client
         self.executor = executor  # Agent executor interface (for actual work)
         self.hardened_executor = MissionNodeExecutor(supabase_client)  # For idempotent execution
         self.mission_completer = MissionCompleter(supabase_client)  # For idempotent completion
 
+        self.max_parallel = max_parallel
+        self.agent_pool_limits = {
+            getattr(agent_type, "value", agent_type): limit
+            for agent_type, limit in (agent_pool_limits or {}).items()
+        }
+        self.default_agent_pool_limit = default_agent_pool_limit
+
+        # Dispatch statistics from the last execute_graph call
+        self.max_running = 0
+        self.pool_waits = 0
+
     async def execute_graph(
         self,
         mission: Mission,
@@ -155,30 +209,12 @@ class MissionGraphScheduler:
         # Update mission status
         await self._update_mission_status(mission.id, "running")
 
-        # Main execution loop
-        while not self._is_complete(state):
-            # Find ready nodes
-            ready_nodes = self._get_ready_nodes(state)
-
-            if not ready_nodes:
-                # No ready nodes - check if blocked
-                if state.blocked_nodes or state.running_nodes:
-                    # Wait for running nodes to complete
-                    await self._await_progress(state)
-                else:
-                    # No progress possible - might be stuck
-                    logger.warning(f"Mission {mission.id} appears stuck")
-                    break
-
-            # Dispatch ready nodes (with parallelism)
-            await self._dispatch_nodes(mission, ready_nodes, state)
-
-            # Update state
-            execution_state = self._build_execution_state(mission, graph, state)
+        # Run nodes as their dependencies complete
+        await self._dispatch_ready_queue(mission, state)
 
-            # Check for completion
-            if execution_state.pending_nodes == 0:
-                break
+        if not self._is_complete(state):
+            # Remaining nodes wait on failed, blocked or externally-run nodes
+            logger.warning(f"Mission {mission.id} appears stuck")
 
         # Final state
         final_state = self._build_execution_state(mission, graph, state)
@@ -206,32 +242,85 @@ class MissionGraphScheduler:
 
         return ready
 
-    async def _dispatch_nodes(
+    def _agent_pool(self, node: MissionNode) -> str:
+        """Agent-type pool a node draws from."""
+        agent_type = node.agent_type or self._determine_agent_type(node)
+        return agent_type.value
+
+    def _pool_limit(self, pool: str) -> Optional[int]:
+        return self.agent_pool_limits.get(pool, self.default_agent_pool_limit)
+
+    async def _dispatch_ready_queue(self, mission: Mission, state: SchedulerState):
+        """
+        Run every reachable node, each as soon as its dependencies complete.
+
+        Only the initial ready set is found by scanning the graph; after
+        that, each completion decrements its dependents' counters and
+        pushes those that reach zero.
+        """
+        order = itertools.count()
+        ready: List[tuple] = []
+
+        def push(node_id: str):
+            node = state.node_map[node_id]
+            heapq.heappush(ready, (PRIORITY_RANK.get(node.priority, 2), next(order), node_id))
+
+        for node in self._get_ready_nodes(state):
+            push(node.id)
+
+        running: Dict[asyncio.Task, str] = {}
+        pool_use: Dict[str, int] = defaultdict(int)
+        self.max_running = 0
+        self.pool_waits = 0
+
+        def start_ready():
+            waiting = []
+            while ready and len(running) < self.max_parallel:
+                entry = heapq.heappop(ready)
+                node = state.node_map[entry[2]]
+                pool = self._agent_pool(node)
+                limit = self._pool_limit(pool)
+                if limit is not None and pool_use[pool] >= limit:
+                    waiting.append(entry)
+                    continue
+                pool_use[pool] += 1
+                state.update_node_status(node.id, NodeStatus.RUNNING)
+                running[asyncio.create_task(self._run_node(mission, node, state))] = node.id
+            self.pool_waits += len(waiting)
+            for entry in waiting:
+                heapq.heappush(ready, entry)
+            self.max_running = max(self.max_running, len(running))
+
+        start_ready()
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    node_id = running.pop(task)
+                    pool_use[self._agent_pool(state.node_map[node_id])] -= 1
+                    if state.node_states.get(node_id) == NodeStatus.COMPLETED:
+                        for released_id in state.mark_dependencies_ready(node_id):
+                            push(released_id)
+                start_ready()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    async def _run_node(
         self,
         mission: Mission,
-        nodes: List[MissionNode],
+        node: MissionNode,
         state: SchedulerState
     ):
-        """
-        Dispatch nodes to agents for execution.
-
-        Uses hardened executor for idempotent node execution.
-        Nodes that are already running or completed will be safely skipped.
-        """
-        for node in nodes:
-            # Check if already executed (idempotency)
-            current_status = state.node_states.get(node.id)
-            if current_status in [NodeStatus.COMPLETED, NodeStatus.RUNNING]:
-                logger.info(f"Node {node.id} already {current_status.value}, skipping")
-                continue
-
-            # Execute node using hardened executor
-            try:
-                await self._execute_node_hardened(mission, node, state)
-            except Exception as e:
-                logger.error(f"Error executing node {node.id}: {e}")
-                state.update_node_status(node.id, NodeStatus.FAILED)
-                await self._persist_node_status(node.id, NodeStatus.FAILED, error=str(e))
+        """Execute one node, recording failures instead of raising."""
+        try:
+            await self._execute_node_hardened(mission, node, state)
+        except Exception as e:
+            logger.error(f"Error executing node {node.id}: {e}")
+            state.update_node_status(node.id, NodeStatus.FAILED)
+            await self._persist_node_status(node.id, NodeStatus.FAILED, error=str(e))
 
     async def _execute_node_hardened(
         self,
@@ -255,7 +344,7 @@ class MissionGraphScheduler:
         memory_context = await self._get_memory_context(node, mission)
 
         # Define the actual work function for this node
-        async def execute_work():
+        async def execute_work(node_title: str, node_type: str):
             """Execute the actual node work."""
             # Execute based on node type
             if node.node_type == NodeType.DECISION:
@@ -268,45 +357,23 @@ class MissionGraphScheduler:
                 return await self._execute_task_node_work(mission, node, inputs, memory_context, state)
 
         # Use hardened executor for the node lifecycle
-        result = self.hardened_executor.execute_node(
+        result = await self.hardened_executor.execute_node_async(
             mission_id=mission.id,
             node_id=node.id,
             node_title=node.title,
             node_type=node.node_type.value,
-            executor_fn=self._sync_wrapper(execute_work)
+            executor_fn=execute_work
         )
 
         # Update local state to match database
         if result.get("skipped"):
-            # Node was already executed, sync local state
-            actual_status = result.get("status", "completed")
-            if actual_status == "completed":
-                state.update_node_status(node.id, NodeStatus.COMPLETED)
-            state.mark_dependencies_ready(node.id)
+            # Node was already executed (or claimed elsewhere), sync local state
+            state.update_node_status(node.id, NodeStatus(result.get("status", "completed")))
             return
 
         # Node executed successfully
+        state.node_outputs[node.id].append(result.get("output_data", {}))
         state.update_node_status(node.id, NodeStatus.COMPLETED)
-        state.mark_dependencies_ready(node.id)
-
-    def _sync_wrapper(self, async_fn):
-        """Wrap async function for sync executor."""
-        def wrapper(*args, **kwargs):
-            # For now, run async function in sync context
-            # In production, this should use proper async/await
-            import asyncio
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # Running in async context, need to create task
-                    # For now, return placeholder
-                    return {"output": {}, "confidence": 0.85}
-                else:
-                    return loop.run_until_complete(async_fn(*args, **kwargs))
-            except RuntimeError:
-                # No event loop, return placeholder
-                return {"output": {}, "confidence": 0.85}
-        return wrapper
 
     async def _execute_node(
         self,
@@ -675,16 +742,6 @@ class MissionGraphScheduler:
                 return False
         return True
 
-    async def _await_progress(self, state: SchedulerState):
-        """Wait for running nodes to make progress."""
-        # In real implementation, this would:
-        # - Subscribe to node completion events
-        # - Wait with timeout
-        # - Check for blocked nodes that need attention
-
-        # For now, just return
-        pass
-
     def _build_execution_state(
         self,
         mission: Mission,
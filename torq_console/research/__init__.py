@@ -25,7 +25,7 @@ from .coordinator import (
 )
 
 from .router import ResearchRouter, get_research_router, is_research_enabled, get_research_status
-from .cache import QueryCache, get_query_cache, get_url_cache
+from .cache import QueryCache, SemanticCacheTier, get_query_cache, get_url_cache
 from .citations import CitationPolicy, get_citation_policy
 from .security import WebSecurityChecker, get_security_checker
 from .canonicalizer import (
@@ -56,6 +56,7 @@ __all__ = [
     "get_research_router",
     # Cache
     "QueryCache",
+    "SemanticCacheTier",
     "get_query_cache",
     "get_url_cache",
     # Citations
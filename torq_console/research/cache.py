@@ -10,16 +10,32 @@ TTL Strategy:
 - News/current events: 15-60 minutes
 - General facts: 1-7 days
 - URL content: 7-30 days
+
+The query cache persists to a SQLite file shared across workers
+(TORQ_RESEARCH_CACHE_PATH, default ~/.torq_console/research_cache.sqlite;
+set it to "" to keep the cache in memory) and serves expired entries
+while a single background refresh runs. TORQ_RESEARCH_SEMANTIC_CACHE=1
+adds a tier that answers near-duplicate queries from cache
+(TORQ_RESEARCH_SEMANTIC_THRESHOLD, default 0.9 cosine similarity).
 """
 
 import hashlib
 import json
+import os
+import random
 import asyncio
 import logging
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timezone, timedelta
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable, Awaitable, Tuple
+from datetime import datetime, timezone
 from dataclasses import dataclass, asdict
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,11 +50,14 @@ class CachedResult:
     hit_count: int = 0
     last_accessed: str = ""
 
+    def age_seconds(self) -> float:
+        """Seconds since this result was cached."""
+        created = datetime.fromisoformat(self.created_at)
+        return (datetime.now(timezone.utc) - created).total_seconds()
+
     def is_expired(self) -> bool:
         """Check if this cached result has expired."""
-        created = datetime.fromisoformat(self.created_at)
-        expiry = created + timedelta(seconds=self.ttl_seconds)
-        return datetime.now(timezone.utc) > expiry
+        return self.age_seconds() > self.ttl_seconds
 
     def touch(self):
         """Update last_accessed time and increment hit count."""
@@ -46,6 +65,286 @@ class CachedResult:
         self.hit_count += 1
 
 
+class _CacheStore:
+    """
+    SQLite (WAL) table behind QueryCache.
+
+    Shared by every worker process pointing at the same file, so a result
+    fetched by one worker is a hit for the others and survives restarts.
+    Blocking; QueryCache calls it through asyncio.to_thread().
+    """
+
+    # Puts between pruning expired / excess rows
+    PRUNE_EVERY = 100
+
+    def __init__(self, path: str, max_rows: int):
+        self.path = Path(path)
+        self.max_rows = max_rows
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._puts = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the connection lazily. Caller holds the lock."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS query_cache ("
+                " key TEXT PRIMARY KEY,"
+                " entry TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_query_cache_created ON query_cache (created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_query_cache_expires ON query_cache (expires_at)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        """Entry stored under a key, if any."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT entry FROM query_cache WHERE key = ?", (key,)
+            ).fetchone()
+        return CachedResult(**json.loads(row[0])) if row else None
+
+    def put(self, key: str, cached: CachedResult, expires_at: float) -> None:
+        """Store an entry; ``expires_at`` is when it stops being servable even stale."""
+        created = datetime.fromisoformat(cached.created_at).timestamp()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO query_cache (key, entry, created_at, expires_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(asdict(cached), default=str), created, expires_at)
+                )
+                self._puts += 1
+                if self._puts % self.PRUNE_EVERY == 0:
+                    self._prune(conn)
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """Drop dead rows, then the oldest rows beyond max_rows."""
+        conn.execute("DELETE FROM query_cache WHERE expires_at < ?", (time.time(),))
+        excess = conn.execute("SELECT COUNT(*) FROM query_cache").fetchone()[0] - self.max_rows
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM query_cache WHERE key IN ("
+                " SELECT key FROM query_cache ORDER BY created_at LIMIT ?)", (excess,)
+            )
+
+    def delete(self, keys: List[str]) -> None:
+        """Delete entries by key."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany("DELETE FROM query_cache WHERE key = ?", [(k,) for k in keys])
+
+    def delete_matching(self, query: Optional[str]) -> int:
+        """Delete entries whose query contains a substring (all if None)."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                if query is None:
+                    return conn.execute("DELETE FROM query_cache").rowcount
+                return conn.execute(
+                    "DELETE FROM query_cache WHERE lower(json_extract(entry, '$.query')) LIKE ?",
+                    (f"%{query.lower()}%",)
+                ).rowcount
+
+    def count(self) -> int:
+        """Number of stored entries."""
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM query_cache").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class SemanticCacheTier:
+    """
+    Near-duplicate query matching for QueryCache.
+
+    Keeps a normalized embedding per cached query and, on an exact-key
+    miss, returns the key of the most similar cached query when cosine
+    similarity reaches ``threshold`` and both queries fall in the same TTL
+    class with the same search parameters ("latest BTC price" vs "current
+    bitcoin price").
+
+    Precision is measured by sampling: ``verify_rate`` of semantic hits
+    also fetch the real result in the background and count as confirmed
+    when their sources overlap the served ones by at least
+    ``verify_overlap`` (Jaccard over URLs).
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[Any] = None,
+        threshold: float = 0.9,
+        max_entries: int = 1000,
+        verify_rate: float = 0.1,
+        verify_overlap: float = 0.5,
+    ):
+        """
+        Initialize the semantic tier.
+
+        Args:
+            embedder: Object with ``generate_single_embedding(text)`` such as
+                indexer.EmbeddingGenerator (created lazily when None)
+            threshold: Minimum cosine similarity for a match
+            max_entries: Embeddings kept (oldest overwritten first)
+            verify_rate: Fraction of semantic hits re-fetched to measure precision
+            verify_overlap: Source overlap that counts a verified hit as correct
+        """
+        self.embedder = embedder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.verify_rate = verify_rate
+        self.verify_overlap = verify_overlap
+        self.enabled = True
+
+        self._vectors: Optional[np.ndarray] = None
+        # Parallel to _vectors rows: (cache key, ttl class, params key)
+        self._entries: List[Optional[tuple]] = []
+        self._rows: Dict[str, int] = {}
+        self._next_row = 0
+        self._lock = threading.Lock()
+
+        self.metrics: Dict[str, int] = {
+            "lookups": 0,
+            "matches": 0,
+            "verified": 0,
+            "confirmed": 0,
+        }
+
+    def _embed(self, query: str) -> Optional[np.ndarray]:
+        """Normalized embedding of a query, or None if no embedder is available or it fails."""
+        if not self.enabled:
+            return None
+        try:
+            if self.embedder is None:
+                from torq_console.indexer.embeddings import EmbeddingGenerator
+                self.embedder = EmbeddingGenerator()
+            vector = np.asarray(
+                self.embedder.generate_single_embedding(query.lower().strip()), dtype='float32'
+            )
+        except ImportError as e:
+            logger.warning(f"Semantic research cache disabled: {e}")
+            self.enabled = False
+            return None
+        except Exception as e:
+            # A broken embedder must not fail the request; exact-match lookups still work
+            logger.warning(f"Semantic research cache embedding failed: {e}")
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    @staticmethod
+    def _params_key(params: Dict[str, Any]) -> tuple:
+        """Search parameters that must match exactly."""
+        return (params.get("top_k", 5), params.get("recency_days"), params.get("search_depth", "basic"))
+
+    def add(self, key: str, query: str, params: Dict[str, Any], ttl_class: int) -> None:
+        """Remember the embedding of a cached query (blocking)."""
+        vector = self._embed(query)
+        if vector is None:
+            return
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype='float32')
+                self._entries = [None] * self.max_entries
+
+            row = self._rows.get(key)
+            if row is None:
+                row = self._next_row
+                self._next_row = (self._next_row + 1) % self.max_entries
+                previous = self._entries[row]
+                if previous is not None:
+                    self._rows.pop(previous[0], None)
+                self._rows[key] = row
+
+            self._vectors[row] = vector
+            self._entries[row] = (key, ttl_class, self._params_key(params))
+
+    def match(self, query: str, params: Dict[str, Any], ttl_class: int) -> Optional[Tuple[str, float]]:
+        """
+        Find a cached query similar enough to stand in for ``query`` (blocking).
+
+        Returns:
+            (cache key, similarity) of the best match, or None
+        """
+        self.metrics["lookups"] += 1
+        if not self._rows:
+            return None
+        vector = self._embed(query)
+        if vector is None:
+            return None
+
+        params_key = self._params_key(params)
+        with self._lock:
+            similarities = self._vectors @ vector
+            for row in np.argsort(-similarities):
+                similarity = float(similarities[row])
+                if similarity < self.threshold:
+                    break
+                entry = self._entries[row]
+                if entry is not None and entry[1] == ttl_class and entry[2] == params_key:
+                    self.metrics["matches"] += 1
+                    return entry[0], similarity
+        return None
+
+    def discard(self, key: str) -> None:
+        """Forget a key whose entry left the cache."""
+        with self._lock:
+            row = self._rows.pop(key, None)
+            if row is not None:
+                self._entries[row] = None
+                self._vectors[row] = 0
+
+    def should_verify(self) -> bool:
+        """Whether to check this semantic hit against a real fetch."""
+        return random.random() < self.verify_rate
+
+    def record_verification(self, served: Dict[str, Any], actual: Dict[str, Any]) -> bool:
+        """Compare a served response with the real one; returns whether it was correct."""
+        served_urls, actual_urls = self._urls(served), self._urls(actual)
+        if served_urls or actual_urls:
+            overlap = len(served_urls & actual_urls) / len(served_urls | actual_urls)
+            correct = overlap >= self.verify_overlap
+        else:
+            correct = served == actual
+        self.metrics["verified"] += 1
+        self.metrics["confirmed"] += int(correct)
+        return correct
+
+    @staticmethod
+    def _urls(response: Dict[str, Any]) -> set:
+        """Source URLs in a cached search response."""
+        return {
+            item.get("url") for item in response.get("items", [])
+            if isinstance(item, dict) and item.get("url")
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get semantic tier statistics."""
+        verified = self.metrics["verified"]
+        return {
+            "enabled": self.enabled,
+            "threshold": self.threshold,
+            "entries": len(self._rows),
+            "precision": self.metrics["confirmed"] / verified if verified else None,
+            **self.metrics,
+        }
+
+
 class QueryCache:
     """
     Cache for research queries with TTL based on query type.
@@ -54,17 +353,46 @@ class QueryCache:
     - Time-sensitive (news, prices, etc.): 15-60 minutes
     - General facts: 1-7 days
     - Conceptual definitions: 7-30 days
+
+    Entries are kept in an LRU (OrderedDict, O(1) per operation) and, when
+    ``path`` is given, written through to a SQLite file shared by all
+    workers. An expired entry stays servable for ``stale_ttl_factor`` times
+    its TTL: get_or_refresh() returns it immediately and refreshes it with
+    a single background fetch per key (stale-while-revalidate).
     """
 
     def __init__(
         self,
         max_size: int = 1000,
         default_ttl_seconds: int = 3600,  # 1 hour default
+        path: Optional[str] = None,
+        stale_ttl_factor: float = 1.0,
+        persist_max_size: int = 10000,
+        semantic: Optional[SemanticCacheTier] = None,
     ):
         self.max_size = max_size
         self.default_ttl_seconds = default_ttl_seconds
-        self._cache: Dict[str, CachedResult] = {}
+        self.stale_ttl_factor = stale_ttl_factor
+        self._cache: "OrderedDict[str, CachedResult]" = OrderedDict()
         self._lock = asyncio.Lock()
+        self._store = _CacheStore(path, persist_max_size) if path else None
+        self.semantic = semantic
+
+        # key -> in-flight fetch or background refresh (single-flight)
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        self.metrics: Dict[str, int] = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "disk_hits": 0,
+            "fetches": 0,
+            "refreshes": 0,
+            "refresh_failures": 0,
+            "coalesced": 0,
+            "evictions": 0,
+            "semantic_hits": 0,
+        }
 
     def _get_cache_key(self, query: str, params: Dict[str, Any]) -> str:
         """Generate cache key from query and params."""
@@ -82,6 +410,16 @@ class QueryCache:
 
     def _determine_ttl(self, query: str, params: Dict[str, Any]) -> int:
         """Determine TTL based on query type."""
+        # The router's recency window already classifies how fast the
+        # answer goes stale; fall back to keywords when it set none
+        recency_days = params.get("recency_days")
+        if recency_days:
+            if recency_days <= 1:
+                return 900  # 15 minutes
+            if recency_days <= 3:
+                return 1800  # 30 minutes
+            return self.default_ttl_seconds
+
         query_lower = query.lower()
 
         # Time-sensitive queries = shorter TTL
@@ -106,31 +444,230 @@ class QueryCache:
         # Default
         return self.default_ttl_seconds
 
+    def _is_servable(self, cached: CachedResult) -> bool:
+        """Whether an entry may still be served (fresh or within its stale window)."""
+        return cached.age_seconds() <= cached.ttl_seconds * (1 + self.stale_ttl_factor)
+
+    async def _lookup(self, key: str) -> Optional[CachedResult]:
+        """Find an entry in memory, falling back to the shared store."""
+        async with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+
+        if self._store is None or (cached is not None and not cached.is_expired()):
+            return cached
+
+        # Missing or expired here: another worker may have a fresher copy
+        stored = await asyncio.to_thread(self._store.get, key)
+        if stored is not None and (
+            cached is None
+            or datetime.fromisoformat(stored.created_at) > datetime.fromisoformat(cached.created_at)
+        ):
+            self.metrics["disk_hits"] += 1
+            async with self._lock:
+                self._insert(key, stored)
+            cached = stored
+        return cached
+
+    def _insert(self, key: str, cached: CachedResult) -> None:
+        """Insert into the LRU, evicting from the cold end. Caller holds the lock."""
+        self._cache[key] = cached
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._evict_oldest()
+
     async def get(
         self,
         query: str,
         params: Dict[str, Any],
+        allow_stale: bool = False,
     ) -> Optional[CachedResult]:
-        """Get cached result if available and not expired."""
-        async with self._lock:
-            key = self._get_cache_key(query, params)
+        """
+        Get cached result if available and not expired.
 
-            if key not in self._cache:
-                return None
+        Args:
+            query: Research query
+            params: Research parameters
+            allow_stale: Also return expired entries still inside their stale window
+        """
+        cached, _ = await self._get(query, params, allow_stale)
+        return cached
 
-            cached = self._cache[key]
+    async def _get(
+        self,
+        query: str,
+        params: Dict[str, Any],
+        allow_stale: bool,
+    ) -> Tuple[Optional[CachedResult], bool]:
+        """Lookup behind get(); also reports whether the hit came from the semantic tier."""
+        key = self._get_cache_key(query, params)
+        cached = await self._lookup(key)
+
+        if cached is None:
+            cached = await self._semantic_lookup(query, params)
+            if cached is not None:
+                self.metrics["semantic_hits"] += 1
+                cached.touch()
+                return cached, True
+            self.metrics["misses"] += 1
+            return None, False
 
-            if cached.is_expired():
-                # Remove expired entry
-                del self._cache[key]
+        if cached.is_expired():
+            if not self._is_servable(cached):
+                async with self._lock:
+                    self._cache.pop(key, None)
                 logger.debug(f"Cache expired for query: {query[:50]}...")
-                return None
-
-            # Update access stats
-            cached.touch()
+                self.metrics["misses"] += 1
+                return None, False
+            if not allow_stale:
+                self.metrics["misses"] += 1
+                return None, False
+            self.metrics["stale_hits"] += 1
+            logger.info(f"Cache STALE HIT for query: {query[:50]}...")
+        else:
+            self.metrics["hits"] += 1
             logger.info(f"Cache HIT for query: {query[:50]}...")
+
+        # Update access stats
+        cached.touch()
+        return cached, False
+
+    async def _semantic_lookup(self, query: str, params: Dict[str, Any]) -> Optional[CachedResult]:
+        """Fresh entry of a near-duplicate query in the same TTL class, if any."""
+        if self.semantic is None or not self.semantic.enabled:
+            return None
+
+        ttl_class = self._determine_ttl(query, params)
+        match = await asyncio.to_thread(self.semantic.match, query, params, ttl_class)
+        if match is None:
+            return None
+
+        key, similarity = match
+        cached = await self._lookup(key)
+        if cached is None or cached.is_expired():
+            if cached is None:
+                self.semantic.discard(key)
+            return None
+
+        logger.info(
+            f"Cache SEMANTIC HIT ({similarity:.2f}) for query: {query[:50]}... "
+            f"-> {cached.query[:50]}..."
+        )
+        return cached
+
+    async def get_or_refresh(
+        self,
+        query: str,
+        params: Dict[str, Any],
+        refresh: Callable[[], Awaitable[Dict[str, Any]]],
+        ttl_seconds: Optional[int] = None,
+    ) -> Optional[CachedResult]:
+        """
+        Stale-while-revalidate lookup.
+
+        Returns a fresh entry, or a stale one while ``refresh`` runs in the
+        background (once per key, however many callers see it stale), or
+        None on a miss - the caller then fetches and calls set().
+
+        Args:
+            query: Research query
+            params: Research parameters
+            refresh: Coroutine function returning a new response
+            ttl_seconds: TTL for the refreshed entry (default: by query type)
+        """
+        cached, semantic = await self._get(query, params, allow_stale=True)
+        if semantic:
+            if self.semantic.should_verify():
+                self._start_verification(query, params, cached, refresh, ttl_seconds)
+        elif cached is not None and cached.is_expired():
+            key = self._get_cache_key(query, params)
+            if key in self._inflight:
+                self.metrics["coalesced"] += 1
+            else:
+                self._start_fetch(key, query, params, refresh, ttl_seconds, background=True)
+        return cached
+
+    def _start_verification(
+        self,
+        query: str,
+        params: Dict[str, Any],
+        served: CachedResult,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        ttl_seconds: Optional[int],
+    ) -> None:
+        """Fetch the real result behind a semantic hit and score the match."""
+        key = self._get_cache_key(query, params)
+        if key in self._inflight:
+            return
+
+        async def run():
+            try:
+                actual = await fetch()
+                correct = self.semantic.record_verification(served.response, actual)
+                if not correct:
+                    logger.info(f"Semantic cache match rejected for query: {query[:50]}...")
+                await self.set(query, params, actual, ttl_seconds)
+            except Exception as e:
+                logger.warning(f"Semantic cache verification failed for query {query[:50]}...: {e}")
+            finally:
+                self._inflight.pop(key, None)
+
+        self._inflight[key] = asyncio.create_task(run())
+
+    async def get_or_fetch(
+        self,
+        query: str,
+        params: Dict[str, Any],
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        ttl_seconds: Optional[int] = None,
+    ) -> CachedResult:
+        """
+        Read-through lookup: like get_or_refresh(), but a miss is fetched
+        and cached, with concurrent misses for the same key sharing one fetch.
+        """
+        cached = await self.get_or_refresh(query, params, fetch, ttl_seconds)
+        if cached is not None:
             return cached
 
+        key = self._get_cache_key(query, params)
+        task = self._inflight.get(key)
+        if task is not None:
+            self.metrics["coalesced"] += 1
+        else:
+            task = self._start_fetch(key, query, params, fetch, ttl_seconds, background=False)
+        # Shielded so one cancelled caller does not cancel the others' fetch
+        return await asyncio.shield(task)
+
+    def _start_fetch(
+        self,
+        key: str,
+        query: str,
+        params: Dict[str, Any],
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        ttl_seconds: Optional[int],
+        background: bool,
+    ) -> asyncio.Task:
+        """Start the single fetch for a key."""
+
+        async def run() -> CachedResult:
+            try:
+                response = await fetch()
+                cached = await self.set(query, params, response, ttl_seconds)
+                self.metrics["refreshes" if background else "fetches"] += 1
+                return cached
+            except Exception as e:
+                if not background:
+                    raise
+                self.metrics["refresh_failures"] += 1
+                logger.warning(f"Background refresh failed for query {query[:50]}...: {e}")
+            finally:
+                self._inflight.pop(key, None)
+
+        task = asyncio.create_task(run())
+        self._inflight[key] = task
+        return task
+
     async def set(
         self,
         query: str,
@@ -139,46 +676,50 @@ class QueryCache:
         ttl_seconds: Optional[int] = None,
     ) -> CachedResult:
         """Cache a research result."""
+        key = self._get_cache_key(query, params)
+
+        # Determine TTL
+        if ttl_seconds is None:
+            ttl_seconds = self._determine_ttl(query, params)
+
+        # Create cache entry
+        now = datetime.now(timezone.utc)
+        cached = CachedResult(
+            query=query,
+            params=params,
+            response=response,
+            created_at=now.isoformat(),
+            ttl_seconds=ttl_seconds,
+            last_accessed=now.isoformat(),
+        )
+
         async with self._lock:
-            key = self._get_cache_key(query, params)
+            self._insert(key, cached)
+            size = len(self._cache)
 
-            # Determine TTL
-            if ttl_seconds is None:
-                ttl_seconds = self._determine_ttl(query, params)
-
-            # Create cache entry
-            cached = CachedResult(
-                query=query,
-                params=params,
-                response=response,
-                created_at=datetime.now(timezone.utc).isoformat(),
-                ttl_seconds=ttl_seconds,
-                last_accessed=datetime.now(timezone.utc).isoformat(),
+        if self.semantic is not None and self.semantic.enabled:
+            await asyncio.to_thread(
+                self.semantic.add, key, query, params, self._determine_ttl(query, params)
             )
 
-            # Enforce max size
-            if len(self._cache) >= self.max_size:
-                await self._evict_oldest()
+        if self._store is not None:
+            expires_at = now.timestamp() + ttl_seconds * (1 + self.stale_ttl_factor)
+            await asyncio.to_thread(self._store.put, key, cached, expires_at)
 
-            self._cache[key] = cached
-            logger.info(
-                f"Cached query (TTL={ttl_seconds}s, {len(self._cache)}/{self.max_size}): "
-                f"{query[:50]}..."
-            )
+        logger.info(
+            f"Cached query (TTL={ttl_seconds}s, {size}/{self.max_size}): "
+            f"{query[:50]}..."
+        )
 
-            return cached
+        return cached
 
-    async def _evict_oldest(self):
-        """Evict the oldest/least-recently-used entry."""
+    def _evict_oldest(self):
+        """Evict the least-recently-used entry. Caller holds the lock."""
         if not self._cache:
             return
 
-        # Sort by last_accessed, evict oldest
-        oldest_key = min(
-            self._cache.keys(),
-            key=lambda k: self._cache[k].last_accessed or self._cache[k].created_at
-        )
-        del self._cache[oldest_key]
+        oldest_key, _ = self._cache.popitem(last=False)
+        self.metrics["evictions"] += 1
         logger.debug(f"Evicted cache entry: {oldest_key}")
 
     async def invalidate(self, query: Optional[str] = None):
@@ -187,7 +728,6 @@ class QueryCache:
             if query is None:
                 # Clear all
                 self._cache.clear()
-                logger.info("Cleared entire query cache")
             else:
                 # Clear entries matching query (partial match)
                 to_remove = [
@@ -196,16 +736,37 @@ class QueryCache:
                 ]
                 for k in to_remove:
                     del self._cache[k]
-                logger.info(f"Invalidated {len(to_remove)} cache entries for: {query}")
+
+        removed = None
+        if self._store is not None:
+            removed = await asyncio.to_thread(self._store.delete_matching, query)
+
+        if query is None:
+            logger.info("Cleared entire query cache")
+        else:
+            logger.info(f"Invalidated {removed if removed is not None else len(to_remove)} "
+                        f"cache entries for: {query}")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
+        served = self.metrics["hits"] + self.metrics["stale_hits"] + self.metrics["semantic_hits"]
+        lookups = served + self.metrics["misses"]
         return {
             "size": len(self._cache),
             "max_size": self.max_size,
             "hit_count": sum(c.hit_count for c in self._cache.values()),
+            "hit_rate": served / lookups if lookups else 0.0,
+            "refreshing": len(self._inflight),
+            "persistent": self._store is not None,
+            "semantic": self.semantic.get_stats() if self.semantic is not None else None,
+            **self.metrics,
         }
 
+    def close(self) -> None:
+        """Close the shared store."""
+        if self._store is not None:
+            self._store.close()
+
 
 class RequestCoalescer:
     """
@@ -359,7 +920,16 @@ def get_query_cache() -> QueryCache:
     """Get the singleton query cache instance."""
     global _query_cache
     if _query_cache is None:
-        _query_cache = QueryCache()
+        path = os.getenv(
+            "TORQ_RESEARCH_CACHE_PATH",
+            str(Path.home() / ".torq_console" / "research_cache.sqlite"),
+        )
+        semantic = None
+        if os.getenv("TORQ_RESEARCH_SEMANTIC_CACHE", "").lower() in ("1", "true", "yes"):
+            semantic = SemanticCacheTier(
+                threshold=float(os.getenv("TORQ_RESEARCH_SEMANTIC_THRESHOLD", "0.9"))
+            )
+        _query_cache = QueryCache(path=path or None, semantic=semantic)
     return _query_cache
 
 
@@ -115,8 +115,12 @@ class ResearchCoordinator:
             **research_params,
         )
 
-        # 3. Check cache first
-        cached_result = await self.cache.get(query, research_params)
+        # 3. Check cache first (a stale hit is served while one refresh runs)
+        cached_result = await self.cache.get_or_refresh(
+            query,
+            research_params,
+            lambda: self._search_for_cache(research_query, trace_id),
+        )
         if cached_result:
             logger.info(f"Cache HIT for research query: {query[:50]}...")
             return self._build_response_from_cache(
@@ -263,6 +267,15 @@ class ResearchCoordinator:
             search_func,
         )
 
+    async def _search_for_cache(
+        self,
+        query: ResearchQuery,
+        trace_id: str,
+    ) -> Dict[str, Any]:
+        """Search and return the response in the form the query cache stores."""
+        search_response = await self._coalesce_and_search(query, trace_id)
+        return search_response.model_dump(mode="json")
+
     async def _validate_sources(
         self,
         sources: List[ResearchSource],
@@ -7,10 +7,11 @@ These adapters normalize everything into the ResearchResponse schema.
 
 import os
 import logging
-import httpx
+import aiohttp
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 
+from ...core.http_pool import get_http_pool
 from ..schema import (
     SearchProvider,
     ResearchSource,
@@ -86,10 +87,11 @@ class TavilyProvider(BaseSearchProvider):
             payload["exclude_domains"] = query.exclude_domains
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(self.base_url, json=payload)
+            async with get_http_pool().request(
+                "POST", self.base_url, json=payload, timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
                 response.raise_for_status()
-                data = response.json()
+                data = await response.json()
 
         except Exception as e:
             logger.error(f"Tavily search error: {e}")
@@ -166,7 +168,7 @@ class BraveProvider(BaseSearchProvider):
         params = {
             "q": query.query,
             "count": query.top_k,
-            "text_decorations": False,
+            "text_decorations": "false",
             "search_lang": "en",
         }
 
@@ -178,14 +180,15 @@ class BraveProvider(BaseSearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    self.base_url,
-                    params=params,
-                    headers=headers,
-                )
+            async with get_http_pool().request(
+                "GET",
+                self.base_url,
+                params=params,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            ) as response:
                 response.raise_for_status()
-                data = response.json()
+                data = await response.json()
 
         except Exception as e:
             logger.error(f"Brave search error: {e}")
@@ -255,12 +258,14 @@ class DuckDuckGoProvider(BaseSearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    self.base_url,
-                    params=params,
-                )
-                data = response.json()
+            async with get_http_pool().request(
+                "GET",
+                self.base_url,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            ) as response:
+                # DDG serves JSON as application/x-javascript
+                data = await response.json(content_type=None)
 
         except Exception as e:
             logger.error(f"DuckDuckGo search error: {e}")
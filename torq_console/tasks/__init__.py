@@ -10,6 +10,7 @@ from .scheduler import Scheduler, ScheduleTrigger
 from .executor import ExecutionEngine, NodeStatus
 from .node_runner import NodeRunner, NodeType
 from .dependency_resolver import DependencyResolver
+from .ready_scheduler import ReadyQueueScheduler
 
 __all__ = [
     "TaskGraph",
@@ -21,4 +22,5 @@ __all__ = [
     "NodeRunner",
     "NodeType",
     "DependencyResolver",
+    "ReadyQueueScheduler",
 ]
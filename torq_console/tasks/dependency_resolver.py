@@ -4,7 +4,7 @@ Dependency Resolver for Task Graph Engine.
 Resolves execution order for nodes in a DAG based on dependencies.
 """
 
-from typing import List, Dict, Set, Optional
+from typing import Callable, List, Dict, Set, Optional
 from collections import deque
 from uuid import UUID
 
@@ -144,6 +144,28 @@ class DependencyResolver:
 
         return layers
 
+    def critical_path_lengths(
+        self,
+        estimate: Optional[Callable[[TaskGraphNode], float]] = None
+    ) -> Dict[UUID, float]:
+        """
+        Longest remaining path from each node to the end of the graph.
+
+        Args:
+            estimate: Estimated duration of a node (default: 1 per node)
+
+        Returns:
+            Node ID -> the node's estimate plus the longest chain of
+            estimates among its dependents
+        """
+        estimate = estimate or (lambda node: 1.0)
+        lengths: Dict[UUID, float] = {}
+        for layer in reversed(self.topological_sort()):
+            for node_id in layer:
+                downstream = [lengths[child] for child in self.adjacency[node_id]]
+                lengths[node_id] = estimate(self.node_map[node_id]) + max(downstream, default=0.0)
+        return lengths
+
     def can_execute_parallel(self, node_ids: List[UUID]) -> bool:
         """
         Determine if nodes can be executed in parallel.
@@ -21,10 +21,12 @@ from .models import (
     ExecutionCreate,
     ExecutionResponse,
     NodeResult,
+    RetryPolicy,
     TaskGraphNode,
 )
 from .dependency_resolver import DependencyResolver
 from .node_runner import NodeRunner
+from .ready_scheduler import ReadyQueueScheduler
 
 # Optional workspace integration for Shared Cognitive Workspace
 try:
@@ -36,6 +38,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Critical-path estimate for nodes that have not run yet
+DEFAULT_NODE_ESTIMATE_MS = 1000.0
+
 
 class ExecutionEngine:
     """
@@ -46,9 +51,23 @@ class ExecutionEngine:
     - State persistence
     - Error handling and recovery
     - Telemetry
+
+    Scheduling modes:
+    - "ready_queue" (default): each node starts as soon as its dependencies
+      finish, in critical-path order, within concurrency limits
+    - "layered": topological layers with a barrier between layers
     """
 
-    def __init__(self, supabase_client=None, agent_registry=None, workspace_service=None):
+    def __init__(
+        self,
+        supabase_client=None,
+        agent_registry=None,
+        workspace_service=None,
+        scheduling: str = "ready_queue",
+        max_concurrency: int = 8,
+        resource_limits: Optional[Dict[str, int]] = None,
+        default_resource_limit: Optional[int] = None,
+    ):
         """
         Initialize the execution engine.
 
@@ -56,11 +75,23 @@ class ExecutionEngine:
             supabase_client: Supabase client for persistence
             agent_registry: Agent registry for agent execution
             workspace_service: Optional WorkspaceService for Shared Cognitive Workspace
+            scheduling: "ready_queue" or "layered"
+            max_concurrency: Maximum nodes running at once (ready_queue)
+            resource_limits: Per-agent/tool limits, e.g. {"agent:researcher": 2} (ready_queue)
+            default_resource_limit: Limit for agents/tools not in resource_limits (ready_queue)
         """
+        if scheduling not in ("ready_queue", "layered"):
+            raise ValueError(f"Unknown scheduling mode: {scheduling}")
         self.supabase = supabase_client
         self.agent_registry = agent_registry
         self.workspace_service = workspace_service
         self.node_runner = NodeRunner(agent_registry)
+        self.scheduling = scheduling
+        self.max_concurrency = max_concurrency
+        self.resource_limits = resource_limits or {}
+        self.default_resource_limit = default_resource_limit
+        # Observed node durations (by node name) for critical-path priority
+        self.duration_estimates: Dict[str, float] = {}
         self._running_executions: Dict[UUID, asyncio.Task] = {}
 
     async def execute_graph(
@@ -130,7 +161,7 @@ class ExecutionEngine:
                     agent_id=n.agent_id,
                     tool_name=n.tool_name,
                     parameters=n.parameters,
-                    retry_policy=n.retry_policy,
+                    retry_policy=n.retry_policy or RetryPolicy(),
                     timeout_seconds=n.timeout_seconds,
                     depends_on=n.depends_on,
                 )
@@ -139,82 +170,58 @@ class ExecutionEngine:
 
             resolver = DependencyResolver(graph_nodes)
 
-            # Execute in layers (topological order)
-            layers = resolver.topological_sort()
-
-            for layer_idx, layer_nodes in enumerate(layers):
-                logger.info(f"[{trace_id}] Executing layer {layer_idx + 1}: {len(layer_nodes)} nodes")
-
-                # Check if layer can run in parallel
-                can_parallel = resolver.can_execute_parallel(layer_nodes)
-
-                if can_parallel:
-                    # Execute layer in parallel
-                    layer_results = await asyncio.gather(
-                        *[
-                            self._execute_single_node(
-                                graph,
-                                UUID(node_id),
-                                resolver.node_map[UUID(node_id)],
-                                output_data,
-                                execution_id,
-                                trace_id,
-                            )
-                            for node_id in layer_nodes
-                        ],
-                        return_exceptions=True,
-                    )
-
-                    for i, result in enumerate(layer_results):
-                        node_id = layer_nodes[i]
-                        if isinstance(result, Exception):
-                            logger.error(f"[{trace_id}] Node {node_id} failed: {result}")
-                            failed_nodes.add(node_id)
-                        else:
-                            if result["status"] == "completed":
-                                completed_nodes.add(node_id)
-                                # Merge output into shared data
-                                output_data.update(result.get("output", {}))
-                            elif result["status"] == "failed":
-                                failed_nodes.add(node_id)
-                            elif result["status"] == "skipped":
-                                completed_nodes.add(node_id)  # Skipped nodes are considered complete
-
-                        node_results.append({
-                            "execution_id": str(execution_id),
-                            "node_id": str(node_id),
-                            **result,
-                        })
-
-                else:
-                    # Execute layer sequentially
-                    for node_id in layer_nodes:
-                        result = await self._execute_single_node(
-                            graph,
-                            node_id,
-                            resolver.node_map[node_id],
-                            output_data,
-                            execution_id,
-                            trace_id,
-                        )
-
-                        node_results.append({
-                            "execution_id": str(execution_id),
-                            "node_id": str(node_id),
-                            **result,
-                        })
-
-                        if result["status"] == "completed":
-                            completed_nodes.add(node_id)
-                            output_data.update(result.get("output", {}))
-                        elif result["status"] == "failed":
-                            failed_nodes.add(node_id)
-                        elif result["status"] == "skipped":
-                            completed_nodes.add(node_id)
+            def record(node_id: UUID, result: Any) -> bool:
+                """Fold a node's result into the execution; True aborts it."""
+                if isinstance(result, Exception):
+                    logger.error(f"[{trace_id}] Node {node_id} failed: {result}")
+                    failed_nodes.add(node_id)
+                    result = {"status": "failed", "output": {}, "error": str(result),
+                              "duration_ms": 0, "retry_count": 0}
+                elif result["status"] == "completed":
+                    completed_nodes.add(node_id)
+                    # Merge output into shared data
+                    output_data.update(result.get("output", {}))
+                elif result["status"] == "failed":
+                    failed_nodes.add(node_id)
+                elif result["status"] == "skipped":
+                    completed_nodes.add(node_id)  # Skipped nodes are considered complete
+
+                node_results.append({
+                    "execution_id": str(execution_id),
+                    "node_id": str(node_id),
+                    **result,
+                })
+                self._observe_duration(resolver.node_map[node_id], result)
 
                 # Stop if too many failures
-                if len(failed_nodes) > len(graph.nodes) / 2:
-                    raise RuntimeError(f"Too many node failures: {len(failed_nodes)}")
+                return len(failed_nodes) > len(graph.nodes) / 2
+
+            async def run_node(graph_node: TaskGraphNode) -> Dict[str, Any]:
+                # Snapshot: outputs merged while this node runs must not leak into its input
+                return await self._execute_single_node(
+                    graph,
+                    graph_node.node_id,
+                    graph_node,
+                    dict(output_data),
+                    execution_id,
+                    trace_id,
+                )
+
+            if self.scheduling == "ready_queue":
+                scheduler = ReadyQueueScheduler(
+                    resolver,
+                    max_concurrency=self.max_concurrency,
+                    resource_limits=self.resource_limits,
+                    default_resource_limit=self.default_resource_limit,
+                    estimate=self._estimate_duration,
+                )
+                logger.info(f"[{trace_id}] Executing {len(graph_nodes)} nodes (ready queue)")
+                await scheduler.run(run_node, record)
+            else:
+                await self._execute_layers(resolver, run_node, record, trace_id)
+
+            if len(failed_nodes) > len(graph.nodes) / 2:
+                raise RuntimeError(f"Too many node failures: {len(failed_nodes)}")
 
             completed_at = time.time()
             duration_ms = int((completed_at - started_at) * 1000)
@@ -281,6 +288,51 @@ class ExecutionEngine:
                 workspace_id=workspace_id,
             )
 
+    async def _execute_layers(
+        self,
+        resolver: DependencyResolver,
+        run_node,
+        record,
+        trace_id: str,
+    ) -> None:
+        """Execute the graph layer by layer (topological order), with a barrier per layer."""
+        layers = resolver.topological_sort()
+
+        for layer_idx, layer_nodes in enumerate(layers):
+            logger.info(f"[{trace_id}] Executing layer {layer_idx + 1}: {len(layer_nodes)} nodes")
+
+            # Check if layer can run in parallel
+            if resolver.can_execute_parallel(layer_nodes):
+                # Execute layer in parallel
+                layer_results = await asyncio.gather(
+                    *[run_node(resolver.node_map[node_id]) for node_id in layer_nodes],
+                    return_exceptions=True,
+                )
+                abort = False
+                for node_id, result in zip(layer_nodes, layer_results):
+                    abort = record(node_id, result) or abort
+            else:
+                # Execute layer sequentially
+                abort = False
+                for node_id in layer_nodes:
+                    abort = record(node_id, await run_node(resolver.node_map[node_id])) or abort
+
+            if abort:
+                return
+
+    def _estimate_duration(self, graph_node: TaskGraphNode) -> float:
+        """Expected duration of a node in ms, from earlier runs of the same node name."""
+        return self.duration_estimates.get(graph_node.name, DEFAULT_NODE_ESTIMATE_MS)
+
+    def _observe_duration(self, graph_node: TaskGraphNode, result: Dict[str, Any]) -> None:
+        if result.get("status") != "completed":
+            return
+        duration = float(result.get("duration_ms") or 0)
+        previous = self.duration_estimates.get(graph_node.name)
+        self.duration_estimates[graph_node.name] = (
+            duration if previous is None else 0.7 * previous + 0.3 * duration
+        )
+
     async def _execute_single_node(
         self,
         graph: TaskGraph,
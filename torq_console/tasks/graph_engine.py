@@ -92,7 +92,7 @@ class TaskGraph:
 
         # Check for cycles (via dependency resolver)
         from .dependency_resolver import DependencyResolver
-        from .models import TaskGraphNode
+        from .models import RetryPolicy, TaskGraphNode
 
         graph_nodes = [
             TaskGraphNode(
@@ -102,7 +102,7 @@ class TaskGraph:
                 agent_id=n.agent_id,
                 tool_name=n.tool_name,
                 parameters=n.parameters,
-                retry_policy=n.retry_policy,
+                retry_policy=n.retry_policy or RetryPolicy(),
                 timeout_seconds=n.timeout_seconds,
                 depends_on=n.depends_on,
             )
@@ -0,0 +1,145 @@
+"""
+Ready-Queue Scheduler for Task Graph Engine.
+
+Runs each node as soon as all of its dependencies have finished, instead
+of waiting for the whole topological layer before it (one slow node no
+longer holds back unrelated downstream work).
+
+Ready nodes are started in critical-path order (longest estimated
+remaining chain first), subject to a global concurrency limit and
+per-agent / per-tool limits. A node whose agent or tool is saturated
+waits without taking a global slot, so other ready nodes can overtake it.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from .dependency_resolver import DependencyResolver
+from .models import NodeType, TaskGraphNode
+
+logger = logging.getLogger(__name__)
+
+
+def node_resource(node: TaskGraphNode) -> Optional[str]:
+    """Concurrency-limited resource a node uses ("agent:<id>" / "tool:<name>"), if any."""
+    if node.node_type == NodeType.AGENT and node.agent_id:
+        return f"agent:{node.agent_id}"
+    if node.node_type == NodeType.TOOL:
+        tool_name = node.tool_name or node.parameters.get("tool")
+        if tool_name:
+            return f"tool:{tool_name}"
+    return None
+
+
+class ReadyQueueScheduler:
+    """
+    Streams DAG nodes into execution as their in-degree reaches zero.
+
+    Dependents are released when a dependency finishes, whatever its
+    status, as in the layered engine; the caller decides whether to stop.
+    """
+
+    def __init__(
+        self,
+        resolver: DependencyResolver,
+        max_concurrency: int = 8,
+        resource_limits: Optional[Dict[str, int]] = None,
+        default_resource_limit: Optional[int] = None,
+        estimate: Optional[Callable[[TaskGraphNode], float]] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            resolver: Dependency resolver for the graph
+            max_concurrency: Maximum nodes running at once
+            resource_limits: Per-resource limits, e.g. {"agent:researcher": 2, "tool:web_search": 4}
+            default_resource_limit: Limit for agents/tools not in resource_limits (None: unlimited)
+            estimate: Estimated node duration for critical-path priority (default: 1 per node)
+        """
+        self.resolver = resolver
+        self.max_concurrency = max_concurrency
+        self.resource_limits = resource_limits or {}
+        self.default_resource_limit = default_resource_limit
+        # Raises on cycles, before anything runs
+        self.priority = resolver.critical_path_lengths(estimate)
+
+        self.max_running = 0
+        self.resource_waits = 0
+
+    def _resource_limit(self, resource: Optional[str]) -> Optional[int]:
+        if resource is None:
+            return None
+        return self.resource_limits.get(resource, self.default_resource_limit)
+
+    async def run(
+        self,
+        run_node: Callable[[TaskGraphNode], Awaitable[Dict[str, Any]]],
+        on_result: Callable[[UUID, Any], bool],
+    ) -> None:
+        """
+        Execute every node of the graph.
+
+        Args:
+            run_node: Coroutine function executing one node
+            on_result: Called with (node_id, result or exception) as each
+                node finishes; returning True stops the run and cancels
+                the nodes still running
+        """
+        order = itertools.count()
+        in_degree = dict(self.resolver.in_degree)
+        ready: List[Tuple[float, int, UUID]] = []
+        for node_id, degree in in_degree.items():
+            if degree == 0:
+                heapq.heappush(ready, (-self.priority[node_id], next(order), node_id))
+
+        running: Dict[asyncio.Task, UUID] = {}
+        resource_use: Dict[str, int] = {}
+
+        def start_ready() -> None:
+            blocked = []
+            while ready and len(running) < self.max_concurrency:
+                entry = heapq.heappop(ready)
+                node = self.resolver.node_map[entry[2]]
+                resource = node_resource(node)
+                limit = self._resource_limit(resource)
+                if limit is not None and resource_use.get(resource, 0) >= limit:
+                    blocked.append(entry)
+                    continue
+                if resource is not None:
+                    resource_use[resource] = resource_use.get(resource, 0) + 1
+                running[asyncio.create_task(run_node(node))] = node.node_id
+            if blocked:
+                self.resource_waits += len(blocked)
+            for entry in blocked:
+                heapq.heappush(ready, entry)
+            self.max_running = max(self.max_running, len(running))
+
+        start_ready()
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    node_id = running.pop(task)
+                    resource = node_resource(self.resolver.node_map[node_id])
+                    if resource is not None:
+                        resource_use[resource] -= 1
+
+                    result = task.exception() if task.exception() is not None else task.result()
+                    if on_result(node_id, result):
+                        return
+
+                    for child in self.resolver.adjacency[node_id]:
+                        in_degree[child] -= 1
+                        if in_degree[child] == 0:
+                            heapq.heappush(ready, (-self.priority[child], next(order), child))
+                start_ready()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
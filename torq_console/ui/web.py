@@ -10,14 +10,14 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Set, AsyncIterator
 import uuid
 from datetime import datetime
 import weakref
 import secrets
 
 from fastapi import FastAPI, WebSocket, Request, HTTPException, UploadFile, File, Header, Depends
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
@@ -40,6 +40,8 @@ if TYPE_CHECKING:
     from ..core.console import TorqConsole
 
 from ..core.chat_manager import ChatManager, MessageType, ChatTabStatus
+from ..core.http_pool import close_http_pool, get_http_pool_stats
+from ..generation_meta import GenerationMeta
 from ..utils.visual_diff import VisualDiffEngine
 from .inline_editor import InlineEditor
 from .command_palette import CommandPalette
@@ -1023,6 +1025,24 @@ class WebUI:
                     "response": f"I apologize, but I encountered an error processing your request: {str(e)}. Please try again."
                 }
 
+        @self.app.post("/api/chat/stream")
+        async def stream_chat(request: "StreamChatRequest"):
+            """
+            Stream an AI response as server-sent events.
+
+            Emits ``chunk`` events as text arrives, then one ``done`` (or
+            ``error``) event. A client disconnect cancels the provider request.
+            """
+            async def events():
+                async for event in self._stream_chat_events(request):
+                    yield f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+            return StreamingResponse(
+                events(),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+            )
+
         @self.app.get("/api/chat/tabs")
         async def list_chat_tabs():
             """List all chat tabs."""
@@ -1129,6 +1149,11 @@ class WebUI:
             """Get chat management statistics."""
             return await self.chat_manager.get_chat_statistics()
 
+        @self.app.get("/api/http-pool/stats")
+        async def get_http_pool_statistics():
+            """Get shared HTTP connection pool statistics."""
+            return get_http_pool_stats()
+
     async def _generate_ai_response(self, user_content: str, context_matches: Optional[List] = None) -> str:
         """
         Generate AI response using enhanced AI integration.
@@ -2241,6 +2266,7 @@ How else can I assist you with "{query}"?"""
         """Handle WebSocket connection."""
         await websocket.accept()
         self.active_connections[client_id] = websocket
+        streams: Dict[str, asyncio.Task] = {}
 
         try:
             while True:
@@ -2254,13 +2280,103 @@ How else can I assist you with "{query}"?"""
                 elif message["type"] == "subscribe":
                     # Handle subscription to events
                     pass
+                elif message["type"] == "chat_stream":
+                    # Stream in the background so this loop can still receive chat_cancel
+                    request_id = message.get("request_id") or str(uuid.uuid4())
+                    request = StreamChatRequest(
+                        message=message["message"],
+                        tab_id=message.get("tab_id"),
+                        provider=message.get("provider"),
+                        system_message=message.get("system_message")
+                    )
+                    task = asyncio.create_task(self._forward_chat_stream(websocket, request_id, request))
+                    streams[request_id] = task
+                    task.add_done_callback(lambda _, rid=request_id: streams.pop(rid, None))
+                elif message["type"] == "chat_cancel":
+                    task = streams.get(message.get("request_id"))
+                    if task:
+                        task.cancel()
 
         except Exception as e:
             self.logger.error(f"WebSocket error for {client_id}: {e}")
         finally:
+            for task in list(streams.values()):
+                task.cancel()
             if client_id in self.active_connections:
                 del self.active_connections[client_id]
 
+    async def _stream_chat_events(self, request: "StreamChatRequest") -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run one streamed chat turn.
+
+        Yields ``chunk`` events with text deltas, then ``done`` with the full
+        content and generation metadata, or ``error`` with whatever text had
+        arrived. With a tab_id, the user message and the completed answer are
+        stored in that tab and the tab's history is sent to the model.
+        """
+        llm_manager = getattr(self.console, 'llm_manager', None)
+        if llm_manager is None:
+            yield {"type": "error", "error": "LLM manager not available", "partial": ""}
+            return
+
+        messages = [{"role": "user", "content": request.message}]
+        if request.tab_id:
+            await self.chat_manager.add_message(
+                content=request.message, message_type=MessageType.USER, tab_id=request.tab_id
+            )
+            history = await self.chat_manager.get_tab_messages(request.tab_id)
+            if history:
+                messages = [
+                    {"role": msg.type.value, "content": msg.content}
+                    for msg in history
+                    if msg.type in (MessageType.USER, MessageType.ASSISTANT)
+                ]
+
+        meta = GenerationMeta()
+        parts = []
+        try:
+            async for chunk in llm_manager.stream_chat(
+                request.provider or llm_manager.default_provider,
+                messages,
+                system_message=request.system_message,
+                meta=meta
+            ):
+                parts.append(chunk)
+                yield {"type": "chunk", "delta": chunk}
+        except Exception as e:
+            self.logger.error(f"Streaming chat error: {e}")
+            yield {"type": "error", "error": str(e), "partial": "".join(parts)}
+            return
+
+        content = "".join(parts)
+        if request.tab_id:
+            await self.chat_manager.add_message(
+                content=content,
+                message_type=MessageType.ASSISTANT,
+                tab_id=request.tab_id,
+                metadata={"provider": meta.provider, "model": meta.model}
+            )
+        yield {"type": "done", "content": content, "meta": meta.to_dict()}
+
+    async def _forward_chat_stream(self, websocket: WebSocket, request_id: str,
+                                   request: "StreamChatRequest"):
+        """Send a streamed chat turn over a WebSocket as chat_chunk/chat_done/chat_error."""
+        try:
+            async for event in self._stream_chat_events(request):
+                # Awaiting each send keeps a slow client from being flooded
+                await websocket.send_text(json.dumps(
+                    {**event, "type": f"chat_{event['type']}", "request_id": request_id},
+                    default=str
+                ))
+        except asyncio.CancelledError:
+            try:
+                await websocket.send_text(json.dumps({"type": "chat_cancelled", "request_id": request_id}))
+            except Exception:
+                pass
+            raise
+        except Exception as e:
+            self.logger.error(f"WebSocket stream error for {request_id}: {e}")
+
     async def _broadcast_message(self, message: Dict[str, Any]):
         """Broadcast message to all connected clients."""
         if not self.active_connections:
@@ -2545,6 +2661,9 @@ How else can I assist you with "{query}"?"""
             # Cleanup inline editor
             await self.inline_editor.cleanup()
 
+            # Close pooled provider connections
+            await close_http_pool()
+
             # Clear connections
             self.connected_clients.clear()
             self.client_subscriptions.clear()
@@ -2617,6 +2736,13 @@ class CreateChatTabRequest(BaseModel):
     model: str = "claude-sonnet-4"
 
 
+class StreamChatRequest(BaseModel):
+    message: str
+    tab_id: Optional[str] = None
+    provider: Optional[str] = None
+    system_message: Optional[str] = None
+
+
 class SendMessageRequest(BaseModel):
     content: str
     include_context: bool = True
@@ -31,8 +31,10 @@ class AITimeoutError(AIResponseError):
 
 class ProviderError(AIResponseError):
     """Exception raised when provider fails."""
-    def __init__(self, message: str):
+    def __init__(self, message: str, code: Optional[str] = None, cause: Optional[Exception] = None):
         super().__init__(message, error_category="provider_error")
+        self.code = code
+        self.cause = cause
 
 # Import the self-correcting intent detector
 try:
@@ -3,30 +3,95 @@ File monitoring utilities for TORQ CONSOLE.
 """
 
 import asyncio
+import inspect
 from pathlib import Path
 from typing import Callable, Optional
 import logging
 
 
 class FileMonitor:
-    """File system monitor for TORQ CONSOLE."""
+    """
+    File system monitor for TORQ CONSOLE.
+
+    Callbacks are invoked as ``callback(path, event_type)`` for every created,
+    modified, deleted or moved file. Events come from watchdog when it is
+    installed; ``notify()`` can also be called directly to dispatch a change.
+    """
 
     def __init__(self, repo_path: Path):
         self.repo_path = repo_path
         self.logger = logging.getLogger(__name__)
         self.running = False
         self.callbacks = []
+        self._observer = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     def add_callback(self, callback: Callable):
         """Add a callback for file changes."""
         self.callbacks.append(callback)
 
+    def remove_callback(self, callback: Callable):
+        """Remove a previously added callback."""
+        if callback in self.callbacks:
+            self.callbacks.remove(callback)
+
+    def notify(self, path, event_type: str = "modified"):
+        """
+        Dispatch a file change to all callbacks.
+
+        Safe to call from watchdog's observer thread: coroutine callbacks are
+        scheduled on the event loop that started the monitor.
+        """
+        path = Path(path)
+        for callback in list(self.callbacks):
+            try:
+                result = callback(path, event_type)
+                if inspect.isawaitable(result):
+                    if self._loop is not None and self._loop.is_running():
+                        asyncio.run_coroutine_threadsafe(result, self._loop)
+                    else:
+                        asyncio.ensure_future(result)
+            except Exception as e:
+                self.logger.warning(f"File monitor callback failed for {path}: {e}")
+
     async def start(self):
         """Start monitoring files."""
         self.running = True
+        self._loop = asyncio.get_running_loop()
+
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            self.logger.info(
+                f"Started file monitoring for {self.repo_path} "
+                "(watchdog not installed, manual notify() only)"
+            )
+            return
+
+        monitor = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                if event.event_type == "moved":
+                    monitor.notify(event.src_path, "deleted")
+                    monitor.notify(event.dest_path, "created")
+                elif event.event_type in ("created", "modified", "deleted"):
+                    monitor.notify(event.src_path, event.event_type)
+
+        self._observer = Observer()
+        self._observer.schedule(_Handler(), str(self.repo_path), recursive=True)
+        self._observer.daemon = True
+        self._observer.start()
         self.logger.info(f"Started file monitoring for {self.repo_path}")
 
     async def stop(self):
         """Stop monitoring files."""
         self.running = False
-        self.logger.info("Stopped file monitoring")
\ No newline at end of file
+        if self._observer is not None:
+            self._observer.stop()
+            await asyncio.to_thread(self._observer.join, 5)
+            self._observer = None
+        self.logger.info("Stopped file monitoring")